@@ -16,7 +16,7 @@
 
 from __future__ import annotations
 
-from typing import Literal, Optional, Sequence, Tuple
+from typing import cast, Literal, Optional, Sequence, Tuple
 import warnings
 
 import google.auth.credentials
@@ -75,6 +75,14 @@ def _validate_ordering_mode(value: str) -> bigframes.enums.OrderingMode:
     raise ValueError("Ordering mode must be one of 'strict' or 'partial'.")
 
 
+def _validate_udf_emulation(
+    value: Optional[str],
+) -> Optional[Literal["thread", "process"]]:
+    if value not in (None, "thread", "process"):
+        raise ValueError("UDF emulation must be one of None, 'thread' or 'process'.")
+    return cast(Optional[Literal["thread", "process"]], value)
+
+
 class BigQueryOptions:
     """Encapsulates configuration for working with a session."""
 
@@ -96,6 +104,7 @@ class BigQueryOptions:
             Tuple[str, requests.adapters.BaseAdapter]
         ] = (),
         enable_polars_execution: bool = False,
+        udf_emulation: Optional[Literal["thread", "process"]] = None,
     ):
         self._credentials = credentials
         self._project = project
@@ -118,6 +127,9 @@ class BigQueryOptions:
         if enable_polars_execution:
             bigframes._importing.import_polars()
         self._enable_polars_execution = enable_polars_execution
+        self._udf_emulation = _validate_udf_emulation(udf_emulation)
+        if udf_emulation is not None:
+            bigframes._importing.import_polars()
 
     @property
     def application_name(self) -> Optional[str]:
@@ -503,3 +515,35 @@ class BigQueryOptions:
             warnings.warn(msg, category=bfe.PreviewWarning)
             bigframes._importing.import_polars()
         self._enable_polars_execution = value
+
+    @property
+    def udf_emulation(self) -> Optional[Literal["thread", "process"]]:
+        """Emulates remote functions and managed functions in process.
+
+        If set, ``remote_function`` and ``udf`` don't deploy anything. The
+        functions are called locally, in batches of up to
+        ``max_batching_rows`` rows processed concurrently by a pool of threads
+        (``"thread"``) or processes (``"process"``). Queries calling them are
+        executed with polars, after downloading the BigQuery data they read.
+        Meant for development on small data. Must have polars installed.
+
+        **Examples:**
+
+            >>> import bigframes.pandas as bpd
+            >>> bpd.options.bigquery.udf_emulation = "thread"  # doctest: +SKIP
+
+        """
+        return self._udf_emulation
+
+    @udf_emulation.setter
+    def udf_emulation(self, value: Optional[Literal["thread", "process"]]):
+        if self._session_started and self._udf_emulation != value:
+            raise ValueError(SESSION_STARTED_MESSAGE.format(attribute="udf_emulation"))
+        value = _validate_udf_emulation(value)
+        if value is not None:
+            msg = bfe.format_message(
+                "UDF emulation is an experimental feature, and may not be stable. Must have polars installed."
+            )
+            warnings.warn(msg, category=bfe.PreviewWarning)
+            bigframes._importing.import_polars()
+        self._udf_emulation = value
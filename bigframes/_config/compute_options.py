@@ -15,7 +15,7 @@
 """Options for displaying objects."""
 
 import dataclasses
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 
 @dataclasses.dataclass
@@ -55,6 +55,84 @@ class ComputeOptions:
         {'test2': 'abc', 'test3': False}
     """
 
+    ai_ops_cache_dataset: Optional[str] = None
+    """
+    Caches the answers of AI and semantic operators in a BigQuery dataset.
+
+    Rows that render to the same prompt are always sent to the model once. When
+    a dataset ID is set, answers are also stored in tables in this dataset,
+    keyed by a hash of the model endpoint, prompt and generation parameters,
+    and only prompts without a stored answer are sent to the model. Cache hits
+    and misses are counted in the session's execution metrics. Embeddings
+    computed by ``DataFrame.ai.search`` and ``DataFrame.ai.sim_join`` are
+    cached the same way, so unchanged rows are not embedded again. Defaults
+    to None, which turns off the cache.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.ai_ops_cache_dataset = "my-project.my_cache"  # doctest: +SKIP
+
+    Returns:
+        Optional[str]: Dataset ID.
+    """
+
+    ai_ops_chunk_concurrency: int = 4
+    """
+    Maximum number of chunks of AI functions run at the same time.
+
+    Only used when ``ai_ops_chunk_rows`` is set. Before Python 3.12, chunks
+    always run one at a time. Defaults to 4.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.ai_ops_chunk_concurrency = 8  # doctest: +SKIP
+
+    Returns:
+        int: Number of chunks.
+    """
+
+    ai_ops_chunk_max_retries: int = 0
+    """
+    Retries of the failed rows of each chunk of ``bigframes.bigquery.ai`` functions.
+
+    Only used when ``ai_ops_chunk_rows`` is set. Rows with a non empty status
+    are sent to the model again, up to this many times. The ``predict``
+    methods of ``bigframes.ml.llm`` models use their ``max_retries`` argument
+    instead. Defaults to 0.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.ai_ops_chunk_max_retries = 2  # doctest: +SKIP
+
+    Returns:
+        int: Number of retries.
+    """
+
+    ai_ops_chunk_rows: Optional[int] = None
+    """
+    Splits the input of AI functions in chunks of at most this many rows.
+
+    Applies to ``bigframes.bigquery.ai.generate_text``, ``generate_table`` and
+    ``generate_embedding``, and to the ``predict`` methods of
+    ``bigframes.ml.llm`` models. Chunks are split by row offsets and run as
+    concurrent jobs, so that quota errors only fail the rows of one chunk,
+    which are retried on their own. When ``ai_ops_cache_dataset`` is set, the
+    result of each chunk is stored as soon as it completes, and running the
+    same function on the same data again resumes from the stored chunks.
+    Defaults to None, which sends the whole input in a single job.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.ai_ops_chunk_rows = 10_000  # doctest: +SKIP
+
+    Returns:
+        Optional[int]: Number of rows.
+    """
+
     ai_ops_confirmation_threshold: Optional[int] = 0
     """
     Guards against unexpected processing of large amount of rows by semantic operators.
@@ -72,6 +150,26 @@ class ComputeOptions:
         Optional[int]: Number of rows.
     """
 
+    ai_ops_rate_limiter: Optional[Any] = None
+    """
+    Throttles the rows sent to models by chunks of AI functions.
+
+    Only used when ``ai_ops_chunk_rows`` is set. Before a chunk is sent to
+    the model, ``acquire(rows)`` is called on this object with its number of
+    rows, and should block until they can be sent, like
+    :class:`bigframes.ml.llm.TokenBucket` does. Defaults to None, which
+    doesn't throttle.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> from bigframes.ml import llm
+        >>> bpd.options.compute.ai_ops_rate_limiter = llm.TokenBucket(rows_per_second=100)  # doctest: +SKIP
+
+    Returns:
+        Optional[Any]: Rate limiter.
+    """
+
     ai_ops_threshold_autofail: bool = False
     """
     Guards against unexpected processing of large amount of rows by semantic operators.
@@ -87,6 +185,26 @@ class ComputeOptions:
         bool: True if the guard is enabled.
     """
 
+    ai_ops_vector_index_min_rows: Optional[int] = 5000
+    """
+    Creates vector indexes for similarity searches of AI operators.
+
+    When ``ai_ops_cache_dataset`` is set, the embeddings searched by
+    ``DataFrame.ai.search`` and ``DataFrame.ai.sim_join`` are kept in a table
+    in that dataset, which is updated in place on later calls. A vector index
+    is created on the table once it has at least this many rows, and reused
+    afterwards. BigQuery does not use vector indexes on smaller tables. Set
+    to None to never create indexes. Defaults to 5000.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.ai_ops_vector_index_min_rows = None  # doctest: +SKIP
+
+    Returns:
+        Optional[int]: Number of rows.
+    """
+
     allow_large_results: Optional[bool] = None
     """
     Specifies whether query results can exceed 10 GB.
@@ -103,6 +221,65 @@ class ComputeOptions:
     Returns:
         bool | None: True if results > 10 GB are enabled.
     """
+
+    approximate: bool = False
+    """
+    Use approximate aggregations by default for expensive statistics.
+
+    When enabled, ``median``, ``quantile`` and ``nunique`` on DataFrames,
+    Series and groupby objects use ``APPROX_QUANTILES`` and
+    ``APPROX_COUNT_DISTINCT`` instead of exact computations, unless ``exact``
+    is passed to the call. Approximate results avoid the shuffles needed for
+    exact percentiles and distinct counts, at the cost of a small error.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.approximate = True  # doctest: +SKIP
+
+    Returns:
+        bool: True if approximate aggregations are used by default.
+    """
+
+    blob_content_cache_bytes: Optional[int] = None
+    """
+    Caches downloaded blob content in memory, up to this many bytes.
+
+    ``Series.blob.read_bytes`` and ``Series.blob.display`` download blob
+    content through signed URLs. When set, the content is cached by the
+    object URI and version, so objects that have not changed are not
+    downloaded again. The least recently used content is evicted first.
+    Defaults to None, which turns off the cache.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.blob_content_cache_bytes = 100 * 1024 * 1024  # doctest: +SKIP
+
+    Returns:
+        Optional[int]: Number of bytes.
+    """
+
+    blob_udf_dataset: Optional[str] = None
+    """
+    Keeps the functions deployed by blob transforms in a BigQuery dataset.
+
+    Blob transforms such as ``Series.blob.image_blur`` and
+    ``Series.blob.pdf_extract`` run as Python UDFs, which are deployed once
+    per session. When a dataset ID is set, the functions are instead created
+    in this dataset, named after a hash of their source code, requirements and
+    container settings, and reused by later sessions. Defaults to None, which
+    deploys temporary functions.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.blob_udf_dataset = "my-project.my_functions"  # doctest: +SKIP
+
+    Returns:
+        Optional[str]: Dataset ID.
+    """
+
     enable_multi_query_execution: bool = False
     """
     If enabled, large queries may be factored into multiple smaller queries.
@@ -120,6 +297,26 @@ class ComputeOptions:
         bool | None: True if enabled.
     """
 
+    estimated_bytes_exceeded_action: Literal["raise", "warn"] = "raise"
+    """
+    What to do when a query is estimated to exceed a bytes budget.
+
+    With ``"raise"`` (the default), a
+    ``bigframes.exceptions.MaximumBytesEstimatedExceeded`` exception is raised
+    before the query is submitted. With ``"warn"``, a
+    ``bigframes.exceptions.MaximumBytesEstimatedWarning`` is emitted and the
+    query runs anyway. See ``maximum_bytes_estimated`` and
+    ``maximum_session_bytes_estimated``.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.estimated_bytes_exceeded_action = "warn"  # doctest: +SKIP
+
+    Returns:
+        str: ``"raise"`` or ``"warn"``.
+    """
+
     extra_query_labels: Dict[str, Any] = dataclasses.field(
         default_factory=dict, init=False
     )
@@ -148,6 +345,83 @@ class ComputeOptions:
         int | None: Number of bytes, if set.
     """
 
+    maximum_bytes_estimated: Optional[int] = None
+    """
+    Limits the bytes each query is estimated to process.
+
+    When set, every query is first dry run (once per distinct SQL text) and,
+    if BigQuery estimates it will process more bytes than this limit, the
+    ``estimated_bytes_exceeded_action`` is taken before the query is
+    submitted. Unlike ``maximum_bytes_billed``, the check happens on the
+    client, so it can also warn rather than fail.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.maximum_bytes_estimated = 10 * 1024**3  # doctest: +SKIP
+
+    Returns:
+        int | None: Number of bytes, if set.
+    """
+
+    maximum_session_bytes_estimated: Optional[int] = None
+    """
+    Limits the total bytes the queries of a session are estimated to process.
+
+    When set, every query is first dry run (once per distinct SQL text). If
+    its estimate, added to the estimates of the queries the session has
+    already run, exceeds this limit, the ``estimated_bytes_exceeded_action``
+    is taken before the query is submitted.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.maximum_session_bytes_estimated = 100 * 1024**3  # doctest: +SKIP
+
+    Returns:
+        int | None: Number of bytes, if set.
+    """
+
+    maximum_inline_join_bytes: int = 64 * 1024
+    """
+    Limits the size of local data inlined into the query text of joins.
+
+    Local DataFrames larger than a few kilobytes are uploaded to a temporary
+    table before they are used in a query. When such data is joined with, or
+    used as the values of ``isin``, it is instead inlined into the query as an
+    array literal, which avoids the load job, as long as all the data inlined
+    this way into one query is at most this many bytes. The literal is a few
+    times larger than the data, so large values can exceed the maximum query
+    length. Set to ``0`` to always upload. Defaults to 64 KiB.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.maximum_inline_join_bytes = 0  # doctest: +SKIP
+
+    Returns:
+        int: Number of bytes.
+    """
+
+    maximum_local_group_bytes: Optional[int] = 100 * 1024 * 1024
+    """
+    Limits the size of groups downloaded when iterating over a groupby.
+
+    Iterating over a ``DataFrameGroupBy`` or ``SeriesGroupBy`` reads the data
+    once, ordered by the group keys, and yields each group from local memory.
+    A group larger than this many bytes is instead yielded as a query on the
+    cached data. Set to ``0`` to always query each group separately, or
+    ``None`` to always download groups. Defaults to 100 MiB.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> bpd.options.compute.maximum_local_group_bytes = 0  # doctest: +SKIP
+
+    Returns:
+        int | None: Number of bytes, if set.
+    """
+
     maximum_result_rows: Optional[int] = None
     """
     Limits the number of rows in an execution result.
@@ -72,6 +72,11 @@ from bigframes.bigquery._operations.geo import (
     st_regionstats,
     st_simplify,
 )
+from bigframes.bigquery._operations.hll import (
+    hll_count_extract,
+    hll_count_init,
+    hll_count_merge_partial,
+)
 from bigframes.bigquery._operations.io import load_data
 from bigframes.bigquery._operations.json import (
     json_extract,
@@ -88,6 +93,11 @@ from bigframes.bigquery._operations.json import (
     to_json_string,
 )
 from bigframes.bigquery._operations.mathematical import rand
+from bigframes.bigquery._operations.partial_agg import (
+    finalize_partial_aggs,
+    merge_partial_aggs,
+    partial_agg,
+)
 from bigframes.bigquery._operations.search import create_vector_index, vector_search
 from bigframes.bigquery._operations.sql import sql_scalar
 from bigframes.bigquery._operations.struct import struct
@@ -117,6 +127,10 @@ _functions = [
     st_length,
     st_regionstats,
     st_simplify,
+    # hll ops
+    hll_count_extract,
+    hll_count_init,
+    hll_count_merge_partial,
     # json ops
     json_extract,
     json_extract_array,
@@ -131,6 +145,10 @@ _functions = [
     to_json_string,
     # mathematical ops
     rand,
+    # partial aggregation ops
+    finalize_partial_aggs,
+    merge_partial_aggs,
+    partial_agg,
     # search ops
     create_vector_index,
     vector_search,
@@ -173,6 +191,10 @@ __all__ = [
     "st_length",
     "st_regionstats",
     "st_simplify",
+    # hll ops
+    "hll_count_extract",
+    "hll_count_init",
+    "hll_count_merge_partial",
     # json ops
     "json_extract",
     "json_extract_array",
@@ -188,6 +210,10 @@ __all__ = [
     "to_json_string",
     # mathematical ops
     "rand",
+    # partial aggregation ops
+    "finalize_partial_aggs",
+    "merge_partial_aggs",
+    "partial_agg",
     # search ops
     "create_vector_index",
     "vector_search",
@@ -19,17 +19,30 @@ https://cloud.google.com/bigquery/docs/reference/standard-sql/bigqueryml-syntax-
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, List, Literal, Mapping, Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
 from bigframes import clients, dataframe, dtypes
+from bigframes import options as bf_options
 from bigframes import pandas as bpd
 from bigframes import series, session
 from bigframes.bigquery._operations import utils as bq_utils
 from bigframes.core import convert
 from bigframes.core.compile.sqlglot import sql as sg_sql
 from bigframes.core.logging import log_adapter
+from bigframes.ml import _chunking as ml_chunking
 from bigframes.ml import base as ml_base
 from bigframes.ml import core as ml_core
 from bigframes.operations import ai_ops, output_schemas
@@ -457,7 +470,6 @@ def generate_embedding(
     """
     data = _to_dataframe(data, series_rename="content")
     model_name, session = bq_utils.get_model_name_and_session(model, data)
-    table_sql = bq_utils.to_sql(data)
 
     struct_fields: Dict[str, Any] = {}
     if output_dimensionality is not None:
@@ -474,7 +486,8 @@ def generate_embedding(
         struct_fields["TRIAL_ID"] = trial_id
 
     # Construct the TVF query
-    query = f"""
+    def build_query(table_sql: str) -> str:
+        return f"""
         SELECT *
         FROM AI.GENERATE_EMBEDDING(
             MODEL `{model_name}`,
@@ -483,10 +496,7 @@ def generate_embedding(
         )
     """
 
-    if session is None:
-        return bpd.read_gbq_query(query)
-    else:
-        return session.read_gbq_query(query)
+    return _read_tvf(data, session, build_query)
 
 
 @log_adapter.method_logger(custom_base_name="bigquery_ai")
@@ -566,7 +576,6 @@ def generate_text(
     """
     data = _to_dataframe(data, series_rename="prompt")
     model_name, session = bq_utils.get_model_name_and_session(model, data)
-    table_sql = bq_utils.to_sql(data)
 
     struct_fields: Dict[
         str,
@@ -587,7 +596,8 @@ def generate_text(
     if request_type is not None:
         struct_fields["REQUEST_TYPE"] = request_type
 
-    query = f"""
+    def build_query(table_sql: str) -> str:
+        return f"""
         SELECT *
         FROM AI.GENERATE_TEXT(
             MODEL `{model_name}`,
@@ -596,10 +606,7 @@ def generate_text(
         )
     """
 
-    if session is None:
-        return bpd.read_gbq_query(query)
-    else:
-        return session.read_gbq_query(query)
+    return _read_tvf(data, session, build_query)
 
 
 @log_adapter.method_logger(custom_base_name="bigquery_ai")
@@ -667,7 +674,6 @@ def generate_table(
     """
     data = _to_dataframe(data, series_rename="prompt")
     model_name, session = bq_utils.get_model_name_and_session(model, data)
-    table_sql = bq_utils.to_sql(data)
 
     if isinstance(output_schema, Mapping):
         output_schema_str = ", ".join(
@@ -691,7 +697,9 @@ def generate_table(
         struct_fields_bq["request_type"] = request_type
 
     struct_sql = sg_sql.to_sql(sg_sql.literal(struct_fields_bq))
-    query = f"""
+
+    def build_query(table_sql: str) -> str:
+        return f"""
         SELECT *
         FROM AI.GENERATE_TABLE(
             MODEL `{model_name}`,
@@ -700,10 +708,7 @@ def generate_table(
         )
     """
 
-    if session is None:
-        return bpd.read_gbq_query(query)
-    else:
-        return session.read_gbq_query(query)
+    return _read_tvf(data, session, build_query)
 
 
 @log_adapter.method_logger(custom_base_name="bigquery_ai")
@@ -985,6 +990,37 @@ def forecast(
     return ml_core.BaseBqml(df._session).ai_forecast(input_data=df, options=options)
 
 
+def _read_tvf(
+    data: dataframe.DataFrame,
+    session: session.Session | None,
+    build_query: Callable[[str], str],
+) -> dataframe.DataFrame:
+    """Runs a table valued AI function, in chunks if
+    ``bigframes.options.compute.ai_ops_chunk_rows`` is set."""
+
+    def read(df: dataframe.DataFrame) -> dataframe.DataFrame:
+        query = build_query(bq_utils.to_sql(df))
+        if session is None:
+            return bpd.read_gbq_query(query)
+        else:
+            return session.read_gbq_query(query)
+
+    chunk_rows = bf_options.compute.ai_ops_chunk_rows
+    if chunk_rows is None:
+        return read(data)
+    return ml_chunking.predict_in_chunks(
+        read,
+        data,
+        # The AI table valued functions all report errors in this column.
+        status_col="status",
+        max_retries=bf_options.compute.ai_ops_chunk_max_retries,
+        identity=build_query(""),
+        chunk_rows=chunk_rows,
+        # Query results have a new default index in every chunk.
+        ignore_index=True,
+    )
+
+
 def _separate_context_and_series(
     prompt: PROMPT_TYPE,
 ) -> Tuple[List[str | None], List[series.Series]]:
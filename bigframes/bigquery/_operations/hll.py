@@ -0,0 +1,149 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+HyperLogLog++ functions defined from
+https://cloud.google.com/bigquery/docs/reference/standard-sql/hll_functions
+"""
+
+from __future__ import annotations
+
+import typing
+
+import bigframes_vendored.constants as constants
+
+import bigframes.core.groupby as groupby
+import bigframes.dtypes
+import bigframes.operations as ops
+import bigframes.operations.aggregations as agg_ops
+import bigframes.series as series
+
+if typing.TYPE_CHECKING:
+    import bigframes.dataframe as dataframe
+
+
+def hll_count_init(
+    obj: groupby.SeriesGroupBy | groupby.DataFrameGroupBy,
+    precision: int = 15,
+) -> series.Series | dataframe.DataFrame:
+    """Aggregates the values of each group into a HyperLogLog++ sketch.
+
+    Sketches are ``BYTES`` values that can be stored, merged with
+    :func:`hll_count_merge_partial` and turned into approximate distinct counts
+    with :func:`hll_count_extract`, so distinct counts can be maintained
+    incrementally without rescanning the data.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> import bigframes.bigquery as bbq
+        >>> df = bpd.DataFrame({"key": ["a", "a", "b"], "user": [1, 2, 1]})
+        >>> sketches = bbq.hll_count_init(df.groupby("key")["user"])
+        >>> bbq.hll_count_extract(sketches)
+        key
+        a    2
+        b    1
+        Name: user, dtype: Int64
+
+    Args:
+        obj (groupby.SeriesGroupBy | groupby.DataFrameGroupBy):
+            A GroupBy object over ``INT64``, ``NUMERIC``, ``BIGNUMERIC``,
+            ``STRING`` or ``BYTES`` columns.
+        precision (int, default 15):
+            The precision of the sketches, between 10 and 24. Higher precision
+            gives more accurate counts, at the cost of larger sketches.
+
+    Returns:
+        bigframes.series.Series | bigframes.dataframe.DataFrame: A Series or
+            DataFrame of sketches, indexed by the original group columns.
+    """
+    if not 10 <= precision <= 24:
+        raise ValueError(f"precision must be between 10 and 24, but got {precision}")
+    op = agg_ops.HllCountInitOp(precision=precision)
+    if isinstance(obj, groupby.SeriesGroupBy):
+        return obj._aggregate(op)
+    elif isinstance(obj, groupby.DataFrameGroupBy):
+        return obj._aggregate_all(op, numeric_only=False)
+    else:
+        raise ValueError(
+            f"Unsupported type {type(obj)} to apply `hll_count_init` function. {constants.FEEDBACK_LINK}"
+        )
+
+
+def hll_count_merge_partial(
+    obj: groupby.SeriesGroupBy | groupby.DataFrameGroupBy,
+) -> series.Series | dataframe.DataFrame:
+    """Merges the HyperLogLog++ sketches of each group into a single sketch.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> import bigframes.bigquery as bbq
+        >>> df = bpd.DataFrame({"key": ["a", "a", "b"], "user": [1, 2, 1]})
+        >>> day1 = bbq.hll_count_init(df.groupby("key")["user"])
+        >>> day2 = bbq.hll_count_init(df.groupby("key")["user"])
+        >>> both = bpd.concat([day1, day2])
+        >>> bbq.hll_count_extract(bbq.hll_count_merge_partial(both.groupby(level=0)))
+        key
+        a    2
+        b    1
+        Name: user, dtype: Int64
+
+    Args:
+        obj (groupby.SeriesGroupBy | groupby.DataFrameGroupBy):
+            A GroupBy object over sketches built by :func:`hll_count_init`.
+
+    Returns:
+        bigframes.series.Series | bigframes.dataframe.DataFrame: A Series or
+            DataFrame of merged sketches, indexed by the original group columns.
+    """
+    op = agg_ops.HllCountMergePartialOp()
+    if isinstance(obj, groupby.SeriesGroupBy):
+        return obj._aggregate(op)
+    elif isinstance(obj, groupby.DataFrameGroupBy):
+        return obj._aggregate_all(op, numeric_only=False)
+    else:
+        raise ValueError(
+            f"Unsupported type {type(obj)} to apply `hll_count_merge_partial` function. {constants.FEEDBACK_LINK}"
+        )
+
+
+def hll_count_extract(series: series.Series) -> series.Series:
+    """Extracts the approximate distinct count from each HyperLogLog++ sketch.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> import bigframes.bigquery as bbq
+        >>> df = bpd.DataFrame({"key": ["a", "a", "b"], "user": [1, 2, 1]})
+        >>> bbq.hll_count_extract(bbq.hll_count_init(df.groupby("key")["user"]))
+        key
+        a    2
+        b    1
+        Name: user, dtype: Int64
+
+    Args:
+        series (bigframes.series.Series):
+            A Series of sketches built by :func:`hll_count_init`.
+
+    Returns:
+        bigframes.series.Series: A new Series with the approximate counts.
+    """
+    if series.dtype != bigframes.dtypes.BYTES_DTYPE:
+        raise TypeError(f"Expected a Series of HLL sketches, but got {series.dtype}")
+    op = ops.SqlScalarOp(
+        _output_type=bigframes.dtypes.INT_DTYPE,
+        sql_template="HLL_COUNT.EXTRACT({0})",
+    )
+    return series._apply_nary_op(op, [])
@@ -0,0 +1,355 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Mergeable partial aggregations, for maintaining grouped statistics
+incrementally.
+"""
+
+from __future__ import annotations
+
+import typing
+from typing import Dict, List, Sequence, Tuple, Union
+
+import bigframes_vendored.constants as constants
+import pandas as pd
+
+from bigframes.core import agg_expressions
+import bigframes.core.expression as ex
+import bigframes.core.groupby as groupby
+from bigframes.core.reshape import concat
+import bigframes.core.utils as utils
+import bigframes.core.window_spec as windows
+import bigframes.dataframe as dataframe
+import bigframes.dtypes
+import bigframes.operations as ops
+import bigframes.operations.aggregations as agg_ops
+
+# State columns are labelled "<column label>__<state>".
+_STATE_SEPARATOR = "__"
+
+# The partial states, in the order their columns are created.
+_STATES = ("count", "sum", "mean", "m2", "min", "max", "hll")
+
+# The partial states each supported function is computed from.
+_FUNC_STATES: Dict[str, Tuple[str, ...]] = {
+    "count": ("count",),
+    "sum": ("sum",),
+    "mean": ("count", "sum"),
+    "var": ("count", "mean", "m2"),
+    "std": ("count", "mean", "m2"),
+    "min": ("min",),
+    "max": ("max",),
+    "nunique": ("hll",),
+}
+
+# How partial states are computed from the data, apart from hll. m2, the sum
+# of squared deviations from the mean, is the population variance at first and
+# is multiplied by the count afterwards.
+_STATE_INIT_OPS: Dict[str, agg_ops.UnaryAggregateOp] = {
+    "count": agg_ops.count_op,
+    "sum": agg_ops.sum_op,
+    "mean": agg_ops.mean_op,
+    "m2": agg_ops.PopVarOp(),
+    "min": agg_ops.min_op,
+    "max": agg_ops.max_op,
+}
+
+# How partial states are combined. Means and m2s are first updated to the
+# whole group, see merge_partial_aggs, so the means of a group are all equal.
+_STATE_MERGE_OPS: Dict[str, agg_ops.UnaryAggregateOp] = {
+    "count": agg_ops.sum_op,
+    "sum": agg_ops.sum_op,
+    "mean": agg_ops.AnyValueOp(),
+    "m2": agg_ops.sum_op,
+    "min": agg_ops.min_op,
+    "max": agg_ops.max_op,
+    "hll": agg_ops.HllCountMergePartialOp(),
+}
+
+
+def partial_agg(
+    obj: groupby.SeriesGroupBy | groupby.DataFrameGroupBy,
+    func: Union[str, Sequence[str]],
+    *,
+    precision: int = 15,
+) -> dataframe.DataFrame:
+    """Computes mergeable partial aggregation states for each group.
+
+    The states can be written to a table, combined with the states of new data
+    by :func:`merge_partial_aggs`, and turned into the final statistics by
+    :func:`finalize_partial_aggs`. This way a daily refresh only needs to scan
+    the new data.
+
+    Supported functions are ``"count"``, ``"sum"``, ``"mean"``, ``"var"``,
+    ``"std"``, ``"min"``, ``"max"`` and ``"nunique"``. They are computed from
+    counts, sums, means, sums of squared deviations from the mean, minimums,
+    maximums and HyperLogLog++ sketches, so ``"nunique"`` is approximate.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> import bigframes.bigquery as bbq
+        >>> day1 = bpd.DataFrame({"key": ["a", "a", "b"], "value": [1, 2, 3]})
+        >>> day2 = bpd.DataFrame({"key": ["a", "b"], "value": [3, 5]})
+        >>> state = bbq.partial_agg(day1.groupby("key"), ["sum", "mean"])
+        >>> state = bbq.merge_partial_aggs(
+        ...     state, bbq.partial_agg(day2.groupby("key"), ["sum", "mean"])
+        ... )
+        >>> bbq.finalize_partial_aggs(state, ["sum", "mean"])
+            value
+              sum mean
+        key
+        a       6  2.0
+        b       8  4.0
+        <BLANKLINE>
+        [2 rows x 2 columns]
+
+    Args:
+        obj (groupby.SeriesGroupBy | groupby.DataFrameGroupBy):
+            A GroupBy object over columns with string labels.
+        func (str or Sequence[str]):
+            The functions the states must be able to compute.
+        precision (int, default 15):
+            The precision of the HyperLogLog++ sketches used for ``"nunique"``.
+
+    Returns:
+        bigframes.dataframe.DataFrame: The partial states, indexed by the
+            group keys, with a ``"<column>__<state>"`` column per state.
+    """
+    funcs = _resolve_funcs(func)
+    needed = {state for f in funcs for state in _FUNC_STATES[f]}
+    states = [state for state in _STATES if state in needed]
+
+    if isinstance(obj, groupby.SeriesGroupBy):
+        block = obj._block
+        columns: List[Tuple[str, typing.Hashable]] = [
+            (obj._value_column, obj._value_name)
+        ]
+        by_col_ids, dropna = obj._by_col_ids, obj._dropna
+    elif isinstance(obj, groupby.DataFrameGroupBy):
+        block = obj._block
+        col_ids, labels = obj._aggregated_columns()
+        columns = list(zip(col_ids, labels))
+        by_col_ids, dropna = obj._by_col_ids, obj._dropna
+    else:
+        raise ValueError(
+            f"Unsupported type {type(obj)} to apply `partial_agg` function. {constants.FEEDBACK_LINK}"
+        )
+
+    aggregations = []
+    state_labels = []
+    for col_id, label in columns:
+        if not isinstance(label, str):
+            raise ValueError(
+                f"partial_agg requires string column labels, but got {label!r}."
+            )
+        for state in states:
+            op = (
+                agg_ops.HllCountInitOp(precision=precision)
+                if state == "hll"
+                else _STATE_INIT_OPS[state]
+            )
+            aggregations.append(agg_expressions.UnaryAggregation(op, ex.deref(col_id)))
+            state_labels.append(f"{label}{_STATE_SEPARATOR}{state}")
+
+    result = block.aggregate(
+        aggregations,
+        by_col_ids,
+        column_labels=pd.Index(state_labels),
+        dropna=dropna,
+    )
+    exprs: List[ex.Expression] = []
+    for column, ids in _state_ids(result).items():
+        for state, col_id in ids.items():
+            if state == "m2":
+                count = _as_float(ids["count"])
+                exprs.append(ops.mul_op.as_expr(col_id, count))
+            else:
+                exprs.append(ex.deref(col_id))
+    result = result.project_exprs(exprs, result.column_labels, drop=True)
+    return dataframe.DataFrame(result)
+
+
+def merge_partial_aggs(*states: dataframe.DataFrame) -> dataframe.DataFrame:
+    """Merges partial aggregation states computed by :func:`partial_agg`.
+
+    Groups that appear in several inputs are combined into one row, so the
+    result can be stored in place of the previous state.
+
+    Args:
+        states (bigframes.dataframe.DataFrame):
+            Partial states with the same columns, indexed by the group keys.
+
+    Returns:
+        bigframes.dataframe.DataFrame: The merged partial states.
+    """
+    if not states:
+        raise ValueError("Must provide at least one partial state to merge.")
+    columns = states[0].columns
+    for state in states[1:]:
+        if not state.columns.equals(columns):
+            raise ValueError(
+                "All partial states must have the same columns, but got "
+                f"{list(columns)} and {list(state.columns)}."
+            )
+    merge_ops = [_STATE_MERGE_OPS[_parse_state_label(label)[1]] for label in columns]
+
+    combined = concat.concat(states) if len(states) > 1 else states[0]
+    block = combined._block
+    merge_ids = list(block.value_columns)
+    group = windows.unbound(grouping_keys=tuple(block.index_columns))
+    # Chan et al.'s parallel algorithm: the group mean is the count weighted
+    # mean of the partial means, and each partial m2 grows by
+    # count * (partial mean - group mean)^2.
+    for ids in _state_ids(block).values():
+        if "mean" not in ids:
+            continue
+        if "count" not in ids:
+            raise ValueError(
+                "Cannot merge the mean partial states without the count "
+                "partial states."
+            )
+        count = _as_float(ids["count"])
+        block, weighted_id = block.project_expr(ops.mul_op.as_expr(count, ids["mean"]))
+        block, (group_count_id, group_weighted_id) = block.apply_analytic(
+            [
+                agg_expressions.UnaryAggregation(agg_ops.sum_op, ex.deref(col_id))
+                for col_id in (ids["count"], weighted_id)
+            ],
+            group,
+            [None, None],
+        )
+        block, group_mean_id = block.project_expr(
+            ops.div_op.as_expr(group_weighted_id, _as_float(group_count_id))
+        )
+        merge_ids[merge_ids.index(ids["mean"])] = group_mean_id
+        if "m2" in ids:
+            delta = ops.sub_op.as_expr(ids["mean"], group_mean_id)
+            block, m2_id = block.project_expr(
+                ops.add_op.as_expr(
+                    ids["m2"],
+                    ops.mul_op.as_expr(count, ops.mul_op.as_expr(delta, delta)),
+                )
+            )
+            merge_ids[merge_ids.index(ids["m2"])] = m2_id
+
+    result = block.aggregate(
+        [
+            agg_expressions.UnaryAggregation(op, ex.deref(col_id))
+            for op, col_id in zip(merge_ops, merge_ids)
+        ],
+        block.index_columns,
+        column_labels=combined._block.column_labels,
+        dropna=False,
+    )
+    return dataframe.DataFrame(result)
+
+
+def finalize_partial_aggs(
+    state: dataframe.DataFrame, func: Union[str, Sequence[str]]
+) -> dataframe.DataFrame:
+    """Computes the final statistics from partial aggregation states.
+
+    Args:
+        state (bigframes.dataframe.DataFrame):
+            Partial states computed by :func:`partial_agg` or
+            :func:`merge_partial_aggs`.
+        func (str or Sequence[str]):
+            The functions to compute. Like ``DataFrameGroupBy.agg``, a list of
+            functions gives ``(column, function)`` column labels.
+
+    Returns:
+        bigframes.dataframe.DataFrame: The statistics, indexed by the group
+            keys.
+    """
+    funcs = _resolve_funcs(func)
+    block = state._block
+    state_ids = _state_ids(block)
+
+    exprs = []
+    labels: List[typing.Hashable] = []
+    for column, ids in state_ids.items():
+        for f in funcs:
+            missing = [s for s in _FUNC_STATES[f] if s not in ids]
+            if missing:
+                raise ValueError(
+                    f"Cannot compute {f!r} for column {column!r} without the "
+                    f"{missing} partial states."
+                )
+            exprs.append(_finalize_expr(f, ids))
+            labels.append((column, f) if utils.is_list_like(func) else column)
+
+    result = block.project_exprs(
+        exprs,
+        pd.MultiIndex.from_tuples(labels)  # type: ignore
+        if utils.is_list_like(func)
+        else pd.Index(labels),
+        drop=True,
+    )
+    return dataframe.DataFrame(result)
+
+
+def _resolve_funcs(func: Union[str, Sequence[str]]) -> List[str]:
+    funcs = list(func) if utils.is_list_like(func) else [typing.cast(str, func)]
+    for f in funcs:
+        if f not in _FUNC_STATES:
+            raise NotImplementedError(
+                f"Partial aggregation of {f!r} is not supported. Supported "
+                f"functions are {list(_FUNC_STATES)}. {constants.FEEDBACK_LINK}"
+            )
+    return funcs
+
+
+def _parse_state_label(label) -> Tuple[str, str]:
+    column, sep, state = str(label).rpartition(_STATE_SEPARATOR)
+    if not sep or state not in _STATE_MERGE_OPS:
+        raise ValueError(
+            f"Column {label!r} is not a partial aggregation state. Expected "
+            f"labels of the form '<column>{_STATE_SEPARATOR}<state>'."
+        )
+    return column, state
+
+
+def _state_ids(block) -> Dict[str, Dict[str, str]]:
+    """Maps each column to the ids of its partial states."""
+    state_ids: Dict[str, Dict[str, str]] = {}
+    for col_id, label in zip(block.value_columns, block.column_labels):
+        column, state_name = _parse_state_label(label)
+        state_ids.setdefault(column, {})[state_name] = col_id
+    return state_ids
+
+
+def _as_float(col_id: str) -> ex.Expression:
+    return ops.AsTypeOp(to_type=bigframes.dtypes.FLOAT_DTYPE).as_expr(col_id)
+
+
+def _finalize_expr(func: str, ids: Dict[str, str]) -> ex.Expression:
+    if func in ("count", "sum", "min", "max"):
+        return ex.deref(ids[func])
+    if func == "nunique":
+        extract = ops.SqlScalarOp(
+            _output_type=bigframes.dtypes.INT_DTYPE,
+            sql_template="HLL_COUNT.EXTRACT({0})",
+        )
+        return extract.as_expr(ids["hll"])
+
+    count = _as_float(ids["count"])
+    if func == "mean":
+        return ops.div_op.as_expr(_as_float(ids["sum"]), count)
+    # Sample variance: m2 / (n - 1)
+    var = ops.div_op.as_expr(ids["m2"], ops.sub_op.as_expr(count, ex.const(1)))
+    if func == "var":
+        return var
+    return ops.sqrt_op.as_expr(var)
@@ -0,0 +1,122 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Parallel downloads of blob content through signed URLs."""
+
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import threading
+from typing import Iterable, List, Optional, Union
+
+import pandas as pd
+import requests
+from requests import adapters
+
+import bigframes
+
+_TIMEOUT_SECONDS = 60
+
+
+class _ContentCache:
+    """Least recently used cache of blob contents, bounded by their size."""
+
+    def __init__(self):
+        self._contents: collections.OrderedDict[str, bytes] = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            content = self._contents.get(key)
+            if content is not None:
+                self._contents.move_to_end(key)
+            return content
+
+    def put(self, key: str, content: bytes, max_bytes: int):
+        if len(content) > max_bytes:
+            return
+        with self._lock:
+            if key in self._contents:
+                return
+            self._contents[key] = content
+            self._size += len(content)
+            while self._size > max_bytes:
+                _, evicted = self._contents.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._contents.clear()
+            self._size = 0
+
+
+_content_cache = _ContentCache()
+
+
+def fetch_all(
+    urls: Iterable[Optional[str]],
+    cache_keys: Optional[Iterable[Optional[str]]] = None,
+    *,
+    max_workers: int = 16,
+    raise_errors: bool = True,
+) -> List[Union[bytes, None, requests.RequestException]]:
+    """Downloads the content behind each URL, at most max_workers at a time.
+
+    The downloads share a pool of HTTP connections. If
+    ``bigframes.options.compute.blob_content_cache_bytes`` is set, contents
+    are cached in memory by their cache key, which should identify the object
+    version, such as its URI and generation. A failed download raises, unless
+    ``raise_errors`` is False, in which case its error is returned in place of
+    the content.
+
+    Returns:
+        List[Union[bytes, None, requests.RequestException]]: The contents, in
+            the order of the URLs. Null URLs give None.
+    """
+    urls = list(urls)
+    keys = list(cache_keys) if cache_keys is not None else [None] * len(urls)
+    max_bytes = bigframes.options.compute.blob_content_cache_bytes
+
+    with requests.Session() as session:
+        adapter = adapters.HTTPAdapter(pool_maxsize=max_workers, max_retries=3)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        def fetch(
+            url: Optional[str], key: Optional[str]
+        ) -> Union[bytes, None, requests.RequestException]:
+            if pd.isna(url):
+                return None
+            cache_key = key if max_bytes and not pd.isna(key) else None
+            if cache_key is not None:
+                content = _content_cache.get(cache_key)
+                if content is not None:
+                    return content
+
+            try:
+                response = session.get(url, timeout=_TIMEOUT_SECONDS)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                if raise_errors:
+                    raise
+                return e
+            content = response.content
+            if cache_key is not None and max_bytes:
+                _content_cache.put(cache_key, content, max_bytes)
+            return content
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(fetch, urls, keys))
@@ -13,12 +13,14 @@
 # limitations under the License.
 
 from dataclasses import dataclass
+import hashlib
 import inspect
 import typing
 from typing import Callable, Iterable, Union
 
 import google.cloud.bigquery as bigquery
 
+import bigframes
 import bigframes.session
 import bigframes.session._io.bigquery as bf_io_bigquery
 
@@ -79,18 +81,13 @@ class TransformFunction:
                 return _PYTHON_TO_BQ_TYPES[args[0]]
         return _PYTHON_TO_BQ_TYPES[sig.return_annotation]
 
-    def _create_udf(self):
-        """Create Python UDF in BQ. Return name of the UDF."""
-        udf_name = str(
-            self._session._anon_dataset_manager.generate_unique_resource_id()
-        )
-
+    def _definition(self) -> str:
+        """The function definition, apart from its name."""
         func_body = "import typing\n" + inspect.getsource(self._func)
         func_name = self._func.__name__
         packages = str(list(self._requirements))
 
-        sql = f"""
-CREATE OR REPLACE FUNCTION `{udf_name}`({self._input_bq_signature()})
+        return f"""({self._input_bq_signature()})
 RETURNS {self._output_bq_type()} LANGUAGE python
 WITH CONNECTION `{self._connection}`
 OPTIONS (entry_point='{func_name}', runtime_version='python-3.11', packages={packages}, max_batching_rows={self._max_batching_rows}, container_cpu={self._container_cpu}, container_memory='{self._container_memory}')
@@ -103,6 +100,31 @@ AS r\"\"\"
 \"\"\"
         """
 
+    def _definition_hash(self) -> str:
+        return hashlib.sha256(self._definition().encode()).hexdigest()
+
+    def _create_udf(self):
+        """Create Python UDF in BQ. Return name of the UDF."""
+        dataset = bigframes.options.compute.blob_udf_dataset
+        if dataset is None:
+            udf_name = str(
+                self._session._anon_dataset_manager.generate_unique_resource_id()
+            )
+            create = "CREATE OR REPLACE FUNCTION"
+        else:
+            # Content addressed, so that other sessions reuse the function.
+            dataset_ref = bigquery.DatasetReference.from_string(
+                dataset, default_project=self._session.bqclient.project
+            )
+            udf_name = str(
+                dataset_ref.routine(
+                    f"bigframes_{self._func.__name__}_{self._definition_hash()[:16]}"
+                )
+            )
+            create = "CREATE FUNCTION IF NOT EXISTS"
+
+        sql = f"{create} `{udf_name}`{self._definition()}"
+
         bf_io_bigquery.start_query_with_client(
             self._session.bqclient,
             sql,
@@ -115,14 +137,19 @@ AS r\"\"\"
             publisher=self._session._publisher,
         )
 
+        if dataset is None:
+            # TODO(b/404605969): remove cleanups when UDF fixes dataset deletion.
+            self._session._function_session._update_temp_artifacts(udf_name, "")
         return udf_name
 
     def udf(self):
-        """Create and return the UDF object."""
-        udf_name = self._create_udf()
+        """Create and return the UDF object.
 
-        # TODO(b/404605969): remove cleanups when UDF fixes dataset deletion.
-        self._session._function_session._update_temp_artifacts(udf_name, "")
+        Functions with the same definition are only created once per session.
+        """
+        udf_name = self._session._function_session._deploy_once(
+            f"blob:{self._definition_hash()}", self._create_udf
+        )
         return self._session.read_gbq_function(udf_name)
 
 
@@ -18,8 +18,9 @@ from __future__ import annotations
 
 import logging
 import textwrap
+import threading
 import time
-from typing import cast, Optional
+from typing import cast, Optional, Set, Tuple
 
 import google.api_core.exceptions
 import google.api_core.retry
@@ -85,6 +86,11 @@ class BqConnectionManager:
         self._bq_connection_client = bq_connection_client
         self._cloud_resource_manager_client = cloud_resource_manager_client
 
+        # Connections known to exist with the IAM role already granted, so
+        # that deploying several functions checks them only once.
+        self._ready_connections: Set[Tuple[str, str, str, Optional[str]]] = set()
+        self._ready_connections_lock = threading.Lock()
+
     def create_bq_connection(
         self,
         project_id: str,
@@ -104,6 +110,24 @@ class BqConnectionManager:
             iam_role:
                 str of the IAM role that the service account of the created connection needs to aquire. E.g. 'run.invoker', 'aiplatform.user'
         """
+        key = (project_id, location, connection_id, iam_role)
+        # Concurrent callers wait for the check in progress, so that the IAM
+        # policy isn't modified concurrently.
+        with self._ready_connections_lock:
+            if key in self._ready_connections:
+                return
+            self._create_bq_connection_with_iam_role(
+                project_id, location, connection_id, iam_role
+            )
+            self._ready_connections.add(key)
+
+    def _create_bq_connection_with_iam_role(
+        self,
+        project_id: str,
+        location: str,
+        connection_id: str,
+        iam_role: Optional[str],
+    ):
         # If the intended connection does not exist then create it
         service_account_id = self._get_service_account_if_connection_exists(
             project_id, location, connection_id
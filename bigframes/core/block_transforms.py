@@ -109,20 +109,39 @@ def quantile(
     qs: Sequence[float],
     grouping_column_ids: Sequence[str] = (),
     dropna: bool = False,
+    exact: bool = True,
 ) -> blocks.Block:
-    # TODO: handle windowing and more interpolation methods
-    window = windows.unbound(
-        grouping_keys=tuple(grouping_column_ids),
-    )
-    quantile_cols = []
-    labels = []
     if len(columns) * len(qs) > bigframes.constants.MAX_COLUMNS:
         raise NotImplementedError("Too many aggregates requested.")
+    labels = []
     for col in columns:
         for q in qs:
             label = block.col_id_to_label[col]
             new_label = (*label, q) if isinstance(label, tuple) else (label, q)
             labels.append(new_label)
+
+    if not exact:
+        # APPROX_QUANTILES is a plain aggregate, so no window pass is needed.
+        return block.aggregate(
+            tuple(
+                agg_expressions.UnaryAggregation(
+                    agg_ops.ApproxQuantileOp(q), ex.deref(col)
+                )
+                for col in columns
+                for q in qs
+            ),
+            grouping_column_ids,
+            column_labels=pd.Index(labels),
+            dropna=dropna,
+        )
+
+    # TODO: handle windowing and more interpolation methods
+    window = windows.unbound(
+        grouping_keys=tuple(grouping_column_ids),
+    )
+    quantile_cols = []
+    for col in columns:
+        for q in qs:
             block, quantile_col = block.apply_window_op(
                 col,
                 agg_ops.QuantileOp(q),
@@ -25,10 +25,13 @@ import ast
 import dataclasses
 import datetime
 import functools
+import hashlib
 import itertools
 import random
+import re
 import typing
 from typing import (
+    Dict,
     Iterable,
     Iterator,
     List,
@@ -58,8 +61,11 @@ import bigframes.core.expression as scalars
 import bigframes.core.guid as guid
 import bigframes.core.identifiers
 import bigframes.core.join_def as join_defs
+import bigframes.core.nodes
 import bigframes.core.ordering as ordering
 import bigframes.core.pyarrow_utils as pyarrow_utils
+import bigframes.core.rewrite as rewrite
+import bigframes.core.tree_properties as tree_properties
 import bigframes.core.utils as utils
 import bigframes.core.window_spec as windows
 import bigframes.dtypes
@@ -91,6 +97,71 @@ _MONOTONIC_INCREASING = "monotonic_increasing"
 _MONOTONIC_DECREASING = "monotonic_decreasing"
 
 
+@dataclasses.dataclass(frozen=True)
+class _LocalValues:
+    values: pd.Index
+    # False if only the first values were fetched
+    complete: bool = True
+
+
+def _is_snapshot(node: bigframes.core.nodes.BigFrameNode) -> bool:
+    # Cached results and local data don't change, other tables only if read
+    # at a fixed time.
+    if isinstance(node, bigframes.core.nodes.CachedTableNode):
+        return True
+    if isinstance(node, bigframes.core.nodes.ReadTableNode):
+        return node.source.at_time is not None
+    return True
+
+
+def _without_snapshot(
+    node: bigframes.core.nodes.BigFrameNode,
+) -> bigframes.core.nodes.BigFrameNode:
+    if isinstance(node, bigframes.core.nodes.ReadTableNode) and not isinstance(
+        node, bigframes.core.nodes.CachedTableNode
+    ):
+        return dataclasses.replace(
+            node, source=dataclasses.replace(node.source, at_time=None)
+        )
+    return node
+
+
+def _without_large_local_data(
+    node: bigframes.core.nodes.BigFrameNode, digests: List[str]
+) -> bigframes.core.nodes.BigFrameNode:
+    # Large local data can only be compiled to SQL after it is loaded to a
+    # session table, so it is identified by a digest of its content instead.
+    if (
+        isinstance(node, bigframes.core.nodes.ReadLocalNode)
+        and node.local_data_source.metadata.total_bytes
+        > bigframes.constants.MAX_INLINE_BYTES
+    ):
+        source = node.local_data_source
+        digest = hashlib.sha256()
+        for batch in source.data.to_batches():
+            digest.update(batch.serialize())
+        digests.append(digest.hexdigest())
+        return dataclasses.replace(
+            node,
+            local_data_source=local_data.ManagedArrowTable(
+                source.data.slice(0, 0), source.schema
+            ),
+        )
+    return node
+
+
+def _renumber_columns(
+    node: bigframes.core.nodes.BigFrameNode,
+) -> bigframes.core.nodes.BigFrameNode:
+    # Column ids are generated per process, so plans built separately over the
+    # same data only match after renumbering.
+    node, _ = rewrite.remap_variables(
+        node,
+        (bigframes.core.identifiers.ColumnId(f"col_{i}") for i in itertools.count()),
+    )
+    return node
+
+
 LevelType = typing.Hashable
 LevelsType = typing.Union[LevelType, typing.Sequence[LevelType]]
 
@@ -259,6 +330,11 @@ class Block:
     def has_index(self) -> bool:
         return len(self._index_columns) > 0
 
+    @property
+    def is_local_only(self) -> bool:
+        """Whether all data read by the block is held in local memory."""
+        return tree_properties.local_only(self.expr.node)
+
     @property
     def index(self) -> BlockIndexProperties:
         """Row identities for values in the Block."""
@@ -1608,34 +1684,81 @@ class Block:
 
         Returns a tuple of the dataframe and the overall number of rows of the query.
         """
+        executor = self.session._executor
+        if not tree_properties.can_fast_peek(self.expr.node):
+            # head caches full underlying expression, so row_count will be free after
+            executor.cached(
+                array_value=self.expr,
+                config=executors.CacheConfig(
+                    optimize_for="head", if_cached="reuse-strict"
+                ),
+            )
+
+        row_count = executor.known_row_count(self.expr)
+        if row_count is not None or max_results <= 0:
+            head_df, head_result = self._execute_rows(self.expr, stop=max_results)
+            if row_count is None:
+                row_count = (
+                    executor.execute(
+                        self.expr.row_count(),
+                        execution_spec.ExecutionSpec(
+                            promise_under_10gb=True,
+                            ordered=False,
+                        ),
+                    )
+                    .batches()
+                    .to_py_scalar()
+                )
+        else:
+            # Fetch the total row count alongside the first page as a
+            # COUNT(*) OVER () column, so that repr only needs a single job.
+            expr, (count_id,) = self.expr.project_window_expr(
+                [agg_expressions.NullaryAggregation(agg_ops.size_op)],
+                windows.unbound(),
+            )
+            head_df, head_result = self._execute_rows(expr, stop=max_results)
+            # A non-empty frame always returns at least one row here.
+            row_count = int(head_df[count_id].iloc[0]) if len(head_df) > 0 else 0
+            head_df = head_df.drop(columns=count_id)
+
+        return self._copy_index_to_pandas(head_df), row_count, head_result.query_job
+
+    def cached_for_paging(self) -> Optional[int]:
+        """
+        Writes the block to a session table clustered by row offsets, so that
+        any range of rows can then be read directly with `retrieve_rows`.
 
-        # head caches full underlying expression, so row_count will be free after
+        Returns the overall number of rows, if it is known without another query.
+        """
         executor = self.session._executor
         executor.cached(
             array_value=self.expr,
             config=executors.CacheConfig(optimize_for="head", if_cached="reuse-strict"),
         )
-        head_result = self.session._executor.execute(
-            self.expr.slice(start=None, stop=max_results, step=None),
+        return executor.known_row_count(self.expr)
+
+    def retrieve_rows(self, start: int, stop: int) -> pd.DataFrame:
+        """
+        Retrieves a pandas dataframe containing the rows from start (inclusive) to
+        stop (exclusive), for use with paginated displays.
+        """
+        rows_df, _ = self._execute_rows(self.expr, start=start, stop=stop)
+        return self._copy_index_to_pandas(rows_df)
+
+    def _execute_rows(
+        self,
+        expr: core.ArrayValue,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ) -> Tuple[pd.DataFrame, executors.ExecuteResult]:
+        result = self.session._executor.execute(
+            expr.slice(start=start, stop=stop, step=None),
             execution_spec.ExecutionSpec(
                 promise_under_10gb=True,
                 ordered=True,
             ),
         )
-        row_count = (
-            self.session._executor.execute(
-                self.expr.row_count(),
-                execution_spec.ExecutionSpec(
-                    promise_under_10gb=True,
-                    ordered=False,
-                ),
-            )
-            .batches()
-            .to_py_scalar()
-        )
-
-        head_df = head_result.batches().to_pandas()
-        return self._copy_index_to_pandas(head_df), row_count, head_result.query_job
+        return result.batches().to_pandas(), result
 
     def promote_offsets(self, label: Label = None) -> typing.Tuple[Block, str]:
         expr, result_id = self._expr.promote_offsets()
@@ -1865,11 +1988,14 @@ class Block:
             return self._transpose_cache.with_transpose_cache(self)
 
         original_col_index = self.column_labels
-        original_row_index = (
-            original_row_index
-            if original_row_index is not None
-            else self.index.to_pandas(ordered=True)[0]
-        )
+        if original_row_index is None:
+            key = self._local_values_key("index", self.index_columns)
+            memoized = self._get_local_values(key)
+            if memoized is None:
+                memoized = _LocalValues(self.index.to_pandas(ordered=True)[0])
+                self._set_local_values(key, memoized)
+            # Memoized values are shared by plans that only differ by labels
+            original_row_index = memoized.values.set_names(list(self.index.names))
         original_row_count = len(original_row_index)
         if original_row_count > bigframes.constants.MAX_COLUMNS:
             raise NotImplementedError(
@@ -2186,6 +2312,22 @@ class Block:
         self, columns: Sequence[str], max_unique_values: int
     ) -> pd.Index:
         """Gets N unique values for a column immediately."""
+        key = self._local_values_key("unique_values", columns)
+        memoized = self._get_local_values(key)
+        if (memoized is None) or (
+            not memoized.complete and len(memoized.values) <= max_unique_values
+        ):
+            memoized = self._fetch_unique_values(columns, max_unique_values)
+            self._set_local_values(key, memoized)
+
+        if len(memoized.values) > max_unique_values:
+            raise ValueError(f"Too many unique values: {memoized.values}")
+        # Memoized values are shared by plans that only differ by labels
+        return memoized.values.set_names(list(self._get_labels_for_columns(columns)))
+
+    def _fetch_unique_values(
+        self, columns: Sequence[str], max_unique_values: int
+    ) -> _LocalValues:
         # Importing here to avoid circular import
         import bigframes.core.block_transforms as block_tf
         import bigframes.dataframe as df
@@ -2204,13 +2346,77 @@ class Block:
         pd_values = (
             df.DataFrame(unique_value_block).head(max_unique_values + 1).to_pandas()
         )
-        if len(pd_values) > max_unique_values:
-            raise ValueError(f"Too many unique values: {pd_values}")
+        complete = len(pd_values) <= max_unique_values
 
         if len(columns) > 1:
-            return pd.MultiIndex.from_frame(pd_values)
+            return _LocalValues(pd.MultiIndex.from_frame(pd_values), complete)
         else:
-            return pd.Index(pd_values.squeeze(axis=1).sort_values(na_position="first"))
+            return _LocalValues(
+                pd.Index(pd_values.squeeze(axis=1).sort_values(na_position="first")),
+                complete,
+            )
+
+    def _local_values_key(
+        self, kind: str, columns: Sequence[str]
+    ) -> Optional[tuple[str, bigframes.core.nodes.BigFrameNode]]:
+        # Prune and renumber the plan of the columns, so that blocks built
+        # separately over the same data, with fresh column ids, share the key.
+        node = rewrite.column_pruning(self.expr.select_columns(columns).node)
+        if not all(map(_is_snapshot, node.unique_nodes())):
+            # Tables read without a snapshot can change between queries.
+            return None
+        return kind, _renumber_columns(node)
+
+    def snapshot_independent_sql(self) -> str:
+        """SQL that identifies the data of the block across sessions.
+
+        Tables are read without the snapshot time of the session and column
+        ids are renumbered, so the SQL only changes with the plan of the block,
+        not with when or where it was built. Local data too large to inline is
+        replaced by a digest of its content rather than uploaded. Labels are
+        not included.
+        """
+        import bigframes.core.compile as compile
+
+        digests: List[str] = []
+        node = (
+            rewrite.column_pruning(self.expr.node)
+            .bottom_up(_without_snapshot)
+            .bottom_up(functools.partial(_without_large_local_data, digests=digests))
+        )
+        sql = (
+            compile.compiler()
+            .compile_sql(
+                compile.CompileRequest(_renumber_columns(node), sort_rows=True)
+            )
+            .sql
+        )
+        # Ids generated while compiling, like the offsets of local data, come
+        # from a process wide counter.
+        generated: Dict[str, str] = {}
+        sql = re.sub(
+            r"bfuid_[A-Za-z_]*\d+",
+            lambda match: generated.setdefault(
+                match.group(0), f"bfuid_{len(generated)}"
+            ),
+            sql,
+        )
+        return "".join(f"-- local data {digest}\n" for digest in digests) + sql
+
+    def _get_local_values(
+        self, key: Optional[tuple[str, bigframes.core.nodes.BigFrameNode]]
+    ) -> Optional[_LocalValues]:
+        if key is None:
+            return None
+        return self.session._executor.get_local_values(key)
+
+    def _set_local_values(
+        self,
+        key: Optional[tuple[str, bigframes.core.nodes.BigFrameNode]],
+        values: _LocalValues,
+    ) -> None:
+        if key is not None:
+            self.session._executor.cache_local_values(key, values)
 
     def concat(
         self,
@@ -22,7 +22,17 @@ import os
 import queue
 import threading
 import typing
-from typing import Any, Iterator, List, Literal, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from google.cloud import bigquery_storage_v1
 import google.cloud.bigquery as bq
@@ -31,7 +41,7 @@ from google.protobuf import timestamp_pb2
 import pyarrow as pa
 
 import bigframes.constants
-from bigframes.core import pyarrow_utils
+from bigframes.core import events, pyarrow_utils
 import bigframes.core.schema
 
 if typing.TYPE_CHECKING:
@@ -113,6 +123,7 @@ class GbqNativeTable:
     partition_col: Optional[str] = None
     cluster_cols: typing.Optional[Tuple[str, ...]] = None
     primary_key: Optional[Tuple[str, ...]] = None
+    require_partition_filter: bool = False
 
     @staticmethod
     def from_table(table: bq.Table, columns: Sequence[str] = ()) -> GbqNativeTable:
@@ -147,6 +158,8 @@ class GbqNativeTable:
             else tuple(table.clustering_fields),
             primary_key=tuple(_get_primary_keys(table)),
             metadata=metadata,
+            # None if the table has never set the option.
+            require_partition_filter=table.require_partition_filter is True,
         )
 
     @staticmethod
@@ -180,9 +193,8 @@ class GbqNativeTable:
             return f"`{self.project_id}`.`{self.dataset_id}`.`{self.table_id}`"
         return f"{self.project_id}.{self.dataset_id}.{self.table_id}"
 
-    @property
-    @functools.cache
-    def schema_by_id(self):
+    @functools.cached_property
+    def schema_by_id(self) -> Dict[str, bq.SchemaField]:
         return {col.name: col for col in self.physical_schema}
 
 
@@ -203,9 +215,8 @@ class BiglakeIcebergTable:
             f"{self.project_id}.{self.catalog_id}.{self.namespace_id}.{self.table_id}"
         )
 
-    @property
-    @functools.cache
-    def schema_by_id(self):
+    @functools.cached_property
+    def schema_by_id(self) -> Dict[str, bq.SchemaField]:
         return {col.name: col for col in self.physical_schema}
 
     @property
@@ -224,6 +235,10 @@ class BiglakeIcebergTable:
     def primary_key(self) -> Optional[Tuple[str, ...]]:
         return None
 
+    @property
+    def require_partition_filter(self) -> bool:
+        return False
+
     def get_table_ref(self) -> bq.TableReference:
         return bq.TableReference(
             bq.DatasetReference(self.project_id, self.dataset_id), self.table_id
@@ -278,6 +293,7 @@ def _iter_stream(
 def _iter_streams(
     streams: Sequence[bq_storage_types.ReadStream],
     storage_read_client: bigquery_storage_v1.BigQueryReadClient,
+    publisher: Optional[events.Publisher] = None,
 ) -> Iterator[pa.RecordBatch]:
     stop_event = threading.Event()
     result_queue: queue.Queue = queue.Queue(
@@ -285,6 +301,9 @@ def _iter_streams(
     )  # each response is large, so small queue is appropriate
 
     in_progress: list[concurrent.futures.Future] = []
+    span = events.Span("read_streams", publisher).start()
+    rows_read = 0
+    bytes_read = 0
     with concurrent.futures.ThreadPoolExecutor(max_workers=len(streams)) as pool:
         try:
             for stream in streams:
@@ -300,7 +319,7 @@ def _iter_streams(
 
             while in_progress:
                 try:
-                    yield result_queue.get(timeout=0.1)
+                    batch = result_queue.get(timeout=0.1)
                 except queue.Empty:
                     new_in_progress = []
                     for future in in_progress:
@@ -310,8 +329,18 @@ def _iter_streams(
                         else:
                             new_in_progress.append(future)
                     in_progress = new_in_progress
+                else:
+                    rows_read += batch.num_rows
+                    bytes_read += batch.nbytes
+                    # Only time the download, not the consumer of the batches.
+                    span.pause()
+                    yield batch
+                    span.resume()
         finally:
             stop_event.set()
+            span.rows = rows_read
+            span.bytes = bytes_read
+            span.finish()
 
 
 @dataclasses.dataclass
@@ -327,6 +356,7 @@ def get_arrow_batches(
     storage_read_client: bigquery_storage_v1.BigQueryReadClient,
     project_id: str,
     sample_rate: Optional[float] = None,
+    publisher: Optional[events.Publisher] = None,
 ) -> ReadResult:
     assert isinstance(data.table, GbqNativeTable)
 
@@ -375,7 +405,7 @@ def get_arrow_batches(
     if not session.streams:
         batches: Iterator[pa.RecordBatch] = iter([])
     else:
-        batches = _iter_streams(session.streams, storage_read_client)
+        batches = _iter_streams(session.streams, storage_read_client, publisher)
 
         def process_batch(pa_batch):
             return pyarrow_utils.cast_batch(
@@ -52,6 +52,22 @@ def approx_quantiles(expression: float, number) -> List[float]:
     return []  # pragma: NO COVER
 
 
+@ibis_udf.agg.builtin(name="INIT", database="HLL_COUNT")
+def hll_count_init(expression, precision: ibis_dtypes.int64) -> ibis_dtypes.binary:  # type: ignore
+    """HLL_COUNT.INIT
+
+    https://cloud.google.com/bigquery/docs/reference/standard-sql/hll_functions#hll_countinit
+    """
+
+
+@ibis_udf.agg.builtin(name="MERGE_PARTIAL", database="HLL_COUNT")
+def hll_count_merge_partial(sketch: ibis_dtypes.binary) -> ibis_dtypes.binary:  # type: ignore
+    """HLL_COUNT.MERGE_PARTIAL
+
+    https://cloud.google.com/bigquery/docs/reference/standard-sql/hll_functions#hll_countmerge_partial
+    """
+
+
 def compile_aggregate(
     aggregate: agg_expressions.Aggregation,
     bindings: typing.Dict[str, ibis_types.Value],
@@ -199,6 +215,21 @@ def _(
     return cast(ibis_types.NumericValue, value)
 
 
+@compile_unary_agg.register
+def _(
+    op: agg_ops.ApproxQuantileOp,
+    column: ibis_types.Column,
+    window=None,
+) -> ibis_types.Value:
+    # APPROX_QUANTILES has very few allowed windows.
+    if window is not None:
+        raise NotImplementedError(
+            f"Approx quantile with windowing is not supported. {constants.FEEDBACK_LINK}"
+        )
+    number, offset = op.quantiles_and_offset
+    return approx_quantiles(column, number)[offset]  # type: ignore
+
+
 @compile_unary_agg.register
 def _(
     op: agg_ops.ApproxTopCountOp,
@@ -480,6 +511,46 @@ def _(
     return _apply_window_if_present(column.nunique(), window)
 
 
+@compile_unary_agg.register
+def _(
+    op: agg_ops.ApproxNuniqueOp,
+    column: ibis_types.Column,
+    window=None,
+) -> ibis_types.IntegerValue:
+    # APPROX_COUNT_DISTINCT does not support windows.
+    if window is not None:
+        raise NotImplementedError(
+            f"Approx nunique with windowing is not supported. {constants.FEEDBACK_LINK}"
+        )
+    return column.approx_nunique()
+
+
+@compile_unary_agg.register
+def _(
+    op: agg_ops.HllCountInitOp,
+    column: ibis_types.Column,
+    window=None,
+) -> ibis_types.BinaryValue:
+    if window is not None:
+        raise NotImplementedError(
+            f"HLL_COUNT.INIT with windowing is not supported. {constants.FEEDBACK_LINK}"
+        )
+    return hll_count_init(column, op.precision)  # type: ignore
+
+
+@compile_unary_agg.register
+def _(
+    op: agg_ops.HllCountMergePartialOp,
+    column: ibis_types.BinaryColumn,
+    window=None,
+) -> ibis_types.BinaryValue:
+    if window is not None:
+        raise NotImplementedError(
+            f"HLL_COUNT.MERGE_PARTIAL with windowing is not supported. {constants.FEEDBACK_LINK}"
+        )
+    return hll_count_merge_partial(column)  # type: ignore
+
+
 @compile_unary_agg.register
 def _(
     op: agg_ops.AnyValueOp,
@@ -520,8 +520,10 @@ if polars_installed:
                 return pl.col(inputs).cast(pl.Boolean).all()
             if isinstance(op, agg_ops.AnyOp):
                 return pl.col(inputs).cast(pl.Boolean).any()
-            if isinstance(op, agg_ops.NuniqueOp):
+            if isinstance(op, (agg_ops.NuniqueOp, agg_ops.ApproxNuniqueOp)):
                 return pl.col(*inputs).drop_nulls().n_unique()
+            if isinstance(op, agg_ops.ApproxQuantileOp):
+                return pl.col(*inputs).quantile(op.q, interpolation="nearest")
             if isinstance(op, agg_ops.MinOp):
                 return pl.min(*inputs)
             if isinstance(op, agg_ops.MaxOp):
@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+BigFrames -> Polars compilation for the operations in bigframes.operations.remote_function_ops.
+
+Only functions emulated in process can be compiled, see
+``bigframes.options.bigquery.udf_emulation``.
+
+Please keep implementations in sequential order by op name.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, TYPE_CHECKING
+
+import bigframes.core.compile.polars.compiler as polars_compiler
+import bigframes.dtypes
+from bigframes.functions import udf_def
+from bigframes.operations import remote_function_ops
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+@polars_compiler.register_op(remote_function_ops.BinaryRemoteFunctionOp)
+def binary_remote_function_op_impl(
+    compiler: polars_compiler.PolarsExpressionCompiler,
+    op: remote_function_ops.BinaryRemoteFunctionOp,  # type: ignore
+    left: pl.Expr,
+    right: pl.Expr,
+) -> pl.Expr:
+    return _emulate(op.function_def, [left, right])
+
+
+@polars_compiler.register_op(remote_function_ops.NaryRemoteFunctionOp)
+def nary_remote_function_op_impl(
+    compiler: polars_compiler.PolarsExpressionCompiler,
+    op: remote_function_ops.NaryRemoteFunctionOp,  # type: ignore
+    *inputs: pl.Expr,
+) -> pl.Expr:
+    return _emulate(op.function_def, inputs)
+
+
+@polars_compiler.register_op(remote_function_ops.RemoteFunctionOp)
+def remote_function_op_impl(
+    compiler: polars_compiler.PolarsExpressionCompiler,
+    op: remote_function_ops.RemoteFunctionOp,  # type: ignore
+    input: pl.Expr,
+) -> pl.Expr:
+    return _emulate(op.function_def, [input], apply_on_null=op.apply_on_null)
+
+
+def _emulate(
+    function_def: udf_def.BigqueryUdf,
+    inputs: Sequence[pl.Expr],
+    apply_on_null: bool = True,
+) -> pl.Expr:
+    import polars as pl
+
+    from bigframes.functions import _emulation
+
+    if function_def.local is None:
+        raise NotImplementedError(
+            f"Polars compiler can only run functions emulated in process, not {function_def.routine_ref}."
+        )
+
+    output_type = function_def.signature.output.bf_type
+    return_dtype: pl.DataType
+    if bigframes.dtypes.is_array_like(output_type):
+        # Arrays of any length, unlike the fixed size polars Array type.
+        return_dtype = pl.List(
+            polars_compiler._bigframes_dtype_to_polars_dtype(
+                bigframes.dtypes.get_array_inner_type(output_type)
+            )
+        )
+    else:
+        return_dtype = polars_compiler._bigframes_dtype_to_polars_dtype(output_type)
+
+    def call(series: Sequence[pl.Series]) -> pl.Series:
+        # Constant arguments are passed as a single value.
+        num_rows = max(len(column) for column in series)
+        columns = [
+            column.extend_constant(column[0], num_rows - 1)
+            if len(column) == 1
+            else column
+            for column in series
+        ]
+        result = _emulation.call_udf(
+            function_def,
+            [column.to_arrow() for column in columns],
+            apply_on_null=apply_on_null,
+        )
+        return pl.Series(result)
+
+    return pl.map_batches(list(inputs), call, return_dtype=return_dtype)
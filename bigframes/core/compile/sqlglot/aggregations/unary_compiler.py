@@ -92,6 +92,59 @@ def _(
     )
 
 
+@UNARY_OP_REGISTRATION.register(agg_ops.ApproxQuantileOp)
+def _(
+    op: agg_ops.ApproxQuantileOp,
+    column: typed_expr.TypedExpr,
+    window: typing.Optional[window_spec.WindowSpec] = None,
+) -> sge.Expression:
+    if window is not None:
+        raise NotImplementedError("Approx quantile with windowing is not supported.")
+    number, offset = op.quantiles_and_offset
+    approx_quantiles_expr = sge.func(
+        "APPROX_QUANTILES", column.expr, sge.convert(number)
+    )
+    return sge.Bracket(
+        this=approx_quantiles_expr,
+        expressions=[sge.func("OFFSET", sge.convert(offset))],
+    )
+
+
+@UNARY_OP_REGISTRATION.register(agg_ops.ApproxNuniqueOp)
+def _(
+    op: agg_ops.ApproxNuniqueOp,
+    column: typed_expr.TypedExpr,
+    window: typing.Optional[window_spec.WindowSpec] = None,
+) -> sge.Expression:
+    if window is not None:
+        raise NotImplementedError("Approx nunique with windowing is not supported.")
+    return sge.func("APPROX_COUNT_DISTINCT", column.expr)
+
+
+@UNARY_OP_REGISTRATION.register(agg_ops.HllCountInitOp)
+def _(
+    op: agg_ops.HllCountInitOp,
+    column: typed_expr.TypedExpr,
+    window: typing.Optional[window_spec.WindowSpec] = None,
+) -> sge.Expression:
+    if window is not None:
+        raise NotImplementedError("HLL_COUNT.INIT with windowing is not supported.")
+    return sge.func("HLL_COUNT.INIT", column.expr, sge.convert(op.precision))
+
+
+@UNARY_OP_REGISTRATION.register(agg_ops.HllCountMergePartialOp)
+def _(
+    op: agg_ops.HllCountMergePartialOp,
+    column: typed_expr.TypedExpr,
+    window: typing.Optional[window_spec.WindowSpec] = None,
+) -> sge.Expression:
+    if window is not None:
+        raise NotImplementedError(
+            "HLL_COUNT.MERGE_PARTIAL with windowing is not supported."
+        )
+    return sge.func("HLL_COUNT.MERGE_PARTIAL", column.expr)
+
+
 @UNARY_OP_REGISTRATION.register(agg_ops.ApproxTopCountOp)
 def _(
     op: agg_ops.ApproxTopCountOp,
@@ -54,6 +54,9 @@ def compile_sql(request: configs.CompileRequest) -> configs.CompileResult:
         # Need to do this before replacing unsupported ops, as that will rewrite slice ops
         result_node = rewrite.pull_up_limits(result_node)
     result_node = _replace_unsupported_ops(result_node)
+    result_node = typing.cast(
+        nodes.ResultNode, rewrite.push_down_pruning_filters(result_node)
+    )
     # prune before pulling up order to avoid unnnecessary row_number() ops
     result_node = typing.cast(nodes.ResultNode, rewrite.column_pruning(result_node))
     result_node = rewrite.defer_order(
@@ -106,6 +109,9 @@ def _compile_result_node(root: nodes.ResultNode) -> str:
     # Create UIDs to standardize variable names and ensure consistent compilation
     # of nodes using the same generator.
     uid_gen = guid.SequentialUIDGenerator()
+    # Hoist repeated subexpressions before remapping so the new columns get
+    # standardized names too.
+    root = typing.cast(nodes.ResultNode, rewrite.hoist_common_subexpressions(root))
     root = _remap_variables(root, uid_gen)
     # Remap variables creates too mayn new
     # root = rewrite.select_pullup(root, prefer_source_names=False)
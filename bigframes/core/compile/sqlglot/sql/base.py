@@ -17,6 +17,7 @@ from __future__ import annotations
 import typing
 
 import bigframes_vendored.sqlglot as sg
+import bigframes_vendored.sqlglot.dialects.bigquery
 import bigframes_vendored.sqlglot.expressions as sge
 from google.cloud import bigquery
 import numpy as np
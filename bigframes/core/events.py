@@ -17,6 +17,8 @@ from __future__ import annotations
 import dataclasses
 import datetime
 import threading
+import time
+import typing
 from typing import Any, Callable, Optional, Set
 import uuid
 
@@ -24,7 +26,9 @@ import google.cloud.bigquery._job_helpers
 import google.cloud.bigquery.job.query
 import google.cloud.bigquery.table
 
-import bigframes.session.executor
+# Avoid circular imports.
+if typing.TYPE_CHECKING:
+    import bigframes.session.executor
 
 
 class Subscriber:
@@ -86,6 +90,10 @@ class Publisher:
             for subscriber in self._subscribers:
                 subscriber(event)
 
+    def span(self, name: str) -> Span:
+        """Time a phase of an execution, publishing SpanFinished at the end."""
+        return Span(name, publisher=self)
+
 
 class Event:
     pass
@@ -109,6 +117,73 @@ class ExecutionFinished(Event):
     result: Optional[bigframes.session.executor.ExecuteResult] = None
 
 
+@dataclasses.dataclass(frozen=True)
+class SpanFinished(Event):
+    """A phase of an execution, such as compilation or download, finished."""
+
+    name: str
+    start_time: datetime.datetime
+    duration: datetime.timedelta
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+
+
+class Span:
+    """Times a phase of an execution and publishes a SpanFinished event.
+
+    Use as a context manager. Row and byte counts can be attached while the
+    span is open. Time spent between ``pause`` and ``resume`` is not counted in
+    the duration. If ``publisher`` is None, nothing is published.
+    """
+
+    def __init__(self, name: str, publisher: Optional[Publisher]):
+        self.name = name
+        self.rows: Optional[int] = None
+        self.bytes: Optional[int] = None
+        self._publisher = publisher
+        self._start_time: Optional[datetime.datetime] = None
+        self._start_counter: Optional[float] = None
+        self._elapsed = 0.0
+        self._finished = False
+
+    def start(self) -> Span:
+        self._start_time = datetime.datetime.now(datetime.timezone.utc)
+        self._start_counter = time.perf_counter()
+        return self
+
+    def pause(self):
+        if self._start_counter is not None:
+            self._elapsed += time.perf_counter() - self._start_counter
+            self._start_counter = None
+
+    def resume(self):
+        if self._start_counter is None and self._start_time is not None:
+            self._start_counter = time.perf_counter()
+
+    def finish(self):
+        if self._finished or self._start_time is None:
+            return
+        self._finished = True
+        self.pause()
+        if self._publisher is None:
+            return
+        self._publisher.publish(
+            SpanFinished(
+                name=self.name,
+                start_time=self._start_time,
+                duration=datetime.timedelta(seconds=self._elapsed),
+                rows=self.rows,
+                bytes=self.bytes,
+            )
+        )
+
+    def __enter__(self) -> Span:
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.finish()
+
+
 @dataclasses.dataclass(frozen=True)
 class UnknownErrorEvent(Event):
     exc_type: Any
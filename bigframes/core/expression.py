@@ -80,7 +80,11 @@ class Expression(abc.ABC):
         allow_partial_bindings: bool = False,
     ) -> TExpression:
         return self.bind_refs(
-            {old_id: DerefOp(new_id) for old_id, new_id in name_mapping.items()},  # type: ignore
+            {
+                old_id: DerefOp(name_mapping[old_id])
+                for old_id in self.column_references
+                if old_id in name_mapping
+            },  # type: ignore
             allow_partial_bindings=allow_partial_bindings,
         )
 
@@ -473,8 +477,11 @@ def bind_schema_fields(
     if expr.is_resolved:
         return expr
 
+    # Only resolve referenced columns, so binding is independent of schema width.
     expr_by_id = {
-        id: ResolvedDerefOp.from_field(field) for id, field in field_by_id.items()
+        id: ResolvedDerefOp.from_field(field_by_id[id])
+        for id in expr.column_references
+        if id in field_by_id
     }
     return expr.bind_refs(expr_by_id)
 
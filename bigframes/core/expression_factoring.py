@@ -40,8 +40,12 @@ from bigframes.core import (
     nodes,
     window_spec,
 )
+from bigframes.operations import generic_ops
 
 _MAX_INLINE_COMPLEXITY = 10
+# Minimum complexity (see `expression_complexity`) for a repeated subexpression
+# to be computed once and shared, rather than emitted at each use.
+_MIN_SHARED_COMPLEXITY = 4
 
 T = TypeVar("T")
 
@@ -444,6 +448,98 @@ def is_simple(expr: expression.Expression) -> bool:
     return True
 
 
+def expression_complexity(expr: expression.Expression) -> int:
+    """Estimates the size of the compiled expression.
+
+    Counts expression nodes, plus operator parameters (eg regex patterns, target
+    types), such that a column reference has complexity 1.
+    """
+    own = 1
+    if isinstance(expr, expression.OpExpression):
+        own += len(dataclasses.fields(expr.op))
+    return own + sum(expression_complexity(child) for child in expr.children)
+
+
+def is_shareable(expr: expression.Expression) -> bool:
+    """Whether a repeated expression is worth computing once and referencing."""
+    return expr.deterministic and expression_complexity(expr) >= _MIN_SHARED_COMPLEXITY
+
+
+def extract_common_subexpressions(
+    roots: Sequence[nodes.ColumnDef],
+) -> Tuple[Tuple[nodes.ColumnDef, ...], Tuple[nodes.ColumnDef, ...]]:
+    """
+    Factors out scalar subexpressions that appear more than once across the roots.
+
+    Returns the shared subexpression definitions, and the roots rewritten to
+    reference them. Only the outermost repeated subexpressions are extracted.
+    Occurrences in conditional branches are not counted, as hoisting them would
+    evaluate them for rows whose branch is not taken.
+    """
+    counts = collections.Counter(
+        itertools.chain.from_iterable(
+            _iter_subexpressions(root.expression) for root in roots
+        )
+    )
+    shared_ids = {
+        expr: identifiers.ColumnId.unique()
+        for expr, count in counts.items()
+        if count > 1
+        and isinstance(expr, expression.OpExpression)
+        and expr.is_scalar_expr
+        and is_shareable(expr)
+    }
+    if not shared_ids:
+        return (), tuple(roots)
+
+    replacements: Mapping[expression.Expression, expression.Expression] = {
+        expr: expression.DerefOp(id) for expr, id in shared_ids.items()
+    }
+    new_roots = tuple(
+        nodes.ColumnDef(sub_expressions(root.expression, replacements), root.id)
+        for root in roots
+    )
+    # Repeated subexpressions nested in larger repeated subexpressions are
+    # replaced along with their parent, so may no longer be referenced.
+    used_ids = set(
+        itertools.chain.from_iterable(
+            root.expression.column_references for root in new_roots
+        )
+    )
+    shared_defs = tuple(
+        nodes.ColumnDef(expr, id) for expr, id in shared_ids.items() if id in used_ids
+    )
+    return shared_defs, new_roots
+
+
+def _iter_subexpressions(
+    root: expression.Expression,
+) -> Iterator[expression.Expression]:
+    """Yields every unconditionally evaluated subexpression, once per occurrence."""
+    stack = [root]
+    while stack:
+        expr = stack.pop()
+        yield expr
+        stack.extend(_unconditional_children(expr))
+
+
+def _unconditional_children(
+    expr: expression.Expression,
+) -> Sequence[expression.Expression]:
+    """The inputs of an expression that are evaluated for every row."""
+    if not isinstance(expr, expression.OpExpression):
+        return expr.children
+    if isinstance(expr.op, generic_ops.WhereOp):
+        # where(value, condition, other): only the condition is always evaluated.
+        return (expr.inputs[1],)
+    if isinstance(expr.op, generic_ops.CaseWhenOp):
+        # Only the first predicate is always evaluated.
+        return expr.inputs[:1]
+    if isinstance(expr.op, (generic_ops.CoalesceOp, generic_ops.FillNaOp)):
+        return expr.inputs[:1]
+    return expr.children
+
+
 K = TypeVar("K", bound=Hashable)
 V = TypeVar("V")
 
@@ -206,11 +206,13 @@ class DataFrameGroupBy:
             self._raise_on_non_numeric("mean")
         return self._aggregate_all(agg_ops.mean_op, numeric_only=True)
 
-    def median(self, numeric_only: bool = False, *, exact: bool = True) -> df.DataFrame:
+    def median(
+        self, numeric_only: bool = False, *, exact: Optional[bool] = None
+    ) -> df.DataFrame:
         if not numeric_only:
             self._raise_on_non_numeric("median")
-        if exact:
-            return self.quantile(0.5)
+        if utils.resolve_exact(exact):
+            return self.quantile(0.5, exact=True)
         return self._aggregate_all(agg_ops.median_op, numeric_only=True)
 
     def rank(
@@ -233,7 +235,11 @@ class DataFrameGroupBy:
         )
 
     def quantile(
-        self, q: Union[float, Sequence[float]] = 0.5, *, numeric_only: bool = False
+        self,
+        q: Union[float, Sequence[float]] = 0.5,
+        *,
+        numeric_only: bool = False,
+        exact: Optional[bool] = None,
     ) -> df.DataFrame:
         if not numeric_only:
             self._raise_on_non_numeric("quantile")
@@ -249,6 +255,7 @@ class DataFrameGroupBy:
             qs=tuple(q) if multi_q else (q,),  # type: ignore
             grouping_column_ids=self._by_col_ids,
             dropna=self._dropna,
+            exact=utils.resolve_exact(exact),
         )
         result_df = df.DataFrame(result)
         if multi_q:
@@ -425,8 +432,10 @@ class DataFrameGroupBy:
     def count(self) -> df.DataFrame:
         return self._aggregate_all(agg_ops.count_op)
 
-    def nunique(self) -> df.DataFrame:
-        return self._aggregate_all(agg_ops.nunique_op)
+    def nunique(self, *, exact: Optional[bool] = None) -> df.DataFrame:
+        if utils.resolve_exact(exact):
+            return self._aggregate_all(agg_ops.nunique_op)
+        return self._aggregate_all(agg_ops.approx_nunique_op)
 
     @validations.requires_ordering()
     def cumcount(self, ascending: bool = True) -> series.Series:
@@ -14,16 +14,29 @@
 
 from __future__ import annotations
 
+import dataclasses
 import functools
-from typing import Sequence
+import queue
+import threading
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
+import numpy as np
 import pandas as pd
 
-from bigframes.core import blocks
+import bigframes
+import bigframes.core as core
+from bigframes.core import blocks, local_data
 from bigframes.core import expression as ex
+import bigframes.core.ordering as ordering
 import bigframes.enums
 import bigframes.operations as ops
 
+T = TypeVar("T")
+
+
+_PREFETCH_BATCHES = 2
+_DONE = object()
+
 
 def block_groupby_iter(
     block: blocks.Block,
@@ -55,6 +68,44 @@ def block_groupby_iter(
         # are more efficient.
         session_aware=False,
     )
+    group_index = _GroupIndex(original_index_columns, original_index_labels)
+    maximum_group_bytes = bigframes.options.compute.maximum_local_group_bytes
+    if maximum_group_bytes == 0:
+        groups = _query_groups(
+            block, by_col_ids=by_col_ids, dropna=dropna, group_index=group_index
+        )
+    else:
+        groups = _scan_groups(
+            block,
+            by_col_ids=by_col_ids,
+            dropna=dropna,
+            group_index=group_index,
+            maximum_group_bytes=maximum_group_bytes,
+        )
+
+    for by_keys, group_block in groups:
+        if by_key_is_singular:
+            yield by_keys[0], group_block
+        else:
+            yield by_keys, group_block
+
+
+@dataclasses.dataclass(frozen=True)
+class _GroupIndex:
+    """The original index, restored on each group."""
+
+    columns: Sequence[str]
+    labels: Sequence[blocks.Label]
+
+
+def _query_groups(
+    block: blocks.Block,
+    *,
+    by_col_ids: Sequence[str],
+    dropna: bool,
+    group_index: _GroupIndex,
+) -> Iterator[Tuple[Tuple, blocks.Block]]:
+    """Downloads the group keys, then yields a filter of the block for each."""
     keys_block = block.aggregate(by_column_ids=by_col_ids, dropna=dropna)
     for chunk in keys_block.to_pandas_batches():
         # Convert to MultiIndex to make sure we get tuples,
@@ -64,28 +115,181 @@ def block_groupby_iter(
             by_keys_index = pd.MultiIndex.from_frame(by_keys_index.to_frame())
 
         for by_keys in by_keys_index:
-            filtered_block = (
-                # To ensure the cache is used, filter first, then reset the
-                # index before yielding the DataFrame.
-                block.filter(
-                    functools.reduce(
-                        ops.and_op.as_expr,
-                        (
-                            ops.eq_op.as_expr(by_col, ex.const(by_key))
-                            for by_col, by_key in zip(by_col_ids, by_keys)
-                        ),
-                    ),
-                ).set_index(
-                    original_index_columns,
-                    # We retained by_col_ids in the set_index call above,
-                    # so it's safe to drop the duplicates now.
-                    drop=True,
-                    append=False,
-                    index_labels=original_index_labels,
-                )
+            yield by_keys, _filter_by_keys(block, by_col_ids, by_keys, group_index)
+
+
+def _scan_groups(
+    block: blocks.Block,
+    *,
+    by_col_ids: Sequence[str],
+    dropna: bool,
+    group_index: _GroupIndex,
+    maximum_group_bytes: Optional[int],
+) -> Iterator[Tuple[Tuple, blocks.Block]]:
+    """Reads the block once, ordered by the group keys, and yields local groups.
+
+    Groups larger than maximum_group_bytes are yielded as a filter of the block
+    instead.
+    """
+    scan_block = block
+    if dropna:
+        scan_block = scan_block.filter(
+            functools.reduce(
+                ops.and_op.as_expr,
+                (ops.notnull_op.as_expr(by_col) for by_col in by_col_ids),
             )
+        )
+    scan_block = scan_block.order_by(
+        [ordering.ascending_over(by_col) for by_col in by_col_ids]
+    )
+    batches = _prefetch(scan_block.to_pandas_batches(), _PREFETCH_BATCHES)
+
+    group_keys: Optional[Tuple] = None
+    group_pieces: List[pd.DataFrame] = []
+    group_bytes = 0
+    # Set once the current group is yielded as a query, to skip its remaining rows.
+    group_queried = False
+    for batch in batches:
+        for by_keys, piece in _split_by_keys(batch):
+            if group_keys is None or not _keys_equal(by_keys, group_keys):
+                if group_keys is not None and group_pieces:
+                    yield group_keys, _local_block(group_pieces, block, group_index)
+                group_keys, group_pieces, group_bytes = by_keys, [], 0
+                group_queried = False
+            if group_queried:
+                continue
+
+            group_pieces.append(piece)
+            group_bytes += int(piece.memory_usage(index=True).sum())
+            if maximum_group_bytes is not None and group_bytes > maximum_group_bytes:
+                group_pieces = []
+                group_queried = True
+                yield by_keys, _filter_by_keys(block, by_col_ids, by_keys, group_index)
+
+    if group_pieces:
+        assert group_keys is not None
+        yield group_keys, _local_block(group_pieces, block, group_index)
+
+
+def _filter_by_keys(
+    block: blocks.Block,
+    by_col_ids: Sequence[str],
+    by_keys: Tuple,
+    group_index: _GroupIndex,
+) -> blocks.Block:
+    return (
+        # To ensure the cache is used, filter first, then reset the
+        # index before yielding the DataFrame.
+        block.filter(
+            functools.reduce(
+                ops.and_op.as_expr,
+                (
+                    ops.isnull_op.as_expr(by_col)
+                    if pd.isna(by_key)
+                    else ops.eq_op.as_expr(by_col, ex.const(by_key))
+                    for by_col, by_key in zip(by_col_ids, by_keys)
+                ),
+            ),
+        ).set_index(
+            group_index.columns,
+            # We retained by_col_ids in the set_index call above,
+            # so it's safe to drop the duplicates now.
+            drop=True,
+            append=False,
+            index_labels=group_index.labels,
+        )
+    )
+
+
+def _split_by_keys(batch: pd.DataFrame) -> Iterator[Tuple[Tuple, pd.DataFrame]]:
+    """Splits a batch sorted by its index into runs of equal keys."""
+    if len(batch) == 0:
+        return
+
+    keys = batch.index.to_frame(index=False)
+    previous = keys.shift()
+    same_as_previous = (
+        ((keys == previous) | (keys.isna() & previous.isna()))
+        .fillna(False)
+        .astype(bool)
+        .all(axis=1)
+    )
+    starts = [*np.flatnonzero(~same_as_previous.to_numpy()), len(batch)]
+    if starts[0] != 0:
+        starts.insert(0, 0)
+    for start, stop in zip(starts, starts[1:]):
+        yield tuple(keys.iloc[start]), batch.iloc[start:stop]
+
+
+def _keys_equal(left: Tuple, right: Tuple) -> bool:
+    return all(
+        (pd.isna(x) and pd.isna(y)) or (not pd.isna(x) and not pd.isna(y) and x == y)
+        for x, y in zip(left, right)
+    )
+
+
+def _local_block(
+    pieces: List[pd.DataFrame], like: blocks.Block, group_index: _GroupIndex
+) -> blocks.Block:
+    """Creates a block with the original index from downloaded rows of like."""
+    pd_data = (
+        pd.concat(pieces)
+        .set_axis(list(like.value_columns), axis=1)
+        .reset_index(drop=True)
+    )
+    managed_data = local_data.ManagedArrowTable.from_pandas(pd_data)
+    value_positions = [
+        i
+        for i, col_id in enumerate(like.value_columns)
+        if col_id not in group_index.columns
+    ]
+    value_columns = [like.value_columns[i] for i in value_positions]
+    return blocks.Block(
+        core.ArrayValue.from_managed(managed_data, session=like.session),
+        index_columns=group_index.columns,
+        column_labels=like.column_labels[value_positions],
+        index_labels=group_index.labels,
+        value_columns=value_columns,
+    )
+
+
+def _prefetch(items: Iterable[T], buffer_size: int) -> Iterator[T]:
+    """Iterates over items in a background thread, reading up to buffer_size ahead."""
+    buffer: queue.Queue = queue.Queue(maxsize=buffer_size)
+    stopped = threading.Event()
+    # Options are thread-local, but some are checked while downloading.
+    maximum_result_rows = bigframes.options.compute.maximum_result_rows
+
+    def put(item) -> bool:
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            with bigframes.option_context(
+                "compute.maximum_result_rows", maximum_result_rows
+            ):
+                for item in items:
+                    if not put((item, None)):
+                        return
+            put((_DONE, None))
+        except Exception as e:
+            put((_DONE, e))
 
-            if by_key_is_singular:
-                yield by_keys[0], filtered_block
-            else:
-                yield by_keys, filtered_block
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if error is not None:
+                raise error
+            if item is _DONE:
+                return
+            yield item
+    finally:
+        stopped.set()
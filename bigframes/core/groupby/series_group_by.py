@@ -16,7 +16,7 @@ from __future__ import annotations
 
 import datetime
 import typing
-from typing import Iterable, Literal, Sequence, Tuple, Union
+from typing import Iterable, Literal, Optional, Sequence, Tuple, Union
 
 import bigframes_vendored.constants as constants
 import bigframes_vendored.pandas.core.groupby as vendored_pandas_groupby
@@ -127,8 +127,10 @@ class SeriesGroupBy(vendored_pandas_groupby.SeriesGroupBy):
     def count(self) -> series.Series:
         return self._aggregate(agg_ops.count_op)
 
-    def nunique(self) -> series.Series:
-        return self._aggregate(agg_ops.nunique_op)
+    def nunique(self, *, exact: Optional[bool] = None) -> series.Series:
+        if utils.resolve_exact(exact):
+            return self._aggregate(agg_ops.nunique_op)
+        return self._aggregate(agg_ops.approx_nunique_op)
 
     def sum(self, *args) -> series.Series:
         return self._aggregate(agg_ops.sum_op)
@@ -158,16 +160,20 @@ class SeriesGroupBy(vendored_pandas_groupby.SeriesGroupBy):
     def median(
         self,
         *args,
-        exact: bool = True,
+        exact: Optional[bool] = None,
         **kwargs,
     ) -> series.Series:
-        if exact:
-            return self.quantile(0.5)
+        if utils.resolve_exact(exact):
+            return self.quantile(0.5, exact=True)
         else:
             return self._aggregate(agg_ops.median_op)
 
     def quantile(
-        self, q: Union[float, Sequence[float]] = 0.5, *, numeric_only: bool = False
+        self,
+        q: Union[float, Sequence[float]] = 0.5,
+        *,
+        numeric_only: bool = False,
+        exact: Optional[bool] = None,
     ) -> series.Series:
         multi_q = utils.is_list_like(q)
         result = block_ops.quantile(
@@ -176,6 +182,7 @@ class SeriesGroupBy(vendored_pandas_groupby.SeriesGroupBy):
             qs=tuple(q) if multi_q else (q,),  # type: ignore
             grouping_column_ids=self._by_col_ids,
             dropna=self._dropna,
+            exact=utils.resolve_exact(exact),
         )
         if multi_q:
             return series.Series(result.stack())
@@ -19,7 +19,6 @@ from typing import Tuple, Union
 import warnings
 
 import bigframes_vendored.constants as constants
-import bigframes_vendored.ibis.common.exceptions as ibis_exceptions
 import pandas as pd
 
 import bigframes.core.blocks
@@ -222,7 +221,12 @@ class LocDataFrameIndexer:
                 return
             try:
                 self._dataframe[key[1]] = new_column.fillna(original_column)
-            except ibis_exceptions.IbisTypeError:
+            except Exception as e:
+                # Imported here to avoid loading ibis at import time.
+                import bigframes_vendored.ibis.common.exceptions as ibis_exceptions
+
+                if not isinstance(e, ibis_exceptions.IbisTypeError):
+                    raise
                 raise TypeError(
                     f"Cannot assign scalar of type {type(value)} to column of type {original_column.dtype}, or index type of series argument does not match dataframe."
                 )
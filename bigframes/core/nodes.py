@@ -101,7 +101,11 @@ class UnaryNode(BigFrameNode):
     def transform_children(
         self, t: Callable[[BigFrameNode], BigFrameNode]
     ) -> UnaryNode:
-        transformed = dataclasses.replace(self, child=t(self.child))
+        new_child = t(self.child)
+        if new_child is self.child:
+            # skip rebuilding (and revalidating) the node, which is O(columns)
+            return self
+        transformed = dataclasses.replace(self, child=new_child)
         if self == transformed:
             # reusing existing object speeds up eq, and saves a small amount of memory
             return self
@@ -287,8 +291,11 @@ class InNode(BigFrameNode, AdditiveNode):
         return dataclasses.replace(self, left_child=node)
 
     def transform_children(self, t: Callable[[BigFrameNode], BigFrameNode]) -> InNode:
+        left_child, right_child = t(self.left_child), t(self.right_child)
+        if left_child is self.left_child and right_child is self.right_child:
+            return self
         transformed = dataclasses.replace(
-            self, left_child=t(self.left_child), right_child=t(self.right_child)
+            self, left_child=left_child, right_child=right_child
         )
         if self == transformed:
             # reusing existing object speeds up eq, and saves a small amount of memory
@@ -406,8 +413,11 @@ class JoinNode(BigFrameNode):
         return tuple(itertools.chain.from_iterable(self.conditions))
 
     def transform_children(self, t: Callable[[BigFrameNode], BigFrameNode]) -> JoinNode:
+        left_child, right_child = t(self.left_child), t(self.right_child)
+        if left_child is self.left_child and right_child is self.right_child:
+            return self
         transformed = dataclasses.replace(
-            self, left_child=t(self.left_child), right_child=t(self.right_child)
+            self, left_child=left_child, right_child=right_child
         )
         if self == transformed:
             # reusing existing object speeds up eq, and saves a small amount of memory
@@ -675,7 +685,7 @@ class ReadLocalNode(LeafNode):
     # Offsets are generated only if this is non-null
     offsets_col: Optional[identifiers.ColumnId] = None
 
-    @property
+    @functools.cached_property
     def fields(self) -> Sequence[Field]:
         fields = tuple(
             Field(col_id, self.local_data_source.schema.get_type(source_id))
@@ -771,7 +781,7 @@ class ReadTableNode(LeafNode):
     def session(self):
         return self.table_session
 
-    @property
+    @functools.cached_property
     def fields(self) -> Sequence[Field]:
         return tuple(
             Field(
@@ -1123,8 +1133,9 @@ class SelectionNode(UnaryNode):
     input_output_pairs: Tuple[AliasedRef, ...]
 
     def _validate(self):
+        child_ids = set(self.child.ids)
         for ref, _ in self.input_output_pairs:
-            if ref.id not in set(self.child.ids):
+            if ref.id not in child_ids:
                 raise ValueError(f"Reference to column not in child: {ref.id}")
 
     @functools.cached_property
@@ -1204,7 +1215,8 @@ class ProjectionNode(UnaryNode, AdditiveNode):
             _ = ex.bind_schema_fields(expression, self.child.field_by_id).output_type
             assert expression.is_scalar_expr
         # Cannot assign to existing variables - append only!
-        assert all(name not in self.child.schema.names for _, name in self.assignments)
+        child_ids = set(self.child.ids)
+        assert all(name not in child_ids for _, name in self.assignments)
 
     @functools.cached_property
     def added_fields(self) -> Tuple[Field, ...]:
@@ -1408,7 +1420,7 @@ class WindowOpNode(UnaryNode, AdditiveNode):
             for agg_child in cdef.expression.children:
                 assert agg_child.is_scalar_expr
             for ref in cdef.expression.column_references:
-                assert ref in self.child.ids
+                assert ref in self.child.field_by_id
 
         assert not any(field.dtype is None for field in self.added_fields)
 
@@ -1574,7 +1586,7 @@ class ExplodeNode(UnaryNode):
 
     def _validate(self):
         for col in self.column_ids:
-            assert col.id in self.child.ids
+            assert col.id in self.child.field_by_id
 
     @property
     def row_preserving(self) -> bool:
@@ -1656,7 +1668,7 @@ class ResultNode(UnaryNode):
 
     def _validate(self):
         for ref, _ in self.output_cols:
-            assert ref.id in self.child.ids
+            assert ref.id in self.child.field_by_id
 
     @property
     def node_defined_ids(self) -> Tuple[identifiers.ColumnId, ...]:
@@ -53,6 +53,12 @@ def cluster_cols_for_predicate(
         # https://cloud.google.com/bigquery/docs/reference/standard-sql/geography_functions
         if isinstance(op, COMPARISON_OP_TYPES):
             cols = cluster_cols_for_comparison(predicate.inputs[0], predicate.inputs[1])
+        elif isinstance(op, ops.IsInOp):
+            cols = (
+                [predicate.inputs[0].id]
+                if isinstance(predicate.inputs[0], ex.DerefOp)
+                else []
+            )
         elif isinstance(op, (type(ops.invert_op))):
             cols = cluster_cols_for_predicate(predicate.inputs[0], clusterable_cols)
         elif isinstance(op, (type(ops.and_op), type(ops.or_op))):
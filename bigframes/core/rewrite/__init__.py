@@ -13,6 +13,7 @@
 # limitations under the License.
 
 from bigframes.core.rewrite.as_sql import as_sql_nodes
+from bigframes.core.rewrite.common_subexpressions import hoist_common_subexpressions
 from bigframes.core.rewrite.ctes import extract_ctes
 from bigframes.core.rewrite.fold_row_count import fold_row_counts
 from bigframes.core.rewrite.identifiers import remap_variables
@@ -20,11 +21,13 @@ from bigframes.core.rewrite.implicit_align import try_row_join
 from bigframes.core.rewrite.legacy_align import legacy_join_as_projection
 from bigframes.core.rewrite.order import bake_order, defer_order
 from bigframes.core.rewrite.pruning import column_pruning
+from bigframes.core.rewrite.pruning_filters import push_down_pruning_filters
 from bigframes.core.rewrite.scan_reduction import (
     try_reduce_to_local_scan,
     try_reduce_to_table_scan,
 )
 from bigframes.core.rewrite.select_pullup import defer_selection
+from bigframes.core.rewrite.semi_joins import try_semi_join
 from bigframes.core.rewrite.slices import pull_out_limit, pull_up_limits, rewrite_slice
 from bigframes.core.rewrite.timedeltas import rewrite_timedelta_expressions
 from bigframes.core.rewrite.udfs import lower_udfs
@@ -46,6 +49,7 @@ __all__ = [
     "remap_variables",
     "defer_order",
     "column_pruning",
+    "push_down_pruning_filters",
     "rewrite_range_rolling",
     "try_reduce_to_table_scan",
     "bake_order",
@@ -53,6 +57,8 @@ __all__ = [
     "fold_row_counts",
     "pull_out_window_order",
     "defer_selection",
+    "try_semi_join",
     "simplify_complex_windows",
     "lower_udfs",
+    "hoist_common_subexpressions",
 ]
@@ -13,13 +13,15 @@
 # limitations under the License.
 from __future__ import annotations
 
+import collections
 import dataclasses
 import itertools
-from typing import Optional, Sequence, Union
+from typing import Iterable, Optional, Sequence, Union
 
 from bigframes.core import (
     agg_expressions,
     expression,
+    expression_factoring,
     guid,
     identifiers,
     nodes,
@@ -28,6 +30,10 @@ from bigframes.core import (
 )
 import bigframes.core.rewrite
 
+# Size of wrapping a select in a subquery, in units of `expression_complexity`,
+# excluding the selected columns.
+_SUBQUERY_COMPLEXITY = 4
+
 
 def _limit(select: sql_nodes.SqlSelectNode, limit: int) -> sql_nodes.SqlSelectNode:
     new_limit = limit if select.limit is None else min([select.limit, limit])
@@ -74,16 +80,37 @@ def _try_bind(
     return expr.bind_refs(bindings)
 
 
+def _inlines_shared_expr(
+    select: sql_nodes.SqlSelectNode, refs: Iterable[identifiers.ColumnId]
+) -> bool:
+    """Whether merging refs into the select duplicates more than a new subquery adds."""
+    id_mapping = select.get_id_mapping()
+    # Each use of a subquery column is still a column reference, of complexity 1
+    duplicated = sum(
+        (count - 1) * (expression_factoring.expression_complexity(id_mapping[id]) - 1)
+        for id, count in collections.Counter(refs).items()
+        if count > 1 and id in id_mapping
+    )
+    # A new subquery must also re-select each column of this one.
+    return duplicated > _SUBQUERY_COMPLEXITY + len(select.selections)
+
+
 def _try_add_cdefs(
     select: sql_nodes.SqlSelectNode, cdefs: Sequence[nodes.ColumnDef]
 ) -> Optional[sql_nodes.SqlSelectNode]:
-    # TODO: add up complexity measure while inlining refs
+    # Keep repeated expressions in a subquery rather than inlining each use
+    if _inlines_shared_expr(
+        select,
+        itertools.chain.from_iterable(
+            cdef.expression.column_references for cdef in cdefs
+        ),
+    ):
+        return None
     new_defs = []
+    id_mapping = select.get_id_mapping()
     for cdef in cdefs:
         cdef_expr = cdef.expression
-        merged_expr = _try_bind(
-            cdef_expr, select.get_id_mapping(), analytic_allowed=True
-        )
+        merged_expr = _try_bind(cdef_expr, id_mapping, analytic_allowed=True)
         if merged_expr is None:
             return None
         new_defs.append(nodes.ColumnDef(merged_expr, cdef.id))
@@ -150,11 +177,12 @@ def _create_noop_select(node: nodes.BigFrameNode) -> sql_nodes.SqlSelectNode:
 def _try_remap_select_cols(
     select: sql_nodes.SqlSelectNode, cols: Sequence[nodes.AliasedRef]
 ):
+    if _inlines_shared_expr(select, (aliased_ref.ref.id for aliased_ref in cols)):
+        return None
     new_defs = []
+    id_mapping = select.get_id_mapping()
     for aliased_ref in cols:
-        new_defs.append(
-            nodes.ColumnDef(select.get_id_mapping()[aliased_ref.ref.id], aliased_ref.id)
-        )
+        new_defs.append(nodes.ColumnDef(id_mapping[aliased_ref.ref.id], aliased_ref.id))
 
     return dataclasses.replace(select, selections=tuple(new_defs))
 
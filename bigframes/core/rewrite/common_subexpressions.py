@@ -0,0 +1,48 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+from bigframes.core import expression_factoring, nodes
+
+
+def hoist_common_subexpressions(root: nodes.BigFrameNode) -> nodes.BigFrameNode:
+    """
+    Computes subexpressions repeated within a projection once, in a new projection below it.
+    """
+    return root.bottom_up(_hoist_projection)
+
+
+def _hoist_projection(node: nodes.BigFrameNode) -> nodes.BigFrameNode:
+    if not isinstance(node, nodes.ProjectionNode):
+        return node
+
+    cdefs = tuple(nodes.ColumnDef(expr, id) for expr, id in node.assignments)
+    shared_defs, new_defs = expression_factoring.extract_common_subexpressions(cdefs)
+    if not shared_defs:
+        return node
+
+    # Shared definitions may themselves have repeated subexpressions.
+    shared = _hoist_projection(
+        nodes.ProjectionNode(
+            node.child, tuple((cdef.expression, cdef.id) for cdef in shared_defs)
+        )
+    )
+    projection = nodes.ProjectionNode(
+        shared, tuple((cdef.expression, cdef.id) for cdef in new_defs)
+    )
+    # Hide the shared columns so that the output schema is unchanged.
+    return nodes.SelectionNode(
+        projection, tuple(nodes.AliasedRef.identity(id) for id in node.ids)
+    )
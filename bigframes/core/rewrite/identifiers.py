@@ -96,11 +96,12 @@ def remap_variables(
         )
         for child in inheriting_nodes:  # inherit ref and def mappings from children
             if not child.defines_namespace:  # these nodes represent new id spaces
+                child_ids = set(child.ids)
                 local_ref_remaps.update(
                     {
                         old_id: new_id
                         for old_id, new_id in id_ref_remaps[child].items()
-                        if old_id in child.ids
+                        if old_id in child_ids
                     }
                 )
             local_ref_remaps.update(id_def_remaps[child])
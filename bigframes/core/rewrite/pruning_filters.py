@@ -0,0 +1,210 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import dataclasses
+import functools
+from typing import AbstractSet, FrozenSet, Sequence, Tuple
+
+from bigframes.core import expression as ex
+from bigframes.core import identifiers as ids
+from bigframes.core import nodes
+import bigframes.core.pruning as predicate_pruning
+import bigframes.operations as ops
+
+# Nodes that filters can always be moved below, as they neither define nor
+# change any of the values the filter could reference.
+_TRANSPARENT_NODES = (nodes.FilterNode, nodes.OrderByNode, nodes.ReversedNode)
+
+
+def push_down_pruning_filters(root: nodes.BigFrameNode) -> nodes.BigFrameNode:
+    """Moves predicates on partitioning and clustering columns down to the scans.
+
+    BigQuery only prunes partitions and clustered blocks if the predicate is
+    applied directly to the table, so predicates are moved below projections,
+    selections, window ops partitioned by the filtered columns, aggregations
+    grouped by them and the preserved side of joins. Other predicates are left
+    in place.
+    """
+    return root.bottom_up(_push_down_filter)
+
+
+def pruning_column_ids(node: nodes.BigFrameNode) -> FrozenSet[ids.ColumnId]:
+    """Returns the columns of the node that are partitioning or clustering
+    columns of a table scan, passed through unchanged."""
+    return node.reduce_up(_pruning_column_ids)
+
+
+def _push_down_filter(node: nodes.BigFrameNode) -> nodes.BigFrameNode:
+    if not isinstance(node, nodes.FilterNode):
+        return node
+    pruning_ids = pruning_column_ids(node.child)
+    if not pruning_ids:
+        return node
+
+    pushable: list[ex.Expression] = []
+    kept: list[ex.Expression] = []
+    for conjunct in _split_conjuncts(node.predicate):
+        if predicate_pruning.cluster_cols_for_predicate(conjunct, set(pruning_ids)):
+            pushable.append(conjunct)
+        else:
+            kept.append(conjunct)
+    if not pushable:
+        return node
+    pushed = _filter_below(node.child, pushable)
+    if isinstance(pushed, nodes.FilterNode) and pushed.child is node.child:
+        # Nothing could be moved.
+        return node
+    return _with_filter(pushed, kept)
+
+
+def _filter_below(
+    node: nodes.BigFrameNode, conjuncts: Sequence[ex.Expression]
+) -> nodes.BigFrameNode:
+    # Walk down iteratively, as plans can have long chains of projections.
+    path: list[Tuple[nodes.UnaryNode, Sequence[ex.Expression]]] = []
+    while conjuncts:
+        if isinstance(node, nodes.JoinNode):
+            node, conjuncts = _filter_join(node, conjuncts), ()
+            break
+        if not isinstance(node, nodes.UnaryNode):
+            break
+        below, above = _split_for_child(node, conjuncts)
+        if not below:
+            break
+        path.append((node, above))
+        node, conjuncts = node.child, below
+
+    result = _with_filter(node, conjuncts)
+    for parent, parent_conjuncts in reversed(path):
+        result = _with_filter(parent.replace_child(result), parent_conjuncts)
+    return result
+
+
+def _split_for_child(
+    node: nodes.UnaryNode, conjuncts: Sequence[ex.Expression]
+) -> Tuple[list[ex.Expression], list[ex.Expression]]:
+    """Splits conjuncts into those that can be evaluated on the child, rewritten
+    in terms of the child's columns, and those that must stay above the node."""
+    if isinstance(node, _TRANSPARENT_NODES):
+        return list(conjuncts), []
+    if isinstance(node, nodes.SelectionNode):
+        mapping = {output: ref.id for ref, output in node.input_output_pairs}
+        return [conjunct.remap_column_refs(mapping) for conjunct in conjuncts], []
+    if isinstance(node, nodes.ProjectionNode):
+        aliases = {
+            id: expr for expr, id in node.assignments if isinstance(expr, ex.DerefOp)
+        }
+        below, above = _split_by_refs(conjuncts, set(node.child.ids) | set(aliases))
+        return [
+            conjunct.bind_refs(aliases, allow_partial_bindings=True)
+            for conjunct in below
+        ], above
+    if isinstance(node, nodes.WindowOpNode):
+        # Filtering on the partitioning keys removes whole partitions, so the
+        # window values of the remaining rows are unchanged.
+        keys = {
+            key.id
+            for key in node.window_spec.grouping_keys
+            if isinstance(key, ex.DerefOp)
+        }
+        return _split_by_refs(conjuncts, keys)
+    if isinstance(node, nodes.AggregateNode):
+        return _split_by_refs(conjuncts, {ref.id for ref in node.by_column_ids})
+    return [], list(conjuncts)
+
+
+def _filter_join(
+    node: nodes.JoinNode, conjuncts: Sequence[ex.Expression]
+) -> nodes.BigFrameNode:
+    # Only the side whose rows are not null-extended can be filtered early.
+    left_ids = (
+        set(node.left_child.ids) if node.type in ("inner", "left", "cross") else set()
+    )
+    right_ids = (
+        set(node.right_child.ids) if node.type in ("inner", "right", "cross") else set()
+    )
+    to_left, rest = _split_by_refs(conjuncts, left_ids)
+    to_right, above = _split_by_refs(rest, right_ids)
+    if not to_left and not to_right:
+        return _with_filter(node, conjuncts)
+    joined = dataclasses.replace(
+        node,
+        left_child=_filter_below(node.left_child, to_left),
+        right_child=_filter_below(node.right_child, to_right),
+    )
+    return _with_filter(joined, above)
+
+
+def _split_by_refs(
+    conjuncts: Sequence[ex.Expression], available: AbstractSet[ids.ColumnId]
+) -> Tuple[list[ex.Expression], list[ex.Expression]]:
+    inside: list[ex.Expression] = []
+    outside: list[ex.Expression] = []
+    for conjunct in conjuncts:
+        if available and set(conjunct.column_references).issubset(available):
+            inside.append(conjunct)
+        else:
+            outside.append(conjunct)
+    return inside, outside
+
+
+def _split_conjuncts(predicate: ex.Expression) -> list[ex.Expression]:
+    if isinstance(predicate, ex.OpExpression) and predicate.op == ops.and_op:
+        return [
+            conjunct
+            for input in predicate.inputs
+            for conjunct in _split_conjuncts(input)
+        ]
+    return [predicate]
+
+
+def _with_filter(
+    node: nodes.BigFrameNode, conjuncts: Sequence[ex.Expression]
+) -> nodes.BigFrameNode:
+    if not conjuncts:
+        return node
+    predicate = functools.reduce(ops.and_op.as_expr, conjuncts)
+    return nodes.FilterNode(node, predicate)
+
+
+def _pruning_column_ids(
+    node: nodes.BigFrameNode, child_results: Tuple[FrozenSet[ids.ColumnId], ...]
+) -> FrozenSet[ids.ColumnId]:
+    if isinstance(node, nodes.ReadTableNode):
+        table = node.source.table
+        pruning_cols = {table.partition_col, *(table.cluster_cols or ())}
+        return frozenset(
+            item.id for item in node.scan_list.items if item.source_id in pruning_cols
+        )
+    if isinstance(node, nodes.JoinNode):
+        return child_results[0] | child_results[1]
+    if not isinstance(node, nodes.UnaryNode):
+        return frozenset()
+    (child_ids,) = child_results
+    if isinstance(node, nodes.SelectionNode):
+        return frozenset(
+            output for ref, output in node.input_output_pairs if ref.id in child_ids
+        )
+    if isinstance(node, nodes.ProjectionNode):
+        return child_ids | frozenset(
+            id
+            for expr, id in node.assignments
+            if isinstance(expr, ex.DerefOp) and expr.id in child_ids
+        )
+    if isinstance(node, nodes.AggregateNode):
+        return frozenset(ref.id for ref in node.by_column_ids) & child_ids
+    if isinstance(node, nodes.ExplodeNode):
+        return child_ids - {ref.id for ref in node.column_ids}
+    return child_ids & frozenset(node.ids)
@@ -0,0 +1,86 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import Optional
+
+import pyarrow.compute as pc
+
+from bigframes.core import expression as ex
+from bigframes.core import identifiers as ids
+from bigframes.core import nodes
+
+
+def try_semi_join(node: nodes.BigFrameNode) -> nodes.BigFrameNode:
+    """Rewrites an inner join against unique local keys as a semi-join.
+
+    When the right side of an inner join is local data with a single, unique
+    key column and nothing else, the join only checks that a match exists, so
+    it can be evaluated as an ``IN`` test that preserves the left rows. Should
+    be applied after column pruning, which removes unused right columns.
+    """
+    if not isinstance(node, nodes.JoinNode):
+        return node
+    if node.type != "inner" or len(node.conditions) != 1:
+        return node
+    ((left_ref, right_ref),) = node.conditions
+    right = node.right_child
+    if tuple(right.ids) != (right_ref.id,):
+        return node
+    if (
+        node.left_child.field_by_id[left_ref.id].dtype
+        != right.field_by_id[right_ref.id].dtype
+    ):
+        return node
+    source_col = _local_source_column(right)
+    if source_col is None:
+        return node
+    local_scan, source_id = source_col
+    keys = local_scan.local_data_source.data.column(source_id)
+    if pc.count_distinct(keys, mode="all").as_py() != len(keys):
+        return node
+
+    # The right key is a new variable in the result, so give the lookup column
+    # a fresh id and recreate the key from the matching left value.
+    lookup_id = ids.ColumnId.unique()
+    lookup = nodes.SelectionNode(right, (nodes.AliasedRef(right_ref, lookup_id),))
+    in_node = nodes.InNode(
+        node.left_child,
+        lookup,
+        left_ref,
+        indicator_col=ids.ColumnId.unique(),
+    )
+    matched = nodes.FilterNode(in_node, ex.DerefOp(in_node.indicator_col))
+    with_key = nodes.ProjectionNode(matched, ((left_ref, right_ref.id),))
+    return nodes.SelectionNode(
+        with_key, tuple(nodes.AliasedRef.identity(id) for id in node.ids)
+    )
+
+
+def _local_source_column(
+    node: nodes.BigFrameNode,
+) -> Optional[tuple[nodes.ReadLocalNode, str]]:
+    """Finds the local data column behind a single-column node, if any."""
+    (col_id,) = node.ids
+    while isinstance(node, nodes.SelectionNode):
+        col_id = next(
+            ref.id for ref, output in node.input_output_pairs if output == col_id
+        )
+        node = node.child
+    if not isinstance(node, nodes.ReadLocalNode):
+        return None
+    for item in node.scan_list.items:
+        if item.id == col_id:
+            return node, item.source_id
+    return None
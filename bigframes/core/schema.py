@@ -40,6 +40,24 @@ class ArraySchema:
     def __iter__(self):
         yield from self.items
 
+    def __hash__(self) -> int:
+        # Schemas can have thousands of items and are used as cache keys by
+        # rewrites, so avoid recomputing the hash from scratch each time.
+        return self._cached_hash
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ArraySchema):
+            return False
+        if self is other:
+            return True
+        if hash(self) != hash(other):
+            return False
+        return self.items == other.items
+
+    @functools.cached_property
+    def _cached_hash(self) -> int:
+        return hash(self.items)
+
     @classmethod
     def from_bq_schema(
         cls,
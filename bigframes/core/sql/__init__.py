@@ -29,9 +29,8 @@ from typing import (
     Union,
 )
 
-import bigframes_vendored.sqlglot.expressions as sge
-
-from bigframes.core.compile.sqlglot import sql
+# sqlglot is imported inside the functions below, since it is slow to import
+# and most sessions only need it once a query is compiled.
 
 if TYPE_CHECKING:
     import google.cloud.bigquery as bigquery
@@ -78,6 +77,8 @@ def escape_chars(value: str):
 
 
 def multi_literal(*values: Any):
+    from bigframes.core.compile.sqlglot import sql
+
     literal_strings = [sql.to_sql(sql.literal(i)) for i in values]
     return "(" + ", ".join(literal_strings) + ")"
 
@@ -85,6 +86,8 @@ def multi_literal(*values: Any):
 def cast_as_string(column_name: str) -> str:
     """Return a string representing string casting of a column."""
 
+    import bigframes_vendored.sqlglot.expressions as sge
+
     return sge.Cast(this=sge.to_identifier(column_name, quoted=True), to="STRING").sql(
         dialect="bigquery"
     )
@@ -93,6 +96,8 @@ def cast_as_string(column_name: str) -> str:
 def to_json_string(column_name: str) -> str:
     """Return a string representing JSON version of a column."""
 
+    from bigframes.core.compile.sqlglot import sql
+
     return f"TO_JSON_STRING({sql.to_sql(sql.identifier(column_name))})"
 
 
@@ -107,6 +112,8 @@ def infix_op(opname: str, left_arg: str, right_arg: str):
 
 
 def is_distinct_sql(columns: Iterable[str], table_ref: bigquery.TableReference) -> str:
+    import bigframes_vendored.sqlglot.expressions as sge
+
     table_expr = sge.Table(
         this=sge.Identifier(this=table_ref.table_id, quoted=True),
         db=sge.Identifier(this=table_ref.dataset_id, quoted=True),
@@ -169,6 +176,8 @@ def create_vector_index_ddl(
 ) -> str:
     """Encode the VECTOR INDEX statement for BigQuery Vector Search."""
 
+    from bigframes.core.compile.sqlglot import sql
+
     if replace:
         create = "CREATE OR REPLACE VECTOR INDEX "
     else:
@@ -209,6 +218,8 @@ def create_vector_search_sql(
 ) -> str:
     """Encode the VECTOR SEARCH statement for BigQuery Vector Search."""
 
+    from bigframes.core.compile.sqlglot import sql
+
     vector_search_args = [
         f"TABLE {sql.to_sql(sql.identifier(cast(str, base_table)))}",
         f"{sql.to_sql(sql.literal(column_to_search))}",
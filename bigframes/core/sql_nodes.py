@@ -30,7 +30,7 @@ import bigframes.dtypes
 
 
 # TODO: Join node, union node
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, eq=False)
 class SqlDataSource(nodes.LeafNode):
     source: bq_data.BigqueryDataSource
 
@@ -89,7 +89,7 @@ class SqlDataSource(nodes.LeafNode):
         raise NotImplementedError()  # type: ignore
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, eq=False)
 class SqlWithCtesNode(nodes.BigFrameNode):
     # def, name pairs
     child: nodes.BigFrameNode
@@ -157,7 +157,7 @@ class SqlWithCtesNode(nodes.BigFrameNode):
         )
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, eq=False)
 class SqlCteRefNode(nodes.LeafNode):
     cte_name: str
     cte_schema: tuple[nodes.Field, ...]
@@ -210,7 +210,7 @@ class SqlCteRefNode(nodes.LeafNode):
         raise NotImplementedError()  # type: ignore
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, eq=False)
 class SqlSelectNode(nodes.UnaryNode):
     selections: tuple[nodes.ColumnDef, ...] = ()
     predicates: tuple[ex.Expression, ...] = ()
@@ -272,8 +272,13 @@ class SqlSelectNode(nodes.UnaryNode):
     def is_star_selection(self) -> bool:
         return tuple(self.ids) == tuple(self.child.ids)
 
-    @functools.cache
     def get_id_mapping(self) -> dict[identifiers.ColumnId, ex.Expression]:
+        return self._id_mapping
+
+    # Cached per instance, as a shared cache keyed on the node would need a
+    # full structural comparison against equal nodes from previous plans.
+    @functools.cached_property
+    def _id_mapping(self) -> dict[identifiers.ColumnId, ex.Expression]:
         return {cdef.id: cdef.expression for cdef in self.selections}
 
     def remap_vars(
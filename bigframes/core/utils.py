@@ -249,3 +249,15 @@ def timedelta_to_micros(
         ) * 1_000_000 + timedelta.microseconds
 
     raise TypeError(f"Unrecognized input type: {type(timedelta)}")
+
+
+def resolve_exact(exact: typing.Optional[bool]) -> bool:
+    """Whether to compute an exact statistic, given a per-call ``exact`` flag.
+
+    When the flag is not set, ``bigframes.options.compute.approximate`` decides.
+    """
+    if exact is not None:
+        return exact
+    import bigframes._config
+
+    return not bigframes._config.options.compute.approximate
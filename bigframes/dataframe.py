@@ -81,6 +81,7 @@ from bigframes.core.window import rolling
 import bigframes.core.window_spec as windows
 import bigframes.dtypes
 import bigframes.exceptions as bfe
+import bigframes.features
 import bigframes.formatting_helpers as formatter
 import bigframes.functions
 from bigframes.functions import function_typing
@@ -117,6 +118,10 @@ U = TypeVar("U")
 LevelType = typing.Hashable
 LevelsType = typing.Union[LevelType, typing.Sequence[LevelType]]
 
+# corr and cov with many columns compute the pairwise statistics in aggregate
+# queries of at most this many aggregations each.
+_STAT_MATRIX_MAX_AGGREGATIONS = 5000
+
 ERROR_IO_ONLY_GS_PATHS = f"Only Google Cloud Storage (gs://...) paths are supported. {constants.FEEDBACK_LINK}"
 ERROR_IO_REQUIRES_WILDCARD = (
     "Google Cloud Storage path must contain a wildcard '*' character. See: "
@@ -1290,6 +1295,48 @@ class DataFrame:
         # Also, drop the last level of each index, which was created to guarantee uniqueness
         return DataFrame(block).droplevel(0).droplevel(-1, axis=0).droplevel(-1, axis=1)
 
+    def _blocked_stat_matrix(self, op: agg_ops.BinaryAggregateOp) -> DataFrame:
+        """Corr, cov calculations for many columns.
+
+        The input is cached once, then the statistics of each pair of columns
+        in the upper triangle are computed in a few wide aggregate queries of
+        at most _STAT_MATRIX_MAX_AGGREGATIONS aggregations each. The symmetric
+        matrix is assembled locally, rather than melting and self-joining the
+        whole table, so the result is a local DataFrame.
+        """
+        orig_columns = self.columns
+        frame = self.copy()
+        frame.columns = pandas.Index(range(len(orig_columns)))
+        # Every query reads the same columns, so only compute them once.
+        frame = frame.astype(bigframes.dtypes.FLOAT_DTYPE).cache()
+        block = frame._block
+        col_ids = block.value_columns
+
+        # Only the upper triangle is needed, as the matrix is symmetric.
+        pairs = [(i, j) for i in range(len(col_ids)) for j in range(i, len(col_ids))]
+        matrix = numpy.full((len(col_ids), len(col_ids)), numpy.nan)
+        for start in range(0, len(pairs), _STAT_MATRIX_MAX_AGGREGATIONS):
+            query_pairs = pairs[start : start + _STAT_MATRIX_MAX_AGGREGATIONS]
+            aggregations = [
+                agg_expressions.BinaryAggregation(
+                    op, ex.deref(col_ids[i]), ex.deref(col_ids[j])
+                )
+                for i, j in query_pairs
+            ]
+            query_block = block.aggregate(
+                aggregations=aggregations,
+                column_labels=pandas.Index(range(len(query_pairs))),
+            )
+            values, _ = query_block.to_pandas()
+            for (i, j), value in zip(query_pairs, values.iloc[0]):
+                if not pandas.isna(value):
+                    matrix[i, j] = matrix[j, i] = value
+
+        result = pandas.DataFrame(
+            matrix, index=orig_columns, columns=orig_columns
+        ).astype(bigframes.dtypes.FLOAT_DTYPE)
+        return DataFrame(blocks.Block.from_local(result, self._block.expr.session))
+
     def corr(self, method="pearson", min_periods=None, numeric_only=False) -> DataFrame:
         if method != "pearson":
             raise NotImplementedError(
@@ -1307,109 +1354,7 @@ class DataFrame:
 
         if len(frame.columns) <= 30:
             return frame._fast_stat_matrix(agg_ops.CorrOp())
-
-        frame = frame.copy()
-        orig_columns = frame.columns
-        # Replace column names with 0 to n - 1 to keep order
-        # and avoid the influence of duplicated column name
-        frame.columns = pandas.Index(range(len(orig_columns)))
-        frame = frame.astype(bigframes.dtypes.FLOAT_DTYPE)
-        block = frame._block
-
-        # A new column that uniquely identifies each row
-        block, ordering_col = frame._block.promote_offsets(label="_bigframes_idx")
-
-        val_col_ids = [
-            col_id for col_id in block.value_columns if col_id != ordering_col
-        ]
-
-        block = block.melt(
-            [ordering_col], val_col_ids, ["_bigframes_variable"], "_bigframes_value"
-        )
-
-        block = block.merge(
-            block,
-            left_join_ids=[ordering_col],
-            right_join_ids=[ordering_col],
-            how="inner",
-            sort=False,
-        )
-
-        frame = DataFrame(block).dropna(
-            subset=["_bigframes_value_x", "_bigframes_value_y"]
-        )
-
-        paired_mean_frame = (
-            frame.groupby(["_bigframes_variable_x", "_bigframes_variable_y"])
-            .agg(
-                _bigframes_paired_mean_x=bigframes.pandas.NamedAgg(
-                    column="_bigframes_value_x", aggfunc="mean"
-                ),
-                _bigframes_paired_mean_y=bigframes.pandas.NamedAgg(
-                    column="_bigframes_value_y", aggfunc="mean"
-                ),
-            )
-            .reset_index()
-        )
-
-        frame = frame.merge(
-            paired_mean_frame, on=["_bigframes_variable_x", "_bigframes_variable_y"]
-        )
-        frame["_bigframes_value_x"] -= frame["_bigframes_paired_mean_x"]
-        frame["_bigframes_value_y"] -= frame["_bigframes_paired_mean_y"]
-
-        frame["_bigframes_dividend"] = (
-            frame["_bigframes_value_x"] * frame["_bigframes_value_y"]
-        )
-        frame["_bigframes_x_square"] = (
-            frame["_bigframes_value_x"] * frame["_bigframes_value_x"]
-        )
-        frame["_bigframes_y_square"] = (
-            frame["_bigframes_value_y"] * frame["_bigframes_value_y"]
-        )
-
-        result = (
-            frame.groupby(["_bigframes_variable_x", "_bigframes_variable_y"])
-            .agg(
-                _bigframes_dividend_sum=bigframes.pandas.NamedAgg(
-                    column="_bigframes_dividend", aggfunc="sum"
-                ),
-                _bigframes_x_square_sum=bigframes.pandas.NamedAgg(
-                    column="_bigframes_x_square", aggfunc="sum"
-                ),
-                _bigframes_y_square_sum=bigframes.pandas.NamedAgg(
-                    column="_bigframes_y_square", aggfunc="sum"
-                ),
-            )
-            .reset_index()
-        )
-        result["_bigframes_corr"] = result["_bigframes_dividend_sum"] / (
-            (
-                result["_bigframes_x_square_sum"] * result["_bigframes_y_square_sum"]
-            )._apply_unary_op(ops.sqrt_op)
-        )
-        result = result._pivot(
-            index="_bigframes_variable_x",
-            columns="_bigframes_variable_y",
-            values="_bigframes_corr",
-        )
-
-        map_data = {
-            f"_bigframes_level_{i}": orig_columns.get_level_values(i)
-            for i in range(orig_columns.nlevels)
-        }
-        map_data["_bigframes_keys"] = range(len(orig_columns))
-        map_df = bigframes.dataframe.DataFrame(
-            map_data,
-            session=self._get_block().expr.session,
-        ).set_index("_bigframes_keys")
-        result = result.join(map_df).sort_index()
-        index_columns = [f"_bigframes_level_{i}" for i in range(orig_columns.nlevels)]
-        result = result.set_index(index_columns)
-        result.index.names = orig_columns.names
-        result.columns = orig_columns
-
-        return result
+        return frame._blocked_stat_matrix(agg_ops.CorrOp())
 
     def cov(self, *, numeric_only: bool = False) -> DataFrame:
         if not numeric_only:
@@ -1419,97 +1364,7 @@ class DataFrame:
 
         if len(frame.columns) <= 30:
             return frame._fast_stat_matrix(agg_ops.CovOp())
-
-        frame = frame.copy()
-        orig_columns = frame.columns
-        # Replace column names with 0 to n - 1 to keep order
-        # and avoid the influence of duplicated column name
-        frame.columns = pandas.Index(range(len(orig_columns)))
-        frame = frame.astype(bigframes.dtypes.FLOAT_DTYPE)
-        block = frame._block
-
-        # A new column that uniquely identifies each row
-        block, ordering_col = frame._block.promote_offsets(label="_bigframes_idx")
-
-        val_col_ids = [
-            col_id for col_id in block.value_columns if col_id != ordering_col
-        ]
-
-        block = block.melt(
-            [ordering_col], val_col_ids, ["_bigframes_variable"], "_bigframes_value"
-        )
-        block = block.merge(
-            block,
-            left_join_ids=[ordering_col],
-            right_join_ids=[ordering_col],
-            how="inner",
-            sort=False,
-        )
-
-        frame = DataFrame(block).dropna(
-            subset=["_bigframes_value_x", "_bigframes_value_y"]
-        )
-
-        paired_mean_frame = (
-            frame.groupby(["_bigframes_variable_x", "_bigframes_variable_y"])
-            .agg(
-                _bigframes_paired_mean_x=bigframes.pandas.NamedAgg(
-                    column="_bigframes_value_x", aggfunc="mean"
-                ),
-                _bigframes_paired_mean_y=bigframes.pandas.NamedAgg(
-                    column="_bigframes_value_y", aggfunc="mean"
-                ),
-            )
-            .reset_index()
-        )
-
-        frame = frame.merge(
-            paired_mean_frame, on=["_bigframes_variable_x", "_bigframes_variable_y"]
-        )
-        frame["_bigframes_value_x"] -= frame["_bigframes_paired_mean_x"]
-        frame["_bigframes_value_y"] -= frame["_bigframes_paired_mean_y"]
-
-        frame["_bigframes_dividend"] = (
-            frame["_bigframes_value_x"] * frame["_bigframes_value_y"]
-        )
-
-        result = (
-            frame.groupby(["_bigframes_variable_x", "_bigframes_variable_y"])
-            .agg(
-                _bigframes_dividend_sum=bigframes.pandas.NamedAgg(
-                    column="_bigframes_dividend", aggfunc="sum"
-                ),
-                _bigframes_dividend_count=bigframes.pandas.NamedAgg(
-                    column="_bigframes_dividend", aggfunc="count"
-                ),
-            )
-            .reset_index()
-        )
-        result["_bigframes_cov"] = result["_bigframes_dividend_sum"] / (
-            result["_bigframes_dividend_count"] - 1
-        )
-        result = result._pivot(
-            index="_bigframes_variable_x",
-            columns="_bigframes_variable_y",
-            values="_bigframes_cov",
-        )
-
-        map_data = {
-            f"_bigframes_level_{i}": orig_columns.get_level_values(i)
-            for i in range(orig_columns.nlevels)
-        }
-        map_data["_bigframes_keys"] = range(len(orig_columns))
-        map_df = bigframes.dataframe.DataFrame(
-            map_data,
-            session=self._get_block().expr.session,
-        ).set_index("_bigframes_keys")
-        result = result.join(map_df).sort_index()
-        index_columns = [f"_bigframes_level_{i}" for i in range(orig_columns.nlevels)]
-        result = result.set_index(index_columns)
-        result.index.names = orig_columns.names
-        result.columns = orig_columns
-
-        return result
+        return frame._blocked_stat_matrix(agg_ops.CovOp())
 
     def corrwith(
         self,
@@ -3042,14 +2897,14 @@ class DataFrame:
         return bigframes.series.Series(block)
 
     def median(
-        self, *, numeric_only: bool = False, exact: bool = True
+        self, *, numeric_only: bool = False, exact: Optional[bool] = None
     ) -> bigframes.series.Series:
         if not numeric_only:
             frame = self._raise_on_non_numeric("median")
         else:
             frame = self._drop_non_numeric()
-        if exact:
-            result = frame.quantile()
+        if utils.resolve_exact(exact):
+            result = frame.quantile(exact=True)
             result.name = None
             return result
         else:
@@ -3057,7 +2912,11 @@ class DataFrame:
             return bigframes.series.Series(block)
 
     def quantile(
-        self, q: Union[float, Sequence[float]] = 0.5, *, numeric_only: bool = False
+        self,
+        q: Union[float, Sequence[float]] = 0.5,
+        *,
+        numeric_only: bool = False,
+        exact: Optional[bool] = None,
     ):
         if not numeric_only:
             frame = self._raise_on_non_numeric("median")
@@ -3065,7 +2924,10 @@ class DataFrame:
             frame = self._drop_non_numeric()
         multi_q = utils.is_list_like(q)
         result = block_ops.quantile(
-            frame._block, frame._block.value_columns, qs=tuple(q) if multi_q else (q,)  # type: ignore
+            frame._block,
+            frame._block.value_columns,
+            qs=tuple(q) if multi_q else (q,),  # type: ignore
+            exact=utils.resolve_exact(exact),
         )
         if multi_q:
             return DataFrame(result.stack()).droplevel(0)
@@ -3138,8 +3000,13 @@ class DataFrame:
         block = frame._block.aggregate_all_and_stack(agg_ops.count_op)
         return bigframes.series.Series(block)
 
-    def nunique(self) -> bigframes.series.Series:
-        block = self._block.aggregate_all_and_stack(agg_ops.nunique_op)
+    def nunique(self, *, exact: Optional[bool] = None) -> bigframes.series.Series:
+        op = (
+            agg_ops.nunique_op
+            if utils.resolve_exact(exact)
+            else agg_ops.approx_nunique_op
+        )
+        block = self._block.aggregate_all_and_stack(op)
         return bigframes.series.Series(block)
 
     def agg(self, func) -> DataFrame | bigframes.series.Series:
@@ -4662,12 +4529,24 @@ class DataFrame:
         return array_value, id_overrides
 
     def map(self, func, na_action: Optional[str] = None) -> DataFrame:
-        if not isinstance(func, bigframes.functions.BigqueryCallableRoutine):
-            raise TypeError("the first argument must be callable")
-
         if na_action not in {None, "ignore"}:
             raise ValueError(f"na_action={na_action} not supported")
 
+        if not isinstance(func, bigframes.functions.BigqueryCallableRoutine):
+            if not callable(func) or not self._block.is_local_only:
+                raise TypeError("the first argument must be callable")
+            # The data is already in memory, so run the function in process.
+            pd_df = self.to_pandas()
+            pd_na_action = typing.cast(Optional[Literal["ignore"]], na_action)
+            if bigframes.features.PANDAS_VERSIONS.is_dataframe_map_usable:
+                pd_result = pd_df.map(func, na_action=pd_na_action)
+            else:
+                # DataFrame.map was added in pandas 2.1, replacing applymap.
+                pd_result = pd_df.applymap(  # type: ignore[operator]
+                    func, na_action=pd_na_action
+                )
+            return DataFrame(pd_result, session=self._session)
+
         # TODO(shobs): Support **kwargs
         return self._apply_unary_op(
             ops.RemoteFunctionOp(
@@ -4693,9 +4572,15 @@ class DataFrame:
                     bigframes.functions.BigqueryCallableRowRoutine,
                 ),
             ):
-                raise ValueError(
-                    "For axis=1 a BigFrames BigQuery function must be used."
-                )
+                if not callable(func) or not self._block.is_local_only:
+                    raise ValueError(
+                        "For axis=1 a BigFrames BigQuery function must be used."
+                    )
+                # The data is already in memory, so run the function in process.
+                local_result = self.to_pandas().apply(func, axis=1, args=args, **kwargs)
+                if isinstance(local_result, pandas.DataFrame):
+                    return DataFrame(local_result, session=self._session)
+                return bigframes.series.Series(local_result, session=self._session)
 
             if func.is_row_processor:
                 # Early check whether the dataframe dtypes are currently supported
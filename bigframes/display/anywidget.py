@@ -16,12 +16,15 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import dataclasses
 from importlib import resources
 import functools
 import math
+import sys
 import threading
-from typing import Any, Iterator, Optional
+from typing import Any, Optional
 import uuid
 import warnings
 
@@ -52,12 +55,36 @@ else:
     _WIDGET_BASE = object
 
 
+# Number of fetched pages kept in memory, across page sizes and sort orders.
+_MAX_CACHED_PAGES = 16
+
+# Planning a query in a background thread while the kernel plans another one
+# can deadlock before Python 3.12, where each functools.cached_property holds
+# a lock shared by all instances. Adjacent pages are only prefetched on 3.12+.
+_PREFETCH_ENABLED = sys.version_info >= (3, 12)
+
+
 @dataclasses.dataclass(frozen=True)
 class _SortState:
     columns: tuple[str, ...]
     ascending: tuple[bool, ...]
 
 
+@dataclasses.dataclass(frozen=True)
+class _PageKey:
+    sort_state: _SortState
+    start: int
+    stop: int
+
+
+@dataclasses.dataclass
+class _PageSource:
+    """Random access to the rows of the DataFrame in one sort order."""
+
+    block: blocks.Block
+    row_count: Optional[int]
+
+
 class TableWidget(_WIDGET_BASE):
     """An interactive, paginated table widget for BigFrames DataFrames.
 
@@ -73,7 +100,6 @@ class TableWidget(_WIDGET_BASE):
     sort_context = traitlets.List(traitlets.Dict(), default_value=[]).tag(sync=True)
     orderable_columns = traitlets.List(traitlets.Unicode(), []).tag(sync=True)
     _initial_load_complete = traitlets.Bool(False).tag(sync=True)
-    _batches: Optional[blocks.PandasBatches] = None
     _error_message = traitlets.Unicode(allow_none=True, default_value=None).tag(
         sync=True
     )
@@ -96,12 +122,18 @@ class TableWidget(_WIDGET_BASE):
 
         # Initialize attributes that might be needed by observers first
         self._table_id = str(uuid.uuid4())
-        self._all_data_loaded = False
-        self._batch_iter: Optional[Iterator[pd.DataFrame]] = None
-        self._cached_batches: list[pd.DataFrame] = []
+        self._sources: dict[_SortState, _PageSource] = {}
+        self._pages: collections.OrderedDict[
+            _PageKey, pd.DataFrame
+        ] = collections.OrderedDict()
+        self._prefetches: dict[_PageKey, concurrent.futures.Future] = {}
+        self._prefetch_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._page_data: Optional[pd.DataFrame] = None
         self._last_sort_state: Optional[_SortState] = None
         # Lock to ensure only one thread at a time is updating the table HTML.
         self._setting_html_lock = threading.Lock()
+        # Guards the page cache, which is also filled by background prefetches.
+        self._pages_lock = threading.Lock()
 
         # respect display options for initial page size
         initial_page_size = bigframes.options.display.max_rows
@@ -140,26 +172,19 @@ class TableWidget(_WIDGET_BASE):
 
     def _initial_load(self) -> None:
         """Get initial data and row count."""
-        # obtain the row counts
-        # TODO(b/428238610): Start iterating over the result of `to_pandas_batches()`
-        # before we get here so that the count might already be cached.
         with bigframes.option_context("display.progress_bar", None):
-            self._reset_batches_for_new_page_size()
-
-            if self._batches is None:
+            try:
+                source = self._get_page_source(_SortState((), ()))
+            except Exception as e:
                 self._error_message = (
-                    "Could not retrieve data batches. Data might be unavailable or "
-                    "an error occurred."
+                    "Could not retrieve data. Data might be unavailable or "
+                    f"an error occurred: {e}"
                 )
                 self.row_count = None
-            elif self._batches.total_rows is None:
-                # Total rows is unknown, this is an expected state.
-                # TODO(b/461536343): Cheaply discover if we have exactly 1 page.
-                # There are cases where total rows is not set, but there are no additional
-                # pages. We could disable the "next" button in these cases.
-                self.row_count = None
             else:
-                self.row_count = self._batches.total_rows
+                # Total rows can be unknown, this is an expected state. It is
+                # counted once the user navigates past the end of the data.
+                self.row_count = source.row_count
 
             # get the initial page
             self._set_table_html()
@@ -241,54 +266,85 @@ class TableWidget(_WIDGET_BASE):
             return 0  # Normalize None to 0 for traitlet
         return max(0, value)
 
-    def _get_next_batch(self) -> bool:
-        """
-        Gets the next batch of data from the generator and appends to cache.
+    def _get_page_source(self, sort_state: _SortState) -> _PageSource:
+        """Gets the rows of the DataFrame in the given sort order.
 
-        Returns:
-            True if a batch was successfully loaded, False otherwise.
+        Each sort order is cached once to a table clustered by row offsets, so
+        that every page can be read directly, without re-running the query.
+        Sorted orders are computed from the cache of the unsorted DataFrame.
         """
-        if self._all_data_loaded:
-            return False
-
-        try:
-            iterator = self._batch_iterator
-            batch = next(iterator)
-            self._cached_batches.append(batch)
-            return True
-        except StopIteration:
-            self._all_data_loaded = True
-            return False
+        source = self._sources.get(sort_state)
+        if source is None:
+            df = self._dataframe
+            if sort_state.columns:
+                # TODO(b/463715504): Support sorting by index columns.
+                df = df.sort_values(
+                    by=list(sort_state.columns), ascending=list(sort_state.ascending)
+                )
+            block = df._block
+            source = _PageSource(block, block.cached_for_paging())
+            self._sources[sort_state] = source
+        return source
+
+    def _get_page(self, key: _PageKey) -> pd.DataFrame:
+        """Gets a page from the cache, a pending prefetch, or BigQuery."""
+        with self._pages_lock:
+            page = self._pages.get(key)
+            if page is not None:
+                self._pages.move_to_end(key)
+                return page
+            prefetch = self._prefetches.pop(key, None)
+
+        if prefetch is not None:
+            page = prefetch.result()
+        else:
+            page = self._fetch_page(key)
+        self._store_page(key, page)
+        return page
+
+    def _fetch_page(self, key: _PageKey) -> pd.DataFrame:
+        source = self._get_page_source(key.sort_state)
+        return source.block.retrieve_rows(key.start, key.stop)
+
+    def _store_page(self, key: _PageKey, page: pd.DataFrame) -> None:
+        with self._pages_lock:
+            self._pages[key] = page
+            self._pages.move_to_end(key)
+            while len(self._pages) > _MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+
+    def _prefetch_adjacent_pages(self, key: _PageKey) -> None:
+        """Starts fetching the previous and next pages in the background."""
+        if not _PREFETCH_ENABLED:
+            return
+        page_size = key.stop - key.start
+        row_count = self._get_page_source(key.sort_state).row_count
+        for start in (key.start - page_size, key.stop):
+            if start < 0 or (row_count is not None and start >= row_count):
+                continue
+            adjacent_key = _PageKey(key.sort_state, start, start + page_size)
+            with self._pages_lock:
+                if adjacent_key in self._pages or adjacent_key in self._prefetches:
+                    continue
+                if self._prefetch_pool is None:
+                    self._prefetch_pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="bigframes-table-widget"
+                    )
+                self._prefetches[adjacent_key] = self._prefetch_pool.submit(
+                    self._prefetch_page, adjacent_key
+                )
 
-    @property
-    def _batch_iterator(self) -> Iterator[pd.DataFrame]:
-        """Lazily initializes and returns the batch iterator."""
-        if self._batch_iter is None:
-            if self._batches is None:
-                self._batch_iter = iter([])
-            else:
-                self._batch_iter = iter(self._batches)
-        return self._batch_iter
+    def _prefetch_page(self, key: _PageKey) -> pd.DataFrame:
+        # Options are thread-local, so they are set again for the worker.
+        with bigframes.option_context("display.progress_bar", None):
+            return self._fetch_page(key)
 
     @property
     def _cached_data(self) -> pd.DataFrame:
-        """Combine all cached batches into a single DataFrame."""
-        if not self._cached_batches:
+        """The data of the page currently displayed."""
+        if self._page_data is None:
             return pd.DataFrame(columns=self._dataframe.columns)
-        return pd.concat(self._cached_batches)
-
-    def _reset_batch_cache(self) -> None:
-        """Resets batch caching attributes."""
-        self._cached_batches = []
-        self._batch_iter = None
-        self._all_data_loaded = False
-
-    def _reset_batches_for_new_page_size(self) -> None:
-        """Reset the batch iterator when page size changes."""
-        with bigframes.option_context("display.progress_bar", None):
-            self._batches = self._dataframe.to_pandas_batches(page_size=self.page_size)
-
-        self._reset_batch_cache()
+        return self._page_data
 
     def _set_table_html(self) -> None:
         """Sets the current html data based on the current page and page size."""
@@ -303,52 +359,33 @@ class TableWidget(_WIDGET_BASE):
                 )
                 return
 
-            # Apply sorting if a column is selected
-            df_to_display = self._dataframe
             sort_columns = [item["column"] for item in self.sort_context]
             sort_ascending = [item["ascending"] for item in self.sort_context]
-
-            if sort_columns:
-                # TODO(b/463715504): Support sorting by index columns.
-                df_to_display = df_to_display.sort_values(
-                    by=sort_columns, ascending=sort_ascending
-                )
-
-            # Reset batches when sorting changes
             current_sort_state = _SortState(tuple(sort_columns), tuple(sort_ascending))
+
+            # Go back to the first page when sorting changes
             if self._last_sort_state != current_sort_state:
-                self._batches = df_to_display.to_pandas_batches(
-                    page_size=self.page_size
-                )
-                self._reset_batch_cache()
+                self._get_page_source(current_sort_state)
                 self._last_sort_state = current_sort_state
                 if self.page != 0:
-                    new_page = 0  # Reset to first page
+                    new_page = 0
 
             if new_page is None:
                 start = self.page * self.page_size
                 end = start + self.page_size
-
-                # fetch more data if the requested page is outside our cache
-                cached_data = self._cached_data
-                while len(cached_data) < end and not self._all_data_loaded:
-                    if self._get_next_batch():
-                        cached_data = self._cached_data
-                    else:
-                        break
-
-                # Get the data for the current page
-                page_data = cached_data.iloc[start:end].copy()
+                page_key = _PageKey(current_sort_state, start, end)
+                page = self._get_page(page_key)
+                page_data = page.copy()
 
                 # Handle case where user navigated beyond available data with unknown row count
-                is_unknown_count = self.row_count is None
-                is_beyond_data = (
-                    self._all_data_loaded and len(page_data) == 0 and self.page > 0
-                )
-                if is_unknown_count and is_beyond_data:
+                if self.row_count is None and len(page_data) == 0 and self.page > 0:
+                    source = self._get_page_source(current_sort_state)
+                    source.row_count = source.block.shape[0]
+                    self.row_count = source.row_count
                     # Calculate the last valid page (zero-indexed)
-                    total_rows = len(cached_data)
-                    last_valid_page = max(0, math.ceil(total_rows / self.page_size) - 1)
+                    last_valid_page = max(
+                        0, math.ceil(source.row_count / self.page_size) - 1
+                    )
                     if self.page != last_valid_page:
                         new_page = last_valid_page
 
@@ -376,6 +413,8 @@ class TableWidget(_WIDGET_BASE):
                     orderable_columns=self.orderable_columns,
                     max_columns=self.max_columns,
                 )
+                self._page_data = page
+                self._prefetch_adjacent_pages(page_key)
 
         if new_page is not None:
             # Navigate to the new page. This triggers the observer, which will
@@ -404,9 +443,6 @@ class TableWidget(_WIDGET_BASE):
         # Reset the sort state to default (no sort)
         self.sort_context = []
 
-        # Reset batches to use new page size for future data fetching
-        self._reset_batches_for_new_page_size()
-
         # Update the table display
         self._set_table_html()
 
@@ -75,6 +75,18 @@ class MaximumResultRowsExceeded(RuntimeError):
     """Maximum number of rows in the result was exceeded."""
 
 
+class MaximumBytesEstimatedExceeded(RuntimeError):
+    """A query was estimated to process more bytes than allowed."""
+
+
+class MaximumBytesEstimatedWarning(Warning):
+    """A query was estimated to process more bytes than allowed, but was run anyway."""
+
+
+class PartitionFilterWarning(Warning):
+    """A query reads a table that requires a partition filter without one."""
+
+
 class TimeTravelDisabledWarning(Warning):
     """A query was reattempted without time travel."""
 
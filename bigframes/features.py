@@ -38,5 +38,11 @@ class PandasVersions:
         version = self.installed_version
         return version[0] != "1"
 
+    @property
+    def is_dataframe_map_usable(self):
+        """True if pandas.DataFrame.map is usable, which replaced applymap in 2.1."""
+        major, minor = self.installed_version[:2]
+        return (int(major), int(minor)) >= (2, 1)
+
 
 PANDAS_VERSIONS = PandasVersions()
@@ -0,0 +1,167 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In process emulation of remote and managed functions."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import concurrent.futures.process
+import functools
+import multiprocessing
+import threading
+from typing import Any, Callable, List, Optional, Sequence
+
+import cloudpickle
+import pandas as pd
+import pyarrow as pa
+
+import bigframes.dtypes
+from bigframes.functions import udf_def
+
+# Same as the pandas dtypes of the arguments of vectorized remote functions.
+_PANDAS_DTYPES = {
+    pa.bool_(): pd.BooleanDtype(),
+    pa.int64(): pd.Int64Dtype(),
+    pa.float64(): pd.Float64Dtype(),
+    pa.string(): pd.StringDtype(),
+}
+
+
+# Starting worker processes is slow, so one pool is shared by all the calls.
+_process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            # Forking is not safe from the threads of the query engine.
+            _process_pool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: concurrent.futures.ProcessPoolExecutor):
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False)
+
+
+def call_udf(
+    function_def: udf_def.BigqueryUdf,
+    columns: Sequence[pa.Array],
+    *,
+    apply_on_null: bool = True,
+) -> pa.Array:
+    """Calls an emulated function with a column per argument.
+
+    As in BigQuery, the rows are split into batches of at most
+    ``max_batching_rows`` rows, which are processed concurrently in a pool of
+    threads or processes. The pool of processes is started once and reused.
+
+    Returns:
+        pyarrow.Array: The result for each row.
+    """
+    local = function_def.local
+    if local is None:
+        raise ValueError(
+            f"Function {function_def.routine_ref} is not emulated in process."
+        )
+    signature = function_def.signature
+    columns = [
+        column.cast(bigframes.dtypes.bigframes_dtype_to_arrow_dtype(arg.bf_type))
+        for column, arg in zip(columns, signature.inputs)
+    ]
+    output_type = bigframes.dtypes.bigframes_dtype_to_arrow_dtype(
+        signature.output.bf_type
+    )
+
+    num_rows = len(columns[0]) if columns else 0
+    batches = [
+        [column.slice(start, local.max_batching_rows) for column in columns]
+        for start in range(0, num_rows, local.max_batching_rows)
+    ]
+    if len(batches) <= 1:
+        # Not worth starting a pool.
+        return pa.concat_arrays(
+            [
+                _call_batch(
+                    local.code.pickled_code,
+                    local.vectorized,
+                    apply_on_null,
+                    output_type,
+                    batch,
+                )
+                for batch in batches
+            ]
+            or [pa.array([], type=output_type)]
+        )
+
+    call_batch = functools.partial(
+        _call_batch,
+        local.code.pickled_code,
+        local.vectorized,
+        apply_on_null,
+        output_type,
+    )
+    if local.pool == "process":
+        process_pool = _get_process_pool()
+        try:
+            return pa.concat_arrays(list(process_pool.map(call_batch, batches)))
+        except concurrent.futures.process.BrokenProcessPool:
+            # A worker died, start a new pool for the next calls.
+            _discard_process_pool(process_pool)
+            raise
+
+    with concurrent.futures.ThreadPoolExecutor() as thread_pool:
+        return pa.concat_arrays(list(thread_pool.map(call_batch, batches)))
+
+
+@functools.lru_cache(maxsize=16)
+def _load(pickled_code: bytes) -> Callable:
+    return cloudpickle.loads(pickled_code)
+
+
+def _call_batch(
+    pickled_code: bytes,
+    vectorized: bool,
+    apply_on_null: bool,
+    output_type: pa.DataType,
+    batch: List[pa.Array],
+) -> pa.Array:
+    func = _load(pickled_code)
+    num_rows = len(batch[0])
+
+    if vectorized:
+        args = [column.to_pandas(types_mapper=_PANDAS_DTYPES.get) for column in batch]
+        result = func(*args)
+        if len(result) != num_rows:
+            raise ValueError(
+                f"Expected {num_rows} results from the vectorized function, "
+                f"got {len(result)}."
+            )
+        return pa.array(result, type=output_type, from_pandas=True)
+
+    results: List[Any] = []
+    for row in zip(*(column.to_pylist() for column in batch)):
+        if not apply_on_null and any(value is None for value in row):
+            results.append(None)
+        else:
+            results.append(func(*row))
+    return pa.array(results, type=output_type)
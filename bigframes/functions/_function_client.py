@@ -245,7 +245,7 @@ class FunctionClient:
         # requirements.
         packages = _utils.get_updated_package_requirements(
             config.code.package_requirements or [],
-            config.signature.is_row_processor,
+            config.signature.is_row_processor or config.vectorized,
             config.capture_references,
             ignore_package_version=True,
         )
@@ -278,7 +278,10 @@ class FunctionClient:
         # including the user's function, necessary imports, and the BigQuery
         # handler wrapper.
         python_code_block = bff_template.generate_managed_function_code(
-            config.code, config.signature, config.capture_references
+            config.code,
+            config.signature,
+            config.capture_references,
+            vectorized=config.vectorized,
         )
 
         create_function_ddl = (
@@ -337,6 +340,7 @@ class FunctionClient:
         directory,
         *,
         udf_signature: udf_def.UdfSignature,
+        vectorized: bool = False,
     ):
         """Generate the cloud function code for a given user defined function."""
 
@@ -351,6 +355,7 @@ class FunctionClient:
             code_def,
             directory,
             udf_signature=udf_signature,
+            vectorized=vectorized,
         )
         return entry_point
 
@@ -383,6 +388,7 @@ class FunctionClient:
                 config.code,
                 directory,
                 udf_signature=config.signature,
+                vectorized=config.vectorized,
             )
             archive_path = shutil.make_archive(directory, "zip", directory)
 
@@ -566,12 +572,14 @@ class FunctionClient:
         cloud_function_cpus: float | None,
         cloud_function_ingress_settings: str,
         bq_connection_id: str,
+        vectorized: bool = False,
     ):
         """Provision a BigQuery remote function."""
         # Augment user package requirements with any internal package
-        # requirements
+        # requirements. The vectorized handler needs pandas, like the row
+        # processor.
         full_package_requirements = _utils.get_updated_package_requirements(
-            package_requirements, func_signature.is_row_processor
+            package_requirements, func_signature.is_row_processor or vectorized
         )
 
         if cloud_function_memory_mib is None:
@@ -603,6 +611,7 @@ class FunctionClient:
             workers=workers,
             threads=threads,
             concurrency=concurrency,
+            vectorized=vectorized,
         )
 
         # If reuse of any existing function with the same name (indicated by the
@@ -16,18 +16,22 @@
 from __future__ import annotations
 
 import collections.abc
+import concurrent.futures
 import functools
 import inspect
 import sys
 import threading
 from typing import (
     Any,
+    Callable,
     cast,
     Dict,
+    List,
     Literal,
     Mapping,
     Optional,
     Sequence,
+    Tuple,
     TYPE_CHECKING,
     Union,
 )
@@ -64,6 +68,11 @@ class FunctionSession:
         # Lock to synchronize the update of the session artifacts
         self._artifacts_lock = threading.Lock()
 
+        # Session level mapping of deployed functions, keyed by a hash of their
+        # definition. Deployments in progress are shared through the futures.
+        self._deployments: Dict[str, concurrent.futures.Future[str]] = dict()
+        self._deployments_lock = threading.Lock()
+
     def _resolve_session(self, session: Optional[Session]) -> Session:
         """Resolves the BigFrames session."""
         import bigframes.pandas as bpd
@@ -192,6 +201,36 @@ class FunctionSession:
         with self._artifacts_lock:
             self._temp_artifacts[bqrf_routine] = gcf_path
 
+    def _deploy_once(self, key: str, deploy: Callable[[], str]) -> str:
+        """Deploys a function at most once per session.
+
+        Concurrent callers with the same key wait for the deployment in
+        progress instead of starting their own. A failed deployment is not
+        remembered, so that it can be retried.
+
+        Returns:
+            str: The name returned by ``deploy``.
+        """
+        with self._deployments_lock:
+            future = self._deployments.get(key)
+            is_owner = future is None
+            if future is None:
+                future = concurrent.futures.Future()
+                self._deployments[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            name = deploy()
+        except BaseException as e:
+            with self._deployments_lock:
+                del self._deployments[key]
+            future.set_exception(e)
+            raise
+        future.set_result(name)
+        return name
+
     def clean_up(
         self,
         bqclient: bigquery.Client,
@@ -215,6 +254,76 @@ class FunctionSession:
 
             self._temp_artifacts.clear()
 
+        with self._deployments_lock:
+            self._deployments.clear()
+
+    def _emulated_function(
+        self,
+        session: Session,
+        *,
+        input_types: Union[None, type, Sequence[type]],
+        output_type: Optional[type],
+        max_batching_rows: int,
+        vectorized: bool,
+        is_managed: bool,
+    ):
+        """Returns a decorator wrapping functions emulated in process.
+
+        Nothing is deployed, the functions are called locally when queries
+        using them are executed.
+        """
+
+        def wrapper(func):
+            if not callable(func):
+                raise bf_formatting.create_exception_with_feedback_link(
+                    TypeError, f"func must be a callable, got {func}"
+                )
+
+            if sys.version_info >= (3, 10):
+                signature_kwargs: Mapping[str, Any] = {"eval_str": True}
+            else:
+                signature_kwargs = {}  # type: ignore
+
+            py_sig = _resolve_signature(
+                inspect.signature(func, **signature_kwargs), input_types, output_type
+            )
+            udf_sig = udf_def.UdfSignature.from_py_signature(py_sig)
+            if not is_managed:
+                udf_sig = udf_sig.to_remote_function_compatible()
+
+            if udf_sig.is_row_processor:
+                raise bf_formatting.create_exception_with_feedback_link(
+                    NotImplementedError,
+                    "Functions taking a Series as input can't be emulated in process.",
+                )
+
+            code = udf_def.CodeDef.from_func(func)
+            local = udf_def.LocalUdfDef(
+                code=code,
+                max_batching_rows=max_batching_rows,
+                vectorized=vectorized,
+                pool=session._udf_emulation or "thread",
+            )
+            # The routine doesn't exist, the name only identifies the function.
+            function_hash = (code.stable_hash() + udf_sig.stable_hash()).hex()
+            udf_definition = udf_def.BigqueryUdf(
+                routine_ref=bigquery.RoutineReference.from_string(
+                    f"{session._project}._bigframes_local.bigframes_local_{function_hash}"
+                ),
+                signature=udf_sig,
+                local=local,
+            )
+            return functools.wraps(func)(
+                bq_functions.BigqueryCallableRoutine(
+                    udf_definition,
+                    session,
+                    local_func=func,
+                    is_managed=is_managed,
+                )
+            )
+
+        return wrapper
+
     # Inspired by @udf decorator implemented in ibis-bigquery package
     # https://github.com/ibis-project/ibis-bigquery/blob/main/ibis_bigquery/udf/__init__.py
     # which has moved as @js to the ibis package
@@ -252,6 +361,7 @@ class FunctionSession:
             "all", "internal-only", "internal-and-gclb"
         ] = "internal-only",
         cloud_build_service_account: Optional[str] = None,
+        vectorized: bool = False,
     ):
         """Decorator to turn a user defined function into a BigQuery remote function.
 
@@ -463,10 +573,30 @@ class FunctionSession:
                 service account is used. See
                 https://cloud.google.com/build/docs/cloud-build-service-account
                 for more details.
+            vectorized (bool, Optional):
+                Whether the function processes a batch of rows at a time.
+                Defaults to False, in which case the function is called once
+                per row. If True, the function is called once per request that
+                BigQuery sends to the cloud function, with a pandas Series per
+                argument, holding the values of all the rows of the batch, and
+                must return a list-like of the same length with the result for
+                each row. This avoids the per row Python overhead for functions
+                that can be expressed with vectorized pandas or numpy
+                operations. Not supported with ``input_types=Series``.
         """
         # Some defaults may be used from the session if not provided otherwise.
         session = self._resolve_session(session)
 
+        if session._udf_emulation is not None:
+            return self._emulated_function(
+                session,
+                input_types=input_types,
+                output_type=output_type,
+                max_batching_rows=max_batching_rows or 1000,
+                vectorized=vectorized,
+                is_managed=False,
+            )
+
         # If the user forces the cloud function service argument to None, throw
         # an exception
         if cloud_function_service_account is None:
@@ -579,6 +709,12 @@ class FunctionSession:
                 py_sig
             ).to_remote_function_compatible()
 
+            if vectorized and udf_sig.is_row_processor:
+                raise bf_formatting.create_exception_with_feedback_link(
+                    ValueError,
+                    "vectorized=True is not supported for functions taking a Series as input.",
+                )
+
             (
                 rf_name,
                 cf_name,
@@ -598,6 +734,7 @@ class FunctionSession:
                 cloud_function_cpus=cloud_function_cpus,
                 cloud_function_ingress_settings=cloud_function_ingress_settings,
                 bq_connection_id=bq_connection_id,
+                vectorized=vectorized,
             )
 
             bigframes_cloud_function = (
@@ -628,6 +765,7 @@ class FunctionSession:
                 signature=udf_sig,
             )
             decorator = functools.wraps(func)
+            assert session is not None  # appease mypy
             if udf_sig.is_row_processor:
                 msg = bfe.format_message("input_types=Series is in preview.")
                 warnings.warn(msg, stacklevel=1, category=bfe.PreviewWarning)
@@ -677,6 +815,64 @@ class FunctionSession:
         # this method to deploy immediately.
         return self.remote_function(**kwargs)(func)
 
+    def deploy_remote_functions(
+        self,
+        funcs: Union[Sequence[Callable], Mapping[str, Callable]],
+        *,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[concurrent.futures.Future]:
+        """Starts deploying several BigQuery remote functions concurrently.
+
+        The clients, dataset and connection are resolved once for all the
+        functions, and the connection permissions are checked once. The cloud
+        functions are then packaged and deployed in parallel in the background.
+
+        Args:
+            funcs:
+                Functions to deploy, or a mapping of names to functions to
+                deploy them as persistent functions with these names.
+            max_workers:
+                Maximum number of functions deployed at the same time. Deploys
+                all of them at once by default.
+            kwargs:
+                All other arguments are passed directly to
+                :meth:`~bigframes.session.Session.remote_function`.
+
+        Returns:
+            List[concurrent.futures.Future]: A future per function, in order,
+                resolving to the wrapped remote function, usable in
+                :meth:`~bigframes.series.Series.apply`. Only ``result()``
+                waits for the deployment.
+        """
+        if "name" in kwargs:
+            raise bf_formatting.create_exception_with_feedback_link(
+                ValueError,
+                "Pass a mapping of names to functions to name the deployed functions.",
+            )
+        if isinstance(funcs, collections.abc.Mapping):
+            named_funcs: List[Tuple[Optional[str], Callable]] = list(funcs.items())
+        else:
+            named_funcs = [(None, func) for func in funcs]
+
+        # Resolving the arguments is cheap and raises on invalid ones right
+        # away, the deployments happen in the wrappers.
+        wrappers = [
+            self.remote_function(name=name, **kwargs) for name, _ in named_funcs
+        ]
+
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers or max(len(named_funcs), 1),
+            thread_name_prefix="bigframes-deploy",
+        )
+        futures = [
+            pool.submit(wrapper, func)
+            for wrapper, (_, func) in zip(wrappers, named_funcs)
+        ]
+        # Let the deployments finish in the background.
+        pool.shutdown(wait=False)
+        return futures
+
     def udf(
         self,
         input_types: Union[None, type, Sequence[type]] = None,
@@ -690,6 +886,7 @@ class FunctionSession:
         max_batching_rows: Optional[int] = None,
         container_cpu: Optional[float] = None,
         container_memory: Optional[str] = None,
+        vectorized: bool = False,
     ):
         """Decorator to turn a Python user defined function (udf) into a
         BigQuery managed function.
@@ -772,6 +969,16 @@ class FunctionSession:
                 default, the memory allocated to each container instance is
                 512 MiB. See details at
                 https://cloud.google.com/bigquery/docs/user-defined-functions-python#configure-container-limits.
+            vectorized (bool, Optional):
+                Whether the udf processes a batch of rows at a time. Defaults
+                to False, in which case the udf is called once per row. If
+                True, the udf is called once per batch with a pandas Series per
+                argument, holding the values of all the rows of the batch, and
+                must return a pandas Series, pyarrow Array or list of the same
+                length with the result for each row. This avoids the per row
+                Python overhead for udfs that can be expressed with vectorized
+                pandas or numpy operations. Not supported with
+                ``input_types=Series``.
         """
 
         warnings.warn("udf is in preview.", category=bfe.PreviewWarning, stacklevel=5)
@@ -779,6 +986,16 @@ class FunctionSession:
         # Some defaults may be used from the session if not provided otherwise.
         session = self._resolve_session(session)
 
+        if session._udf_emulation is not None:
+            return self._emulated_function(
+                session,
+                input_types=input_types,
+                output_type=output_type,
+                max_batching_rows=max_batching_rows or 1000,
+                vectorized=vectorized,
+                is_managed=True,
+            )
+
         # A BigQuery client is required to perform BQ operations.
         bigquery_client = self._resolve_bigquery_client(session, bigquery_client)
 
@@ -827,6 +1044,12 @@ class FunctionSession:
 
             udf_sig = udf_def.UdfSignature.from_py_signature(py_sig)
 
+            if vectorized and udf_sig.is_row_processor:
+                raise bf_formatting.create_exception_with_feedback_link(
+                    ValueError,
+                    "vectorized=True is not supported for functions taking a Series as input.",
+                )
+
             managed_function_client = _function_client.FunctionClient(
                 dataset_ref.project,
                 bq_location,
@@ -843,6 +1066,7 @@ class FunctionSession:
                 container_memory=container_memory,
                 bq_connection_id=bq_connection_id,
                 capture_references=False,
+                vectorized=vectorized,
             )
 
             bq_function_name = managed_function_client.provision_bq_managed_function(
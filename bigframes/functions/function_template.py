@@ -19,6 +19,7 @@ import logging
 import os
 import re
 import textwrap
+from typing import Any, Callable
 
 from bigframes.functions import udf_def
 
@@ -128,6 +129,51 @@ def get_pd_series(row):
     return row_series
 
 
+# get_pd_columns converts a batch of calls into one pandas Series per argument,
+# for the vectorized handler. The values of each argument are converted at
+# once by pyarrow, rather than one by one.
+def get_pd_columns(input_types, calls):
+    import pandas as pd
+    import pyarrow as pa
+
+    arrow_types = {
+        "BOOL": pa.bool_(),
+        "INT64": pa.int64(),
+        "FLOAT64": pa.float64(),
+        "STRING": pa.string(),
+    }
+    dtypes = {
+        pa.bool_(): pd.BooleanDtype(),
+        pa.int64(): pd.Int64Dtype(),
+        pa.float64(): pd.Float64Dtype(),
+        pa.string(): pd.StringDtype(),
+    }
+    # BigQuery may send large integers and the special float values (NaN,
+    # Infinity, -Infinity) as json strings.
+    converters = {"INT64": int, "FLOAT64": float}
+
+    columns = []
+    for i, type_ in enumerate(input_types):
+        values = [call[i] for call in calls]
+        arrow_type = arrow_types.get(type_)
+        if arrow_type is None:
+            values = [convert_from_bq_json(type_, value) for value in values]
+            columns.append(pd.Series(values, dtype="object"))
+            continue
+        try:
+            array = pa.array(values, type=arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            if type_ not in converters:
+                raise
+            converter = converters[type_]
+            values = [
+                converter(value) if value is not None else None for value in values
+            ]
+            array = pa.array(values, type=arrow_type)
+        columns.append(array.to_pandas(types_mapper=dtypes.get))
+    return columns
+
+
 def udf(*args):
     """Dummy function to use as a placeholder for function code in templates."""
     pass
@@ -222,6 +268,68 @@ def udf_http_row_processor(request):
         return jsonify({"errorMessage": traceback.format_exc()}), 400
 
 
+# The vectorized handler calls the udf once per request with the whole batch
+# of rows, i.e. one pandas Series per argument, e.g. for the request above
+#   foo(pd.Series([123, 456]), pd.Series(["hello", "world"]))
+# The udf must return a list-like of the same length, one reply per row.
+def udf_http_vectorized(request):
+    global input_types, output_type
+    import json
+    import math
+    import traceback
+
+    from flask import jsonify
+    import pandas as pd
+    import pyarrow as pa
+
+    try:
+        request_json = request.get_json(silent=True)
+        calls = request_json["calls"]
+        result = udf(*get_pd_columns(input_types, calls))
+        if not isinstance(result, pd.Series):
+            result = pd.Series(list(result), dtype="object")
+        if len(result) != len(calls):
+            raise ValueError(
+                f"Expected {len(calls)} results from the vectorized function, "
+                f"got {len(result)}."
+            )
+
+        try:
+            # Converts numpy and pandas values, including N/A values, to their
+            # Python equivalents at once.
+            replies = pa.array(result, from_pandas=True).to_pylist()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            replies = [
+                None
+                if type(reply) is not list and pd.isna(reply)
+                else (reply.item() if hasattr(reply, "item") else reply)
+                for reply in result
+            ]
+
+        if output_type == "FLOAT64":
+            # Json serialization of the special float values (nan, inf, -inf)
+            # is not in strict compliance of the JSON specification, so return
+            # their quoted string representation, which is handled by BigQuery.
+            replies = [
+                json.dumps(reply)
+                if isinstance(reply, float) and (math.isnan(reply) or math.isinf(reply))
+                else reply
+                for reply in replies
+            ]
+        elif output_type == "BYTES":
+            replies = [convert_to_bq_json(output_type, reply) for reply in replies]
+        elif any(type(reply) is list for reply in replies):
+            # Since the BQ remote function does not support array yet,
+            # return a json serialized version of the reply.
+            replies = [
+                json.dumps(reply) if type(reply) is list else reply for reply in replies
+            ]
+        return_json = json.dumps({"replies": replies})
+        return return_json
+    except Exception:
+        return jsonify({"errorMessage": traceback.format_exc()}), 400
+
+
 def generate_udf_code(code_def: udf_def.CodeDef, directory: str):
     """Generate serialized code using cloudpickle given a udf."""
     udf_code_file_name = "udf.py"
@@ -247,8 +355,13 @@ def generate_cloud_function_main_code(
     directory: str,
     *,
     udf_signature: udf_def.UdfSignature,
+    vectorized: bool = False,
 ):
-    """Get main.py code for the cloud function for the given user defined function."""
+    """Get main.py code for the cloud function for the given user defined function.
+
+    If ``vectorized`` is True, the function is called once per request with
+    a pandas Series per argument, instead of once per row.
+    """
 
     # Pickle the udf with all its dependencies
     udf_code_file, udf_pickle_file = generate_udf_code(code_def, directory)
@@ -273,7 +386,12 @@ output_type = {repr(output_type)}
     # For converting scalar outputs to the correct type.
     code_blocks.append(inspect.getsource(convert_to_bq_json))
 
-    if udf_signature.is_row_processor:
+    if vectorized:
+        code_blocks.append(inspect.getsource(convert_from_bq_json))
+        code_blocks.append(inspect.getsource(get_pd_columns))
+        handler_func_name = "udf_http_vectorized"
+        code_blocks.append(inspect.getsource(udf_http_vectorized))
+    elif udf_signature.is_row_processor:
         code_blocks.append(inspect.getsource(get_pd_series))
         handler_func_name = "udf_http_row_processor"
         code_blocks.append(inspect.getsource(udf_http_row_processor))
@@ -295,8 +413,14 @@ def generate_managed_function_code(
     code_def: udf_def.CodeDef,
     signature: udf_def.UdfSignature,
     capture_references: bool,
+    vectorized: bool = False,
 ) -> str:
-    """Generates the Python code block for managed Python UDF."""
+    """Generates the Python code block for managed Python UDF.
+
+    If ``vectorized`` is True, the handler is a vectorized Python UDF, which
+    BigQuery calls once per batch with a pandas DataFrame holding a column per
+    argument. The udf is called with a pandas Series per argument instead.
+    """
 
     udf_name = "unpickled_udf"
     if capture_references:
@@ -354,6 +478,19 @@ def generate_managed_function_code(
             """
         )
 
+    elif vectorized:
+        udf_code = ""
+        # BigQuery recognizes vectorized UDFs by the pandas DataFrame
+        # annotation of the handler argument.
+        bigframes_handler_code = textwrap.dedent(
+            f"""
+            import pandas as pd
+
+            def bigframes_handler(df: pd.DataFrame):
+                return {udf_name}(*(df[column] for column in df.columns))
+            """
+        )
+
     else:
         udf_code = ""
         bigframes_handler_code = textwrap.dedent(
@@ -376,3 +513,23 @@ def generate_managed_function_code(
     udf_code_block.append(bigframes_handler_code)
 
     return textwrap.dedent("\n".join(udf_code_block))
+
+
+def load_managed_function_handler(
+    code_def: udf_def.CodeDef,
+    signature: udf_def.UdfSignature,
+    capture_references: bool,
+    vectorized: bool = False,
+) -> Callable:
+    """Loads the handler of a managed Python UDF, to run it locally.
+
+    This executes the same code block as generated for BigQuery, so the
+    handler takes the arguments BigQuery passes to the managed function, i.e.
+    the values of a row, or a pandas DataFrame for a vectorized UDF.
+    """
+    code = generate_managed_function_code(
+        code_def, signature, capture_references, vectorized=vectorized
+    )
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)
+    return namespace["bigframes_handler"]
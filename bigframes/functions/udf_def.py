@@ -19,7 +19,7 @@ import inspect
 import io
 import os
 import textwrap
-from typing import Any, cast, get_args, get_origin, Optional, Sequence, Type
+from typing import Any, cast, get_args, get_origin, Literal, Optional, Sequence, Type
 import warnings
 
 import cloudpickle
@@ -377,6 +377,8 @@ class BigqueryUdf:
 
     routine_ref: bigquery.RoutineReference = dataclasses.field()
     signature: UdfSignature
+    # Set for functions emulated in process, which are not deployed.
+    local: Optional[LocalUdfDef] = None
 
     def with_devirtualize(self) -> BigqueryUdf:
         if not self.signature.is_virtual:
@@ -384,6 +386,7 @@ class BigqueryUdf:
         return BigqueryUdf(
             routine_ref=self.routine_ref,
             signature=self.signature.with_devirtualize(),
+            local=self.local,
         )
 
     @classmethod
@@ -456,6 +459,20 @@ class CodeDef:
         return hash_val.digest()
 
 
+@dataclasses.dataclass(frozen=True)
+class LocalUdfDef:
+    """
+    Represents the information needed to emulate a function in process.
+    """
+
+    code: CodeDef
+    # Rows are passed to the function in batches of at most this many rows.
+    max_batching_rows: int
+    vectorized: bool = False
+    # Whether batches are processed in a pool of threads or processes.
+    pool: Literal["thread", "process"] = "thread"
+
+
 @dataclasses.dataclass(frozen=True)
 class ManagedFunctionConfig:
     code: CodeDef
@@ -467,6 +484,7 @@ class ManagedFunctionConfig:
     # capture_refernces=True -> deploy as cloudpickle
     # capture_references=False -> deploy as source
     capture_references: bool = False
+    vectorized: bool = False
 
     def stable_hash(self) -> bytes:
         hash_val = google_crc32c.Checksum()
@@ -477,6 +495,9 @@ class ManagedFunctionConfig:
         hash_val.update(str(self.container_memory).encode())
         hash_val.update(str(self.bq_connection_id).encode())
         hash_val.update(str(self.capture_references).encode())
+        if self.vectorized:
+            # Only hashed when set, to keep the names of existing functions.
+            hash_val.update(b"vectorized")
         return hash_val.digest()
 
 
@@ -494,6 +515,7 @@ class CloudRunFunctionConfig:
     workers: int | None
     threads: int | None
     concurrency: int | None
+    vectorized: bool = False
 
     def stable_hash(self) -> bytes:
         hash_val = google_crc32c.Checksum()
@@ -509,6 +531,9 @@ class CloudRunFunctionConfig:
         hash_val.update(str(self.workers).encode())
         hash_val.update(str(self.threads).encode())
         hash_val.update(str(self.concurrency).encode())
+        if self.vectorized:
+            # Only hashed when set, to keep the names of existing functions.
+            hash_val.update(b"vectorized")
         return hash_val.digest()
 
 
@@ -0,0 +1,321 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Chunked and throttled execution of model calls on large inputs."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import datetime
+import hashlib
+import json
+import sys
+import threading
+import time
+import typing
+from typing import Callable, List, Optional, Sequence, TypeVar
+import warnings
+
+import google.api_core.exceptions
+from google.cloud import bigquery
+
+from bigframes import constants
+from bigframes import exceptions as bfe
+from bigframes import option_context, options
+import bigframes.session._io.bigquery as bf_io_bigquery
+
+if typing.TYPE_CHECKING:
+    import bigframes.dataframe
+    import bigframes.session
+
+_CHECKPOINT_INDEX_PREFIX = "bigframes_index_"
+
+T = TypeVar("T")
+
+# Building plans in several threads at once can deadlock before Python 3.12,
+# where each functools.cached_property holds a lock shared by all instances.
+# Chunks only run concurrently on 3.12+.
+_CONCURRENT_CHUNKS = sys.version_info >= (3, 12)
+
+
+class TokenBucket:
+    """Limits the rate of the rows sent to a model.
+
+    Up to ``capacity`` rows can be sent at once, and the bucket refills at
+    ``rows_per_second``. Set an instance as
+    ``bigframes.options.compute.ai_ops_rate_limiter`` to throttle the chunks of
+    AI functions. Any object with an ``acquire(rows)`` method can be used
+    instead.
+
+    **Examples:**
+
+        >>> import bigframes.pandas as bpd
+        >>> from bigframes.ml import llm
+        >>> bpd.options.compute.ai_ops_rate_limiter = llm.TokenBucket(rows_per_second=100)  # doctest: +SKIP
+
+    Args:
+        rows_per_second (float):
+            Sustained number of rows per second.
+        capacity (float, optional):
+            Maximum number of rows sent at once. Defaults to ``rows_per_second``.
+    """
+
+    def __init__(self, rows_per_second: float, capacity: Optional[float] = None):
+        if rows_per_second <= 0:
+            raise ValueError(
+                f"rows_per_second must be positive, got {rows_per_second}."
+            )
+        self._rate = rows_per_second
+        self._capacity = capacity if capacity is not None else rows_per_second
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, rows: int = 1):
+        """Blocks until ``rows`` rows can be sent."""
+        # Requests larger than the bucket wait for a full bucket, and the
+        # excess is paid back before the next request, to keep the rate.
+        needed = min(rows, self._capacity)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= rows
+                    return
+                wait = (needed - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+def predict_in_chunks(
+    predict: Callable[[bigframes.dataframe.DataFrame], bigframes.dataframe.DataFrame],
+    X: bigframes.dataframe.DataFrame,
+    *,
+    status_col: str,
+    max_retries: int,
+    identity: str,
+    chunk_rows: int,
+    ignore_index: bool = False,
+) -> bigframes.dataframe.DataFrame:
+    """Calls ``predict`` on chunks of at most ``chunk_rows`` rows of ``X``.
+
+    Chunks are split by row offsets and run as concurrent jobs, at most
+    ``bigframes.options.compute.ai_ops_chunk_concurrency`` at a time on Python
+    3.12+ and one at a time before, after acquiring their rows from
+    ``bigframes.options.compute.ai_ops_rate_limiter`` if set. Rows of a chunk with a non empty ``status_col`` are retried, up to
+    ``max_retries`` times. If ``bigframes.options.compute.ai_ops_cache_dataset``
+    is set, the result of each chunk without failed rows is stored in a table
+    in that dataset as soon as it completes, and reused when the same input is
+    predicted again with the same ``identity`` and ``chunk_rows``, so that
+    interrupted runs resume. The input is identified by its plan without the
+    snapshot time, so inputs read from query results, which are stored in a
+    new table every time, don't resume. The tables expire a week after they
+    are written. The chunks run with the compute options of the caller.
+
+    Set ``ignore_index`` if ``predict`` doesn't keep the index of its input,
+    so that the results of different chunks don't share labels.
+
+    Returns:
+        bigframes.dataframe.DataFrame: The results of all the chunks, in
+            order.
+    """
+    from bigframes.core.reshape.api import concat
+
+    cache_dataset = options.compute.ai_ops_cache_dataset
+    rate_limiter = options.compute.ai_ops_rate_limiter
+    index_names = list(X.index.names)
+    if cache_dataset is None:
+        X = X.cache()
+    row_count = len(X)
+    starts = range(0, row_count, chunk_rows)
+    if not starts:
+        return predict(X)
+
+    table_ids: List[Optional[str]] = [None] * len(starts)
+    if cache_dataset is not None:
+        # The snapshot time and column ids of the input change in every
+        # session, so they are left out of the identity of its chunks. The
+        # chunk size and row count decide which rows each chunk holds.
+        identity = json.dumps(
+            [
+                identity,
+                X._block.snapshot_independent_sql(),
+                list(X.columns),
+                chunk_rows,
+                row_count,
+            ],
+            default=str,
+        )
+        digest = hashlib.sha256(identity.encode()).hexdigest()[:16]
+        table_ids = [
+            f"{cache_dataset}.ai_ops_chunk_{digest}_{chunk_index}"
+            for chunk_index in range(len(starts))
+        ]
+
+    def read_chunk(
+        table_id: Optional[str],
+    ) -> Optional[bigframes.dataframe.DataFrame]:
+        if table_id is None:
+            return None
+        return _read_checkpoint(X._session, table_id, index_names)
+
+    def run_chunk(start: int, table_id: Optional[str]) -> bigframes.dataframe.DataFrame:
+        chunk = X.iloc[start : start + chunk_rows]
+        result = _predict_and_retry(
+            predict,
+            chunk,
+            rows=min(chunk_rows, row_count - start),
+            status_col=status_col,
+            max_retries=max_retries,
+            rate_limiter=rate_limiter,
+        )
+        # Failed rows are predicted again when the run is resumed.
+        if table_id is not None and not _has_failures(result, status_col):
+            _write_checkpoint(result, table_id)
+        return result
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=(
+            options.compute.ai_ops_chunk_concurrency if _CONCURRENT_CHUNKS else 1
+        )
+    ) as pool:
+        results = list(pool.map(_with_compute_options(read_chunk), table_ids))
+        missing = [i for i, result in enumerate(results) if result is None]
+        if missing:
+            # Only the chunks that weren't stored by an earlier run need the
+            # input.
+            X = X.cache()
+            futures = {
+                i: pool.submit(
+                    _with_compute_options(run_chunk), starts[i], table_ids[i]
+                )
+                for i in missing
+            }
+            for i, future in futures.items():
+                results[i] = future.result()
+
+    chunks = typing.cast(List["bigframes.dataframe.DataFrame"], results)
+    return typing.cast(
+        "bigframes.dataframe.DataFrame", concat(chunks, ignore_index=ignore_index)
+    )
+
+
+def _with_compute_options(func: Callable[..., T]) -> Callable[..., T]:
+    """Runs ``func`` with the compute options of the calling thread.
+
+    Options are thread-local, so chunks run in a pool would otherwise lose
+    limits like ``maximum_bytes_billed`` and labels like
+    ``extra_query_labels``.
+    """
+    compute = options.compute
+    settings = [
+        item
+        for field in dataclasses.fields(compute)
+        for item in (f"compute.{field.name}", getattr(compute, field.name))
+    ]
+
+    def wrapper(*args):
+        with option_context(*settings):
+            return func(*args)
+
+    return wrapper
+
+
+def _has_failures(result: bigframes.dataframe.DataFrame, status_col: str) -> bool:
+    return bool((result[status_col].str.len() > 0).any())
+
+
+def _predict_and_retry(
+    predict: Callable[[bigframes.dataframe.DataFrame], bigframes.dataframe.DataFrame],
+    chunk: bigframes.dataframe.DataFrame,
+    *,
+    rows: int,
+    status_col: str,
+    max_retries: int,
+    rate_limiter,
+) -> bigframes.dataframe.DataFrame:
+    """Predicts a chunk, retrying only the rows that failed."""
+    from bigframes.core.reshape.api import concat
+
+    succeeded: List[bigframes.dataframe.DataFrame] = []
+    pending = chunk
+    for attempt in range(max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire(rows)
+        df = predict(pending)
+        success = df[status_col].str.len() == 0
+        succeeded.append(df[success])
+        pending = df[~success]
+
+        if attempt == max_retries:
+            break
+        rows = len(pending)
+        if rows == 0:
+            break
+        if len(succeeded[-1]) == 0:
+            msg = bfe.format_message("Can't make any progress, stop retrying.")
+            warnings.warn(msg, category=RuntimeWarning)
+            break
+        # Only the failed rows are sent again, without the output columns.
+        pending = pending[list(chunk.columns)]
+
+    return typing.cast(
+        "bigframes.dataframe.DataFrame", concat([*succeeded, pending]).cache()
+    )
+
+
+def _read_checkpoint(
+    session: bigframes.session.Session,
+    table_id: str,
+    index_names: Sequence[Optional[str]],
+) -> Optional[bigframes.dataframe.DataFrame]:
+    try:
+        table = session.bqclient.get_table(table_id)
+    except google.api_core.exceptions.NotFound:
+        return None
+    # The result of a chunk doesn't always have the index of the input, so
+    # the index levels are read from the table.
+    index_cols = sorted(
+        (
+            field.name
+            for field in table.schema
+            if field.name.startswith(_CHECKPOINT_INDEX_PREFIX)
+        ),
+        key=lambda name: int(name[len(_CHECKPOINT_INDEX_PREFIX) :]),
+    )
+    result = session.read_gbq_table(table_id, index_col=index_cols, use_cache=False)
+    if not index_cols:
+        return result
+    if len(index_cols) == len(index_names):
+        result.index.names = list(index_names)
+    else:
+        result.index.names = [None] * len(index_cols)
+    return result
+
+
+def _write_checkpoint(result: bigframes.dataframe.DataFrame, table_id: str):
+    checkpoint = result.copy()
+    checkpoint.index.names = [
+        f"{_CHECKPOINT_INDEX_PREFIX}{i}" for i in range(checkpoint.index.nlevels)
+    ]
+    table_id = checkpoint.to_gbq(table_id, index=True, if_exists="replace")
+    bf_io_bigquery.set_table_expiration(
+        result._session.bqclient,
+        bigquery.TableReference.from_string(table_id),
+        datetime.datetime.now(datetime.timezone.utc) + constants.DEFAULT_EXPIRATION,
+    )
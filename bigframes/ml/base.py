@@ -24,15 +24,17 @@ This library is an evolving attempt to:
 """
 
 import abc
+import json
 import typing
 from typing import Optional, TypeVar, Union
 import warnings
 
 import bigframes_vendored.sklearn.base
 
+from bigframes import options as bf_options
 from bigframes._tools import docs
 import bigframes.exceptions as bfe
-from bigframes.ml import core
+from bigframes.ml import _chunking, core
 import bigframes.ml.utils as utils
 import bigframes.pandas as bpd
 
@@ -269,6 +271,22 @@ class RetriableRemotePredictor(BaseEstimator):
     ) -> bpd.DataFrame:
         assert self._bqml_model is not None
 
+        chunk_rows = bf_options.compute.ai_ops_chunk_rows
+        if chunk_rows is not None:
+            bqml_model = self._bqml_model
+            return _chunking.predict_in_chunks(
+                lambda chunk: bqml_model_predict_tvf.tvf(bqml_model, chunk, options),
+                X,
+                status_col=bqml_model_predict_tvf.status_col,
+                max_retries=max_retries,
+                identity=json.dumps(
+                    [bqml_model.model_name, bqml_model_predict_tvf.status_col, options],
+                    sort_keys=True,
+                    default=str,
+                ),
+                chunk_rows=chunk_rows,
+            )
+
         df_result: Union[bpd.DataFrame, None] = None  # placeholder
         df_succ = df_fail = X
         for i in range(max_retries + 1):
@@ -29,6 +29,7 @@ from bigframes.core import blocks, global_session
 from bigframes.core.logging import log_adapter
 import bigframes.dataframe
 from bigframes.ml import base, core, globals, utils
+from bigframes.ml._chunking import TokenBucket
 import bigframes.series
 
 _BQML_PARAMS_MAPPING = {
@@ -0,0 +1,237 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deduplication and caching of the model calls made by the AI and semantic
+operators."""
+
+from __future__ import annotations
+
+import datetime
+import hashlib
+import json
+import typing
+from typing import Any, List, Mapping, Optional, Sequence
+
+import google.api_core.exceptions
+from google.cloud import bigquery
+
+from bigframes import constants, dtypes, options
+import bigframes.operations as ops
+import bigframes.session._io.bigquery as bf_io_bigquery
+
+if typing.TYPE_CHECKING:
+    import bigframes.dataframe
+    import bigframes.series
+
+_KEY_COL = "bigframes_prompt_key"
+_DEFAULT_OUTPUT_COL = "ml_generate_text_llm_result"
+# Status columns of the model outputs, empty if the call succeeded.
+_STATUS_COLS = ("ml_generate_text_status", "ml_generate_embedding_status", "status")
+
+
+def predict_unique_prompts(
+    model,
+    prompts: bigframes.series.Series,
+    *,
+    output_schema: Optional[Mapping[str, str]] = None,
+    output_columns: Optional[Sequence[str]] = None,
+    **params: Any,
+) -> bigframes.dataframe.DataFrame:
+    """Calls ``model.predict`` once per distinct prompt.
+
+    Rows that render to the same prompt share the model answer, which is read
+    from ``output_columns``, the ``output_schema`` columns or the generated
+    text column, in this order. If
+    ``bigframes.options.compute.ai_ops_cache_dataset`` is set, answers are also
+    stored in and reused from a table in that dataset, so only prompts that
+    have not been answered before with the same model and parameters are sent
+    to the model. Failed calls are not stored, so they are sent again later.
+
+    Returns:
+        bigframes.dataframe.DataFrame: The output columns, with the index of
+            ``prompts``.
+    """
+    if output_columns is not None:
+        output_cols = list(output_columns)
+    elif output_schema:
+        output_cols = list(output_schema)
+    else:
+        output_cols = [_DEFAULT_OUTPUT_COL]
+    if output_schema:
+        params = {**params, "output_schema": output_schema}
+
+    cache_dataset = options.compute.ai_ops_cache_dataset
+    if cache_dataset is None:
+        keys = prompts.rename(_KEY_COL)
+        unique_prompts = keys.drop_duplicates()
+        answers = model.predict(unique_prompts.rename(prompts.name), **params)
+        lookup = answers[output_cols].assign(**{_KEY_COL: unique_prompts})
+    else:
+        lookup, keys = _cached_lookup(
+            model, prompts, cache_dataset, output_cols, params
+        )
+
+    rows = keys.to_frame().join(lookup.set_index(_KEY_COL), on=_KEY_COL)
+    return rows[output_cols]
+
+
+def _cached_lookup(
+    model,
+    prompts: bigframes.series.Series,
+    cache_dataset: str,
+    output_cols: List[str],
+    params: Mapping[str, Any],
+):
+    from bigframes.core.reshape.api import concat
+
+    session = prompts._session
+    # The key only depends on the prompt, model and parameters, so it is
+    # computed in BigQuery rather than downloading the prompts.
+    key_prefix = _key_prefix(model, params)
+    hash_op = ops.SqlScalarOp(
+        _output_type=dtypes.STRING_DTYPE,
+        sql_template=f"TO_HEX(SHA256(CONCAT('{key_prefix}', {{0}})))",
+    )
+    keys = prompts._apply_nary_op(hash_op, []).rename(_KEY_COL)
+    unique = (
+        concat([keys, prompts.rename("prompt")], axis=1)
+        .drop_duplicates(subset=[_KEY_COL])
+        .cache()
+    )
+    table_id = f"{cache_dataset}.ai_ops_cache_{_table_digest(output_cols, params)}"
+
+    try:
+        session.bqclient.get_table(table_id)
+    except google.api_core.exceptions.NotFound:
+        cached = None
+        misses = unique
+    else:
+        table = session.read_gbq_table(
+            table_id, columns=[_KEY_COL, *output_cols], use_cache=False
+        )
+        cached = table[table[_KEY_COL].isin(unique[_KEY_COL])]
+        # Concurrent runs can store the same prompt more than once.
+        cached = cached.drop_duplicates(subset=[_KEY_COL])
+        misses = unique[~unique[_KEY_COL].isin(cached[_KEY_COL])]
+
+    unique_count = len(unique)
+    miss_count = len(misses) if cached is not None else unique_count
+    session._metrics.ai_prompt_cache_hits += unique_count - miss_count
+    session._metrics.ai_prompt_cache_misses += miss_count
+    if miss_count == 0:
+        assert cached is not None
+        return cached, keys
+
+    answers = model.predict(misses["prompt"], **params)
+    new_entries = answers[output_cols].assign(**{_KEY_COL: misses[_KEY_COL]})
+    new_entries = new_entries[[_KEY_COL, *output_cols]].cache()
+    _succeeded(new_entries, answers).to_gbq(table_id, if_exists="append", index=False)
+
+    lookup = (
+        new_entries
+        if cached is None
+        else concat([cached, new_entries], ignore_index=True)
+    )
+    return lookup, keys
+
+
+def _succeeded(
+    entries: bigframes.dataframe.DataFrame, answers: bigframes.dataframe.DataFrame
+) -> bigframes.dataframe.DataFrame:
+    """The entries of the calls that succeeded, which are the only ones stored.
+
+    Failed calls have a NULL result and a non empty status. Not storing them
+    lets later runs retry them.
+    """
+    status_col = next((col for col in _STATUS_COLS if col in answers.columns), None)
+    if status_col is None:
+        return entries
+    return entries[answers[status_col].str.len() == 0]
+
+
+def _key_prefix(model, params: Mapping[str, Any]) -> str:
+    """A digest of the model endpoint and generation parameters."""
+    identity = json.dumps(
+        {"endpoint": model.model_name, "params": params},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(identity.encode()).hexdigest()
+
+
+def _table_digest(output_cols: Sequence[str], params: Mapping[str, Any]) -> str:
+    """Answers with different output columns are stored in different tables."""
+    schema = json.dumps(
+        [list(output_cols), params.get("output_schema")], sort_keys=True
+    )
+    return hashlib.sha256(schema.encode()).hexdigest()[:16]
+
+
+def write_vector_table(
+    df: bigframes.dataframe.DataFrame,
+    embedding_column: str,
+    model,
+    *,
+    source: bigframes.dataframe.DataFrame,
+    row_count: int,
+) -> str:
+    """Writes embeddings to a table to search with ``VECTOR_SEARCH``.
+
+    Without ``bigframes.options.compute.ai_ops_cache_dataset``, this is a
+    temporary table. Otherwise, the table is kept in that dataset, named after
+    the model and the plan of the embedded ``source`` data, without its
+    snapshot time. Its contents are replaced in place, which keeps the vector
+    index on it, and it expires a week after the last write. The index is
+    created once the table has at least
+    ``bigframes.options.compute.ai_ops_vector_index_min_rows`` rows.
+
+    Returns:
+        str: The ID of the table.
+    """
+    cache_dataset = options.compute.ai_ops_cache_dataset
+    if cache_dataset is None:
+        return df.to_gbq()
+
+    import bigframes.bigquery as bbq
+
+    # The snapshot time changes in every session, so it is left out of the
+    # name, to keep reusing the table and its index for the same data.
+    identity = json.dumps(
+        [
+            model.model_name,
+            embedding_column,
+            source._block.snapshot_independent_sql(),
+        ]
+    )
+    digest = hashlib.sha256(identity.encode()).hexdigest()[:16]
+    table_id = df.to_gbq(
+        f"{cache_dataset}.ai_ops_vectors_{digest}", if_exists="replace"
+    )
+    bf_io_bigquery.set_table_expiration(
+        df._session.bqclient,
+        bigquery.TableReference.from_string(table_id),
+        datetime.datetime.now(datetime.timezone.utc) + constants.DEFAULT_EXPIRATION,
+    )
+
+    min_rows = options.compute.ai_ops_vector_index_min_rows
+    if min_rows is not None and row_count >= min_rows:
+        # VECTOR_SEARCH only uses indexes with a matching distance type, and
+        # the AI operators search with the default euclidean distance.
+        bbq.create_vector_index(
+            table_id,
+            embedding_column,
+            distance_type="euclidean",
+            session=df._session,
+        )
+    return table_id
@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import abc
 import dataclasses
+import fractions
 import typing
 from typing import Callable, ClassVar, Iterable, Optional, TYPE_CHECKING
 
@@ -267,6 +268,30 @@ class ApproxQuartilesOp(UnaryAggregateOp):
         return False
 
 
+@dataclasses.dataclass(frozen=True)
+class ApproxQuantileOp(UnaryAggregateOp):
+    q: float
+
+    @property
+    def name(self):
+        return f"{int(self.q * 100)}%"
+
+    @property
+    def quantiles_and_offset(self) -> typing.Tuple[int, int]:
+        """The number of quantiles to compute and the offset of q among them."""
+        fraction = fractions.Fraction(self.q).limit_denominator(1000)
+        return fraction.denominator, fraction.numerator
+
+    def output_type(self, *input_types: dtypes.ExpressionType) -> dtypes.ExpressionType:
+        if not dtypes.is_orderable(input_types[0]):
+            raise TypeError(f"Type {input_types[0]} is not orderable")
+        return input_types[0]
+
+    @property
+    def can_be_windowized(self):
+        return False
+
+
 @dataclasses.dataclass(frozen=True)
 class ApproxTopCountOp(UnaryAggregateOp):
     name: typing.ClassVar[str] = "approx_top_count"
@@ -494,6 +519,61 @@ class NuniqueOp(UnaryAggregateOp):
         return dtypes.INT_DTYPE
 
 
+@dataclasses.dataclass(frozen=True)
+class ApproxNuniqueOp(UnaryAggregateOp):
+    name: ClassVar[str] = "nunique"
+
+    @property
+    def skips_nulls(self):
+        return False
+
+    def output_type(self, *input_types: dtypes.ExpressionType) -> dtypes.ExpressionType:
+        return dtypes.INT_DTYPE
+
+    @property
+    def can_be_windowized(self):
+        return False
+
+
+@dataclasses.dataclass(frozen=True)
+class HllCountInitOp(UnaryAggregateOp):
+    """Builds a HyperLogLog++ sketch of the distinct values of the input."""
+
+    name: ClassVar[str] = "hll_count_init"
+    precision: int = 15
+
+    def output_type(self, *input_types: dtypes.ExpressionType) -> dtypes.ExpressionType:
+        if input_types[0] not in (
+            dtypes.INT_DTYPE,
+            dtypes.NUMERIC_DTYPE,
+            dtypes.BIGNUMERIC_DTYPE,
+            dtypes.STRING_DTYPE,
+            dtypes.BYTES_DTYPE,
+        ):
+            raise TypeError(f"Type {input_types[0]} cannot be counted with HLL_COUNT")
+        return dtypes.BYTES_DTYPE
+
+    @property
+    def can_be_windowized(self):
+        return False
+
+
+@dataclasses.dataclass(frozen=True)
+class HllCountMergePartialOp(UnaryAggregateOp):
+    """Merges HyperLogLog++ sketches into a single sketch."""
+
+    name: ClassVar[str] = "hll_count_merge_partial"
+
+    def output_type(self, *input_types: dtypes.ExpressionType) -> dtypes.ExpressionType:
+        if input_types[0] != dtypes.BYTES_DTYPE:
+            raise TypeError(f"Type {input_types[0]} is not a HLL sketch")
+        return dtypes.BYTES_DTYPE
+
+    @property
+    def can_be_windowized(self):
+        return False
+
+
 @dataclasses.dataclass(frozen=True)
 class AnyValueOp(UnaryAggregateOp):
     # Warning: only use if all values are equal. Non-deterministic otherwise.
@@ -685,6 +765,7 @@ std_op = StdOp()
 var_op = VarOp()
 count_op = CountOp()
 nunique_op = NuniqueOp()
+approx_nunique_op = ApproxNuniqueOp()
 rank_op = RankOp()
 dense_rank_op = DenseRankOp()
 all_op = AllOp()
@@ -20,8 +20,8 @@ from typing import Dict, Iterable, List, Optional, Sequence, Union
 import warnings
 
 from bigframes import dtypes, exceptions, options
-from bigframes.core import guid
 from bigframes.core.logging import log_adapter
+from bigframes.operations import _prompt_cache
 
 
 @log_adapter.class_logger
@@ -234,7 +234,8 @@ class AIAccessor:
         else:
             results = typing.cast(
                 bigframes.series.Series,
-                model.predict(
+                _prompt_cache.predict_unique_prompts(
+                    model,
                     self._make_text_prompt(
                         df, columns, user_instruction, output_instruction
                     ),
@@ -543,32 +544,36 @@ class AIAccessor:
         if top_k < 1:
             raise ValueError("top_k must be an integer greater than or equal to 1.")
 
-        embedded_df = model.predict(self._df[search_column])
-        embedded_table = embedded_df.reset_index().to_gbq()
+        embedding_result_column = "ml_generate_embedding_result"
+        embedded_df = self._attach_embedding(
+            self._df[[search_column]], search_column, embedding_result_column, model
+        )
+        embedded_table = _prompt_cache.write_vector_table(
+            embedded_df.reset_index(),
+            embedding_result_column,
+            model,
+            source=self._df[[search_column]],
+            row_count=len(self._df),
+        )
 
         import bigframes.pandas as bpd
 
-        embedding_result_column = "ml_generate_embedding_result"
         query_df = model.predict(bpd.DataFrame({"query_id": [query]})).rename(
             columns={"content": "query_id", embedding_result_column: "embedding"}
         )
 
         import bigframes.bigquery as bbq
 
-        search_result = (
-            bbq.vector_search(
-                base_table=embedded_table,
-                column_to_search=embedding_result_column,
-                query=query_df,
-                top_k=top_k,
-                # TODO(tswast): set allow_large_results based on Series size.
-                # If we expect small results, it could be faster to set
-                # allow_large_results to False.
-                allow_large_results=True,
-            )
-            .rename(columns={"content": search_column})
-            .set_index("index")
-        )
+        search_result = bbq.vector_search(
+            base_table=embedded_table,
+            column_to_search=embedding_result_column,
+            query=query_df,
+            top_k=top_k,
+            # TODO(tswast): set allow_large_results based on Series size.
+            # If we expect small results, it could be faster to set
+            # allow_large_results to False.
+            allow_large_results=True,
+        ).set_index("index")
 
         search_result.index.name = self._df.index.name
 
@@ -671,10 +676,15 @@ class AIAccessor:
         work_estimate = len(self._df) * len(other)
         self._confirm_operation(work_estimate)
 
-        base_table_embedding_column = guid.generate_guid()
-        base_table = self._attach_embedding(
-            other, right_on, base_table_embedding_column, model
-        ).to_gbq()
+        # A fixed name keeps the schema of a cached vector table stable.
+        base_table_embedding_column = "bigframes_base_embedding"
+        base_table = _prompt_cache.write_vector_table(
+            self._attach_embedding(other, right_on, base_table_embedding_column, model),
+            base_table_embedding_column,
+            model,
+            source=other,
+            row_count=len(other),
+        )
         query_table = self._attach_embedding(self._df, left_on, "embedding", model)
 
         import bigframes.bigquery as bbq
@@ -767,9 +777,11 @@ class AIAccessor:
     @staticmethod
     def _attach_embedding(dataframe, source_column: str, embedding_column: str, model):
         result_df = dataframe.copy()
-        embeddings = model.predict(dataframe[source_column])[
-            "ml_generate_embedding_result"
-        ]
+        embeddings = _prompt_cache.predict_unique_prompts(
+            model,
+            dataframe[source_column],
+            output_columns=["ml_generate_embedding_result"],
+        )["ml_generate_embedding_result"]
         result_df[embedding_column] = embeddings
         return result_df
 
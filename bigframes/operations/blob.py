@@ -19,7 +19,6 @@ from typing import cast, Literal, Optional, Union
 import warnings
 
 import pandas as pd
-import requests
 
 from bigframes import clients, dtypes
 from bigframes.core.logging import log_adapter
@@ -243,6 +242,8 @@ class BlobAccessor:
         """
         import IPython.display as ipy_display
 
+        import bigframes.blob._download as blob_download
+
         width = width or bigframes.options.display.blob_display_width
         height = height or bigframes.options.display.blob_display_height
 
@@ -250,6 +251,9 @@ class BlobAccessor:
         df = bigframes.series.Series(self._data._block).rename("blob_col").to_frame()
 
         df["read_url"] = df["blob_col"].blob.read_url()
+        cache_key = df["blob_col"].blob._content_cache_key()
+        if cache_key is not None:
+            df["cache_key"] = cache_key
 
         if content_type:
             df["content_type"] = content_type
@@ -259,17 +263,45 @@ class BlobAccessor:
         pandas_df, _, query_job = df._block.retrieve_repr_request_results(n)
         df._set_internal_query_job(query_job)
 
+        def needs_content(
+            read_url: Union[str, pd._libs.missing.NAType],
+            content_type: Union[str, pd._libs.missing.NAType],
+        ) -> bool:
+            # Images and videos are displayed from their URLs.
+            return not pd.isna(read_url) and (
+                pd.isna(content_type)
+                or not cast(str, content_type).casefold().startswith(("image", "video"))
+            )
+
+        # Download the content of all rows at once, rather than one by one.
+        fetch_rows = [
+            needs_content(row["read_url"], row["content_type"])
+            for _, row in pandas_df.iterrows()
+        ]
+        fetched = iter(
+            blob_download.fetch_all(
+                pandas_df["read_url"][fetch_rows],
+                pandas_df["cache_key"][fetch_rows] if cache_key is not None else None,
+                # One failed download shouldn't hide the other rows.
+                raise_errors=False,
+            )
+        )
+
         def display_single_url(
             read_url: Union[str, pd._libs.missing.NAType],
             content_type: Union[str, pd._libs.missing.NAType],
+            content: Union[bytes, None, Exception],
         ):
             if pd.isna(read_url):
                 ipy_display.display("<NA>")
                 return
 
+            if isinstance(content, Exception):
+                ipy_display.display(f"Error: {content}")
+                return
+
             if pd.isna(content_type):  # display as raw data or error
-                response = requests.get(read_url)
-                ipy_display.display(response.content)
+                ipy_display.display(content)
                 return
 
             content_type = cast(str, content_type).casefold()
@@ -280,18 +312,66 @@ class BlobAccessor:
                 )
             elif content_type.startswith("audio"):
                 # using url somehow doesn't work with audios
-                response = requests.get(read_url)
-                ipy_display.display(ipy_display.Audio(response.content))
+                ipy_display.display(ipy_display.Audio(content))
             elif content_type.startswith("video"):
                 ipy_display.display(
                     ipy_display.Video(read_url, width=width, height=height)
                 )
             else:  # display as raw data
-                response = requests.get(read_url)
-                ipy_display.display(response.content)
+                ipy_display.display(content)
+
+        for fetch, (_, row) in zip(fetch_rows, pandas_df.iterrows()):
+            display_single_url(
+                row["read_url"],
+                row["content_type"],
+                next(fetched) if fetch else None,
+            )
+
+    def read_bytes(self, *, max_workers: int = 16) -> pd.Series:
+        """Download the content of the Blobs.
+
+        The objects are downloaded in parallel through their signed URLs,
+        sharing a pool of HTTP connections, which is much faster than reading
+        many small objects one by one. If
+        ``bigframes.options.compute.blob_content_cache_bytes`` is set, content
+        that was downloaded before is reused if the object has not changed.
+
+        Args:
+            max_workers (int, default 16): the maximum number of concurrent
+                downloads.
+
+        Returns:
+            pandas.Series: the content as bytes, with the index of the Series.
+                Null Blobs give None.
+        """
+        import bigframes.blob._download as blob_download
+
+        if max_workers < 1:
+            raise ValueError(
+                "max_workers must be an integer greater than or equal to 1."
+            )
+
+        df = bigframes.series.Series(self._data._block).rename("blob_col").to_frame()
+        df["read_url"] = df["blob_col"].blob.read_url()
+        cache_key = df["blob_col"].blob._content_cache_key()
+        if cache_key is not None:
+            df["cache_key"] = cache_key
+        pandas_df = df.drop(columns="blob_col").to_pandas()
+
+        contents = blob_download.fetch_all(
+            pandas_df["read_url"],
+            pandas_df["cache_key"] if cache_key is not None else None,
+            max_workers=max_workers,
+        )
+        return pd.Series(
+            contents, index=pandas_df.index, name=self._data.name, dtype="object"
+        )
 
-        for _, row in pandas_df.iterrows():
-            display_single_url(row["read_url"], row["content_type"])
+    def _content_cache_key(self) -> Optional[bigframes.series.Series]:
+        """Identifies the content of the Blobs, if the content cache is on."""
+        if not bigframes.options.compute.blob_content_cache_bytes:
+            return None
+        return self.uri().str.cat("#").str.cat(self.version())
 
     @property
     def session(self):
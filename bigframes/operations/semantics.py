@@ -15,7 +15,7 @@
 
 import re
 import typing
-from typing import List, Optional
+from typing import List, Literal, Optional
 import warnings
 
 import numpy as np
@@ -23,6 +23,7 @@ import numpy as np
 from bigframes import dtypes, exceptions
 from bigframes.core import guid
 from bigframes.core.logging import log_adapter
+from bigframes.operations import _prompt_cache
 
 
 @log_adapter.class_logger
@@ -407,7 +408,8 @@ class Semantics:
         else:
             results = typing.cast(
                 bigframes.dataframe.DataFrame,
-                model.predict(
+                _prompt_cache.predict_unique_prompts(
+                    model,
                     self._make_text_prompt(
                         df, columns, user_instruction, output_instruction
                     ),
@@ -528,7 +530,8 @@ class Semantics:
         else:
             results = typing.cast(
                 bigframes.series.Series,
-                model.predict(
+                _prompt_cache.predict_unique_prompts(
+                    model,
                     self._make_text_prompt(
                         df, columns, user_instruction, output_instruction
                     ),
@@ -784,6 +787,9 @@ class Semantics:
         model,
         k: int = 10,
         ground_with_google_search: bool = False,
+        *,
+        algorithm: Literal["quickselect", "multi_pivot"] = "quickselect",
+        num_pivots: int = 8,
     ):
         """
         Ranks each tuple and returns the k best according to the instruction.
@@ -792,6 +798,13 @@ class Semantics:
         with all other items. By leveraging an LLM (Large Language Model), it then
         identifies the top 'k' best answers from these comparisons.
 
+        With ``algorithm="multi_pivot"``, each round compares the pending items
+        with ``num_pivots`` pivots, and the pivots with each other, in a single
+        batched model call. The pivots split the items into ``num_pivots + 1``
+        ranges, so the number of sequential rounds is about
+        ``log(n) / log(num_pivots + 1)``, at the cost of about
+        ``n * (num_pivots + 1)`` comparisons in total instead of ``2 * n``.
+
         **Examples:**
 
             >>> import bigframes.pandas as bpd
@@ -834,6 +847,15 @@ class Semantics:
                 page for details: https://cloud.google.com/vertex-ai/generative-ai/pricing#google_models
                 The default is `False`.
 
+            algorithm ({"quickselect", "multi_pivot"}, default "quickselect"):
+                The selection algorithm. "quickselect" compares the items with
+                one pivot per round. "multi_pivot" compares them with several
+                pivots per round, which needs fewer sequential rounds but more
+                comparisons.
+
+            num_pivots (int, default 8):
+                The number of pivots per round of the "multi_pivot" algorithm.
+
         Returns:
             bigframes.dataframe.DataFrame: A new DataFrame with the top k rows.
 
@@ -860,7 +882,19 @@ class Semantics:
             )
             warnings.warn(msg, category=UserWarning)
 
-        work_estimate = int(len(self._df) * (len(self._df) - 1) / 2)
+        if algorithm not in ("quickselect", "multi_pivot"):
+            raise ValueError(
+                f"Unsupported algorithm {algorithm!r}. Expected 'quickselect' or 'multi_pivot'."
+            )
+        if num_pivots < 1:
+            raise ValueError(
+                "num_pivots must be an integer greater than or equal to 1."
+            )
+
+        if algorithm == "multi_pivot":
+            work_estimate = len(self._df) * (num_pivots + 1)
+        else:
+            work_estimate = int(len(self._df) * (len(self._df) - 1) / 2)
         self._confirm_operation(work_estimate)
 
         df: bigframes.dataframe.DataFrame = self._df[columns].copy()
@@ -887,6 +921,19 @@ class Semantics:
         # is needed for the select search algorithm due to unimplemented bigFrame methods.
         df = df.reset_index().rename(columns={"index": "old_index"}).reset_index()
 
+        if algorithm == "multi_pivot":
+            selected = self._topk_multi_pivot(
+                df[["index", column]],
+                column,
+                user_instruction,
+                model,
+                k,
+                num_pivots,
+                ground_with_google_search,
+            )
+            result_df: bigframes.dataframe.DataFrame = self._df.copy()
+            return result_df[df.set_index("old_index")["index"].isin(selected)]
+
         # Initialize a status column to track the selection status of each item.
         #  - None: Unknown/not yet processed
         #  - 1.0: Selected as part of the top-k items
@@ -909,9 +956,156 @@ class Semantics:
             )
             num_selected += num_new_selected
 
-        result_df: bigframes.dataframe.DataFrame = self._df.copy()
+        result_df = self._df.copy()
         return result_df[df.set_index("old_index")[status_column] > 0.0]
 
+    @staticmethod
+    def _topk_multi_pivot(
+        df,
+        column: str,
+        user_instruction: str,
+        model,
+        k: int,
+        num_pivots: int,
+        ground_with_google_search: bool,
+    ) -> List[int]:
+        """Returns the "index" values of the top k rows of df.
+
+        Each round scores the pending items by the number of pivots they beat,
+        and the pivots by the number of other pivots they beat plus one half,
+        which places each pivot between the items it separates. All comparisons
+        of a round go to the model in one batch. The highest scored ranges that
+        fit into k are selected, the lowest are excluded, and the range that
+        straddles k is refined in the next round. The pivots and the other
+        items always land in different ranges, so each round decides at least
+        one item.
+        """
+        import bigframes.dataframe
+        from bigframes.core.reshape.api import concat
+
+        output_instruction = (
+            "Given a question and two documents, choose the document that best answers "
+            "the question. Respond with 'Document 1' or 'Document 2'.  You must choose "
+            "one, even if neither is ideal. "
+        )
+        prompt_prefix = f"{output_instruction}\n\nQuestion: {user_instruction}\n"
+
+        selected: List[int] = []
+        pending = df
+        remaining = k
+        while remaining > 0:
+            num_pending = pending.shape[0]
+            if num_pending <= remaining:
+                selected.extend(pending["index"].to_pandas().tolist())
+                break
+
+            # Random pivots for improved average performance, keeping at least
+            # one item that is not a pivot.
+            pivot_ilocs = np.random.choice(
+                num_pending, size=min(num_pivots, num_pending - 1), replace=False
+            )
+            pivots = pending.iloc[sorted(pivot_ilocs)].to_pandas()
+            pivot_ids = pivots["index"].tolist()
+            pivots = pivots.rename(
+                columns={"index": "pivot_index", column: "pivot_value"}
+            ).reset_index(drop=True)
+
+            items = pending[~pending["index"].isin(pivot_ids)]
+            item_pairs = items.merge(
+                bigframes.dataframe.DataFrame(pivots, session=df._session), how="cross"
+            )
+            # Each pair of pivots is compared once, the later one as document 2.
+            pivot_pairs = pivots.rename(
+                columns={"pivot_index": "index", "pivot_value": column}
+            ).merge(pivots, how="cross")
+            pivot_pairs = bigframes.dataframe.DataFrame(
+                pivot_pairs[pivot_pairs["pivot_index"] < pivot_pairs["index"]],
+                session=df._session,
+            )
+            item_pairs["is_pivot_pair"] = False
+            pivot_pairs["is_pivot_pair"] = True
+            pairs = concat([item_pairs, pivot_pairs], ignore_index=True)
+
+            prompt_s = (
+                prompt_prefix
+                + f"\nDocument 1: {column} "
+                + pairs["pivot_value"]
+                + f"\nDocument 2: {column} "
+                + pairs[column]
+            )
+            predict_df = typing.cast(
+                bigframes.dataframe.DataFrame,
+                model.predict(
+                    prompt_s,
+                    temperature=0.0,
+                    ground_with_google_search=ground_with_google_search,
+                ),
+            )
+            pairs["wins"] = (
+                predict_df["ml_generate_text_llm_result"]
+                .str.contains("2")
+                .fillna(False)
+            ).astype(dtypes.INT_DTYPE)
+            pairs = pairs.cache()
+
+            pivot_results = pairs[pairs["is_pivot_pair"]].to_pandas()
+            pivot_scores = {id: 0.5 for id in pivot_ids}
+            for _, row in pivot_results.iterrows():
+                winner = row["index"] if row["wins"] else row["pivot_index"]
+                pivot_scores[winner] += 1.0
+
+            item_scores = (
+                pairs[~pairs["is_pivot_pair"]]
+                .groupby("index", as_index=False)["wins"]
+                .sum()
+                .cache()
+            )
+            bucket_sizes = item_scores["wins"].value_counts().to_pandas()
+            buckets = {float(score): int(size) for score, size in bucket_sizes.items()}
+            for score in pivot_scores.values():
+                buckets[score] = buckets.get(score, 0) + 1
+
+            selected_scores = []
+            straddling_score = None
+            num_better = 0
+            for score in sorted(buckets, reverse=True):
+                if num_better + buckets[score] <= remaining:
+                    selected_scores.append(score)
+                elif num_better < remaining:
+                    straddling_score = score
+                num_better += buckets[score]
+
+            selected_pivots = [
+                id for id, score in pivot_scores.items() if score in selected_scores
+            ]
+            selected_items = (
+                item_scores[
+                    item_scores["wins"].isin(
+                        [int(s) for s in selected_scores if s % 1 == 0]
+                    )
+                ]["index"]
+                .to_pandas()
+                .tolist()
+            )
+            selected.extend(selected_pivots + selected_items)
+            remaining -= len(selected_pivots) + len(selected_items)
+
+            if straddling_score is None:
+                break
+            if straddling_score % 1 == 0:
+                straddling_ids = item_scores[item_scores["wins"] == straddling_score][
+                    "index"
+                ]
+            else:
+                straddling_ids = [
+                    id
+                    for id, score in pivot_scores.items()
+                    if score == straddling_score
+                ]
+            pending = pending[pending["index"].isin(straddling_ids)].cache()
+
+        return selected
+
     @staticmethod
     def _topk_partition(
         df,
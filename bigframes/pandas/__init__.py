@@ -74,11 +74,23 @@ movement bottleneck" by keeping your data in BigQuery for processing.
 from __future__ import annotations
 
 import collections
+import concurrent.futures
+import contextlib
 import datetime
 import inspect
 import sys
 import typing
-from typing import Literal, Optional, Sequence, Union
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 import bigframes_vendored.pandas.core.tools.datetimes as vendored_pandas_datetimes
 import pandas
@@ -112,6 +124,7 @@ from bigframes.pandas.io.api import (
 import bigframes.series
 import bigframes.session
 import bigframes.session._io.bigquery
+import bigframes.session.profiling
 import bigframes.version
 
 try:
@@ -151,6 +164,7 @@ def remote_function(
         "all", "internal-only", "internal-and-gclb"
     ] = "internal-only",
     cloud_build_service_account: Optional[str] = None,
+    vectorized: bool = False,
 ):
     return global_session.with_default_session(
         bigframes.session.Session.remote_function,
@@ -173,6 +187,7 @@ def remote_function(
         cloud_function_cpus=cloud_function_cpus,
         cloud_function_ingress_settings=cloud_function_ingress_settings,
         cloud_build_service_account=cloud_build_service_account,
+        vectorized=vectorized,
     )
 
 
@@ -195,6 +210,25 @@ deploy_remote_function.__doc__ = inspect.getdoc(
 )
 
 
+def deploy_remote_functions(
+    funcs: Union[Sequence[Callable], Mapping[str, Callable]],
+    *,
+    max_workers: Optional[int] = None,
+    **kwargs,
+) -> List[concurrent.futures.Future]:
+    return global_session.with_default_session(
+        bigframes.session.Session.deploy_remote_functions,
+        funcs=funcs,
+        max_workers=max_workers,
+        **kwargs,
+    )
+
+
+deploy_remote_functions.__doc__ = inspect.getdoc(
+    bigframes.session.Session.deploy_remote_functions
+)
+
+
 def udf(
     *,
     input_types: Union[None, type, Sequence[type]] = None,
@@ -206,6 +240,7 @@ def udf(
     max_batching_rows: Optional[int] = None,
     container_cpu: Optional[float] = None,
     container_memory: Optional[str] = None,
+    vectorized: bool = False,
 ):
     return global_session.with_default_session(
         bigframes.session.Session.udf,
@@ -218,6 +253,7 @@ def udf(
         max_batching_rows=max_batching_rows,
         container_cpu=container_cpu,
         container_memory=container_memory,
+        vectorized=vectorized,
     )
 
 
@@ -238,6 +274,21 @@ def deploy_udf(
 deploy_udf.__doc__ = inspect.getdoc(bigframes.session.Session.deploy_udf)
 
 
+@contextlib.contextmanager
+def profile(
+    *, print_summary: bool = True, tracer: Optional[Any] = None
+) -> Iterator[bigframes.session.profiling.ExecutionProfile]:
+    with global_session.with_default_session(
+        bigframes.session.Session.profile,
+        print_summary=print_summary,
+        tracer=tracer,
+    ) as execution_profile:
+        yield execution_profile
+
+
+profile.__doc__ = inspect.getdoc(bigframes.session.Session.profile)
+
+
 @typing.overload
 def to_datetime(
     arg: Union[
@@ -443,10 +494,12 @@ _functions = [
     crosstab,
     cut,
     deploy_remote_function,
+    deploy_remote_functions,
     deploy_udf,
     get_default_session_id,
     get_dummies,
     merge,
+    profile,
     qcut,
     read_csv,
     read_arrow,
@@ -478,10 +531,12 @@ __all__ = [
     "col",
     "cut",
     "deploy_remote_function",
+    "deploy_remote_functions",
     "deploy_udf",
     "get_default_session_id",
     "get_dummies",
     "merge",
+    "profile",
     "qcut",
     "read_csv",
     "read_arrow",
@@ -60,7 +60,6 @@ import bigframes.session
 from bigframes.session import dry_runs
 import bigframes.session._io.bigquery
 import bigframes.session.clients
-import bigframes.session.iceberg
 import bigframes.session.metrics
 
 # Note: the following methods are duplicated from Session. This duplication
@@ -699,6 +698,9 @@ def _set_default_session_location_if_possible_deferred_query(create_query):
             job = _dry_run(query, bqclient)
             config.options.bigquery.location = job.location
         elif bq_data.is_irc_table(query):
+            # Imported here to avoid loading pyiceberg at import time.
+            import bigframes.session.iceberg
+
             irc_table = bigframes.session.iceberg.get_table(
                 default_project, query, bqclient._credentials
             )
@@ -1376,8 +1376,13 @@ class Series:
     def count(self) -> int:
         return typing.cast(int, self._apply_aggregation(agg_ops.count_op))
 
-    def nunique(self) -> int:
-        return typing.cast(int, self._apply_aggregation(agg_ops.nunique_op))
+    def nunique(self, *, exact: Optional[bool] = None) -> int:
+        op = (
+            agg_ops.nunique_op
+            if utils.resolve_exact(exact)
+            else agg_ops.approx_nunique_op
+        )
+        return typing.cast(int, self._apply_aggregation(op))
 
     def max(self) -> scalars.Scalar:
         return self._apply_aggregation(agg_ops.max_op)
@@ -1492,15 +1497,22 @@ class Series:
     def mean(self) -> float:
         return typing.cast(float, self._apply_aggregation(agg_ops.mean_op))
 
-    def median(self, *, exact: bool = True) -> float:
-        if exact:
-            return typing.cast(float, self.quantile(0.5))
+    def median(self, *, exact: Optional[bool] = None) -> float:
+        if utils.resolve_exact(exact):
+            return typing.cast(float, self.quantile(0.5, exact=True))
         else:
             return typing.cast(float, self._apply_aggregation(agg_ops.median_op))
 
-    def quantile(self, q: Union[float, Sequence[float]] = 0.5) -> Union[Series, float]:
+    def quantile(
+        self, q: Union[float, Sequence[float]] = 0.5, *, exact: Optional[bool] = None
+    ) -> Union[Series, float]:
         qs = tuple(q) if utils.is_list_like(q) else (q,)
-        result = block_ops.quantile(self._block, (self._value_column,), qs=qs)
+        result = block_ops.quantile(
+            self._block,
+            (self._value_column,),
+            qs=qs,
+            exact=utils.resolve_exact(exact),
+        )
         if utils.is_list_like(q):
             # Drop the first level, since only one column
             result = result.with_column_labels(result.column_labels.droplevel(0))
@@ -2049,6 +2061,13 @@ class Series:
         if bf_op and isinstance(bf_op, ops.UnaryOp):
             return self._apply_unary_op(bf_op)
 
+        if by_row and self._block.is_local_only:
+            # The data is already in memory, so run the function in process
+            # rather than requiring a deployed BigQuery function.
+            return Series(
+                self.to_pandas().apply(func, args=args), session=self._session
+            )
+
         # It is neither a remote function nor a managed function.
         # Then it must be a vectorized function that applies to the Series
         # as a whole.
@@ -17,6 +17,8 @@
 from __future__ import annotations
 
 from collections import abc
+import concurrent.futures
+import contextlib
 import datetime
 import fnmatch
 import inspect
@@ -31,7 +33,10 @@ from typing import (
     Dict,
     IO,
     Iterable,
+    Iterator,
+    List,
     Literal,
+    Mapping,
     MutableSequence,
     Optional,
     overload,
@@ -44,7 +49,6 @@ import weakref
 
 import bigframes_vendored.constants as constants
 import bigframes_vendored.google_cloud_bigquery.retry as third_party_gcb_retry
-import bigframes_vendored.ibis.backends.bigquery as ibis_bigquery  # noqa
 import bigframes_vendored.pandas.io.gbq as third_party_pandas_gbq
 import bigframes_vendored.pandas.io.parquet as third_party_pandas_parquet
 import bigframes_vendored.pandas.io.parsers.readers as third_party_pandas_readers
@@ -79,6 +83,7 @@ import bigframes.functions.function as bff
 from bigframes.session import bigquery_session, bq_caching_executor, executor
 import bigframes.session._io.bigquery as bf_io_bigquery
 import bigframes.session.clients
+import bigframes.session.profiling
 import bigframes.session.validation
 
 # Avoid circular imports.
@@ -234,6 +239,8 @@ class Session(
 
         self._metrics = metrics.ExecutionMetrics()
         self._function_session = bff_session.FunctionSession()
+        # If set, functions are emulated in process rather than deployed.
+        self._udf_emulation = context.udf_emulation
         self._anon_dataset_manager = anonymous_dataset.AnonymousDatasetManager(
             self._clients_provider.bqclient,
             location=self._location,
@@ -277,6 +284,7 @@ class Session(
             storage_manager=self._temp_storage_manager,
             metrics=self._metrics,
             enable_polars_execution=context.enable_polars_execution,
+            enable_udf_emulation=context.udf_emulation is not None,
             publisher=self._publisher,
             labels=labels,
         )
@@ -371,6 +379,44 @@ class Session(
         """The sum of all slot time used by bigquery jobs in this session."""
         return self._metrics.slot_millis
 
+    @contextlib.contextmanager
+    def profile(
+        self, *, print_summary: bool = True, tracer: Optional[Any] = None
+    ) -> Iterator[bigframes.session.profiling.ExecutionProfile]:
+        """Profile the phases of executions run in this session.
+
+        While the context is open, the time spent preparing plans, compiling
+        SQL, uploading local data, running queries, reading result streams
+        and converting results to pandas is recorded per phase.
+
+        Args:
+            print_summary (bool, default True):
+                If True, print a per-phase breakdown when the context exits.
+            tracer (opentelemetry.trace.Tracer, Optional):
+                If set, also export each phase as an OpenTelemetry span to
+                this tracer.
+
+        Returns:
+            bigframes.session.profiling.ExecutionProfile:
+                The collected profile. Call ``summary()`` for a DataFrame
+                with the per-phase breakdown.
+        """
+        execution_profile = bigframes.session.profiling.ExecutionProfile()
+        subscribers = [self._publisher.subscribe(execution_profile)]
+        if tracer is not None:
+            subscribers.append(
+                self._publisher.subscribe(
+                    bigframes.session.profiling.OpenTelemetryExporter(tracer)
+                )
+            )
+        try:
+            yield execution_profile
+        finally:
+            for subscriber in subscribers:
+                subscriber.close()
+            if print_summary:
+                print(execution_profile)
+
     @property
     def _allows_ambiguity(self) -> bool:
         return self._allow_ambiguity
@@ -1519,6 +1565,64 @@ class Session(
             **kwargs,
         )
 
+    def deploy_remote_functions(
+        self,
+        funcs: Union[Sequence[Callable], Mapping[str, Callable]],
+        *,
+        max_workers: Optional[int] = None,
+        **kwargs,
+    ) -> List[concurrent.futures.Future]:
+        """Starts deploying several BigQuery remote functions concurrently.
+
+        The connection and its permissions are checked once for all the
+        functions, and the cloud functions are packaged and deployed in
+        parallel in the background. Use this to avoid waiting for each
+        deployment in turn when a pipeline needs several functions.
+
+        **Examples:**
+
+            >>> import bigframes.pandas as bpd
+            >>> def add_one(x: int) -> int:
+            ...     return x + 1
+            >>> def double(x: int) -> int:
+            ...     return x * 2
+            >>> futures = bpd.deploy_remote_functions(
+            ...     [add_one, double], cloud_function_service_account="default"
+            ... )  # doctest: +SKIP
+            >>> add_one_remote, double_remote = [f.result() for f in futures]  # doctest: +SKIP
+
+        Args:
+            funcs:
+                Functions to deploy, or a mapping of names to functions to
+                deploy them as persistent functions with these names.
+            max_workers (int, Optional):
+                Maximum number of functions deployed at the same time. Deploys
+                all of them at once by default.
+            kwargs:
+                All other arguments are passed directly to
+                :meth:`~bigframes.session.Session.remote_function`.  Please see
+                its docstring for parameter details.
+
+        Returns:
+            List[concurrent.futures.Future]:
+                A future per function, in order, resolving to the wrapped
+                remote function, usable in
+                :meth:`~bigframes.series.Series.apply`. Only ``result()``
+                waits for the deployment.
+        """
+        return self._function_session.deploy_remote_functions(
+            funcs,
+            max_workers=max_workers,
+            # Session-provided arguments.
+            session=self,
+            bigquery_client=self._clients_provider.bqclient,
+            bigquery_connection_client=self._clients_provider.bqconnectionclient,
+            cloud_functions_client=self._clients_provider.cloudfunctionsclient,
+            resource_manager_client=self._clients_provider.resourcemanagerclient,
+            # User-provided arguments.
+            **kwargs,
+        )
+
     def remote_function(
         self,
         # Make sure that the input/output types, and dataset can be used
@@ -1549,6 +1653,7 @@ class Session(
             "all", "internal-only", "internal-and-gclb"
         ] = "internal-only",
         cloud_build_service_account: Optional[str] = None,
+        vectorized: bool = False,
     ):
         """Decorator to turn a user defined function into a BigQuery remote function. Check out
         the code samples at: https://cloud.google.com/bigquery/docs/remote-functions#bigquery-dataframes.
@@ -1745,6 +1850,16 @@ class Session(
                 service account is used. See
                 https://cloud.google.com/build/docs/cloud-build-service-account
                 for more details.
+            vectorized (bool, Optional):
+                Whether the function processes a batch of rows at a time.
+                Defaults to False, in which case the function is called once
+                per row. If True, the function is called once per request that
+                BigQuery sends to the cloud function, with a pandas Series per
+                argument, holding the values of all the rows of the batch, and
+                must return a list-like of the same length with the result for
+                each row. This avoids the per row Python overhead for functions
+                that can be expressed with vectorized pandas or numpy
+                operations. Not supported with ``input_types=Series``.
         Returns:
             collections.abc.Callable:
                 A remote function object pointing to the cloud assets created
@@ -1782,6 +1897,7 @@ class Session(
             cloud_function_cpus=cloud_function_cpus,
             cloud_function_ingress_settings=cloud_function_ingress_settings,
             cloud_build_service_account=cloud_build_service_account,
+            vectorized=vectorized,
         )
 
     def deploy_udf(
@@ -1827,6 +1943,7 @@ class Session(
         max_batching_rows: Optional[int] = None,
         container_cpu: Optional[float] = None,
         container_memory: Optional[str] = None,
+        vectorized: bool = False,
     ):
         """Decorator to turn a Python user defined function (udf) into a
         [BigQuery managed user-defined function](https://cloud.google.com/bigquery/docs/user-defined-functions-python).
@@ -1961,6 +2078,16 @@ class Session(
                 default, the memory allocated to each container instance is
                 512 MiB. See details at
                 https://cloud.google.com/bigquery/docs/user-defined-functions-python#configure-container-limits.
+            vectorized (bool, Optional):
+                Whether the udf processes a batch of rows at a time. Defaults
+                to False, in which case the udf is called once per row. If
+                True, the udf is called once per batch with a pandas Series per
+                argument, holding the values of all the rows of the batch, and
+                must return a pandas Series, pyarrow Array or list of the same
+                length with the result for each row. This avoids the per row
+                Python overhead for udfs that can be expressed with vectorized
+                pandas or numpy operations. Not supported with
+                ``input_types=Series``.
         Returns:
             collections.abc.Callable:
                 A managed function object pointing to the cloud assets created
@@ -1985,6 +2112,7 @@ class Session(
             max_batching_rows=max_batching_rows,
             container_cpu=container_cpu,
             container_memory=container_memory,
+            vectorized=vectorized,
         )
 
     def read_gbq_function(
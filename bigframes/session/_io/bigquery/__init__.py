@@ -32,7 +32,6 @@ import google.cloud.bigquery as bigquery
 import google.cloud.bigquery._job_helpers
 import google.cloud.bigquery.table
 
-from bigframes.core.compile.sqlglot import sql as sg_sql
 import bigframes.core.events
 from bigframes.core.logging import log_adapter
 import bigframes.core.sql
@@ -519,6 +518,8 @@ def to_query(
     time_travel_timestamp: Optional[datetime.datetime] = None,
 ) -> str:
     """Compile query_or_table with conditions(filters, wildcards) to query."""
+    from bigframes.core.compile.sqlglot import sql as sg_sql
+
     sub_query = (
         f"({query_or_table})" if is_query(query_or_table) else f"`{query_or_table}`"
     )
@@ -552,6 +553,8 @@ def to_query(
 
 def compile_filters(filters: third_party_pandas_gbq.FiltersType) -> str:
     """Compiles a set of filters into a boolean sql expression"""
+    from bigframes.core.compile.sqlglot import sql as sg_sql
+
     if not filters:
         return ""
     filter_string = ""
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 import dataclasses
 import typing
-from typing import Collection, Union
+from typing import Collection, Optional, Union
 
 import bigframes_vendored.constants as constants
 import geopandas  # type: ignore
@@ -25,6 +25,7 @@ import pyarrow  # type: ignore
 import pyarrow.compute  # type: ignore
 import pyarrow.types  # type: ignore
 
+from bigframes.core import events
 import bigframes.core.schema
 import bigframes.dtypes
 import bigframes.features
@@ -65,6 +66,7 @@ def _arrow_to_pandas_arrowdtype(
 def arrow_to_pandas(
     arrow_table: Union[pyarrow.Table, pyarrow.RecordBatch],
     schema: bigframes.core.schema.ArraySchema,
+    publisher: Optional[events.Publisher] = None,
 ):
     if len(schema) != arrow_table.num_columns:
         raise ValueError(
@@ -72,6 +74,16 @@ def arrow_to_pandas(
             f"{arrow_table.num_columns}. {constants.FEEDBACK_LINK}"
         )
 
+    with events.Span("arrow_to_pandas", publisher) as span:
+        span.rows = arrow_table.num_rows
+        span.bytes = arrow_table.nbytes
+        return _arrow_to_pandas(arrow_table, schema)
+
+
+def _arrow_to_pandas(
+    arrow_table: Union[pyarrow.Table, pyarrow.RecordBatch],
+    schema: bigframes.core.schema.ArraySchema,
+) -> pandas.DataFrame:
     serieses = {}
     for field, column in zip(arrow_table.schema, arrow_table):
         dtype = schema.get_type(field.name)
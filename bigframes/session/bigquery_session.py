@@ -21,10 +21,8 @@ from typing import Callable, Optional, Sequence
 import uuid
 
 # TODO: Non-ibis implementation
-import bigframes_vendored.ibis.backends.bigquery.datatypes as ibis_bq
 import google.cloud.bigquery as bigquery
 
-from bigframes.core.compile.sqlglot import sql as sg_sql
 import bigframes.core.events
 from bigframes.session import temporary_storage
 import bigframes.session._io.bigquery as bfbqio
@@ -66,6 +64,11 @@ class SessionResourceManager(temporary_storage.TemporaryStorageManager):
         """Create a temporary session table. Session is an exclusive resource, so throughput is limited"""
         # Can't set a table in _SESSION as destination via query job API, so we
         # run DDL, instead.
+        # Imported here to avoid loading ibis and sqlglot at import time.
+        import bigframes_vendored.ibis.backends.bigquery.datatypes as ibis_bq
+
+        from bigframes.core.compile.sqlglot import sql as sg_sql
+
         with self._session_lock:
             table_ref = bigquery.TableReference(
                 bigquery.DatasetReference(self.bqclient.project, "_SESSION"),
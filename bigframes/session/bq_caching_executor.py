@@ -17,7 +17,8 @@ from __future__ import annotations
 import concurrent.futures
 import math
 import threading
-from typing import Literal, Mapping, Optional, Sequence, Tuple
+from typing import Any, Hashable, Literal, Mapping, Optional, Sequence, Tuple
+import warnings
 
 import google.api_core.exceptions
 from google.cloud import bigquery
@@ -30,8 +31,6 @@ from bigframes import exceptions as bfe
 import bigframes.constants
 import bigframes.core
 from bigframes.core import bq_data, compile, local_data, rewrite
-from bigframes.core.compile.sqlglot import sql as sg_sql
-from bigframes.core.compile.sqlglot import sqlglot_ir
 import bigframes.core.events
 import bigframes.core.guid
 import bigframes.core.identifiers
@@ -40,6 +39,7 @@ import bigframes.core.schema as schemata
 import bigframes.core.tree_properties as tree_properties
 import bigframes.dtypes
 from bigframes.session import (
+    cost_guard,
     executor,
     loader,
     local_scan_executor,
@@ -79,6 +79,7 @@ class BigQueryCachingExecutor(executor.Executor):
         *,
         metrics: Optional[bigframes.session.metrics.ExecutionMetrics] = None,
         enable_polars_execution: bool = False,
+        enable_udf_emulation: bool = False,
         publisher: bigframes.core.events.Publisher,
         labels: Mapping[str, str] = {},
     ):
@@ -91,21 +92,32 @@ class BigQueryCachingExecutor(executor.Executor):
         self._enable_polars_execution = enable_polars_execution
         self._publisher = publisher
         self._labels = labels
+        self._cost_guard = cost_guard.QueryCostGuard(bqclient, metrics=metrics)
 
         # TODO(tswast): Send events from semi-executors, too.
         self._semi_executors: Sequence[semi_executor.SemiExecutor] = (
             read_api_execution.ReadApiSemiExecutor(
                 bqstoragereadclient=bqstoragereadclient,
                 project=self.bqclient.project,
+                publisher=publisher,
             ),
-            local_scan_executor.LocalScanExecutor(),
+            local_scan_executor.LocalScanExecutor(publisher=publisher),
         )
         if enable_polars_execution:
             from bigframes.session import polars_executor
 
             self._semi_executors = (
                 *self._semi_executors,
-                polars_executor.PolarsExecutor(),
+                polars_executor.PolarsExecutor(publisher=publisher),
+            )
+        if enable_udf_emulation:
+            from bigframes.session import local_udf_executor
+
+            self._semi_executors = (
+                *self._semi_executors,
+                local_udf_executor.LocalUdfExecutor(
+                    materialize=self._execute_ordered, publisher=publisher
+                ),
             )
         self._upload_lock = threading.Lock()
 
@@ -124,9 +136,7 @@ class BigQueryCachingExecutor(executor.Executor):
             else array_value.node
         )
         node = self._substitute_large_local_sources(node)
-        compiled = compile.compiler().compile_sql(
-            compile.CompileRequest(node, sort_rows=ordered)
-        )
+        compiled = self._compile_sql(compile.CompileRequest(node, sort_rows=ordered))
         return compiled.sql
 
     def execute(
@@ -185,6 +195,12 @@ class BigQueryCachingExecutor(executor.Executor):
         )
         return result
 
+    def _execute_ordered(self, node: nodes.BigFrameNode) -> executor.ExecuteResult:
+        return self.execute(
+            bigframes.core.ArrayValue(node),
+            ex_spec.ExecutionSpec(ordered=True, promise_under_10gb=True),
+        )
+
     def _export_result_gcs(
         self, result: executor.ExecuteResult, gcs_export_spec: ex_spec.GcsOutputSpec
     ):
@@ -242,9 +258,7 @@ class BigQueryCachingExecutor(executor.Executor):
         # validate destination table
         existing_table = self._maybe_find_existing_table(spec)
 
-        compiled = compile.compiler().compile_sql(
-            compile.CompileRequest(plan, sort_rows=False)
-        )
+        compiled = self._compile_sql(compile.CompileRequest(plan, sort_rows=False))
         sql = compiled.sql
 
         if (existing_table is not None) and _is_schema_match(
@@ -253,6 +267,9 @@ class BigQueryCachingExecutor(executor.Executor):
             # b/409086472: Uses DML for table appends and replacements to avoid
             # BigQuery `RATE_LIMIT_EXCEEDED` errors, as per quota limits:
             # https://cloud.google.com/bigquery/quotas#standard_tables
+            from bigframes.core.compile.sqlglot import sql as sg_sql
+            from bigframes.core.compile.sqlglot import sqlglot_ir
+
             job_config = bigquery.QueryJobConfig()
 
             ir = sqlglot_ir.SQLGlotIR.from_unparsed_query(sql)
@@ -323,7 +340,8 @@ class BigQueryCachingExecutor(executor.Executor):
         elif config.if_cached == "reuse-strict":
             # This path basically exists to make sure that repr in head mode is optimized for subsequent repr operations.
             if config.optimize_for == "head":
-                if tree_properties.can_fast_head(array_value.node):
+                # Plans already cached with offsets are also cheap to head.
+                if tree_properties.can_fast_head(self.prepare_plan(array_value.node)):
                     return
             else:
                 raise NotImplementedError(
@@ -342,6 +360,16 @@ class BigQueryCachingExecutor(executor.Executor):
                 array_value, cluster_cols=config.optimize_for.columns
             )
 
+    def get_local_values(self, key: Hashable) -> Optional[Any]:
+        return self.cache.get_local_values(key)
+
+    def cache_local_values(self, key: Hashable, values: Any) -> None:
+        self.cache.cache_local_values(key, values)
+
+    def known_row_count(self, array_value: bigframes.core.ArrayValue) -> Optional[int]:
+        # Cached results know their row count from the destination table metadata.
+        return self.prepare_plan(array_value.node).row_count
+
     # Helpers
     def _run_execute_query(
         self,
@@ -362,6 +390,24 @@ class BigQueryCachingExecutor(executor.Executor):
         if self._labels:
             job_config.labels.update(self._labels)
 
+        if not job_config.dry_run:
+            self._cost_guard.check(sql, job_config)
+
+        with self._publisher.span("execute_query") as span:
+            iterator, job = self._start_query(
+                sql, job_config, query_with_job=query_with_job, session=session
+            )
+            span.rows = iterator.total_rows
+            span.bytes = iterator.total_bytes_processed
+        return iterator, job
+
+    def _start_query(
+        self,
+        sql: str,
+        job_config: bq_job.QueryJobConfig,
+        query_with_job: bool,
+        session=None,
+    ) -> Tuple[bq_table.RowIterator, Optional[bigquery.QueryJob]]:
         try:
             # Trick the type checker into thinking we got a literal.
             if query_with_job:
@@ -399,6 +445,10 @@ class BigQueryCachingExecutor(executor.Executor):
             else:
                 raise
 
+    def _compile_sql(self, request: compile.CompileRequest) -> compile.CompileResult:
+        with self._publisher.span("compile_sql"):
+            return compile.compiler().compile_sql(request)
+
     def _is_trivially_executable(self, array_value: bigframes.core.ArrayValue):
         """
         Can the block be evaluated very cheaply?
@@ -428,9 +478,11 @@ class BigQueryCachingExecutor(executor.Executor):
         ):
             self._simplify_with_caching(plan)
 
-        plan = self.cache.subsitute_cached_subplans(plan)
-        plan = rewrite.column_pruning(plan)
-        plan = plan.top_down(rewrite.fold_row_counts)
+        with self._publisher.span("prepare_plan"):
+            plan = self.cache.subsitute_cached_subplans(plan)
+            plan = rewrite.column_pruning(plan)
+            plan = plan.top_down(rewrite.fold_row_counts)
+            plan = plan.bottom_up(rewrite.try_semi_join)
 
         if target == "bq_execution":
             plan = self._substitute_large_local_sources(plan)
@@ -514,30 +566,26 @@ class BigQueryCachingExecutor(executor.Executor):
         """
         Replace large local sources with the uploaded version of those datasources.
         """
-        # Step 1: Upload all previously un-uploaded data
+        # Step 1: Upload all previously un-uploaded data, except small lookup
+        # tables of joins, which are cheaper to inline than to load.
+        inlined_lookups = bigframes.session.planner.join_lookup_sources(
+            original_root, bigframes.options.compute.maximum_inline_join_bytes
+        )
         needs_upload = []
         for leaf in original_root.unique_nodes():
             if isinstance(leaf, nodes.ReadLocalNode):
                 if (
                     leaf.local_data_source.metadata.total_bytes
                     > bigframes.constants.MAX_INLINE_BYTES
+                    and leaf.local_data_source.id not in inlined_lookups
                 ):
                     needs_upload.append(leaf.local_data_source)
 
-        futures: dict[concurrent.futures.Future, local_data.ManagedArrowTable] = dict()
-        for local_source in needs_upload:
-            future = self.loader.read_data_async(
-                local_source, bigframes.core.guid.generate_guid()
-            )
-            futures[future] = local_source
-        try:
-            for future in concurrent.futures.as_completed(futures.keys()):
-                self.cache.cache_remote_replacement(futures[future], future.result())
-        except Exception as e:
-            # cancel all futures
-            for future in futures:
-                future.cancel()
-            raise e
+        if needs_upload:
+            with self._publisher.span("upload_local_data") as span:
+                span.rows = sum(source.metadata.row_count for source in needs_upload)
+                span.bytes = sum(source.metadata.total_bytes for source in needs_upload)
+                self._upload_local_sources(needs_upload)
 
         # Step 2: Replace local scans with remote scans
         def map_local_scans(node: nodes.BigFrameNode):
@@ -567,6 +615,24 @@ class BigQueryCachingExecutor(executor.Executor):
 
         return original_root.bottom_up(map_local_scans)
 
+    def _upload_local_sources(
+        self, local_sources: Sequence[local_data.ManagedArrowTable]
+    ):
+        futures: dict[concurrent.futures.Future, local_data.ManagedArrowTable] = dict()
+        for local_source in local_sources:
+            future = self.loader.read_data_async(
+                local_source, bigframes.core.guid.generate_guid()
+            )
+            futures[future] = local_source
+        try:
+            for future in concurrent.futures.as_completed(futures.keys()):
+                self.cache.cache_remote_replacement(futures[future], future.result())
+        except Exception as e:
+            # cancel all futures
+            for future in futures:
+                future.cancel()
+            raise e
+
     def _execute_plan_gbq(
         self,
         plan: nodes.BigFrameNode,
@@ -583,6 +649,14 @@ class BigQueryCachingExecutor(executor.Executor):
         og_schema = plan.schema
 
         plan = self.prepare_plan(plan, target="bq_execution")
+        for table_id in bigframes.session.planner.tables_missing_partition_filter(plan):
+            msg = bfe.format_message(
+                f"Table '{table_id}' requires a filter on its partitioning "
+                "column, but the query does not filter on it, so BigQuery will "
+                "reject it. Filter on the partitioning column, or pass "
+                "`filters` to `read_gbq_table`."
+            )
+            warnings.warn(msg, category=bfe.PartitionFilterWarning)
         create_table = must_create_table
         cluster_cols: Sequence[str] = []
         if cache_spec is not None:
@@ -604,7 +678,7 @@ class BigQueryCachingExecutor(executor.Executor):
                 ]
                 cluster_cols = cluster_cols[:_MAX_CLUSTER_COLUMNS]
 
-        compiled = compile.compiler().compile_sql(
+        compiled = self._compile_sql(
             compile.CompileRequest(
                 plan,
                 sort_rows=ordered,
@@ -671,12 +745,14 @@ class BigQueryCachingExecutor(executor.Executor):
                 storage_client=self.bqstoragereadclient,
                 execution_metadata=execution_metadata,
                 selected_fields=tuple((col, col) for col in og_schema.names),
+                publisher=self._publisher,
             )
         else:
             return executor.LocalExecuteResult(
                 data=iterator.to_arrow().select(og_schema.names),
                 bf_schema=plan.schema,
                 execution_metadata=execution_metadata,
+                publisher=self._publisher,
             )
 
 
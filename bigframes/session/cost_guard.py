@@ -0,0 +1,148 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Checks estimated query costs against budgets before queries are run."""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import threading
+from typing import Dict, Optional, Tuple
+import warnings
+
+from google.cloud import bigquery
+import google.cloud.bigquery.job as bq_job
+
+import bigframes
+import bigframes.exceptions as bfe
+import bigframes.formatting_helpers as formatting_helpers
+import bigframes.session.metrics
+
+_SUGGESTION = (
+    "To reduce the bytes processed, filter on partitioning or clustering "
+    "columns, select fewer columns, or call `cache()` on intermediate results "
+    "that are used more than once."
+)
+
+
+@dataclasses.dataclass(frozen=True)
+class QueryEstimate:
+    """The dry run estimate of a query."""
+
+    bytes_processed: int
+    referenced_tables: Tuple[str, ...] = ()
+
+
+class QueryCostGuard:
+    """Dry runs queries to enforce the estimated bytes budgets in
+    ``bigframes.options.compute``.
+
+    Estimates are cached per SQL text, so re-running a query does not dry run
+    it again.
+    """
+
+    def __init__(
+        self,
+        bqclient: bigquery.Client,
+        metrics: Optional[bigframes.session.metrics.ExecutionMetrics] = None,
+    ):
+        self._bqclient = bqclient
+        self._metrics = metrics
+        self._estimates: Dict[str, QueryEstimate] = {}
+        self._session_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def session_bytes_estimated(self) -> int:
+        """Total estimated bytes of the queries allowed to run so far."""
+        return self._session_bytes
+
+    def check(self, sql: str, job_config: bq_job.QueryJobConfig) -> None:
+        """Checks the query against the budgets, if any are set.
+
+        Raises:
+            bigframes.exceptions.MaximumBytesEstimatedExceeded:
+                If a budget would be exceeded and
+                ``estimated_bytes_exceeded_action`` is ``"raise"``.
+        """
+        options = bigframes.options.compute
+        maximum_query_bytes = options.maximum_bytes_estimated
+        maximum_session_bytes = options.maximum_session_bytes_estimated
+        if maximum_query_bytes is None and maximum_session_bytes is None:
+            return
+
+        estimate = self.estimate(sql, job_config)
+        problems = []
+        if (
+            maximum_query_bytes is not None
+            and estimate.bytes_processed > maximum_query_bytes
+        ):
+            problems.append(
+                "exceeding `bpd.options.compute.maximum_bytes_estimated` of "
+                f"{formatting_helpers.get_formatted_bytes(maximum_query_bytes)}"
+            )
+        with self._lock:
+            session_bytes = self._session_bytes + estimate.bytes_processed
+            if (
+                maximum_session_bytes is not None
+                and session_bytes > maximum_session_bytes
+            ):
+                problems.append(
+                    "bringing the session total to "
+                    f"{formatting_helpers.get_formatted_bytes(session_bytes)}, "
+                    "exceeding `bpd.options.compute.maximum_session_bytes_estimated` of "
+                    f"{formatting_helpers.get_formatted_bytes(maximum_session_bytes)}"
+                )
+
+            if problems:
+                message = _format_message(estimate, problems)
+                if options.estimated_bytes_exceeded_action == "raise":
+                    raise bfe.MaximumBytesEstimatedExceeded(message)
+                warnings.warn(message, category=bfe.MaximumBytesEstimatedWarning)
+            self._session_bytes = session_bytes
+            if self._metrics is not None:
+                self._metrics.bytes_estimated += estimate.bytes_processed
+
+    def estimate(self, sql: str, job_config: bq_job.QueryJobConfig) -> QueryEstimate:
+        """Dry runs the query, unless it has been estimated before."""
+        with self._lock:
+            cached = self._estimates.get(sql)
+        if cached is not None:
+            return cached
+
+        dry_run_config = copy.deepcopy(job_config)
+        dry_run_config.dry_run = True
+        query_job = self._bqclient.query(sql, job_config=dry_run_config)
+        bytes_processed = query_job.total_bytes_processed
+        estimate = QueryEstimate(
+            bytes_processed=bytes_processed if isinstance(bytes_processed, int) else 0,
+            referenced_tables=tuple(
+                str(table) for table in (query_job.referenced_tables or ())
+            ),
+        )
+        with self._lock:
+            self._estimates[sql] = estimate
+        return estimate
+
+
+def _format_message(estimate: QueryEstimate, problems: list[str]) -> str:
+    message = (
+        "Query is estimated to process "
+        f"{formatting_helpers.get_formatted_bytes(estimate.bytes_processed)}, "
+        f"{' and '.join(problems)}."
+    )
+    if estimate.referenced_tables:
+        message += f" It reads from {', '.join(estimate.referenced_tables)}."
+    return bfe.format_message(f"{message} {_SUGGESTION}")
@@ -14,14 +14,18 @@
 
 from __future__ import annotations
 
+import collections
 import dataclasses
-from typing import Mapping, Optional
+import threading
+from typing import Any, Hashable, Mapping, Optional
 import weakref
 
 from bigframes.core import bq_data, local_data, nodes
 
 SourceIdMapping = Mapping[str, str]
 
+_MAX_LOCAL_VALUES_CACHED = 64
+
 
 @dataclasses.dataclass(frozen=True)
 class UploadedLocalData:
@@ -40,6 +44,12 @@ class ExecutionCache:
             local_data.ManagedArrowTable,
             UploadedLocalData,
         ] = weakref.WeakKeyDictionary()
+        # Small values read to build plans, such as the unique values of pivot
+        # columns, keyed by the plan they were read from.
+        self._local_values: collections.OrderedDict[
+            Hashable, Any
+        ] = collections.OrderedDict()
+        self._local_values_lock = threading.Lock()
 
     def subsitute_cached_subplans(self, root: nodes.BigFrameNode) -> nodes.BigFrameNode:
         def replace_if_cached(node: nodes.BigFrameNode) -> nodes.BigFrameNode:
@@ -86,3 +96,18 @@ class ExecutionCache:
         self, local_data: local_data.ManagedArrowTable
     ) -> Optional[UploadedLocalData]:
         return self._uploaded_local_data.get(local_data)
+
+    ## Local values caching
+    def cache_local_values(self, key: Hashable, values: Any):
+        with self._local_values_lock:
+            self._local_values[key] = values
+            self._local_values.move_to_end(key)
+            while len(self._local_values) > _MAX_LOCAL_VALUES_CACHED:
+                self._local_values.popitem(last=False)
+
+    def get_local_values(self, key: Hashable) -> Optional[Any]:
+        with self._local_values_lock:
+            values = self._local_values.get(key)
+            if values is not None:
+                self._local_values.move_to_end(key)
+            return values
@@ -18,7 +18,7 @@ import abc
 import dataclasses
 import functools
 import itertools
-from typing import Iterator, Literal, Optional, Sequence, Union
+from typing import Any, Hashable, Iterator, Literal, Optional, Sequence, Union
 
 from google.cloud import bigquery, bigquery_storage_v1
 import google.cloud.bigquery.table as bq_table
@@ -28,7 +28,7 @@ import pyarrow as pa
 
 import bigframes
 import bigframes.core
-from bigframes.core import bq_data, local_data, pyarrow_utils
+from bigframes.core import bq_data, events, local_data, pyarrow_utils
 import bigframes.core.schema
 import bigframes.dtypes
 import bigframes.session._io.pandas as io_pandas
@@ -52,11 +52,13 @@ class ResultsIterator(Iterator[pa.RecordBatch]):
         schema: bigframes.core.schema.ArraySchema,
         total_rows: Optional[int] = 0,
         total_bytes: Optional[int] = 0,
+        publisher: Optional[events.Publisher] = None,
     ):
         self._batches = batches
         self._schema = schema
         self._total_rows = total_rows
         self._total_bytes = total_bytes
+        self._publisher = publisher
 
     @property
     def approx_total_rows(self) -> Optional[int]:
@@ -111,7 +113,9 @@ class ResultsIterator(Iterator[pa.RecordBatch]):
                 return self._schema.to_pyarrow(use_storage_types=True).empty_table()
 
     def to_pandas(self, limit: Optional[int] = None) -> pd.DataFrame:
-        return io_pandas.arrow_to_pandas(self.to_arrow_table(limit=limit), self._schema)
+        return io_pandas.arrow_to_pandas(
+            self.to_arrow_table(limit=limit), self._schema, publisher=self._publisher
+        )
 
     def to_pandas_batches(
         self, page_size: Optional[int] = None, max_results: Optional[int] = None
@@ -133,7 +137,11 @@ class ResultsIterator(Iterator[pa.RecordBatch]):
             )
 
         yield from map(
-            functools.partial(io_pandas.arrow_to_pandas, schema=self._schema),
+            functools.partial(
+                io_pandas.arrow_to_pandas,
+                schema=self._schema,
+                publisher=self._publisher,
+            ),
             batch_iter,
         )
 
@@ -191,9 +199,11 @@ class LocalExecuteResult(ExecuteResult):
         data: pa.Table,
         bf_schema: bigframes.core.schema.ArraySchema,
         execution_metadata: ExecutionMetadata = ExecutionMetadata(),
+        publisher: Optional[events.Publisher] = None,
     ):
         self._data = local_data.ManagedArrowTable.from_pyarrow(data, bf_schema)
         self._execution_metadata = execution_metadata
+        self._publisher = publisher
 
     @property
     def execution_metadata(self) -> ExecutionMetadata:
@@ -209,6 +219,7 @@ class LocalExecuteResult(ExecuteResult):
             self.schema,
             self._data.metadata.row_count,
             self._data.metadata.total_bytes,
+            publisher=self._publisher,
         )
 
 
@@ -243,12 +254,14 @@ class BQTableExecuteResult(ExecuteResult):
         execution_metadata: ExecutionMetadata = ExecutionMetadata(),
         limit: Optional[int] = None,
         selected_fields: Optional[Sequence[tuple[str, str]]] = None,
+        publisher: Optional[events.Publisher] = None,
     ):
         self._data = data
         self._project_id = project_id
         self._execution_metadata = execution_metadata
         self._storage_client = storage_client
         self._limit = limit
+        self._publisher = publisher
         self._selected_fields = selected_fields or [
             (name, name) for name in data.schema.names
         ]
@@ -270,6 +283,7 @@ class BQTableExecuteResult(ExecuteResult):
             self._storage_client,
             self._project_id,
             sample_rate=sample_rate,
+            publisher=self._publisher,
         )
         arrow_batches: Iterator[pa.RecordBatch] = map(
             functools.partial(
@@ -291,7 +305,13 @@ class BQTableExecuteResult(ExecuteResult):
             approx_bytes = None
             approx_rows = None
 
-        return ResultsIterator(arrow_batches, self.schema, approx_rows, approx_bytes)
+        return ResultsIterator(
+            arrow_batches,
+            self.schema,
+            approx_rows,
+            approx_bytes,
+            publisher=self._publisher,
+        )
 
 
 @dataclasses.dataclass(frozen=True)
@@ -350,3 +370,21 @@ class Executor(abc.ABC):
         config: CacheConfig,
     ) -> None:
         raise NotImplementedError("cached not implemented for this executor")
+
+    def known_row_count(self, array_value: bigframes.core.ArrayValue) -> Optional[int]:
+        """
+        Get the number of rows in the ArrayValue if it is known without running a query, otherwise None.
+        """
+        return array_value.node.row_count
+
+    def get_local_values(self, key: Hashable) -> Optional[Any]:
+        """
+        Get values memoized with cache_local_values, if any.
+        """
+        return None
+
+    def cache_local_values(self, key: Hashable, values: Any) -> None:
+        """
+        Memoize small values read to build a plan, such as the unique values of pivot columns.
+        """
+        return
@@ -76,7 +76,6 @@ from bigframes.session import dry_runs
 import bigframes.session._io.bigquery as bf_io_bigquery
 import bigframes.session._io.bigquery.read_gbq_query as bf_read_gbq_query
 import bigframes.session._io.bigquery.read_gbq_table as bf_read_gbq_table
-import bigframes.session.iceberg
 import bigframes.session.metrics
 import bigframes.session.temporary_storage
 import bigframes.session.time as session_time
@@ -1064,6 +1063,9 @@ class GbqDataLoader:
             )
             table = bq_data.GbqNativeTable.from_table(client_table)
         elif bq_data.is_irc_table(table_id):
+            # Imported here to avoid loading pyiceberg at import time.
+            import bigframes.session.iceberg
+
             table = bigframes.session.iceberg.get_table(
                 self._bqclient.project, table_id, self._bqclient._credentials
             )
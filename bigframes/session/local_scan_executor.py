@@ -15,7 +15,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from bigframes.core import bigframe_node, rewrite
+from bigframes.core import bigframe_node, events, rewrite
 from bigframes.session import executor, semi_executor
 
 
@@ -24,6 +24,9 @@ class LocalScanExecutor(semi_executor.SemiExecutor):
     Executes plans reducible to a arrow table scan.
     """
 
+    def __init__(self, publisher: Optional[events.Publisher] = None):
+        self._publisher = publisher
+
     def execute(
         self,
         plan: bigframe_node.BigFrameNode,
@@ -60,4 +63,5 @@ class LocalScanExecutor(semi_executor.SemiExecutor):
         return executor.LocalExecuteResult(
             data=arrow_table,
             bf_schema=plan.schema,
+            publisher=self._publisher,
         )
@@ -0,0 +1,146 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import Callable, Iterator, Optional
+
+from bigframes.core import (
+    array_value,
+    bigframe_node,
+    events,
+    expression,
+    local_data,
+    nodes,
+)
+from bigframes.core import schema as schemata
+from bigframes.operations import remote_function_ops
+from bigframes.session import executor, semi_executor
+
+_REMOTE_FUNCTION_OPS = (
+    remote_function_ops.RemoteFunctionOp,
+    remote_function_ops.BinaryRemoteFunctionOp,
+    remote_function_ops.NaryRemoteFunctionOp,
+)
+
+
+def _expr_ops(expr: expression.Expression) -> Iterator:
+    if isinstance(expr, expression.OpExpression):
+        yield expr.op
+    for child in expr.children:
+        yield from _expr_ops(child)
+
+
+def has_emulated_udf(plan: bigframe_node.BigFrameNode) -> bool:
+    """Whether the plan calls any function emulated in process."""
+    for node in plan.unique_nodes():
+        for expr in node._node_expressions:
+            if not isinstance(expr, expression.Expression):
+                continue
+            for op in _expr_ops(expr):
+                if (
+                    isinstance(op, _REMOTE_FUNCTION_OPS)
+                    and op.function_def.local is not None
+                ):
+                    return True
+    return False
+
+
+class LocalUdfExecutor(semi_executor.SemiExecutor):
+    """
+    Executes plans calling functions emulated in process, with polars.
+
+    The parts of the plan that read BigQuery data and don't call emulated
+    functions are executed with ``materialize`` first, and their results are
+    processed locally.
+    """
+
+    def __init__(
+        self,
+        materialize: Callable[[bigframe_node.BigFrameNode], executor.ExecuteResult],
+        publisher: Optional[events.Publisher] = None,
+    ):
+        # This will error out if polars is not installed
+        from bigframes.core.compile.polars import PolarsCompiler
+
+        self._compiler = PolarsCompiler()
+        self._materialize = materialize
+        self._publisher = publisher
+
+    def execute(
+        self,
+        plan: bigframe_node.BigFrameNode,
+        ordered: bool,
+        peek: Optional[int] = None,
+    ) -> Optional[executor.ExecuteResult]:
+        if not has_emulated_udf(plan):
+            return None
+        import polars as pl
+
+        local_plan = self._localize(plan)
+        try:
+            lazy_frame: pl.LazyFrame = self._compiler.compile(
+                array_value.ArrayValue(local_plan).node
+            )
+        except Exception as exc:
+            # Emulated functions aren't deployed, so BigQuery can't run them.
+            raise NotImplementedError(
+                f"Cannot run a query calling functions emulated in process: {exc}"
+            ) from exc
+        if peek is not None:
+            lazy_frame = lazy_frame.limit(peek)
+        try:
+            pa_table = lazy_frame.collect().to_arrow()
+        except pl.exceptions.PanicException as exc:
+            # Exceptions raised by the function are turned into panics.
+            raise RuntimeError(f"Function emulated in process failed: {exc}") from exc
+        return executor.LocalExecuteResult(
+            data=pa_table,
+            bf_schema=plan.schema,
+            publisher=self._publisher,
+        )
+
+    def _localize(self, node: bigframe_node.BigFrameNode) -> bigframe_node.BigFrameNode:
+        """Replaces the subtrees that read BigQuery data with their results."""
+        if has_emulated_udf(node):
+            return node.transform_children(self._localize)
+        if all(
+            isinstance(leaf, nodes.ReadLocalNode)
+            for leaf in node.unique_nodes()
+            if isinstance(leaf, nodes.LeafNode)
+        ):
+            return node
+
+        table = self._materialize(node).batches().to_arrow_table()
+        names = [f"col_{i}" for i in range(len(node.fields))]
+        schema = schemata.ArraySchema(
+            tuple(
+                schemata.SchemaItem(name, field.dtype)
+                for name, field in zip(names, node.fields)
+            )
+        )
+        source = local_data.ManagedArrowTable.from_pyarrow(
+            table.rename_columns(names), schema
+        )
+        scan_list = nodes.ScanList(
+            tuple(
+                nodes.ScanItem(field.id, name)
+                for name, field in zip(names, node.fields)
+            )
+        )
+        session = next(
+            leaf.table_session
+            for leaf in node.unique_nodes()
+            if isinstance(leaf, nodes.ReadTableNode)
+        )
+        return nodes.ReadLocalNode(source, scan_list=scan_list, session=session)
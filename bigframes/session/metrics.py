@@ -32,6 +32,11 @@ class ExecutionMetrics:
     bytes_processed: int = 0
     execution_secs: float = 0
     query_char_count: int = 0
+    # Estimated by dry runs before execution, see ComputeOptions.maximum_bytes_estimated.
+    bytes_estimated: int = 0
+    # Prompts answered from, or added to, ComputeOptions.ai_ops_cache_dataset.
+    ai_prompt_cache_hits: int = 0
+    ai_prompt_cache_misses: int = 0
 
     def count_job_stats(
         self,
@@ -15,12 +15,14 @@
 from __future__ import annotations
 
 import itertools
-from typing import Sequence, Tuple
+from typing import Dict, Sequence, Set, Tuple
+import uuid
 
 import bigframes.core.expression as ex
 import bigframes.core.identifiers as ids
 import bigframes.core.nodes as nodes
 import bigframes.core.pruning as predicate_pruning
+import bigframes.core.rewrite as rewrite
 import bigframes.core.tree_properties as traversals
 import bigframes.dtypes
 
@@ -83,3 +85,88 @@ def session_aware_cache_plan(
     # BQ supports up to 4 cluster columns, just prioritize by alphabetical ordering
     # TODO: Prioritize caching columns by estimated filter selectivity
     return caching_target, sorted(list(clusterable_cols))[:4]
+
+
+def join_lookup_sources(root: nodes.BigFrameNode, max_bytes: int) -> Set[uuid.UUID]:
+    """
+    Finds the local data read by one side of a join that is small enough to inline.
+
+    Returns the ids of the local data sources, smallest first, up to a total of
+    max_bytes for the whole query. Looks through selections, projections and
+    filters between the join and the local scan.
+    """
+    candidates: Dict[uuid.UUID, int] = {}
+    for node in root.unique_nodes():
+        if not isinstance(node, (nodes.JoinNode, nodes.InNode)):
+            continue
+        for side in node.child_nodes:
+            while isinstance(
+                side, (nodes.SelectionNode, nodes.ProjectionNode, nodes.FilterNode)
+            ):
+                side = side.child
+            if isinstance(side, nodes.ReadLocalNode):
+                source = side.local_data_source
+                candidates[source.id] = source.metadata.total_bytes
+
+    # Inlined data adds to the length of the query text, so the limit applies
+    # to all the sources together rather than to each one.
+    sources: Set[uuid.UUID] = set()
+    total_bytes = 0
+    for source_id, source_bytes in sorted(candidates.items(), key=lambda x: x[1]):
+        if total_bytes + source_bytes > max_bytes:
+            break
+        sources.add(source_id)
+        total_bytes += source_bytes
+    return sources
+
+
+def tables_missing_partition_filter(root: nodes.BigFrameNode) -> list[str]:
+    """
+    Finds the tables that require a partition filter but are read without one.
+
+    BigQuery rejects such queries, so this lets callers explain the failure
+    before running them. Only filters that can be pushed down to the scan
+    count, as BigQuery cannot use the others to eliminate partitions.
+    """
+    root = rewrite.push_down_pruning_filters(root)
+    filtered_ids: set[ids.ColumnId] = set()
+    for node in root.unique_nodes():
+        if isinstance(node, nodes.FilterNode):
+            filtered_ids.update(
+                predicate_pruning.cluster_cols_for_predicate(
+                    node.predicate, set(node.predicate.column_references)
+                )
+            )
+
+    missing = []
+    for node in root.unique_nodes():
+        if not isinstance(node, nodes.ReadTableNode):
+            continue
+        table = node.source.table
+        if not table.require_partition_filter or table.partition_col is None:
+            continue
+        if _sql_predicate_references(node.source.sql_predicate, table.partition_col):
+            continue
+        if any(
+            item.source_id == table.partition_col and item.id in filtered_ids
+            for item in node.scan_list.items
+        ):
+            continue
+        missing.append(table.get_full_id())
+    return missing
+
+
+def _sql_predicate_references(sql_predicate: str | None, column: str) -> bool:
+    if not sql_predicate:
+        return False
+    # sqlglot is slow to import, so only load it when needed.
+    import bigframes_vendored.sqlglot as sg
+    import bigframes_vendored.sqlglot.errors as sg_errors
+    import bigframes_vendored.sqlglot.expressions as sge
+
+    try:
+        parsed = sg.parse_one(sql_predicate, dialect="bigquery")
+    except sg_errors.ParseError:
+        # Cannot tell, so do not warn.
+        return True
+    return any(col.name == column for col in parsed.find_all(sge.Column))
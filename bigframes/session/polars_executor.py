@@ -20,6 +20,7 @@ from bigframes.core import (
     agg_expressions,
     array_value,
     bigframe_node,
+    events,
     expression,
     nodes,
 )
@@ -131,11 +132,12 @@ def _is_node_polars_executable(node: nodes.BigFrameNode):
 
 
 class PolarsExecutor(semi_executor.SemiExecutor):
-    def __init__(self):
+    def __init__(self, publisher: Optional[events.Publisher] = None):
         # This will error out if polars is not installed
         from bigframes.core.compile.polars import PolarsCompiler
 
         self._compiler = PolarsCompiler()
+        self._publisher = publisher
 
     def execute(
         self,
@@ -158,6 +160,7 @@ class PolarsExecutor(semi_executor.SemiExecutor):
         return executor.LocalExecuteResult(
             data=pa_table,
             bf_schema=plan.schema,
+            publisher=self._publisher,
         )
 
     def _can_execute(self, plan: bigframe_node.BigFrameNode):
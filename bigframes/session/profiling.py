@@ -0,0 +1,117 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-phase execution profiling built on the session event publisher."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+import pandas
+
+import bigframes.core.events as events
+
+
+class ExecutionProfile:
+    """Collects span events published while a session is being profiled.
+
+    Instances are event callbacks; see :meth:`bigframes.session.Session.profile`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: list[events.SpanFinished] = []
+
+    def __call__(self, event: events.Event):
+        if isinstance(event, events.SpanFinished):
+            with self._lock:
+                self.spans.append(event)
+
+    def summary(self) -> pandas.DataFrame:
+        """Aggregate the collected spans by phase name.
+
+        Returns:
+            pandas.DataFrame:
+                One row per phase with the number of spans, the total and
+                maximum duration in seconds, and the total rows and bytes.
+        """
+        with self._lock:
+            spans = list(self.spans)
+
+        phases: dict[str, dict[str, Any]] = {}
+        for span in spans:
+            phase = phases.setdefault(
+                span.name,
+                {"count": 0, "total_secs": 0.0, "max_secs": 0.0, "rows": 0, "bytes": 0},
+            )
+            secs = span.duration.total_seconds()
+            phase["count"] += 1
+            phase["total_secs"] += secs
+            phase["max_secs"] = max(phase["max_secs"], secs)
+            phase["rows"] += span.rows if isinstance(span.rows, int) else 0
+            phase["bytes"] += span.bytes if isinstance(span.bytes, int) else 0
+
+        return pandas.DataFrame.from_dict(
+            phases,
+            orient="index",
+            columns=["count", "total_secs", "max_secs", "rows", "bytes"],
+        ).rename_axis("phase")
+
+    def __str__(self) -> str:
+        if not self.spans:
+            return "No execution phases were recorded."
+        return self.summary().to_string()
+
+
+class OpenTelemetryExporter:
+    """Forwards span events to an OpenTelemetry tracer.
+
+    Requires the ``opentelemetry-api`` package.
+
+    Args:
+        tracer (opentelemetry.trace.Tracer, Optional):
+            Tracer used to record spans. Defaults to the tracer named
+            ``bigframes`` from the global tracer provider.
+    """
+
+    def __init__(self, tracer: Optional[Any] = None):
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError as e:
+                raise ImportError(
+                    "Please `pip install opentelemetry-api` or "
+                    "`pip install 'bigframes[opentelemetry]'` to export spans "
+                    "to OpenTelemetry."
+                ) from e
+            tracer = trace.get_tracer("bigframes")
+        self._tracer = tracer
+
+    def __call__(self, event: events.Event):
+        if not isinstance(event, events.SpanFinished):
+            return
+
+        start_ns = int(event.start_time.timestamp() * 1e9)
+        end_ns = start_ns + int(event.duration.total_seconds() * 1e9)
+        attributes = {}
+        if isinstance(event.rows, int):
+            attributes["bigframes.rows"] = event.rows
+        if isinstance(event.bytes, int):
+            attributes["bigframes.bytes"] = event.bytes
+
+        span = self._tracer.start_span(
+            f"bigframes.{event.name}", start_time=start_ns, attributes=attributes
+        )
+        span.end(end_time=end_ns)
@@ -13,11 +13,14 @@
 # limitations under the License.
 from __future__ import annotations
 
+import dataclasses
 from typing import Optional
 
 from google.cloud import bigquery_storage_v1
+import pyarrow as pa
 
-from bigframes.core import bigframe_node, bq_data, nodes, rewrite
+from bigframes.core import bigframe_node, bq_data, events, nodes, rewrite
+import bigframes.core.expression as ex
 from bigframes.session import executor, semi_executor
 
 
@@ -30,9 +33,11 @@ class ReadApiSemiExecutor(semi_executor.SemiExecutor):
         self,
         bqstoragereadclient: bigquery_storage_v1.BigQueryReadClient,
         project: str,
+        publisher: Optional[events.Publisher] = None,
     ):
         self.bqstoragereadclient = bqstoragereadclient
         self.project = project
+        self._publisher = publisher
 
     def execute(
         self,
@@ -40,6 +45,10 @@ class ReadApiSemiExecutor(semi_executor.SemiExecutor):
         ordered: bool,
         peek: Optional[int] = None,
     ) -> Optional[executor.ExecuteResult]:
+        row_range = self._try_adapt_row_range(plan, peek)
+        if row_range is not None:
+            return self._read_row_range(*row_range, ordered=ordered)
+
         adapt_result = self._try_adapt_plan(plan, ordered)
         if not adapt_result:
             return None
@@ -65,6 +74,7 @@ class ReadApiSemiExecutor(semi_executor.SemiExecutor):
             selected_fields=[
                 (item.source_id, item.id.sql) for item in node.scan_list.items
             ],
+            publisher=self._publisher,
         )
 
     def _try_adapt_plan(
@@ -88,3 +98,81 @@ class ReadApiSemiExecutor(semi_executor.SemiExecutor):
             # read api can only use physical ordering to limit, not a logical ordering
             return None
         return (read_table_node, limit)
+
+    def _try_adapt_row_range(
+        self,
+        plan: bigframe_node.BigFrameNode,
+        peek: Optional[int] = None,
+    ) -> Optional[tuple[nodes.ReadTableNode, str, str]]:
+        """
+        Tries to simplify the plan to a slice of a table scan, where the table has sequential offsets, such as a cached table.
+
+        Returns the table scan, the offsets column and the row restriction selecting the slice. Otherwise, returns None.
+        """
+        if not isinstance(plan, nodes.SliceNode) or plan.step != 1:
+            return None
+        start = plan.start or 0
+        stop = plan.stop
+        if start < 0 or (stop is not None and stop < 0):
+            return None
+        if peek is not None:
+            stop = start + peek if stop is None else min(stop, start + peek)
+
+        node = rewrite.try_reduce_to_table_scan(plan.child)
+        if node is None:
+            return None
+        source = node.source
+        if not isinstance(source.table, bq_data.GbqNativeTable):
+            return None
+        if not source.table.is_physically_stored:
+            return None
+        if source.sql_predicate or (source.ordering is None):
+            return None
+        if not source.ordering.is_sequential:
+            return None
+        (order_col, *rest) = source.ordering.all_ordering_columns
+        if rest or not order_col.direction.is_ascending:
+            return None
+        if not isinstance(order_col.scalar_expression, ex.DerefOp):
+            return None
+
+        offsets_col = order_col.scalar_expression.id.name
+        if offsets_col not in source.schema.names:
+            return None
+        row_restriction = f"`{offsets_col}` >= {start}"
+        if stop is not None:
+            row_restriction += f" AND `{offsets_col}` < {stop}"
+        return node, offsets_col, row_restriction
+
+    def _read_row_range(
+        self,
+        node: nodes.ReadTableNode,
+        offsets_col: str,
+        row_restriction: str,
+        *,
+        ordered: bool,
+    ) -> executor.ExecuteResult:
+        source_ids = [item.source_id for item in node.scan_list.items]
+        columns = list(dict.fromkeys([*source_ids, offsets_col]))
+        read_result = bq_data.get_arrow_batches(
+            dataclasses.replace(node.source, sql_predicate=row_restriction),
+            columns,
+            self.bqstoragereadclient,
+            self.project,
+            publisher=self._publisher,
+        )
+        table = pa.Table.from_batches(
+            list(read_result.iter),
+            schema=node.source.schema.select(columns).to_pyarrow(),
+        )
+        # Rows within the range are not returned in any particular order.
+        if ordered:
+            table = table.sort_by(offsets_col)
+        table = table.select(source_ids).rename_columns(
+            [item.id.sql for item in node.scan_list.items]
+        )
+        return executor.LocalExecuteResult(
+            data=table,
+            bf_schema=node.schema,
+            publisher=self._publisher,
+        )
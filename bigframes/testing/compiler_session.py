@@ -17,6 +17,7 @@ import typing
 
 import bigframes.core
 import bigframes.core.compile as compile
+import bigframes.core.compile.sqlglot as sqlglot
 import bigframes.session.executor
 
 
@@ -24,7 +25,7 @@ import bigframes.session.executor
 class SQLCompilerExecutor(bigframes.session.executor.Executor):
     """Executor for SQL compilation using sqlglot."""
 
-    compiler = compile.sqlglot
+    compiler = sqlglot
 
     def to_sql(
         self,
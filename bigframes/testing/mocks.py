@@ -45,6 +45,7 @@ def create_bigquery_session(
     anonymous_dataset: Optional[google.cloud.bigquery.DatasetReference] = None,
     location: str = "test-region",
     ordering_mode: Literal["strict", "partial"] = "partial",
+    udf_emulation: Optional[Literal["thread", "process"]] = None,
 ) -> bigframes.Session:
     """[Experimental] Create a mock BigQuery DataFrames session that avoids making Google Cloud API calls.
 
@@ -153,6 +154,7 @@ def create_bigquery_session(
         credentials=credentials,
         location=location,
         ordering_mode=ordering_mode,
+        udf_emulation=udf_emulation,
     )
     session = bigframes.Session(context=bqoptions, clients_provider=clients_provider)
     session._bq_connection_manager = mock.create_autospec(
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 import dataclasses
-from typing import Union
+from typing import Any, Hashable, Optional, Union
 import weakref
 
 import pandas
@@ -23,6 +23,7 @@ import bigframes
 import bigframes.core.blocks
 import bigframes.core.compile.polars
 import bigframes.dataframe
+import bigframes.session.execution_cache
 import bigframes.session.execution_spec
 import bigframes.session.executor
 import bigframes.session.metrics
@@ -32,6 +33,9 @@ import bigframes.session.metrics
 @dataclasses.dataclass
 class TestExecutor(bigframes.session.executor.Executor):
     compiler = bigframes.core.compile.polars.PolarsCompiler()
+    cache: bigframes.session.execution_cache.ExecutionCache = dataclasses.field(
+        default_factory=bigframes.session.execution_cache.ExecutionCache
+    )
 
     def execute(
         self,
@@ -64,6 +68,12 @@ class TestExecutor(bigframes.session.executor.Executor):
     ) -> None:
         return
 
+    def get_local_values(self, key: Hashable) -> Optional[Any]:
+        return self.cache.get_local_values(key)
+
+    def cache_local_values(self, key: Hashable, values: Any) -> None:
+        self.cache.cache_local_values(key, values)
+
 
 class TestSession(bigframes.session.Session):
     def __init__(self):
@@ -79,6 +79,8 @@ extras = {
     # used for local engine
     "polars": ["polars >= 1.21.0"],
     "scikit-learn": ["scikit-learn>=1.2.2"],
+    # used for exporting execution profiles
+    "opentelemetry": ["opentelemetry-api >= 1.20.0"],
     # Packages required for basic development flow.
     "dev": [
         "pytest",
@@ -0,0 +1,83 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures cold-start import time with `python -X importtime`.
+
+Each iteration imports the module in a fresh interpreter, so cached modules
+from earlier benchmarks don't affect the result.
+"""
+
+import argparse
+import pathlib
+import subprocess
+import sys
+
+import bigframes.session.metrics
+
+# Heavy optional dependencies that should only be imported when used.
+DEFERRED_MODULES = (
+    "bigframes_vendored.ibis",
+    "bigframes_vendored.sqlglot",
+    "pyiceberg",
+)
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse `-X importtime` output into cumulative microseconds per module."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # header line
+        cumulative[parts[2].strip()] = int(parts[1])
+    return cumulative
+
+
+def import_time(module: str) -> dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", type=str, required=True)
+    parser.add_argument("--benchmark_suffix", type=str)
+    args = parser.parse_args()
+
+    cumulative = import_time(args.module)
+    seconds = cumulative[args.module] / 1e6
+    print(f"import {args.module}: {seconds:.3f}s")
+
+    eagerly_imported = [name for name in DEFERRED_MODULES if name in cumulative]
+    if eagerly_imported:
+        print(f"Deferred modules imported eagerly: {', '.join(eagerly_imported)}")
+
+    current_path = pathlib.Path(__file__).absolute()
+    clock_time_file_path = (
+        f"{current_path}_{args.benchmark_suffix}.local_exec_time_seconds"
+    )
+    with open(clock_time_file_path, "a") as log_file:
+        log_file.write(f"{seconds}\n")
+
+    # No queries are run, but the report expects BigQuery stats for each benchmark.
+    bigframes.session.metrics.write_stats_to_disk(
+        query_char_count=0, bytes_processed=0, slot_millis=0, exec_seconds=0
+    )
@@ -0,0 +1,76 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the throughput of the remote function HTTP handlers.
+
+The handlers run locally in a Flask request context, so only the time spent
+in the cloud function decoding the batch, calling the user code and encoding
+the replies is measured.
+"""
+
+import argparse
+import pathlib
+import time
+
+import flask
+
+import bigframes.functions.function_template as bff_template
+import bigframes.session.metrics
+
+
+def scaled_sum(x, y):
+    return x * 2 + y
+
+
+def handle_batches(num_rows: int, num_batches: int, vectorized: bool) -> float:
+    bff_template.input_types = ("INT64", "FLOAT64")
+    bff_template.output_type = "FLOAT64"
+    bff_template.udf = scaled_sum  # type: ignore
+    handler = bff_template.udf_http_vectorized if vectorized else bff_template.udf_http
+    calls = [[i, i / 2] for i in range(num_rows)]
+
+    app = flask.Flask(__name__)
+    start_time = time.perf_counter()
+    for _ in range(num_batches):
+        with app.test_request_context(json={"calls": calls}):
+            handler(flask.request)
+    return time.perf_counter() - start_time
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_rows", type=int, required=True)
+    parser.add_argument("--num_batches", type=int, default=20)
+    parser.add_argument("--vectorized", type=lambda value: value == "True")
+    parser.add_argument("--benchmark_suffix", type=str)
+    args = parser.parse_args()
+
+    seconds = handle_batches(args.num_rows, args.num_batches, args.vectorized)
+    rows_per_second = args.num_rows * args.num_batches / seconds
+    print(
+        f"{args.num_rows} rows per batch (vectorized={args.vectorized}): "
+        f"{seconds / args.num_batches:.4f}s per batch, {rows_per_second:.0f} rows/s"
+    )
+
+    current_path = pathlib.Path(__file__).absolute()
+    clock_time_file_path = (
+        f"{current_path}_{args.benchmark_suffix}.local_exec_time_seconds"
+    )
+    with open(clock_time_file_path, "a") as log_file:
+        log_file.write(f"{seconds}\n")
+
+    # No queries are run, but the report expects BigQuery stats for each benchmark.
+    bigframes.session.metrics.write_stats_to_disk(
+        query_char_count=0, bytes_processed=0, slot_millis=0, exec_seconds=0
+    )
@@ -0,0 +1,68 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures client-side planning time for operations over very wide tables.
+
+Uses a mock session, so only plan construction, rewriting and SQL compilation
+are timed. Planning time should grow linearly with the number of columns.
+"""
+
+import argparse
+import pathlib
+import time
+
+import google.cloud.bigquery as bigquery
+
+import bigframes
+import bigframes.session.metrics
+from bigframes.testing import mocks
+
+
+def plan_wide_table(num_columns: int) -> str:
+    schema = [bigquery.SchemaField("rowindex", "INTEGER")] + [
+        bigquery.SchemaField(f"col_{i}", "FLOAT") for i in range(num_columns)
+    ]
+    session = mocks.create_bigquery_session(table_schema=schema)
+    df = session.read_gbq("test-project.test_dataset.test_table", index_col="rowindex")
+
+    # Each operation touches every column.
+    df = (df + 1).fillna(0).astype("Float64")
+    return df.sql
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num_columns", type=int, required=True)
+    parser.add_argument("--sql_compiler", type=str, default="stable")
+    parser.add_argument("--benchmark_suffix", type=str)
+    args = parser.parse_args()
+
+    bigframes.options.experiments.sql_compiler = args.sql_compiler
+
+    start_time = time.perf_counter()
+    plan_wide_table(args.num_columns)
+    seconds = time.perf_counter() - start_time
+    print(f"{args.num_columns} columns ({args.sql_compiler}): {seconds:.3f}s")
+
+    current_path = pathlib.Path(__file__).absolute()
+    clock_time_file_path = (
+        f"{current_path}_{args.benchmark_suffix}.local_exec_time_seconds"
+    )
+    with open(clock_time_file_path, "a") as log_file:
+        log_file.write(f"{seconds}\n")
+
+    # No queries are run, but the report expects BigQuery stats for each benchmark.
+    bigframes.session.metrics.write_stats_to_disk(
+        query_char_count=0, bytes_processed=0, slot_millis=0, exec_seconds=0
+    )
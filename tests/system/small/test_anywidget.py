@@ -119,18 +119,12 @@ def unknown_row_count_widget(session):
     )
     bf_df = session.read_pandas(test_data)
 
-    # Simulate a scenario where total_rows is not available from the iterator
-    with mock.patch.object(bf_df, "_to_pandas_batches") as mock_batches:
-        # We need to provide an iterator of DataFrames, not Series
-        batches_iterator = iter([test_data])
-        mock_batches.return_value = blocks.PandasBatches(
-            batches_iterator, total_rows=None
-        )
-        with bf.option_context(
-            "display.render_mode", "anywidget", "display.max_rows", 2
-        ):
-            widget = TableWidget(bf_df)
-            yield widget
+    # Simulate a scenario where the total row count is not known up front
+    with mock.patch.object(
+        blocks.Block, "cached_for_paging", return_value=None
+    ), bf.option_context("display.render_mode", "anywidget", "display.max_rows", 2):
+        widget = TableWidget(bf_df)
+        yield widget
 
 
 @pytest.fixture(scope="module")
@@ -564,14 +558,15 @@ def test_widget_should_show_error_on_batch_failure(
     monkeypatch: pytest.MonkeyPatch,
 ):
     """
-    Given that the internal call to `_to_pandas_batches` fails and returns None,
+    Given that the internal call to cache the data for paging fails,
     when the TableWidget is created, its `error_message` should be set and displayed.
     """
-    # Patch the DataFrame's batch creation method to simulate a failure.
-    monkeypatch.setattr(
-        "bigframes.dataframe.DataFrame._to_pandas_batches",
-        lambda self, *args, **kwargs: None,
-    )
+
+    def fail(self):
+        raise ValueError("Simulated read error")
+
+    # Patch the Block's caching method to simulate a failure.
+    monkeypatch.setattr("bigframes.core.blocks.Block.cached_for_paging", fail)
 
     # Create the TableWidget under the error condition.
     with bigframes.option_context("display.render_mode", "anywidget"):
@@ -583,7 +578,8 @@ def test_widget_should_show_error_on_batch_failure(
     # The widget should have an error message and display it in the HTML.
     assert widget.row_count is None
     assert widget._error_message is not None
-    assert "Could not retrieve data batches" in widget._error_message
+    assert "Could not retrieve data" in widget._error_message
+    assert "Simulated read error" in widget._error_message
     assert widget._error_message in widget.table_html
 
 
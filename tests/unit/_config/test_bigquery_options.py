@@ -39,6 +39,7 @@ import bigframes.exceptions
         ("client_endpoints_override", {}, {"bqclient": "endpoint_address"}),
         ("ordering_mode", "strict", "partial"),
         ("requests_transport_adapters", object(), object()),
+        ("udf_emulation", None, "thread"),
     ],
 )
 def test_setter_raises_if_session_started(attribute, original_value, new_value):
@@ -198,6 +199,13 @@ def test_client_endpoints_override_set_shows_warning():
         options.client_endpoints_override = {"bqclient": "endpoint_address"}
 
 
+def test_udf_emulation_set_to_invalid_value():
+    options = bigquery_options.BigQueryOptions()
+
+    with pytest.raises(ValueError, match="UDF emulation"):
+        options.udf_emulation = "fork"  # type: ignore
+
+
 def test_default_options():
     options = bigquery_options.BigQueryOptions()
 
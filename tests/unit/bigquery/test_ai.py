@@ -17,8 +17,10 @@ from unittest import mock
 import pandas as pd
 import pytest
 
+import bigframes
 import bigframes.bigquery as bbq
 import bigframes.dataframe
+from bigframes.ml import _chunking as ml_chunking
 import bigframes.series
 import bigframes.session
 
@@ -317,3 +319,27 @@ def test_generate_text_with_pandas_dataframe(
     assert read_pandas_mock.call_args[0][0] is pandas_df
 
     mock_session.read_gbq_query.assert_called_once()
+
+
+def test_generate_text_in_chunks(mock_dataframe, mock_session):
+    model_name = "project.dataset.model"
+
+    with mock.patch.object(
+        ml_chunking, "predict_in_chunks", autospec=True
+    ) as predict_in_chunks, bigframes.option_context("compute.ai_ops_chunk_rows", 100):
+        bbq.ai.generate_text(model_name, mock_dataframe, temperature=0.5)
+
+    mock_session.read_gbq_query.assert_not_called()
+    read, data = predict_in_chunks.call_args.args
+    assert data is mock_dataframe
+    assert predict_in_chunks.call_args.kwargs["chunk_rows"] == 100
+    assert predict_in_chunks.call_args.kwargs["status_col"] == "status"
+    assert predict_in_chunks.call_args.kwargs["ignore_index"]
+
+    read(mock_dataframe)
+
+    mock_session.read_gbq_query.assert_called_once()
+    query = " ".join(mock_session.read_gbq_query.call_args[0][0].split())
+    assert "FROM AI.GENERATE_TEXT(" in query
+    assert "(SELECT * FROM my_table)," in query
+    assert "STRUCT(0.5 AS `TEMPERATURE`)" in query
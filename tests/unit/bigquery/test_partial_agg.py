@@ -0,0 +1,114 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bigframes.bigquery as bbq
+
+_FUNCS = ["count", "sum", "mean", "var", "std", "min", "max"]
+
+
+@pytest.fixture(scope="module")
+def pd_df() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "key": rng.integers(0, 3, 30),
+            "float_col": rng.normal(size=30),
+            "int_col": rng.integers(0, 10, 30),
+        }
+    )
+
+
+def test_merged_partial_aggs_match_full_agg(polars_session, pd_df):
+    day1 = polars_session.read_pandas(pd_df.iloc[:20])
+    day2 = polars_session.read_pandas(pd_df.iloc[20:])
+
+    state = bbq.merge_partial_aggs(
+        bbq.partial_agg(day1.groupby("key"), _FUNCS),
+        bbq.partial_agg(day2.groupby("key"), _FUNCS),
+    )
+    result = bbq.finalize_partial_aggs(state, _FUNCS).to_pandas()
+
+    pd.testing.assert_frame_equal(
+        result,
+        pd_df.groupby("key").agg(_FUNCS),
+        check_dtype=False,
+        check_index_type=False,
+    )
+
+
+def test_merged_partial_var_is_stable_for_large_means(polars_session):
+    rng = np.random.default_rng(0)
+    pd_df = pd.DataFrame(
+        {"key": rng.integers(0, 2, 30), "value": 1e9 + rng.normal(size=30)}
+    )
+
+    state = bbq.merge_partial_aggs(
+        *(
+            bbq.partial_agg(polars_session.read_pandas(part).groupby("key"), "var")
+            for part in (pd_df.iloc[:10], pd_df.iloc[10:20], pd_df.iloc[20:])
+        )
+    )
+    result = bbq.finalize_partial_aggs(state, "var").to_pandas()
+
+    pd.testing.assert_series_equal(
+        result["value"],
+        pd_df.groupby("key")["value"].var(),
+        check_dtype=False,
+        check_index_type=False,
+        rtol=1e-6,
+    )
+
+
+def test_partial_agg_only_keeps_needed_states(polars_session, pd_df):
+    df = polars_session.read_pandas(pd_df)
+
+    state = bbq.partial_agg(df.groupby("key")["float_col"], "mean")
+    result = bbq.finalize_partial_aggs(state, "mean").to_pandas()
+
+    assert list(state.columns) == ["float_col__count", "float_col__sum"]
+    pd.testing.assert_series_equal(
+        result["float_col"],
+        pd_df.groupby("key")["float_col"].mean(),
+        check_dtype=False,
+        check_index_type=False,
+    )
+
+
+def test_finalize_partial_aggs_missing_state_raises(polars_session, pd_df):
+    df = polars_session.read_pandas(pd_df)
+    state = bbq.partial_agg(df.groupby("key"), "sum")
+
+    with pytest.raises(ValueError, match="partial states"):
+        bbq.finalize_partial_aggs(state, "std")
+
+
+def test_merge_partial_aggs_mismatched_columns_raises(polars_session, pd_df):
+    df = polars_session.read_pandas(pd_df)
+
+    with pytest.raises(ValueError, match="same columns"):
+        bbq.merge_partial_aggs(
+            bbq.partial_agg(df.groupby("key"), "sum"),
+            bbq.partial_agg(df.groupby("key"), "max"),
+        )
+
+
+def test_partial_agg_unsupported_func_raises(polars_session, pd_df):
+    df = polars_session.read_pandas(pd_df)
+
+    with pytest.raises(NotImplementedError, match="median"):
+        bbq.partial_agg(df.groupby("key"), ["sum", "median"])
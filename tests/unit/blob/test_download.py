@@ -0,0 +1,125 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+import requests
+
+import bigframes
+import bigframes.blob._download as blob_download
+
+
+class _FakeGet:
+    """Returns the URL as content and records the concurrency."""
+
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, url, timeout=None):
+        with self._lock:
+            self.calls.append(url)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        response = mock.Mock()
+        response.content = url.encode()
+        if "missing" in url:
+            response.raise_for_status.side_effect = requests.HTTPError("404")
+        return response
+
+
+@pytest.fixture
+def fake_get():
+    fake = _FakeGet()
+    blob_download._content_cache.clear()
+    with mock.patch.object(requests.Session, "get", side_effect=fake):
+        yield fake
+    blob_download._content_cache.clear()
+
+
+def test_fetch_all_downloads_in_parallel(fake_get):
+    urls = [f"https://example.com/{i}" for i in range(20)]
+
+    contents = blob_download.fetch_all(urls, max_workers=4)
+
+    assert contents == [url.encode() for url in urls]
+    assert 1 < fake_get.max_active <= 4
+
+
+def test_fetch_all_skips_null_urls(fake_get):
+    contents = blob_download.fetch_all(["https://example.com/a", None])
+
+    assert contents == [b"https://example.com/a", None]
+    assert fake_get.calls == ["https://example.com/a"]
+
+
+def test_fetch_all_raises_http_errors(fake_get):
+    with pytest.raises(requests.HTTPError):
+        blob_download.fetch_all(
+            ["https://example.com/a", "https://example.com/missing"]
+        )
+
+
+def test_fetch_all_returns_http_errors(fake_get):
+    contents = blob_download.fetch_all(
+        ["https://example.com/a", "https://example.com/missing"], raise_errors=False
+    )
+
+    assert contents[0] == b"https://example.com/a"
+    assert isinstance(contents[1], requests.HTTPError)
+
+
+def test_fetch_all_cache(fake_get):
+    urls = ["https://example.com/a?sig=1", "https://example.com/b?sig=1"]
+    keys = ["gs://bucket/a#1", "gs://bucket/b#1"]
+
+    with bigframes.option_context("compute.blob_content_cache_bytes", 1000):
+        blob_download.fetch_all(urls, keys)
+        # New signed URLs for the same object versions are served from cache.
+        contents = blob_download.fetch_all(
+            ["https://example.com/a?sig=2", "https://example.com/b?sig=2"], keys
+        )
+
+    assert contents == [url.encode() for url in urls]
+    assert fake_get.calls == urls
+
+
+def test_fetch_all_without_cache(fake_get):
+    urls = ["https://example.com/a"]
+    keys = ["gs://bucket/a#1"]
+
+    blob_download.fetch_all(urls, keys)
+    blob_download.fetch_all(urls, keys)
+
+    assert fake_get.calls == urls * 2
+
+
+def test_content_cache_evicts_least_recently_used():
+    cache = blob_download._ContentCache()
+    cache.put("a", b"aaaa", max_bytes=10)
+    cache.put("b", b"bbbb", max_bytes=10)
+    cache.get("a")
+    cache.put("c", b"cccc", max_bytes=10)
+
+    assert cache.get("a") == b"aaaa"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"cccc"
@@ -0,0 +1,86 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest import mock
+
+import bigframes
+import bigframes.blob._functions as blob_func
+from bigframes.functions import _function_session
+
+
+def _transform_function(session, func_def=blob_func.image_blur_def, cpu=1):
+    return blob_func.TransformFunction(
+        func_def,
+        session=session,
+        connection="my-project.us.my-connection",
+        max_batching_rows=8192,
+        container_cpu=cpu,
+        container_memory="512Mi",
+    )
+
+
+def _mock_session():
+    session = mock.Mock()
+    session.bqclient.project = "my-project"
+    session._function_session = _function_session.FunctionSession()
+    session._anon_dataset_manager.generate_unique_resource_id.side_effect = [
+        "my-project._anon.first",
+        "my-project._anon.second",
+    ]
+    return session
+
+
+def test_definition_hash_depends_on_definition():
+    session = _mock_session()
+    blur_hash = _transform_function(session)._definition_hash()
+
+    assert blur_hash == _transform_function(session)._definition_hash()
+    assert blur_hash != _transform_function(session, cpu=2)._definition_hash()
+    assert (
+        blur_hash
+        != _transform_function(
+            session, func_def=blob_func.image_resize_def
+        )._definition_hash()
+    )
+
+
+@mock.patch("bigframes.session._io.bigquery.start_query_with_client")
+def test_udf_deploys_once_per_session(start_query):
+    session = _mock_session()
+
+    _transform_function(session).udf()
+    _transform_function(session).udf()
+
+    start_query.assert_called_once()
+    sql = start_query.call_args.args[1]
+    assert sql.startswith("CREATE OR REPLACE FUNCTION `my-project._anon.first`(")
+    session.read_gbq_function.assert_called_with("my-project._anon.first")
+
+
+@mock.patch("bigframes.session._io.bigquery.start_query_with_client")
+def test_udf_content_addressed_in_dataset(start_query):
+    session = _mock_session()
+    function = _transform_function(session)
+
+    with bigframes.option_context("compute.blob_udf_dataset", "my_functions"):
+        function.udf()
+
+    udf_name = (
+        "my-project.my_functions.bigframes_image_blur_func_"
+        + function._definition_hash()[:16]
+    )
+    sql = start_query.call_args.args[1]
+    assert sql.startswith(f"CREATE FUNCTION IF NOT EXISTS `{udf_name}`(")
+    session.read_gbq_function.assert_called_with(udf_name)
+    session._anon_dataset_manager.generate_unique_resource_id.assert_not_called()
@@ -0,0 +1,16 @@
+WITH `bfcte_0` AS (
+  SELECT
+    `int64_col`
+  FROM `bigframes-dev`.`sqlglot_test`.`scalar_types` AS `bft_0`
+), `bfcte_1` AS (
+  SELECT
+    APPROX_QUANTILES(`int64_col`, 10)[OFFSET(1)] AS `bfcol_1`,
+    APPROX_QUANTILES(`int64_col`, 2)[OFFSET(1)] AS `bfcol_2`,
+    APPROX_QUANTILES(`int64_col`, 100)[OFFSET(99)] AS `bfcol_3`
+  FROM `bfcte_0`
+)
+SELECT
+  `bfcol_1` AS `p10`,
+  `bfcol_2` AS `p50`,
+  `bfcol_3` AS `p99`
+FROM `bfcte_1`
\ No newline at end of file
@@ -0,0 +1,12 @@
+WITH `bfcte_0` AS (
+  SELECT
+    `int64_col`
+  FROM `bigframes-dev`.`sqlglot_test`.`scalar_types` AS `bft_0`
+), `bfcte_1` AS (
+  SELECT
+    HLL_COUNT.INIT(`int64_col`, 12) AS `bfcol_1`
+  FROM `bfcte_0`
+)
+SELECT
+  `bfcol_1` AS `int64_col`
+FROM `bfcte_1`
\ No newline at end of file
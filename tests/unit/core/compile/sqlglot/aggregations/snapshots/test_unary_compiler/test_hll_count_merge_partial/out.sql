@@ -0,0 +1,12 @@
+WITH `bfcte_0` AS (
+  SELECT
+    `bytes_col`
+  FROM `bigframes-dev`.`sqlglot_test`.`scalar_types` AS `bft_0`
+), `bfcte_1` AS (
+  SELECT
+    HLL_COUNT.MERGE_PARTIAL(`bytes_col`) AS `bfcol_1`
+  FROM `bfcte_0`
+)
+SELECT
+  `bfcol_1` AS `bytes_col`
+FROM `bfcte_1`
\ No newline at end of file
@@ -106,6 +106,30 @@ def test_any_w_window(scalar_types_df: bpd.DataFrame, snapshot):
     snapshot.assert_match(sql_window, "out.sql")
 
 
+def test_approx_nunique(scalar_types_df: bpd.DataFrame, snapshot):
+    col_name = "int64_col"
+    bf_df = scalar_types_df[[col_name]]
+    agg_expr = agg_ops.ApproxNuniqueOp().as_expr(col_name)
+    sql = _apply_unary_agg_ops(bf_df, [agg_expr], [col_name])
+
+    snapshot.assert_match(sql, "out.sql")
+
+
+def test_approx_quantile(scalar_types_df: bpd.DataFrame, snapshot):
+    col_name = "int64_col"
+    bf_df = scalar_types_df[[col_name]]
+    agg_ops_map = {
+        "p10": agg_ops.ApproxQuantileOp(q=0.1).as_expr(col_name),
+        "p50": agg_ops.ApproxQuantileOp(q=0.5).as_expr(col_name),
+        "p99": agg_ops.ApproxQuantileOp(q=0.99).as_expr(col_name),
+    }
+    sql = _apply_unary_agg_ops(
+        bf_df, list(agg_ops_map.values()), list(agg_ops_map.keys())
+    )
+
+    snapshot.assert_match(sql, "out.sql")
+
+
 def test_approx_quartiles(scalar_types_df: bpd.DataFrame, snapshot):
     col_name = "int64_col"
     bf_df = scalar_types_df[[col_name]]
@@ -319,6 +343,24 @@ def test_last_non_null(scalar_types_df: bpd.DataFrame, snapshot):
     snapshot.assert_match(sql, "out.sql")
 
 
+def test_hll_count_init(scalar_types_df: bpd.DataFrame, snapshot):
+    col_name = "int64_col"
+    bf_df = scalar_types_df[[col_name]]
+    agg_expr = agg_ops.HllCountInitOp(precision=12).as_expr(col_name)
+    sql = _apply_unary_agg_ops(bf_df, [agg_expr], [col_name])
+
+    snapshot.assert_match(sql, "out.sql")
+
+
+def test_hll_count_merge_partial(scalar_types_df: bpd.DataFrame, snapshot):
+    col_name = "bytes_col"
+    bf_df = scalar_types_df[[col_name]]
+    agg_expr = agg_ops.HllCountMergePartialOp().as_expr(col_name)
+    sql = _apply_unary_agg_ops(bf_df, [agg_expr], [col_name])
+
+    snapshot.assert_match(sql, "out.sql")
+
+
 def test_max(scalar_types_df: bpd.DataFrame, snapshot):
     col_name = "int64_col"
     bf_df = scalar_types_df[[col_name]]
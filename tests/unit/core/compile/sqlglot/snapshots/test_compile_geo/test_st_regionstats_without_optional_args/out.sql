@@ -2,14 +2,20 @@ WITH `bfcte_0` AS (
   SELECT
     *
   FROM UNNEST(ARRAY<STRUCT<`bfcol_0` STRING, `bfcol_1` INT64>>[STRUCT('POINT(1 1)', 0)])
+), `bfcte_1` AS (
+  SELECT
+    `bfcol_0`,
+    `bfcol_1`,
+    ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri') AS `bfcol_2`
+  FROM `bfcte_0`
 )
 SELECT
-  ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri').`min`,
-  ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri').`max`,
-  ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri').`sum`,
-  ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri').`count`,
-  ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri').`mean`,
-  ST_REGIONSTATS(`bfcol_0`, 'ee://some/raster/uri').`area`
-FROM `bfcte_0`
+  `bfcol_2`.`min`,
+  `bfcol_2`.`max`,
+  `bfcol_2`.`sum`,
+  `bfcol_2`.`count`,
+  `bfcol_2`.`mean`,
+  `bfcol_2`.`area`
+FROM `bfcte_1`
 ORDER BY
   `bfcol_1` ASC NULLS LAST
\ No newline at end of file
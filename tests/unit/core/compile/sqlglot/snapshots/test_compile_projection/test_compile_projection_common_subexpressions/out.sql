@@ -0,0 +1,17 @@
+WITH `bfcte_0` AS (
+  SELECT
+    `int64_col`,
+    `rowindex`,
+    (
+      `int64_col` * 2
+    ) + 1 AS `bfcol_5`
+  FROM `bigframes-dev`.`sqlglot_test`.`scalar_types` AS `bft_0`
+)
+SELECT
+  `rowindex`,
+  `rowindex` AS `rowindex_1`,
+  `int64_col`,
+  `bfcol_5` + 1 AS `a`,
+  `bfcol_5` - 1 AS `b`,
+  `bfcol_5` * `bfcol_5` AS `c`
+FROM `bfcte_0`
\ No newline at end of file
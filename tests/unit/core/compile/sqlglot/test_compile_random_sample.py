@@ -17,6 +17,7 @@ import pytest
 from bigframes.core import nodes
 import bigframes.core as core
 import bigframes.core.compile as compile
+import bigframes.core.compile.sqlglot as sqlglot
 
 pytest.importorskip("pytest_snapshot")
 
@@ -31,5 +32,5 @@ def test_compile_random_sample(
     operation, this test constructs the node directly and then compiles it to SQL.
     """
     node = nodes.RandomSampleNode(scalar_types_array_value.node, fraction=0.1)
-    sql = compile.sqlglot.compile_sql(compile.CompileRequest(node, sort_rows=True)).sql
+    sql = sqlglot.compile_sql(compile.CompileRequest(node, sort_rows=True)).sql
     snapshot.assert_match(sql, "out.sql")
@@ -0,0 +1,128 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import bigframes.core.expression as ex
+import bigframes.core.expression_factoring as expression_factoring
+import bigframes.core.identifiers as identifiers
+import bigframes.core.nodes as nodes
+import bigframes.core.rewrite as rewrites
+import bigframes.dtypes as dtypes
+import bigframes.operations as ops
+
+
+def _scaled(leaf):
+    # (col_a * 2) + 1
+    return ops.add_op.as_expr(
+        ops.mul_op.as_expr(ex.DerefOp(leaf.fields[0].id), ex.const(2)), ex.const(1)
+    )
+
+
+def test_extract_common_subexpressions(leaf):
+    scaled = _scaled(leaf)
+    roots = (
+        nodes.ColumnDef(
+            ops.add_op.as_expr(scaled, ex.const(1)), identifiers.ColumnId("a")
+        ),
+        nodes.ColumnDef(ops.mul_op.as_expr(scaled, scaled), identifiers.ColumnId("b")),
+    )
+
+    shared, new_roots = expression_factoring.extract_common_subexpressions(roots)
+
+    assert len(shared) == 1
+    assert shared[0].expression == scaled
+    shared_ref = ex.DerefOp(shared[0].id)
+    assert new_roots[0].expression == ops.add_op.as_expr(shared_ref, ex.const(1))
+    assert new_roots[1].expression == ops.mul_op.as_expr(shared_ref, shared_ref)
+
+
+def test_extract_common_subexpressions_skips_simple_expressions(leaf):
+    negated = ops.neg_op.as_expr(ex.DerefOp(leaf.fields[0].id))
+    roots = (
+        nodes.ColumnDef(negated, identifiers.ColumnId("a")),
+        nodes.ColumnDef(ops.abs_op.as_expr(negated), identifiers.ColumnId("b")),
+    )
+
+    shared, new_roots = expression_factoring.extract_common_subexpressions(roots)
+
+    assert shared == ()
+    assert new_roots == roots
+
+
+def test_extract_common_subexpressions_skips_nondeterministic(leaf):
+    random = ops.SqlScalarOp(
+        dtypes.FLOAT_DTYPE, "RAND() * {0}", is_deterministic=False
+    ).as_expr(ex.DerefOp(leaf.fields[0].id))
+    scaled = ops.add_op.as_expr(ops.mul_op.as_expr(random, ex.const(2)), ex.const(1))
+    roots = (
+        nodes.ColumnDef(scaled, identifiers.ColumnId("a")),
+        nodes.ColumnDef(scaled, identifiers.ColumnId("b")),
+    )
+
+    shared, _ = expression_factoring.extract_common_subexpressions(roots)
+
+    assert shared == ()
+
+
+def test_extract_common_subexpressions_skips_guarded_branches(leaf):
+    col = ex.DerefOp(leaf.fields[0].id)
+    cast = ops.AsTypeOp(to_type=dtypes.INT_DTYPE).as_expr(col)
+    guarded = ops.add_op.as_expr(ops.mul_op.as_expr(cast, ex.const(2)), ex.const(1))
+    cond = ops.gt_op.as_expr(col, ex.const(0))
+    roots = (
+        nodes.ColumnDef(
+            ops.where_op.as_expr(guarded, cond, ex.const(0)), identifiers.ColumnId("a")
+        ),
+        nodes.ColumnDef(
+            ops.case_when_op.as_expr(cond, guarded, ex.const(True), ex.const(1)),
+            identifiers.ColumnId("b"),
+        ),
+        nodes.ColumnDef(
+            ops.coalesce_op.as_expr(col, guarded), identifiers.ColumnId("c")
+        ),
+    )
+
+    shared, new_roots = expression_factoring.extract_common_subexpressions(roots)
+
+    assert shared == ()
+    assert new_roots == roots
+
+
+def test_hoist_common_subexpressions(leaf):
+    scaled = _scaled(leaf)
+    node = nodes.ProjectionNode(
+        leaf,
+        (
+            (ops.add_op.as_expr(scaled, ex.const(1)), identifiers.ColumnId("a")),
+            (ops.sub_op.as_expr(scaled, ex.const(1)), identifiers.ColumnId("b")),
+        ),
+    )
+
+    result = rewrites.hoist_common_subexpressions(node)
+
+    assert result.schema == node.schema
+    assert isinstance(result, nodes.SelectionNode)
+    projection = result.child
+    assert isinstance(projection, nodes.ProjectionNode)
+    assert isinstance(projection.child, nodes.ProjectionNode)
+    ((shared_expr, shared_id),) = projection.child.assignments
+    assert shared_expr == scaled
+    assert projection.assignments[0][0] == ops.add_op.as_expr(
+        ex.DerefOp(shared_id), ex.const(1)
+    )
+
+
+def test_hoist_common_subexpressions_without_repeats(leaf):
+    node = nodes.ProjectionNode(leaf, ((_scaled(leaf), identifiers.ColumnId("a")),))
+
+    assert rewrites.hoist_common_subexpressions(node) is node
@@ -0,0 +1,162 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import google.cloud.bigquery
+import pytest
+
+from bigframes.core import bq_data, window_spec
+import bigframes.core as core
+import bigframes.core.agg_expressions as agg_ex
+import bigframes.core.expression as ex
+import bigframes.core.identifiers as identifiers
+import bigframes.core.nodes as nodes
+import bigframes.core.rewrite as rewrite
+import bigframes.operations as ops
+import bigframes.operations.aggregations as agg_ops
+import bigframes.session.planner as planner
+
+
+@pytest.fixture
+def partitioned_leaf(fake_session, table):
+    table.range_partitioning = google.cloud.bigquery.RangePartitioning(
+        field="col_a",
+        range_=google.cloud.bigquery.PartitionRange(start=0, end=100, interval=10),
+    )
+    table.require_partition_filter = True
+    return core.ArrayValue.from_table(
+        session=fake_session,
+        table=bq_data.GbqNativeTable.from_table(table),
+    ).node
+
+
+def _window_sum(child, col_id, grouping_keys):
+    return nodes.WindowOpNode(
+        child,
+        (
+            nodes.ColumnDef(
+                agg_ex.UnaryAggregation(agg_ops.sum_op, ex.deref(col_id.name)),
+                identifiers.ColumnId("window_sum"),
+            ),
+        ),
+        window_spec.unbound(grouping_keys=grouping_keys),
+    )
+
+
+def test_push_down_pruning_filters_through_window_and_projection(partitioned_leaf):
+    col_a, col_b = (field.id for field in partitioned_leaf.fields)
+    alias = identifiers.ColumnId("alias_a")
+    windowed = _window_sum(partitioned_leaf, col_b, (col_a.name,))
+    projected = nodes.ProjectionNode(windowed, ((ex.deref(col_a.name), alias),))
+    predicate = ops.and_op.as_expr(
+        ops.gt_op.as_expr(ex.deref(alias.name), ex.const(10)),
+        ops.gt_op.as_expr(ex.deref("window_sum"), ex.const(0)),
+    )
+
+    result = rewrite.push_down_pruning_filters(nodes.FilterNode(projected, predicate))
+
+    # The predicate on the partitioning column moves to the scan, the other stays.
+    assert isinstance(result, nodes.FilterNode)
+    assert result.predicate == ops.gt_op.as_expr(ex.deref("window_sum"), ex.const(0))
+    projection = result.child
+    assert isinstance(projection, nodes.ProjectionNode)
+    window = projection.child
+    assert isinstance(window, nodes.WindowOpNode)
+    pushed = window.child
+    assert isinstance(pushed, nodes.FilterNode)
+    assert pushed.predicate == ops.gt_op.as_expr(ex.deref(col_a.name), ex.const(10))
+    assert pushed.child is partitioned_leaf
+
+
+def test_push_down_pruning_filters_keeps_filter_above_ungrouped_window(
+    partitioned_leaf,
+):
+    col_a, col_b = (field.id for field in partitioned_leaf.fields)
+    windowed = _window_sum(partitioned_leaf, col_b, ())
+    node = nodes.FilterNode(
+        windowed, ops.gt_op.as_expr(ex.deref(col_a.name), ex.const(10))
+    )
+
+    assert rewrite.push_down_pruning_filters(node) is node
+
+
+def test_push_down_pruning_filters_ignores_non_pruning_columns(partitioned_leaf):
+    col_a, col_b = (field.id for field in partitioned_leaf.fields)
+    windowed = _window_sum(partitioned_leaf, col_b, (col_a.name, col_b.name))
+    node = nodes.FilterNode(
+        windowed, ops.gt_op.as_expr(ex.deref(col_b.name), ex.const(10))
+    )
+
+    assert rewrite.push_down_pruning_filters(node) is node
+
+
+def test_push_down_pruning_filters_into_preserved_join_side(partitioned_leaf, leaf_too):
+    left_ids = {
+        field.id: identifiers.ColumnId(f"left_{field.id.name}")
+        for field in partitioned_leaf.fields
+    }
+    left = nodes.SelectionNode(
+        partitioned_leaf,
+        tuple(
+            nodes.AliasedRef(ex.deref(old.name), new) for old, new in left_ids.items()
+        ),
+    )
+    left_a = identifiers.ColumnId("left_col_a")
+    joined = nodes.JoinNode(
+        left,
+        leaf_too,
+        conditions=((ex.deref(left_a.name), ex.deref("col_a")),),
+        type="left",
+        propogate_order=False,
+    )
+    predicate = ops.IsInOp(values=(1, 2)).as_expr(ex.deref(left_a.name))
+
+    result = rewrite.push_down_pruning_filters(nodes.FilterNode(joined, predicate))
+
+    assert isinstance(result, nodes.JoinNode)
+    assert result.right_child is leaf_too
+    selection = result.left_child
+    assert isinstance(selection, nodes.SelectionNode)
+    pushed = selection.child
+    assert isinstance(pushed, nodes.FilterNode)
+    assert pushed.predicate == ops.IsInOp(values=(1, 2)).as_expr(ex.deref("col_a"))
+
+
+def test_tables_missing_partition_filter(partitioned_leaf):
+    col_a, col_b = (field.id for field in partitioned_leaf.fields)
+    unfiltered = nodes.FilterNode(
+        partitioned_leaf, ops.gt_op.as_expr(ex.deref(col_b.name), ex.const(10))
+    )
+    filtered = nodes.FilterNode(
+        _window_sum(partitioned_leaf, col_b, (col_a.name,)),
+        ops.eq_op.as_expr(ex.deref(col_a.name), ex.const(10)),
+    )
+
+    assert planner.tables_missing_partition_filter(unfiltered) == [
+        "project.dataset.table"
+    ]
+    assert planner.tables_missing_partition_filter(filtered) == []
+
+
+def test_tables_missing_partition_filter_accepts_sql_predicate(fake_session, table):
+    table.range_partitioning = google.cloud.bigquery.RangePartitioning(
+        field="col_a",
+        range_=google.cloud.bigquery.PartitionRange(start=0, end=100, interval=10),
+    )
+    table.require_partition_filter = True
+    leaf = core.ArrayValue.from_table(
+        session=fake_session,
+        table=bq_data.GbqNativeTable.from_table(table),
+        predicate="`col_a` IN (1, 2)",
+    ).node
+
+    assert planner.tables_missing_partition_filter(leaf) == []
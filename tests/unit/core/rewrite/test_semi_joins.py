@@ -0,0 +1,122 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pandas as pd
+import pytest
+
+import bigframes.core.nodes as nodes
+import bigframes.core.rewrite as rewrite
+import bigframes.session.planner as planner
+
+polars = pytest.importorskip("polars")
+
+from bigframes.core.compile.polars import PolarsCompiler  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def left(polars_session):
+    return polars_session.read_pandas(
+        pd.DataFrame(
+            {"key": [1, 2, 3, 2, None], "value": [10, 20, 30, 40, 50]}, dtype="Int64"
+        )
+    )
+
+
+def _merge_plan(left, right, how="inner"):
+    merged = left.merge(right, on="key", how=how)
+    return rewrite.column_pruning(merged._block.expr.node)
+
+
+def _has_node(plan, node_type):
+    return any(isinstance(node, node_type) for node in plan.unique_nodes())
+
+
+def test_try_semi_join_unique_local_keys(polars_session, left):
+    right = polars_session.read_pandas(
+        pd.DataFrame({"key": [2, 3, 7, None]}, dtype="Int64")
+    )
+    plan = _merge_plan(left, right)
+
+    result = plan.bottom_up(rewrite.try_semi_join)
+
+    assert _has_node(result, nodes.InNode)
+    assert not _has_node(result, nodes.JoinNode)
+    assert list(result.ids) == list(plan.ids)
+    compiler = PolarsCompiler()
+    expected = compiler.compile(plan).collect()
+    actual = compiler.compile(result).collect()
+    assert actual.equals(expected)
+
+
+@pytest.mark.parametrize(
+    ("right_data", "how"),
+    [
+        pytest.param({"key": [2, 2, 3]}, "inner", id="duplicate_keys"),
+        pytest.param({"key": [2, 3], "other": [0, 1]}, "inner", id="extra_columns"),
+        pytest.param({"key": [2, 3]}, "left", id="left_join"),
+    ],
+)
+def test_try_semi_join_keeps_join(polars_session, left, right_data, how):
+    right = polars_session.read_pandas(pd.DataFrame(right_data, dtype="Int64"))
+    plan = _merge_plan(left, right, how=how)
+
+    result = plan.bottom_up(rewrite.try_semi_join)
+
+    assert _has_node(result, nodes.JoinNode)
+    assert not _has_node(result, nodes.InNode)
+
+
+def test_join_lookup_sources(polars_session, left):
+    right = polars_session.read_pandas(
+        pd.DataFrame({"key": range(1000), "other": range(1000)}, dtype="Int64")
+    )
+    plan = _merge_plan(left, right)
+    sources = {
+        node.local_data_source.metadata.row_count: node.local_data_source
+        for node in plan.unique_nodes()
+        if isinstance(node, nodes.ReadLocalNode)
+    }
+    left_source, right_source = sources[5], sources[1000]
+    total_bytes = left_source.metadata.total_bytes + right_source.metadata.total_bytes
+
+    assert planner.join_lookup_sources(plan, total_bytes) == {
+        left_source.id,
+        right_source.id,
+    }
+    assert planner.join_lookup_sources(plan, total_bytes - 1) == {left_source.id}
+    assert planner.join_lookup_sources(plan, 0) == set()
+
+
+def test_join_lookup_sources_limits_total_bytes(polars_session, left):
+    small, large = (
+        polars_session.read_pandas(
+            pd.DataFrame({"key": range(n), f"other_{n}": range(n)}, dtype="Int64")
+        )
+        for n in (1000, 2000)
+    )
+    merged = left.merge(small, on="key").merge(large, on="key")
+    plan = rewrite.column_pruning(merged._block.expr.node)
+    sources = {
+        node.local_data_source.metadata.row_count: node.local_data_source
+        for node in plan.unique_nodes()
+        if isinstance(node, nodes.ReadLocalNode)
+    }
+    total_bytes = sum(source.metadata.total_bytes for source in sources.values())
+
+    assert planner.join_lookup_sources(plan, total_bytes) == {
+        source.id for source in sources.values()
+    }
+    # The largest source no longer fits once the limit is below the total.
+    result = planner.join_lookup_sources(plan, total_bytes - 1)
+    assert sources[1000].id in result
+    assert sources[2000].id not in result
@@ -21,6 +21,8 @@ import pytest
 import bigframes
 import bigframes.core.blocks as blocks
 import bigframes.session.bq_caching_executor
+from bigframes.testing import mocks
+import bigframes.testing.polars_session
 
 
 @pytest.mark.parametrize(
@@ -98,3 +100,156 @@ def test_block_compute_dry_run__raises_error_when_sampling_is_enabled():
 
     with pytest.raises(NotImplementedError):
         block._compute_dry_run(sampling_method="UNIFORM")
+
+
+def _repr_executions(polars_session, df):
+    executor = polars_session._executor
+    with mock.patch.object(
+        executor, "execute", wraps=executor.execute
+    ) as execute, mock.patch.object(executor, "cached") as cached:
+        head_df, row_count, _ = df._block.retrieve_repr_request_results(2)
+    return head_df, row_count, execute.call_count, cached.call_count
+
+
+def test_block_repr_with_known_row_count_runs_head_only(polars_session):
+    pd_df = pandas.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    df = polars_session.read_pandas(pd_df)
+
+    head_df, row_count, num_executions, num_caches = _repr_executions(
+        polars_session, df
+    )
+
+    assert row_count == 3
+    assert num_executions == 1
+    assert num_caches == 0
+    pandas.testing.assert_frame_equal(
+        head_df, pd_df.head(2), check_dtype=False, check_index_type=False
+    )
+
+
+@pytest.mark.parametrize(
+    ("threshold", "expected_count"),
+    (
+        pytest.param(1, 3, id="some_rows"),
+        pytest.param(10, 0, id="no_rows"),
+    ),
+)
+def test_block_repr_fetches_head_and_row_count_together(
+    polars_session, threshold, expected_count
+):
+    pd_df = pandas.DataFrame({"a": [1, 2, 3, 4], "b": ["w", "x", "y", "z"]})
+    df = polars_session.read_pandas(pd_df)
+    filtered = df[df["a"] > threshold]
+    assert filtered._block.expr.node.row_count is None
+
+    head_df, row_count, num_executions, num_caches = _repr_executions(
+        polars_session, filtered
+    )
+
+    assert row_count == expected_count
+    assert num_executions == 1
+    assert num_caches == 0
+    expected = pd_df[pd_df["a"] > threshold].head(2)
+    pandas.testing.assert_frame_equal(
+        head_df, expected, check_dtype=False, check_index_type=False
+    )
+
+
+def test_block_pivot_memoizes_unique_values(polars_session):
+    pd_df = pandas.DataFrame(
+        {"idx": [0, 0, 1, 1], "key": ["a", "b", "a", "b"], "val": [1, 2, 3, 4]}
+    )
+    df = polars_session.read_pandas(pd_df)
+
+    with mock.patch.object(
+        blocks.Block,
+        "_fetch_unique_values",
+        autospec=True,
+        side_effect=blocks.Block._fetch_unique_values,
+    ) as fetch_unique_values:
+        first = df.pivot(index="idx", columns="key", values="val").to_pandas()
+        # Frames over the same plan reuse the values, even if relabeled.
+        second = (
+            df.rename(columns={"key": "other"})
+            .pivot(index="idx", columns="other", values="val")
+            .to_pandas()
+        )
+
+    assert fetch_unique_values.call_count == 1
+    pandas.testing.assert_frame_equal(
+        first,
+        pd_df.pivot(index="idx", columns="key", values="val"),
+        check_dtype=False,
+        check_index_type=False,
+        check_column_type=False,
+    )
+    assert second.columns.name == "other"
+
+
+def test_block_get_unique_values_memoized_respects_limit(polars_session):
+    df = polars_session.read_pandas(pandas.DataFrame({"key": ["a", "b", "c"]}))
+    block = df._block
+
+    assert list(block._get_unique_values(block.value_columns, 3)) == ["a", "b", "c"]
+    with pytest.raises(ValueError, match="Too many unique values"):
+        block._get_unique_values(block.value_columns, 2)
+
+
+def test_block_memoized_values_are_scoped_to_session(polars_session):
+    pd_df = pandas.DataFrame({"key": ["a", "b"], "val": [1, 2]})
+    other_session = bigframes.testing.polars_session.TestSession()
+
+    with mock.patch.object(
+        blocks.Block,
+        "_fetch_unique_values",
+        autospec=True,
+        side_effect=blocks.Block._fetch_unique_values,
+    ) as fetch_unique_values:
+        for session in (polars_session, other_session):
+            block = session.read_pandas(pd_df)._block
+            block._get_unique_values(block.value_columns[:1], 2)
+
+    assert fetch_unique_values.call_count == 2
+
+
+def test_block_values_not_memoized_without_snapshot():
+    session = mocks.create_bigquery_session()
+    df = session._loader.read_gbq_table(
+        "test-project.test_dataset.test_table", enable_snapshot=False
+    )
+    block = df._block
+
+    assert block._local_values_key("unique_values", block.value_columns) is None
+
+
+def test_block_snapshot_independent_sql_matches_across_sessions():
+    table_id = "test-project.test_dataset.test_table"
+    first = mocks.create_bigquery_session().read_gbq(table_id)
+    second = mocks.create_bigquery_session().read_gbq(table_id)
+
+    sql = first._block.snapshot_independent_sql()
+
+    assert "SYSTEM_TIME" in first.sql
+    assert "SYSTEM_TIME" not in sql
+    assert sql == second._block.snapshot_independent_sql()
+
+
+def test_block_snapshot_independent_sql_does_not_upload_local_data():
+    pd_df = pandas.DataFrame({"text": [f"document {i}" for i in range(2000)]})
+    first = mocks.create_bigquery_session().read_pandas(pd_df, write_engine="_deferred")
+    second = mocks.create_bigquery_session().read_pandas(
+        pd_df, write_engine="_deferred"
+    )
+    other = mocks.create_bigquery_session().read_pandas(
+        pd_df.iloc[::-1], write_engine="_deferred"
+    )
+
+    with mock.patch.object(
+        bigframes.session.bq_caching_executor.BigQueryCachingExecutor,
+        "_upload_local_sources",
+    ) as upload:
+        sql = first._block.snapshot_independent_sql()
+
+        assert sql == second._block.snapshot_independent_sql()
+        assert sql != other._block.snapshot_independent_sql()
+    upload.assert_not_called()
@@ -104,6 +104,36 @@ def test_nested_expression_dtypes_are_cached():
     _assert_output_type(result.inputs[1], dtypes.INT_DTYPE)
 
 
+def test_bind_schema_fields_ignores_unreferenced_fields():
+    expression = ops.add_op.as_expr("a", "b")
+    field_bindings = _create_field_bindings(
+        {f"col_{i}": dtypes.STRING_DTYPE for i in range(1000)}
+        | {"a": dtypes.INT_DTYPE, "b": dtypes.FLOAT_DTYPE}
+    )
+
+    result = ex.bind_schema_fields(expression, field_bindings)
+
+    _assert_output_type(result, dtypes.FLOAT_DTYPE)
+
+
+def test_bind_schema_fields_missing_field_raises():
+    expression = ops.add_op.as_expr("a", "b")
+    field_bindings = _create_field_bindings({"a": dtypes.INT_DTYPE})
+
+    with pytest.raises(ValueError):
+        ex.bind_schema_fields(expression, field_bindings)
+
+
+def test_remap_column_refs_ignores_unreferenced_mappings():
+    expression = ops.add_op.as_expr("a", "b")
+    mapping = {ids.ColumnId(f"col_{i}"): ids.ColumnId(f"x_{i}") for i in range(1000)}
+    mapping[ids.ColumnId("a")] = ids.ColumnId("c")
+
+    result = expression.remap_column_refs(mapping, allow_partial_bindings=True)
+
+    assert result == ops.add_op.as_expr("c", "b")
+
+
 def _create_field_bindings(
     col_dtypes: typing.Dict[str, dtypes.Dtype]
 ) -> typing.Dict[ids.ColumnId, field.Field]:
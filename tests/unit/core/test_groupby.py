@@ -16,6 +16,8 @@ import pandas as pd
 import pandas.testing
 import pytest
 
+import bigframes
+from bigframes.core.groupby import group_by
 import bigframes.core.utils as utils
 import bigframes.pandas as bpd
 import bigframes.testing.utils
@@ -262,3 +264,67 @@ def test_groupby_series_iter_by_series_list_multiple(polars_session):
         bigframes.testing.utils.assert_series_equal(
             bf_result, pd_result, check_dtype=False, check_index_type=False
         )
+
+
+@pytest.mark.parametrize(
+    ("maximum_local_group_bytes",),
+    [
+        pytest.param(None, id="scan"),
+        pytest.param(1, id="scan-fallback"),
+        pytest.param(0, id="query-per-group"),
+    ],
+)
+@pytest.mark.parametrize("dropna", [True, False])
+def test_groupby_df_iter_group_modes(polars_session, maximum_local_group_bytes, dropna):
+    pd_df = pd.DataFrame(
+        {
+            "colA": ["c", "a", None, "b", "a", "c", None],
+            "colB": [1, 2, 3, 4, 5, 6, 7],
+        },
+    ).astype({"colA": "string[pyarrow]", "colB": "Int64"})
+    bf_df = bpd.DataFrame(pd_df, session=polars_session)
+
+    with bigframes.option_context(
+        "compute.maximum_local_group_bytes", maximum_local_group_bytes
+    ):
+        bf_groups = list(bf_df.groupby("colA", dropna=dropna))  # type: ignore
+    # pandas can't list() groups with null keys.
+    pd_groups = [group for group in pd_df.groupby("colA", dropna=dropna)]
+
+    assert len(bf_groups) == len(pd_groups)
+    for (bf_key, bf_group_df), (pd_key, pd_result) in zip(bf_groups, pd_groups):
+        if pd.isna(pd_key):
+            assert pd.isna(bf_key)
+        else:
+            assert bf_key == pd_key
+        bigframes.testing.utils.assert_frame_equal(
+            bf_group_df.to_pandas(),
+            pd_result,
+            check_dtype=False,
+            check_index_type=False,
+        )
+
+
+def test_split_by_keys_with_nulls():
+    batch = pd.DataFrame(
+        {"value": [1, 2, 3, 4]},
+        index=pd.Index(["a", "a", None, None], dtype="string[pyarrow]", name="key"),
+    )
+
+    pieces = list(group_by._split_by_keys(batch))
+
+    assert [len(piece) for _, piece in pieces] == [2, 2]
+    assert pieces[0][0] == ("a",)
+    assert pd.isna(pieces[1][0][0])
+
+
+def test_prefetch_propagates_errors():
+    def items():
+        yield 1
+        raise ValueError("boom")
+
+    results = group_by._prefetch(items(), buffer_size=1)
+
+    assert next(results) == 1
+    with pytest.raises(ValueError, match="boom"):
+        next(results)
@@ -0,0 +1,98 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import google.cloud.bigquery
+import pytest
+
+import bigframes
+import bigframes.core.expression as ex
+import bigframes.core.identifiers as ids
+import bigframes.core.nodes as nodes
+import bigframes.core.schema as schemata
+import bigframes.core.sql_nodes as sql_nodes
+import bigframes.dtypes as dtypes
+from bigframes.testing import mocks
+
+NUM_COLUMNS = 200
+
+
+@pytest.fixture
+def wide_dataframe():
+    schema = [google.cloud.bigquery.SchemaField("rowindex", "INTEGER")] + [
+        google.cloud.bigquery.SchemaField(f"col_{i}", "FLOAT")
+        for i in range(NUM_COLUMNS)
+    ]
+    session = mocks.create_bigquery_session(table_schema=schema, ordering_mode="strict")
+    yield session.read_gbq("test-project.test_dataset.test_table", index_col="rowindex")
+    session.close()
+
+
+@pytest.mark.parametrize("sql_compiler", ["stable", "experimental"])
+def test_wide_table_compiles(wide_dataframe, sql_compiler):
+    df = (wide_dataframe + 1).fillna(0).astype("Float64")
+
+    with bigframes.option_context("experiments.sql_compiler", sql_compiler):
+        sql = df.sql
+
+    assert sql.startswith("SELECT")
+
+
+def test_wide_table_plan_keeps_all_columns(wide_dataframe):
+    df = (wide_dataframe + 1).fillna(0).astype("Float64")
+
+    sql = df.sql
+
+    assert f"`col_{NUM_COLUMNS - 1}`" in sql
+
+
+def test_array_schema_hash_is_cached():
+    schema = schemata.ArraySchema(
+        tuple(schemata.SchemaItem(f"col_{i}", dtypes.INT_DTYPE) for i in range(10))
+    )
+    same_schema = schemata.ArraySchema(tuple(schema.items))
+
+    assert schema == same_schema
+    assert hash(schema) == hash(same_schema) == schema._cached_hash
+    assert schema != schema.drop(["col_0"])
+
+
+def test_sql_select_node_uses_cached_node_hash(wide_dataframe):
+    child = wide_dataframe._block.expr.node
+    select = sql_nodes.SqlSelectNode(
+        child,
+        tuple(
+            nodes.ColumnDef(ex.ResolvedDerefOp.from_field(field), field.id)
+            for field in child.fields
+        ),
+    )
+
+    assert hash(select) == select._cached_hash
+    assert select.get_id_mapping() is select.get_id_mapping()
+
+
+def test_projection_node_rejects_existing_column(wide_dataframe):
+    child = wide_dataframe._block.expr.node
+    existing_id = next(iter(child.ids))
+
+    projection = nodes.ProjectionNode(child, ((ex.const(1), existing_id),))
+
+    with pytest.raises(AssertionError):
+        projection.validate_tree()
+
+
+def test_transform_children_reuses_unchanged_node(wide_dataframe):
+    child = wide_dataframe._block.expr.node
+    projection = nodes.ProjectionNode(child, ((ex.const(1), ids.ColumnId("new")),))
+
+    assert projection.transform_children(lambda node: node) is projection
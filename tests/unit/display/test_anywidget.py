@@ -19,44 +19,39 @@ import pandas as pd
 import pytest
 
 import bigframes
+import bigframes.core.blocks
+import bigframes.dataframe
 
 # Skip if anywidget/traitlets not installed, though they should be in the dev env
 pytest.importorskip("anywidget")
 pytest.importorskip("traitlets")
 
 
-def test_navigation_to_invalid_page_resets_to_valid_page_without_deadlock():
+def _page_values(widget, column="col1"):
+    return list(widget._cached_data[column])
+
+
+@pytest.fixture
+def paged_df(polars_session):
+    pd_df = pd.DataFrame({"col1": range(10), "col2": [i % 3 for i in range(10)]})
+    return polars_session.read_pandas(pd_df)
+
+
+def test_navigation_to_invalid_page_resets_to_valid_page_without_deadlock(paged_df):
     """
     Given a widget on a page beyond available data, when navigating,
     then it should reset to the last valid page without deadlock.
     """
     from bigframes.display.anywidget import TableWidget
 
-    mock_df = mock.create_autospec(bigframes.dataframe.DataFrame, instance=True)
-    mock_df.columns = ["col1"]
-    mock_df.dtypes = {"col1": "object"}
-
-    mock_block = mock.Mock()
-    mock_block.has_index = False
-    mock_df._block = mock_block
-
-    # We mock _initial_load to avoid complex setup
-    with mock.patch.object(TableWidget, "_initial_load"):
-        with bigframes.option_context(
-            "display.render_mode", "anywidget", "display.max_rows", 10
-        ):
-            widget = TableWidget(mock_df)
-
-    # Simulate "loaded data but unknown total rows" state
-    widget.page_size = 10
-    widget.row_count = None
-    widget._all_data_loaded = True
-
-    # Populate cache with 1 page of data (10 rows). Page 0 is valid, page 1+ are invalid.
-    widget._cached_batches = [pd.DataFrame({"col1": range(10)})]
-
-    # Mark initial load as complete so observers fire
-    widget._initial_load_complete = True
+    # Simulate an unknown total row count.
+    with mock.patch.object(
+        bigframes.core.blocks.Block, "cached_for_paging", return_value=None
+    ), bigframes.option_context(
+        "display.render_mode", "anywidget", "display.max_rows", 10
+    ):
+        widget = TableWidget(paged_df)
+    assert widget.row_count is None
 
     # Setup timeout to fail fast if deadlock occurs
     # signal.SIGALRM is not available on Windows
@@ -74,108 +69,155 @@ def test_navigation_to_invalid_page_resets_to_valid_page_without_deadlock():
         widget.page = 5
 
         assert widget.page == 0
+        assert widget.row_count == 10
 
     finally:
         if has_sigalrm:
             signal.alarm(0)
 
 
-def test_css_contains_dark_mode_selectors():
+def test_css_contains_dark_mode_selectors(paged_df):
     """Test that the CSS for dark mode is loaded with all required selectors."""
     from bigframes.display.anywidget import TableWidget
 
-    mock_df = mock.create_autospec(bigframes.dataframe.DataFrame, instance=True)
-    # mock_df.columns and mock_df.dtypes are needed for __init__
-    mock_df.columns = ["col1"]
-    mock_df.dtypes = {"col1": "object"}
+    widget = TableWidget(paged_df)
+    css = widget._css
+    assert "@media (prefers-color-scheme: dark)" in css
+    assert 'html[theme="dark"]' in css
+    assert 'body[data-theme="dark"]' in css
 
-    # Mock _block to avoid AttributeError during _set_table_html
-    mock_block = mock.Mock()
-    mock_block.has_index = False
-    mock_df._block = mock_block
 
-    with mock.patch.object(TableWidget, "_initial_load"):
-        widget = TableWidget(mock_df)
-        css = widget._css
-        assert "@media (prefers-color-scheme: dark)" in css
-        assert 'html[theme="dark"]' in css
-        assert 'body[data-theme="dark"]' in css
+def test_pages_are_fetched_by_row_range(paged_df):
+    """Test that jumping to a page only fetches the rows of that page."""
+    from bigframes.display.anywidget import TableWidget
 
+    with bigframes.option_context("display.max_rows", 3):
+        widget = TableWidget(paged_df)
 
-@pytest.fixture
-def mock_df():
-    """A mock DataFrame that can be used in multiple tests."""
-    df = mock.create_autospec(bigframes.dataframe.DataFrame, instance=True)
-    df.columns = ["col1", "col2"]
-    df.dtypes = {"col1": "int64", "col2": "int64"}
+    with mock.patch.object(
+        bigframes.core.blocks.Block,
+        "retrieve_rows",
+        autospec=True,
+        side_effect=bigframes.core.blocks.Block.retrieve_rows,
+    ) as retrieve_rows:
+        widget.page = 3
+
+    assert widget.row_count == 10
+    assert _page_values(widget) == [9]
+    fetched_ranges = [call.args[1:] for call in retrieve_rows.call_args_list]
+    assert fetched_ranges[0] == (9, 12)
+    assert all(start >= 6 for start, _ in fetched_ranges)
+
+
+def test_visited_pages_are_served_from_cache(paged_df):
+    """Test that returning to a page does not fetch it again."""
+    from bigframes.display.anywidget import TableWidget
+
+    with bigframes.option_context("display.max_rows", 3):
+        widget = TableWidget(paged_df)
+    widget.page = 1
+    # Wait for background prefetches to finish, so they don't race the mock.
+    for prefetch in list(widget._prefetches.values()):
+        prefetch.result()
+
+    with mock.patch.object(
+        bigframes.core.blocks.Block, "retrieve_rows", autospec=True
+    ) as retrieve_rows:
+        widget.page = 0
+        widget.max_columns = 1
+
+    retrieve_rows.assert_not_called()
+    assert _page_values(widget) == [0, 1, 2]
 
-    mock_block = mock.Mock()
-    mock_block.has_index = False
-    df._block = mock_block
 
-    # Mock to_pandas_batches to return empty iterator or simple data
-    batch_df = pd.DataFrame({"col1": [1, 2], "col2": [3, 4]})
-    batches = mock.MagicMock()
-    batches.__iter__.return_value = iter([batch_df])
-    batches.total_rows = 2
-    df.to_pandas_batches.return_value = batches
+def test_adjacent_pages_are_prefetched(paged_df, monkeypatch):
+    """Test that the pages next to the current page are fetched in the background."""
+    import bigframes.display.anywidget
+    from bigframes.display.anywidget import TableWidget
+
+    monkeypatch.setattr(bigframes.display.anywidget, "_PREFETCH_ENABLED", True)
 
-    # Mock sort_values to return self (for chaining)
-    df.sort_values.return_value = df
+    with bigframes.option_context("display.max_rows", 4):
+        widget = TableWidget(paged_df)
+    widget.page = 1
 
-    return df
+    prefetched = {
+        (key.start, key.stop): future.result()
+        for key, future in widget._prefetches.items()
+    }
+    # The previous page was already fetched when the widget was created.
+    assert list(prefetched) == [(8, 12)]
+    assert list(prefetched[(8, 12)]["col1"]) == [8, 9]
 
 
-def test_sorting_single_column(mock_df):
+def test_sorting_single_column(paged_df):
     """Test that the widget can be sorted by a single column."""
     from bigframes.display.anywidget import TableWidget
 
     with bigframes.option_context("display.render_mode", "anywidget"):
-        widget = TableWidget(mock_df)
+        widget = TableWidget(paged_df)
 
     # Verify initial state
     assert widget.sort_context == []
 
     # Apply sort
-    widget.sort_context = [{"column": "col1", "ascending": True}]
+    widget.sort_context = [{"column": "col1", "ascending": False}]
 
-    # This should trigger _sort_changed -> _set_table_html
-    # which calls df.sort_values
+    assert _page_values(widget)[:3] == [9, 8, 7]
 
-    mock_df.sort_values.assert_called_with(by=["col1"], ascending=[True])
 
-
-def test_sorting_multi_column(mock_df):
+def test_sorting_multi_column(paged_df):
     """Test that the widget can be sorted by multiple columns."""
     from bigframes.display.anywidget import TableWidget
 
     with bigframes.option_context("display.render_mode", "anywidget"):
-        widget = TableWidget(mock_df)
+        widget = TableWidget(paged_df)
 
     # Apply multi-column sort
     widget.sort_context = [
-        {"column": "col1", "ascending": True},
-        {"column": "col2", "ascending": False},
+        {"column": "col2", "ascending": True},
+        {"column": "col1", "ascending": False},
     ]
 
-    mock_df.sort_values.assert_called_with(by=["col1", "col2"], ascending=[True, False])
+    assert _page_values(widget)[:5] == [9, 6, 3, 0, 7]
 
 
-def test_page_size_change_resets_sort(mock_df):
+def test_sorting_resets_to_first_page_and_reuses_sort(paged_df):
+    from bigframes.display.anywidget import TableWidget
+
+    with bigframes.option_context("display.max_rows", 3):
+        widget = TableWidget(paged_df)
+    widget.page = 2
+
+    with mock.patch.object(
+        bigframes.dataframe.DataFrame,
+        "sort_values",
+        autospec=True,
+        side_effect=bigframes.dataframe.DataFrame.sort_values,
+    ) as sort_values:
+        widget.sort_context = [{"column": "col1", "ascending": False}]
+        assert widget.page == 0
+        assert _page_values(widget) == [9, 8, 7]
+
+        widget.sort_context = []
+        widget.sort_context = [{"column": "col1", "ascending": False}]
+
+    assert sort_values.call_count == 1
+
+
+def test_page_size_change_resets_sort(paged_df):
     """Test that changing the page size resets the sorting."""
     from bigframes.display.anywidget import TableWidget
 
     with bigframes.option_context("display.render_mode", "anywidget"):
-        widget = TableWidget(mock_df)
+        widget = TableWidget(paged_df)
 
     # Set sort state
-    widget.sort_context = [{"column": "col1", "ascending": True}]
+    widget.sort_context = [{"column": "col1", "ascending": False}]
 
     # Change page size
-    widget.page_size = 50
+    widget.page_size = 4
 
     # Sort should be reset
     assert widget.sort_context == []
-
-    # to_pandas_batches called again (reset)
-    assert mock_df.to_pandas_batches.call_count >= 2
+    assert _page_values(widget) == [0, 1, 2, 3]
@@ -0,0 +1,107 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import inspect
+
+from google.cloud import bigquery
+import pyarrow as pa
+import pytest
+
+from bigframes.functions import _emulation, udf_def
+
+
+def _function_def(func, *, max_batching_rows=2, vectorized=False, pool="thread"):
+    signature = udf_def.UdfSignature.from_py_signature(inspect.signature(func))
+    return udf_def.BigqueryUdf(
+        routine_ref=bigquery.RoutineReference.from_string("project.dataset.routine"),
+        signature=signature,
+        local=udf_def.LocalUdfDef(
+            code=udf_def.CodeDef.from_func(func),
+            max_batching_rows=max_batching_rows,
+            vectorized=vectorized,
+            pool=pool,
+        ),
+    )
+
+
+def _add(x: int, y: float) -> float:
+    return x + y
+
+
+@pytest.mark.parametrize("pool", ["thread", "process"])
+def test_call_udf_in_batches(pool):
+    function_def = _function_def(_add, pool=pool)
+
+    result = _emulation.call_udf(
+        function_def, [pa.array([1, 2, 3, 4, 5]), pa.array([0.5] * 5)]
+    )
+
+    assert result.to_pylist() == [1.5, 2.5, 3.5, 4.5, 5.5]
+
+
+def test_call_udf_reuses_process_pool():
+    function_def = _function_def(_add, pool="process")
+    columns = [pa.array([1, 2, 3, 4, 5]), pa.array([0.5] * 5)]
+
+    _emulation.call_udf(function_def, columns)
+    pool = _emulation._get_process_pool()
+    result = _emulation.call_udf(function_def, columns)
+
+    assert _emulation._get_process_pool() is pool
+    assert result.to_pylist() == [1.5, 2.5, 3.5, 4.5, 5.5]
+
+
+def test_call_udf_vectorized_receives_batches():
+    def batch_size(x: int) -> int:
+        return x.fillna(0) * 0 + len(x)  # type: ignore
+
+    function_def = _function_def(batch_size, max_batching_rows=3, vectorized=True)
+
+    result = _emulation.call_udf(function_def, [pa.array([1, None, 3, 4])])
+
+    assert result.to_pylist() == [3, 3, 3, 1]
+
+
+def test_call_udf_skips_nulls_unless_apply_on_null():
+    def is_null(x: int) -> bool:
+        return x is None
+
+    function_def = _function_def(is_null)
+
+    assert _emulation.call_udf(
+        function_def, [pa.array([1, None])], apply_on_null=True
+    ).to_pylist() == [False, True]
+    assert _emulation.call_udf(
+        function_def, [pa.array([1, None])], apply_on_null=False
+    ).to_pylist() == [False, None]
+
+
+def test_call_udf_vectorized_wrong_length():
+    def first(x: int) -> int:
+        return x[:1]  # type: ignore
+
+    function_def = _function_def(first, vectorized=True)
+
+    with pytest.raises(ValueError, match="Expected 2 results"):
+        _emulation.call_udf(function_def, [pa.array([1, 2])])
+
+
+def test_call_udf_not_emulated():
+    function_def = udf_def.BigqueryUdf(
+        routine_ref=bigquery.RoutineReference.from_string("project.dataset.routine"),
+        signature=udf_def.UdfSignature.from_py_signature(inspect.signature(_add)),
+    )
+
+    with pytest.raises(ValueError, match="not emulated"):
+        _emulation.call_udf(function_def, [pa.array([1]), pa.array([1.0])])
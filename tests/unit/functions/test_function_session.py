@@ -0,0 +1,133 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import threading
+from unittest import mock
+
+import pytest
+
+from bigframes.functions import _function_client, _function_session
+from bigframes.testing import mocks
+
+
+def test_deploy_once_reuses_deployment():
+    function_session = _function_session.FunctionSession()
+    deployed = []
+
+    def deploy():
+        deployed.append(1)
+        return "my_function"
+
+    assert function_session._deploy_once("key", deploy) == "my_function"
+    assert function_session._deploy_once("key", deploy) == "my_function"
+    assert len(deployed) == 1
+
+
+def test_deploy_once_shares_deployment_in_progress():
+    function_session = _function_session.FunctionSession()
+    started = threading.Event()
+    release = threading.Event()
+    deployed = []
+
+    def deploy():
+        deployed.append(1)
+        started.set()
+        release.wait(timeout=10)
+        return "my_function"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        first = executor.submit(function_session._deploy_once, "key", deploy)
+        started.wait(timeout=10)
+        others = [
+            executor.submit(function_session._deploy_once, "key", deploy)
+            for _ in range(3)
+        ]
+        release.set()
+        names = [first.result(), *(other.result() for other in others)]
+
+    assert names == ["my_function"] * 4
+    assert len(deployed) == 1
+
+
+def test_deploy_once_retries_failed_deployment():
+    function_session = _function_session.FunctionSession()
+
+    def fail():
+        raise ValueError("deployment failed")
+
+    with pytest.raises(ValueError, match="deployment failed"):
+        function_session._deploy_once("key", fail)
+
+    assert function_session._deploy_once("key", lambda: "my_function") == "my_function"
+
+
+def test_deploy_remote_functions_deploys_concurrently():
+    session = mocks.create_bigquery_session()
+    # Each deployment waits for the other one to start.
+    barrier = threading.Barrier(2, timeout=10)
+
+    def provision(func, *, name, **kwargs):
+        barrier.wait()
+        return name or f"bigframes_{func.__name__}", f"cf_{func.__name__}", True
+
+    def add_one(x: int) -> int:
+        return x + 1
+
+    def double(x: int) -> int:
+        return x * 2
+
+    with mock.patch.object(
+        _function_client.FunctionClient,
+        "provision_bq_remote_function",
+        autospec=True,
+        side_effect=lambda self, func, **kwargs: provision(func, **kwargs),
+    ):
+        futures = session.deploy_remote_functions(
+            [add_one, double], cloud_function_service_account="default"
+        )
+        deployed = [future.result(timeout=10) for future in futures]
+
+    assert deployed[0].bigframes_bigquery_function.endswith(".bigframes_add_one")
+    assert deployed[1].bigframes_bigquery_function.endswith(".bigframes_double")
+    assert deployed[1](2) == 4
+
+
+def test_deploy_remote_functions_with_names():
+    session = mocks.create_bigquery_session()
+
+    def add_one(x: int) -> int:
+        return x + 1
+
+    with mock.patch.object(
+        _function_client.FunctionClient,
+        "provision_bq_remote_function",
+        autospec=True,
+        side_effect=lambda self, func, *, name, **kwargs: (name, "cf", False),
+    ):
+        (future,) = session.deploy_remote_functions(
+            {"my_add_one": add_one}, cloud_function_service_account="default"
+        )
+        deployed = future.result(timeout=10)
+
+    assert deployed.bigframes_bigquery_function.endswith(".my_add_one")
+
+
+def test_deploy_remote_functions_rejects_single_name():
+    session = mocks.create_bigquery_session()
+
+    with pytest.raises(ValueError, match="mapping of names"):
+        session.deploy_remote_functions(
+            [], name="my_function", cloud_function_service_account="default"
+        )
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import inspect
 import json
 
 import pandas as pd
@@ -21,6 +22,7 @@ import pytest
 
 import bigframes.dtypes
 import bigframes.functions.function_template as bff_template
+from bigframes.functions import udf_def
 
 HELLO_WORLD_BASE64_BYTES = b"SGVsbG8sIFdvcmxkIQ=="
 HELLO_WORLD_BASE64_STR = "SGVsbG8sIFdvcmxkIQ=="
@@ -191,3 +193,128 @@ def test_get_pd_series_converter_dtypes():
     assert str(bigframes.dtypes.FLOAT_DTYPE) == "Float64"
     assert str(bigframes.dtypes.INT_DTYPE) == "Int64"
     assert str(bigframes.dtypes.STRING_DTYPE) == "string"
+
+
+def test_get_pd_columns():
+    calls = [
+        [1, "1.5", True, "a", HELLO_WORLD_BASE64_STR],
+        ["2", "NaN", None, None, None],
+    ]
+
+    got = bff_template.get_pd_columns(
+        ("INT64", "FLOAT64", "BOOL", "STRING", "BYTES"), calls
+    )
+
+    pandas.testing.assert_series_equal(got[0], pd.Series([1, 2], dtype="Int64"))
+    assert got[1][0] == 1.5 and pd.isna(got[1][1])
+    pandas.testing.assert_series_equal(got[2], pd.Series([True, None], dtype="boolean"))
+    pandas.testing.assert_series_equal(got[3], pd.Series(["a", None], dtype="string"))
+    assert got[4].tolist() == [b"Hello, World!", None]
+
+
+@pytest.fixture
+def vectorized_udf(monkeypatch):
+    flask = pytest.importorskip("flask")
+    app = flask.Flask(__name__)
+
+    def set_udf(udf, input_types, output_type):
+        monkeypatch.setattr(bff_template, "udf", udf)
+        monkeypatch.setattr(bff_template, "input_types", input_types)
+        monkeypatch.setattr(bff_template, "output_type", output_type)
+
+    def call(calls):
+        with app.test_request_context(json={"calls": calls}):
+            return bff_template.udf_http_vectorized(flask.request)
+
+    return set_udf, call
+
+
+def test_udf_http_vectorized(vectorized_udf):
+    set_udf, call = vectorized_udf
+    batches = []
+
+    def add(x, y):
+        batches.append(len(x))
+        return x + y
+
+    set_udf(add, ("INT64", "FLOAT64"), "FLOAT64")
+
+    reply = call([[1, 0.5], [2, None], [3, "Infinity"]])
+
+    # The function is called once for the whole batch.
+    assert batches == [3]
+    assert json.loads(reply) == {"replies": [1.5, None, "Infinity"]}
+
+
+def test_udf_http_vectorized_list_output(vectorized_udf):
+    set_udf, call = vectorized_udf
+    set_udf(
+        lambda x: [[value, value * 2] for value in x],
+        ("INT64",),
+        "STRING",
+    )
+
+    reply = call([[1], [2]])
+
+    assert json.loads(reply) == {"replies": ["[1, 2]", "[2, 4]"]}
+
+
+def test_udf_http_vectorized_wrong_length(vectorized_udf):
+    set_udf, call = vectorized_udf
+    set_udf(lambda x: x.head(1), ("STRING",), "STRING")
+
+    response, status = call([["a"], ["b"]])
+
+    assert status == 400
+    assert "Expected 2 results" in response.get_json()["errorMessage"]
+
+
+def test_generate_cloud_function_main_code_vectorized(tmp_path):
+    def add_one(x: int) -> int:
+        return x + 1
+
+    code_def = udf_def.CodeDef.from_func(add_one)
+    signature = udf_def.UdfSignature.from_py_signature(inspect.signature(add_one))
+
+    handler = bff_template.generate_cloud_function_main_code(
+        code_def, str(tmp_path), udf_signature=signature, vectorized=True
+    )
+
+    assert handler == "udf_http_vectorized"
+    main_py = (tmp_path / "main.py").read_text()
+    assert "def udf_http_vectorized(request):" in main_py
+    assert "def get_pd_columns(input_types, calls):" in main_py
+
+
+@pytest.mark.parametrize("capture_references", [True, False])
+def test_managed_function_handler_vectorized(capture_references):
+    def scaled_sum(x: float, y: float) -> float:
+        return x * 2 + y
+
+    code_def = udf_def.CodeDef.from_func(scaled_sum)
+    signature = udf_def.UdfSignature.from_py_signature(inspect.signature(scaled_sum))
+
+    code = bff_template.generate_managed_function_code(
+        code_def, signature, capture_references, vectorized=True
+    )
+    handler = bff_template.load_managed_function_handler(
+        code_def, signature, capture_references, vectorized=True
+    )
+    got = handler(pd.DataFrame({"x": [1.0, 2.0, None], "y": [0.5, 0.5, 0.5]}))
+
+    assert "def bigframes_handler(df: pd.DataFrame):" in code
+    pandas.testing.assert_series_equal(got, pd.Series([2.5, 4.5, None]))
+
+
+def test_managed_function_handler_scalar():
+    def scaled_sum(x: float, y: float) -> float:
+        return x * 2 + y
+
+    code_def = udf_def.CodeDef.from_func(scaled_sum)
+    signature = udf_def.UdfSignature.from_py_signature(inspect.signature(scaled_sum))
+
+    handler = bff_template.load_managed_function_handler(
+        code_def, signature, capture_references=False
+    )
+
+    assert handler(1.0, 0.5) == 2.5
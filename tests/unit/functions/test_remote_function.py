@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pandas as pd
 import pytest
 
 import bigframes.functions.function as bff
@@ -76,3 +77,29 @@ def test_deploy_udf_with_name():
 
     # Test that the function would have been deployed somewhere.
     assert "my_custom_name" in deployed.bigframes_bigquery_function
+
+
+def test_deploy_udf_vectorized():
+    session = mocks.create_bigquery_session()
+
+    def my_remote_func(x: int) -> int:
+        return x * 2
+
+    deployed = session.deploy_udf(my_remote_func)
+    deployed_vectorized = session.deploy_udf(my_remote_func, vectorized=True)
+
+    # The vectorized function is a different deployment.
+    assert (
+        deployed.bigframes_bigquery_function
+        != deployed_vectorized.bigframes_bigquery_function
+    )
+
+
+def test_deploy_udf_vectorized_row_processor():
+    session = mocks.create_bigquery_session()
+
+    def my_remote_func(row: pd.Series) -> int:
+        return row["x"]
+
+    with pytest.raises(ValueError, match="vectorized=True is not supported"):
+        session.deploy_udf(my_remote_func, vectorized=True)
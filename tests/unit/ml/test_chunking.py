@@ -0,0 +1,310 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from unittest import mock
+
+from google.cloud import bigquery
+import pandas as pd
+import pytest
+
+import bigframes
+from bigframes.core import blocks
+import bigframes.dataframe
+from bigframes.ml import _chunking
+
+
+class _RecordingLimiter:
+    def __init__(self):
+        self.acquired = []
+        self._lock = threading.Lock()
+
+    def acquire(self, rows):
+        with self._lock:
+            self.acquired.append(rows)
+
+
+class _FlakyModel:
+    """Answers each prompt with the upper cased prompt, failing some rows once.
+
+    With ``reset_index``, the answers have a new default index, like the
+    results of a query.
+    """
+
+    def __init__(self, failing_prompts=(), reset_index=False):
+        self.calls = []
+        self._failing = set(failing_prompts)
+        self._reset_index = reset_index
+        self._lock = threading.Lock()
+
+    def predict(self, df):
+        prompts = df["prompt"].to_pandas().tolist()
+        with self._lock:
+            self.calls.append(prompts)
+            failing = set(self._failing)
+            self._failing -= set(prompts)
+        status = df["prompt"].isin(list(failing)).map({True: "quota", False: ""})
+        result = df.assign(result=df["prompt"].str.upper(), status=status)
+        return result.reset_index(drop=True) if self._reset_index else result
+
+
+@pytest.fixture
+def prompts(polars_session):
+    return bigframes.dataframe.DataFrame(
+        {"prompt": ["a", "b", "c", "d", "e"]},
+        index=[10, 11, 12, 13, 14],
+        session=polars_session,
+    )
+
+
+def test_predict_in_chunks_splits_by_offsets(prompts):
+    model = _FlakyModel()
+    limiter = _RecordingLimiter()
+
+    with bigframes.option_context("compute.ai_ops_rate_limiter", limiter):
+        result = _chunking.predict_in_chunks(
+            model.predict,
+            prompts,
+            status_col="status",
+            max_retries=0,
+            identity="model",
+            chunk_rows=2,
+        )
+
+    assert sorted(model.calls) == [["a", "b"], ["c", "d"], ["e"]]
+    assert sorted(limiter.acquired) == [1, 2, 2]
+    result_pd = result.to_pandas()
+    assert result_pd.index.tolist() == [10, 11, 12, 13, 14]
+    assert result_pd["result"].tolist() == ["A", "B", "C", "D", "E"]
+
+
+def test_predict_in_chunks_retries_failed_rows_only(prompts):
+    model = _FlakyModel(failing_prompts=["b", "e"])
+
+    result = _chunking.predict_in_chunks(
+        model.predict,
+        prompts,
+        status_col="status",
+        max_retries=1,
+        identity="model",
+        chunk_rows=3,
+    )
+
+    assert sorted(model.calls) == [["a", "b", "c"], ["b"], ["d", "e"], ["e"]]
+    result_pd = result.to_pandas().sort_index()
+    assert result_pd["result"].tolist() == ["A", "B", "C", "D", "E"]
+    assert (result_pd["status"] == "").all()
+
+
+def test_predict_in_chunks_keeps_failed_rows_without_retries(prompts):
+    model = _FlakyModel(failing_prompts=["b"])
+
+    result = _chunking.predict_in_chunks(
+        model.predict,
+        prompts,
+        status_col="status",
+        max_retries=0,
+        identity="model",
+        chunk_rows=5,
+    )
+
+    result_pd = result.to_pandas().sort_index()
+    assert result_pd["status"].tolist() == ["", "quota", "", "", ""]
+
+
+def test_predict_in_chunks_ignore_index(prompts):
+    model = _FlakyModel(reset_index=True)
+
+    result = _chunking.predict_in_chunks(
+        model.predict,
+        prompts,
+        status_col="status",
+        max_retries=0,
+        identity="model",
+        chunk_rows=2,
+        ignore_index=True,
+    )
+
+    result_pd = result.to_pandas()
+    assert result_pd.index.tolist() == [0, 1, 2, 3, 4]
+    assert result_pd["result"].tolist() == ["A", "B", "C", "D", "E"]
+
+
+@pytest.fixture
+def checkpoints():
+    """Stores the chunk checkpoints in a dict instead of tables."""
+    stored: dict[str, bigframes.dataframe.DataFrame] = {}
+
+    def read_checkpoint(session, table_id, index_names):
+        return stored.get(table_id)
+
+    def write_checkpoint(result, table_id):
+        stored[table_id] = result
+
+    with mock.patch.object(
+        blocks.Block,
+        "snapshot_independent_sql",
+        return_value="SELECT prompt FROM prompts",
+    ), mock.patch.object(
+        _chunking, "_read_checkpoint", side_effect=read_checkpoint
+    ), mock.patch.object(
+        _chunking, "_write_checkpoint", side_effect=write_checkpoint
+    ), bigframes.option_context(
+        "compute.ai_ops_cache_dataset", "project.dataset"
+    ):
+        yield stored
+
+
+def _predict(model, prompts, chunk_rows=2):
+    return _chunking.predict_in_chunks(
+        model.predict,
+        prompts,
+        status_col="status",
+        max_retries=0,
+        identity="model",
+        chunk_rows=chunk_rows,
+    )
+
+
+def test_predict_in_chunks_resumes_from_checkpoints(prompts, checkpoints):
+    model = _FlakyModel()
+
+    _predict(model, prompts)
+    # Forget the last chunk, as if the run was interrupted.
+    del checkpoints[max(checkpoints)]
+    model.calls.clear()
+    result = _predict(model, prompts)
+
+    assert all(
+        table_id.startswith("project.dataset.ai_ops_chunk_") for table_id in checkpoints
+    )
+    assert model.calls == [["e"]]
+    assert result.to_pandas()["result"].tolist() == ["A", "B", "C", "D", "E"]
+
+
+def test_predict_in_chunks_does_not_cache_input_when_resumed(prompts, checkpoints):
+    model = _FlakyModel()
+    _predict(model, prompts)
+    model.calls.clear()
+
+    with mock.patch.object(bigframes.dataframe.DataFrame, "cache") as cache:
+        result = _predict(model, prompts)
+
+    cache.assert_not_called()
+    assert model.calls == []
+    assert result.to_pandas()["result"].tolist() == ["A", "B", "C", "D", "E"]
+
+
+def test_predict_in_chunks_does_not_store_failed_chunks(prompts, checkpoints):
+    model = _FlakyModel(failing_prompts=["c"])
+
+    _predict(model, prompts)
+    model.calls.clear()
+    result = _predict(model, prompts)
+
+    assert len(checkpoints) == 3
+    assert model.calls == [["c", "d"]]
+    assert (result.to_pandas()["status"] == "").all()
+
+
+def test_predict_in_chunks_checkpoints_depend_on_chunk_rows(prompts, checkpoints):
+    model = _FlakyModel()
+
+    _predict(model, prompts, chunk_rows=2)
+    model.calls.clear()
+    result = _predict(model, prompts, chunk_rows=3)
+
+    assert sorted(model.calls) == [["a", "b", "c"], ["d", "e"]]
+    assert len(checkpoints) == 5
+    assert result.to_pandas()["result"].tolist() == ["A", "B", "C", "D", "E"]
+
+
+def test_predict_in_chunks_uses_caller_compute_options(prompts):
+    model = _FlakyModel()
+    maximum_bytes_billed = []
+
+    def predict(df):
+        maximum_bytes_billed.append(bigframes.options.compute.maximum_bytes_billed)
+        return model.predict(df)
+
+    with bigframes.option_context("compute.maximum_bytes_billed", 1234):
+        _chunking.predict_in_chunks(
+            predict,
+            prompts,
+            status_col="status",
+            max_retries=0,
+            identity="model",
+            chunk_rows=2,
+        )
+
+    assert maximum_bytes_billed == [1234, 1234, 1234]
+
+
+@pytest.mark.parametrize(
+    ("index_names", "expected_names"),
+    [
+        pytest.param(["x", "y"], ["x", "y"], id="input_index"),
+        pytest.param(["x"], [None, None], id="other_index"),
+    ],
+)
+def test_read_checkpoint_reads_written_index_levels(
+    polars_session, index_names, expected_names
+):
+    checkpoint = polars_session.read_pandas(
+        pd.DataFrame(
+            {
+                "bigframes_index_0": [1, 2],
+                "bigframes_index_1": ["a", "b"],
+                "result": ["A", "B"],
+            }
+        )
+    ).set_index(["bigframes_index_0", "bigframes_index_1"])
+    session = mock.Mock()
+    session.bqclient.get_table.return_value = bigquery.Table(
+        "project.dataset.table",
+        schema=[
+            bigquery.SchemaField("bigframes_index_1", "STRING"),
+            bigquery.SchemaField("bigframes_index_0", "INT64"),
+            bigquery.SchemaField("result", "STRING"),
+        ],
+    )
+    session.read_gbq_table.return_value = checkpoint
+
+    result = _chunking._read_checkpoint(session, "project.dataset.table", index_names)
+
+    session.read_gbq_table.assert_called_once_with(
+        "project.dataset.table",
+        index_col=["bigframes_index_0", "bigframes_index_1"],
+        use_cache=False,
+    )
+    assert result is not None
+    assert list(result.index.names) == expected_names
+    assert result.index.nlevels == 2
+
+
+def test_token_bucket_waits_for_tokens():
+    bucket = _chunking.TokenBucket(rows_per_second=10, capacity=5)
+
+    with mock.patch.object(_chunking.time, "sleep") as sleep:
+        bucket.acquire(5)
+        sleep.assert_not_called()
+
+        bucket.acquire(2)
+    # About 2 rows at 10 rows per second.
+    assert sleep.call_args_list[0].args[0] == pytest.approx(0.2, abs=0.05)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError, match="rows_per_second"):
+        _chunking.TokenBucket(rows_per_second=0)
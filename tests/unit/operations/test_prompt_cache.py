@@ -0,0 +1,150 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pandas as pd
+import pandas.testing
+import pytest
+
+import bigframes.dataframe
+from bigframes.operations import _prompt_cache
+import bigframes.series
+
+
+class _UpperModel:
+    """Answers each prompt with the upper cased prompt."""
+
+    model_name = "test-model"
+
+    def __init__(self):
+        self.predicted_prompts = []
+
+    def predict(self, prompts, *, output_schema=None, **params):
+        self.predicted_prompts.extend(prompts.to_pandas().tolist())
+        answers = prompts.str.upper()
+        col = (
+            next(iter(output_schema))
+            if output_schema
+            else "ml_generate_text_llm_result"
+        )
+        return answers.rename(col).to_frame()
+
+
+def test_predict_unique_prompts_calls_model_once_per_prompt(polars_session):
+    prompts = bigframes.series.Series(
+        ["a", "b", "a", "a", "c", "b"],
+        index=[10, 11, 12, 13, 14, 15],
+        name="prompt",
+        session=polars_session,
+    )
+    model = _UpperModel()
+
+    result = _prompt_cache.predict_unique_prompts(model, prompts, temperature=0.0)
+
+    assert sorted(model.predicted_prompts) == ["a", "b", "c"]
+    pandas.testing.assert_series_equal(
+        result["ml_generate_text_llm_result"].to_pandas(),
+        pd.Series(
+            ["A", "B", "A", "A", "C", "B"],
+            index=pd.Index([10, 11, 12, 13, 14, 15], dtype="Int64"),
+            name="ml_generate_text_llm_result",
+            dtype="string[pyarrow]",
+        ),
+    )
+
+
+def test_predict_unique_prompts_with_output_schema(polars_session):
+    prompts = bigframes.series.Series(
+        ["x", "x", "y"], name="prompt", session=polars_session
+    )
+    model = _UpperModel()
+
+    result = _prompt_cache.predict_unique_prompts(
+        model, prompts, output_schema={"answer": "string"}
+    )
+
+    assert sorted(model.predicted_prompts) == ["x", "y"]
+    assert list(result.columns) == ["answer"]
+    assert result["answer"].to_pandas().tolist() == ["X", "X", "Y"]
+
+
+@pytest.mark.parametrize(
+    ("result_col", "status_col"),
+    [
+        ("ml_generate_text_llm_result", "ml_generate_text_status"),
+        ("ml_generate_embedding_result", "ml_generate_embedding_status"),
+    ],
+)
+def test_succeeded_skips_failed_answers(polars_session, result_col, status_col):
+    answers = bigframes.dataframe.DataFrame(
+        {
+            result_col: ["A", None, "C"],
+            status_col: ["", "quota exceeded", ""],
+        },
+        session=polars_session,
+    )
+    entries = answers[[result_col]].assign(**{_prompt_cache._KEY_COL: ["a", "b", "c"]})
+
+    result = _prompt_cache._succeeded(entries, answers).to_pandas()
+
+    assert result[_prompt_cache._KEY_COL].tolist() == ["a", "c"]
+
+
+def test_succeeded_without_status_keeps_all(polars_session):
+    answers = bigframes.dataframe.DataFrame(
+        {"answer": ["A", "B"]}, session=polars_session
+    )
+
+    result = _prompt_cache._succeeded(answers, answers)
+
+    assert result is answers
+
+
+def test_key_prefix_depends_on_model_and_params():
+    model = _UpperModel()
+    other_model = _UpperModel()
+    other_model.model_name = "other-model"
+
+    prefix = _prompt_cache._key_prefix(model, {"temperature": 0.0})
+
+    assert prefix == _prompt_cache._key_prefix(model, {"temperature": 0.0})
+    assert prefix != _prompt_cache._key_prefix(model, {"temperature": 0.5})
+    assert prefix != _prompt_cache._key_prefix(other_model, {"temperature": 0.0})
+
+
+def test_predict_unique_prompts_with_output_columns(polars_session):
+    prompts = bigframes.series.Series(
+        ["x", "y", "y"], name="content", session=polars_session
+    )
+    model = _UpperModel()
+
+    result = _prompt_cache.predict_unique_prompts(
+        model, prompts, output_columns=["ml_generate_text_llm_result"]
+    )
+
+    assert sorted(model.predicted_prompts) == ["x", "y"]
+    assert result["ml_generate_text_llm_result"].to_pandas().tolist() == [
+        "X",
+        "Y",
+        "Y",
+    ]
+
+
+def test_table_digest_depends_on_output_columns():
+    text_digest = _prompt_cache._table_digest(["ml_generate_text_llm_result"], {})
+    embedding_digest = _prompt_cache._table_digest(["ml_generate_embedding_result"], {})
+
+    assert text_digest != embedding_digest
+    assert text_digest == _prompt_cache._table_digest(
+        ["ml_generate_text_llm_result"], {"temperature": 0.0}
+    )
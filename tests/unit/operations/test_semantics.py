@@ -0,0 +1,109 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+
+import numpy as np
+import pytest
+
+import bigframes
+import bigframes.dataframe
+from bigframes.operations import semantics
+import bigframes.series
+
+
+class _CompareModel:
+    """Prefers the document with the larger number, and counts the calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.prompts = 0
+
+    def predict(self, prompts, **kwargs):
+        local = prompts.to_pandas()
+        self.calls += 1
+        self.prompts += len(local)
+
+        def answer(prompt):
+            doc1, doc2 = re.findall(r"Document \d: score (\d+)", prompt)
+            return "Document 2" if int(doc2) > int(doc1) else "Document 1"
+
+        return bigframes.series.Series(
+            local.map(answer),
+            name="ml_generate_text_llm_result",
+            session=prompts._session,
+        ).to_frame()
+
+
+@pytest.fixture
+def semantic_operators(monkeypatch):
+    monkeypatch.setattr(
+        semantics.Semantics, "_validate_model", staticmethod(lambda model: None)
+    )
+    with bigframes.option_context(
+        "experiments.semantic_operators",
+        True,
+        "compute.semantic_ops_confirmation_threshold",
+        None,
+    ):
+        yield
+
+
+@pytest.mark.parametrize("num_pivots", [1, 3, 8])
+def test_top_k_multi_pivot(polars_session, semantic_operators, num_pivots):
+    np.random.seed(0)
+    scores = np.random.permutation(40)
+    df = bigframes.dataframe.DataFrame(
+        {"score": [str(score) for score in scores]}, session=polars_session
+    )
+    model = _CompareModel()
+
+    result = semantics.Semantics(df).top_k(
+        "{score}", model, k=5, algorithm="multi_pivot", num_pivots=num_pivots
+    )
+
+    assert sorted(int(score) for score in result["score"].to_pandas()) == [
+        35,
+        36,
+        37,
+        38,
+        39,
+    ]
+
+
+def test_top_k_multi_pivot_needs_fewer_rounds(polars_session, semantic_operators):
+    np.random.seed(0)
+    scores = np.random.permutation(50)
+    df = bigframes.dataframe.DataFrame(
+        {"score": [str(score) for score in scores]}, session=polars_session
+    )
+    quickselect_model = _CompareModel()
+    multi_pivot_model = _CompareModel()
+
+    expected = semantics.Semantics(df).top_k("{score}", quickselect_model, k=3)
+    result = semantics.Semantics(df).top_k(
+        "{score}", multi_pivot_model, k=3, algorithm="multi_pivot", num_pivots=7
+    )
+
+    assert sorted(result["score"].to_pandas()) == sorted(expected["score"].to_pandas())
+    # Each round is one model call.
+    assert multi_pivot_model.calls < quickselect_model.calls
+    assert multi_pivot_model.calls <= 3
+
+
+def test_top_k_invalid_algorithm(polars_session, semantic_operators):
+    df = bigframes.dataframe.DataFrame({"score": ["1", "2"]}, session=polars_session)
+
+    with pytest.raises(ValueError, match="algorithm"):
+        semantics.Semantics(df).top_k("{score}", _CompareModel(), k=1, algorithm="x")  # type: ignore[arg-type]
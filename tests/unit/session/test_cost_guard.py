@@ -0,0 +1,99 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest.mock as mock
+
+import google.cloud.bigquery as bigquery
+import pytest
+
+import bigframes
+import bigframes.exceptions as bfe
+import bigframes.session.cost_guard as cost_guard
+import bigframes.session.metrics as metrics
+
+
+def _create_client(bytes_processed: int):
+    bqclient = mock.create_autospec(bigquery.Client, instance=True)
+    query_job = mock.create_autospec(bigquery.QueryJob, instance=True)
+    type(query_job).total_bytes_processed = mock.PropertyMock(
+        return_value=bytes_processed
+    )
+    type(query_job).referenced_tables = mock.PropertyMock(
+        return_value=[bigquery.TableReference.from_string("my-project.dataset.table")]
+    )
+    bqclient.query.return_value = query_job
+    return bqclient
+
+
+def test_check_without_budgets_does_not_dry_run():
+    bqclient = _create_client(100)
+    guard = cost_guard.QueryCostGuard(bqclient)
+
+    guard.check("SELECT 1", bigquery.QueryJobConfig())
+
+    bqclient.query.assert_not_called()
+
+
+def test_check_dry_runs_once_per_sql():
+    bqclient = _create_client(100)
+    execution_metrics = metrics.ExecutionMetrics()
+    guard = cost_guard.QueryCostGuard(bqclient, metrics=execution_metrics)
+
+    with bigframes.option_context("compute.maximum_bytes_estimated", 1000):
+        guard.check("SELECT 1", bigquery.QueryJobConfig(use_query_cache=False))
+        guard.check("SELECT 1", bigquery.QueryJobConfig())
+
+    bqclient.query.assert_called_once()
+    job_config = bqclient.query.call_args.kwargs["job_config"]
+    assert job_config.dry_run
+    assert not job_config.use_query_cache
+    assert guard.session_bytes_estimated == 200
+    assert execution_metrics.bytes_estimated == 200
+
+
+def test_check_raises_when_query_exceeds_budget():
+    guard = cost_guard.QueryCostGuard(_create_client(100))
+
+    with bigframes.option_context("compute.maximum_bytes_estimated", 99):
+        with pytest.raises(
+            bfe.MaximumBytesEstimatedExceeded, match="my-project.dataset.table"
+        ):
+            guard.check("SELECT 1", bigquery.QueryJobConfig())
+
+    assert guard.session_bytes_estimated == 0
+
+
+def test_check_raises_when_session_exceeds_budget():
+    guard = cost_guard.QueryCostGuard(_create_client(100))
+
+    with bigframes.option_context("compute.maximum_session_bytes_estimated", 250):
+        guard.check("SELECT 1", bigquery.QueryJobConfig())
+        guard.check("SELECT 2", bigquery.QueryJobConfig())
+        with pytest.raises(bfe.MaximumBytesEstimatedExceeded, match="session"):
+            guard.check("SELECT 3", bigquery.QueryJobConfig())
+
+
+def test_check_warns_when_configured():
+    guard = cost_guard.QueryCostGuard(_create_client(100))
+
+    with bigframes.option_context(
+        "compute.maximum_bytes_estimated",
+        99,
+        "compute.estimated_bytes_exceeded_action",
+        "warn",
+    ):
+        with pytest.warns(bfe.MaximumBytesEstimatedWarning, match="cache()"):
+            guard.check("SELECT 1", bigquery.QueryJobConfig())
+
+    assert guard.session_bytes_estimated == 100
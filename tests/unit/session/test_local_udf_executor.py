@@ -0,0 +1,123 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow
+import pytest
+
+import bigframes.dataframe
+from bigframes.session import executor, local_udf_executor
+from bigframes.testing import mocks
+
+pytest.importorskip("polars")
+
+
+@pytest.fixture
+def session():
+    return mocks.create_bigquery_session(udf_emulation="thread")
+
+
+def test_remote_function_is_not_deployed(session):
+    @session.remote_function(cloud_function_service_account="default")
+    def add_one(x: int) -> int:
+        return x + 1
+
+    assert add_one.udf_def.local is not None
+    assert add_one.udf_def.local.max_batching_rows == 1000
+    session.bqclient.create_routine.assert_not_called()
+    assert add_one(1) == 2
+
+
+def test_udf_is_not_deployed(session):
+    @session.udf(dataset="dataset", name="multiply", max_batching_rows=10)
+    def multiply(x: int, y: float) -> float:
+        return x * y
+
+    assert multiply.udf_def.local is not None
+    assert multiply.udf_def.local.max_batching_rows == 10
+    session.bqclient.create_routine.assert_not_called()
+    session.bqclient.query.assert_not_called()
+
+
+def test_emulated_functions_run_locally(session):
+    @session.remote_function(
+        cloud_function_service_account="default", max_batching_rows=2
+    )
+    def add_one(x: int) -> int:
+        return x + 1
+
+    @session.udf(dataset="dataset", name="multiply", vectorized=True)
+    def multiply(x: int, y: float) -> float:
+        return x * y  # type: ignore
+
+    df = bigframes.dataframe.DataFrame(
+        {"a": [1, 2, 3, 4, 5], "b": [0.5, 1.0, 1.5, 2.0, 2.5]}, session=session
+    )
+    df["c"] = df["a"].apply(add_one)
+    df["d"] = df["a"].combine(df["b"], multiply)
+
+    result = df.to_pandas()
+
+    assert result["c"].tolist() == [2, 3, 4, 5, 6]
+    assert result["d"].tolist() == [0.5, 2.0, 4.5, 8.0, 12.5]
+    session.bqclient.query.assert_not_called()
+
+
+def test_row_processor_is_not_emulated(session):
+    with pytest.raises(NotImplementedError):
+
+        @session.remote_function(cloud_function_service_account="default")
+        def row_sum(row: pd.Series) -> int:
+            return row["a"] + row["b"]
+
+
+def test_execute_ignores_plans_without_emulated_functions(session):
+    df = bigframes.dataframe.DataFrame({"a": [1, 2]}, session=session)
+    object_under_test = local_udf_executor.LocalUdfExecutor(
+        materialize=lambda node: pytest.fail("unexpected materialization")
+    )
+
+    assert object_under_test.execute(df._block.expr.node, ordered=True) is None
+
+
+def test_execute_materializes_bigquery_reads(session):
+    @session.remote_function(cloud_function_service_account="default")
+    def add_one(x: int) -> int:
+        return x + 1
+
+    df = session.read_gbq("test-project.test_dataset.test_table")
+    plan = df["col"].apply(add_one)._block.expr.node
+    materialized = []
+
+    def materialize(node):
+        materialized.append(node)
+        return executor.LocalExecuteResult(
+            data=pyarrow.table(
+                {
+                    field.id.sql: pyarrow.array([1, 2, 3], pyarrow.int64())
+                    for field in node.fields
+                }
+            ),
+            bf_schema=node.schema,
+        )
+
+    object_under_test = local_udf_executor.LocalUdfExecutor(materialize=materialize)
+    result = object_under_test.execute(plan, ordered=True)
+
+    assert len(materialized) == 1
+    assert not local_udf_executor.has_emulated_udf(materialized[0])
+    assert result is not None
+    table = result.batches().to_arrow_table()
+    assert table.columns[-1].to_pylist() == [2, 3, 4]
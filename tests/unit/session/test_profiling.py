@@ -0,0 +1,160 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import unittest.mock as mock
+
+import pyarrow
+import pytest
+
+import bigframes.core.events
+import bigframes.core.schema
+import bigframes.dtypes
+import bigframes.session._io.pandas
+import bigframes.session.profiling
+from bigframes.testing import mocks
+
+
+def _span(name, secs, rows=None, nbytes=None):
+    return bigframes.core.events.SpanFinished(
+        name=name,
+        start_time=datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc),
+        duration=datetime.timedelta(seconds=secs),
+        rows=rows,
+        bytes=nbytes,
+    )
+
+
+def test_span_publishes_span_finished():
+    publisher = bigframes.core.events.Publisher()
+    received: list[bigframes.core.events.Event] = []
+    publisher.subscribe(received.append)
+
+    with publisher.span("compile_sql") as span:
+        span.rows = 3
+        span.bytes = 24
+
+    assert len(received) == 1
+    event = received[0]
+    assert isinstance(event, bigframes.core.events.SpanFinished)
+    assert event.name == "compile_sql"
+    assert event.rows == 3
+    assert event.bytes == 24
+    assert event.duration >= datetime.timedelta(0)
+
+
+def test_span_publishes_on_error():
+    publisher = bigframes.core.events.Publisher()
+    received: list[bigframes.core.events.Event] = []
+    publisher.subscribe(received.append)
+
+    with pytest.raises(ValueError):
+        with publisher.span("execute_query"):
+            raise ValueError("boom")
+
+    assert [
+        event.name
+        for event in received
+        if isinstance(event, bigframes.core.events.SpanFinished)
+    ] == ["execute_query"]
+
+
+def test_span_without_publisher_is_noop():
+    with bigframes.core.events.Span("prepare_plan", None) as span:
+        span.rows = 1
+
+
+def test_span_excludes_paused_time(monkeypatch):
+    clock = iter([0.0, 1.0, 11.0, 12.0])
+    monkeypatch.setattr(bigframes.core.events.time, "perf_counter", lambda: next(clock))
+    publisher = bigframes.core.events.Publisher()
+    received: list[bigframes.core.events.Event] = []
+    publisher.subscribe(received.append)
+
+    with publisher.span("read_streams") as span:
+        span.pause()
+        span.resume()
+
+    assert len(received) == 1
+    event = received[0]
+    assert isinstance(event, bigframes.core.events.SpanFinished)
+    assert event.duration == datetime.timedelta(seconds=2)
+
+
+def test_arrow_to_pandas_publishes_span():
+    publisher = bigframes.core.events.Publisher()
+    received: list[bigframes.core.events.Event] = []
+    publisher.subscribe(received.append)
+    schema = bigframes.core.schema.ArraySchema(
+        (bigframes.core.schema.SchemaItem("col", bigframes.dtypes.INT_DTYPE),)
+    )
+    table = pyarrow.table({"col": pyarrow.array([1, 2, 3], pyarrow.int64())})
+
+    bigframes.session._io.pandas.arrow_to_pandas(table, schema, publisher=publisher)
+
+    assert len(received) == 1
+    event = received[0]
+    assert isinstance(event, bigframes.core.events.SpanFinished)
+    assert event.name == "arrow_to_pandas"
+    assert event.rows == 3
+    assert event.bytes == table.nbytes
+
+
+def test_execution_profile_summary_aggregates_by_phase():
+    profile = bigframes.session.profiling.ExecutionProfile()
+    profile(_span("execute_query", 2.0, rows=10, nbytes=100))
+    profile(_span("execute_query", 1.0, rows=5, nbytes=50))
+    profile(_span("compile_sql", 0.5))
+    profile(bigframes.core.events.ExecutionStarted())
+
+    summary = profile.summary()
+
+    assert summary.loc["execute_query", "count"] == 2
+    assert summary.loc["execute_query", "total_secs"] == 3.0
+    assert summary.loc["execute_query", "max_secs"] == 2.0
+    assert summary.loc["execute_query", "rows"] == 15
+    assert summary.loc["execute_query", "bytes"] == 150
+    assert summary.loc["compile_sql", "count"] == 1
+    assert summary.loc["compile_sql", "rows"] == 0
+
+
+def test_opentelemetry_exporter_records_span():
+    tracer = mock.Mock()
+    exporter = bigframes.session.profiling.OpenTelemetryExporter(tracer)
+
+    exporter(_span("read_streams", 1.5, rows=7, nbytes=70))
+    exporter(bigframes.core.events.ExecutionStarted())
+
+    tracer.start_span.assert_called_once()
+    args, kwargs = tracer.start_span.call_args
+    assert args == ("bigframes.read_streams",)
+    assert kwargs["attributes"] == {"bigframes.rows": 7, "bigframes.bytes": 70}
+    otel_span = tracer.start_span.return_value
+    otel_span.end.assert_called_once_with(end_time=kwargs["start_time"] + 1_500_000_000)
+
+
+def test_session_profile_collects_spans(monkeypatch, capsys):
+    session = mocks.create_bigquery_session()
+    df = mocks.create_dataframe(monkeypatch, session=session, data={"col": [1, 2]})
+
+    with session.profile() as profile:
+        df.to_pandas()
+
+    assert "prepare_plan" in {span.name for span in profile.spans}
+    assert "arrow_to_pandas" in capsys.readouterr().out
+
+    # Spans after the context exits are not recorded.
+    num_spans = len(profile.spans)
+    df.to_pandas()
+    assert len(profile.spans) == num_spans
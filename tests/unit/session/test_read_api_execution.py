@@ -0,0 +1,129 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from unittest import mock
+
+import google.cloud.bigquery as bigquery
+import pyarrow
+import pytest
+
+from bigframes.core import bq_data, identifiers, nodes, ordering
+import bigframes.core.schema
+import bigframes.dtypes
+from bigframes.session import read_api_execution
+from bigframes.testing import mocks
+
+
+@pytest.fixture
+def object_under_test():
+    return read_api_execution.ReadApiSemiExecutor(
+        bqstoragereadclient=mock.Mock(), project="test-project"
+    )
+
+
+@pytest.fixture
+def session():
+    session = mocks.create_bigquery_session()
+    yield session
+    session.close()
+
+
+def create_read_table_node(
+    session, offsets_ordered: bool = True
+) -> nodes.ReadTableNode:
+    table = bq_data.GbqNativeTable.from_ref_and_schema(
+        bigquery.TableReference.from_string("test-project.dataset.cached"),
+        (
+            bigquery.SchemaField("letters", "STRING"),
+            bigquery.SchemaField("offsets", "INTEGER"),
+        ),
+        location="US",
+        cluster_cols=("offsets",),
+    )
+    source = bq_data.BigqueryDataSource(
+        table=table,
+        schema=bigframes.core.schema.ArraySchema(
+            (
+                bigframes.core.schema.SchemaItem(
+                    "letters", bigframes.dtypes.STRING_DTYPE
+                ),
+                bigframes.core.schema.SchemaItem("offsets", bigframes.dtypes.INT_DTYPE),
+            )
+        ),
+        ordering=ordering.TotalOrdering.from_offset_col("offsets")
+        if offsets_ordered
+        else None,
+        n_rows=10,
+    )
+    return nodes.ReadTableNode(
+        source=source,
+        scan_list=nodes.ScanList(
+            (nodes.ScanItem(identifiers.ColumnId("letters_id"), "letters"),)
+        ),
+        table_session=session,
+    )
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "peek", "expected_restriction"),
+    (
+        (4, 8, None, "`offsets` >= 4 AND `offsets` < 8"),
+        (None, 3, None, "`offsets` >= 0 AND `offsets` < 3"),
+        (6, None, None, "`offsets` >= 6"),
+        (6, None, 2, "`offsets` >= 6 AND `offsets` < 8"),
+    ),
+)
+def test_read_api_executor_slices_offsets_with_row_restriction(
+    start, stop, peek, expected_restriction, object_under_test, session, monkeypatch
+):
+    read_sources = []
+
+    def get_arrow_batches(data, columns, *args, **kwargs):
+        read_sources.append(data)
+        # Rows within the range may be returned out of order.
+        batch = pyarrow.record_batch(
+            {"letters": ["g", "e", "f"], "offsets": [6, 4, 5]}
+        ).select(columns)
+        return bq_data.ReadResult(iter([batch]), 3, 0)
+
+    monkeypatch.setattr(bq_data, "get_arrow_batches", get_arrow_batches)
+    plan = nodes.SliceNode(create_read_table_node(session), start=start, stop=stop)
+
+    result = object_under_test.execute(plan, ordered=True, peek=peek)
+
+    assert result is not None
+    assert [source.sql_predicate for source in read_sources] == [expected_restriction]
+    assert result.batches().to_pandas()["letters_id"].to_list() == ["e", "f", "g"]
+
+
+@pytest.mark.parametrize(
+    ("start", "stop", "step", "offsets_ordered"),
+    (
+        (-3, None, 1, True),
+        (0, 4, 2, True),
+        (0, 4, 1, False),
+    ),
+)
+def test_read_api_executor_does_not_slice_without_offsets(
+    start, stop, step, offsets_ordered, object_under_test, session
+):
+    plan = nodes.SliceNode(
+        create_read_table_node(session, offsets_ordered),
+        start=start,
+        stop=stop,
+        step=step,
+    )
+
+    assert object_under_test._try_adapt_row_range(plan) is None
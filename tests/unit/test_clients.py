@@ -93,3 +93,30 @@ def test_ensure_iam_binding():
         "test-project", "serviceAccount2", "roles/test.role2"
     )
     resource_manager_client.set_iam_policy.assert_called_once()
+
+
+def test_create_bq_connection_checks_connection_once():
+    bq_connection_client = mock.create_autospec(
+        bigquery_connection_v1.ConnectionServiceClient, instance=True
+    )
+    resource_manager_client = mock.create_autospec(
+        resourcemanager_v3.ProjectsClient, instance=True
+    )
+    bq_connection_manager = clients.BqConnectionManager(
+        bq_connection_client, resource_manager_client
+    )
+
+    with mock.patch.object(
+        bq_connection_manager,
+        "_create_bq_connection_with_iam_role",
+        autospec=True,
+    ) as create:
+        for _ in range(3):
+            bq_connection_manager.create_bq_connection(
+                "test-project", "us", "test-connection", "run.invoker"
+            )
+        bq_connection_manager.create_bq_connection(
+            "test-project", "us", "test-connection", "aiplatform.user"
+        )
+
+    assert create.call_count == 2
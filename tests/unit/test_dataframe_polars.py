@@ -28,6 +28,7 @@ import bigframes
 import bigframes._config.display_options as display_options
 import bigframes.core.indexes as bf_indexes
 import bigframes.dataframe as dataframe
+import bigframes.features
 import bigframes.pandas as bpd
 import bigframes.series as series
 from bigframes.testing.utils import (
@@ -1287,6 +1288,52 @@ def test_apply_series_scalar_callable(
     pandas.testing.assert_series_equal(bf_result, pd_result)
 
 
+def test_apply_axis_1_python_callable_local(
+    scalars_df_index,
+    scalars_pandas_df_index,
+):
+    columns = ["int64_too", "int64_col", "string_col"]
+
+    def describe(row, sep):
+        return f"{row['string_col']}{sep}{row['int64_col'] - row['int64_too']}"
+
+    with pytest.warns(bigframes.exceptions.FunctionAxisOnePreviewWarning):
+        bf_result = (
+            scalars_df_index[columns].apply(describe, axis=1, args=(":",)).to_pandas()
+        )
+
+    pd_result = scalars_pandas_df_index[columns].apply(describe, axis=1, args=(":",))
+
+    assert_series_equal(bf_result, pd_result, check_dtype=False)
+
+
+# pandas before 2.1 only has DataFrame.applymap, deprecated in later versions.
+@pytest.mark.filterwarnings("ignore:DataFrame.applymap has been deprecated")
+@pytest.mark.parametrize("map_usable", [True, False])
+def test_map_python_callable_local(
+    scalars_df_index,
+    scalars_pandas_df_index,
+    monkeypatch,
+    map_usable,
+):
+    monkeypatch.setattr(
+        bigframes.features.PandasVersions,
+        "is_dataframe_map_usable",
+        property(lambda self: map_usable),
+    )
+    columns = ["int64_too", "int64_col"]
+
+    bf_result = (
+        scalars_df_index[columns].map(lambda x: x * 2, na_action="ignore").to_pandas()
+    )
+
+    pd_result = scalars_pandas_df_index[columns].map(
+        lambda x: x * 2, na_action="ignore"
+    )
+
+    assert_frame_equal(bf_result, pd_result, check_dtype=False)
+
+
 def test_df_pipe(
     scalars_df_index,
     scalars_pandas_df_index,
@@ -2094,6 +2141,47 @@ def test_cov_w_numeric_only(scalars_dfs, columns, numeric_only):
     )
 
 
+def test_df_approximate_option(scalars_dfs):
+    columns = ["int64_too", "int64_col", "float64_col"]
+    scalars_df, scalars_pandas_df = scalars_dfs
+
+    with bigframes.option_context("compute.approximate", True):
+        bf_nunique = scalars_df[columns].groupby("int64_too").nunique().to_pandas()
+        bf_quantile = scalars_df[columns].quantile([0.0, 1.0]).to_pandas()
+
+    pd_nunique = scalars_pandas_df[columns].groupby("int64_too").nunique()
+    pd_quantile = scalars_pandas_df[columns].quantile([0.0, 1.0])
+    pd.testing.assert_frame_equal(bf_nunique, pd_nunique, check_dtype=False)
+    # The extremes are exact, even for approximate quantiles.
+    pd.testing.assert_frame_equal(
+        bf_quantile, pd_quantile, check_dtype=False, check_index_type=False
+    )
+
+
+@pytest.mark.parametrize("max_aggregations", [5000, 1000])
+@pytest.mark.parametrize("method", ["corr", "cov"])
+def test_stat_matrix_many_columns(session, monkeypatch, method, max_aggregations):
+    monkeypatch.setattr(dataframe, "_STAT_MATRIX_MAX_AGGREGATIONS", max_aggregations)
+    rng = np.random.default_rng(0)
+    columns = pd.MultiIndex.from_tuples(
+        [(f"c{i % 60}", i % 2) for i in range(120)], names=["name", "parity"]
+    )
+    pd_df = pd.DataFrame(rng.normal(size=(20, 120)), columns=columns)
+    pd_df.iloc[3, 5] = np.nan
+    pd_df.iloc[7, :60] = np.nan
+
+    bf_result = getattr(session.read_pandas(pd_df), method)().to_pandas()
+    pd_result = getattr(pd_df, method)()
+
+    pd.testing.assert_frame_equal(
+        bf_result,
+        pd_result,
+        check_dtype=False,
+        check_index_type=False,
+        check_column_type=False,
+    )
+
+
 def test_df_corrwith_df(scalars_dfs):
     scalars_df, scalars_pandas_df = scalars_dfs
 
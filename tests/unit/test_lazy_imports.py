@@ -0,0 +1,42 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "deferred_module",
+    [
+        "bigframes_vendored.ibis",
+        "bigframes_vendored.sqlglot",
+        "pyiceberg",
+    ],
+)
+def test_import_bigframes_pandas_defers_heavy_module(deferred_module):
+    # Use a fresh interpreter, since the test session has imported everything.
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import bigframes.pandas; "
+            f"print({deferred_module!r} in sys.modules)",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -4612,9 +4612,13 @@ def test_apply_lambda(scalars_dfs, col, lambda_):
 
     bf_col = scalars_df[col]
 
-    # Can't be applied to BigFrames Series without by_row=False
-    with pytest.raises(ValueError, match="by_row=False"):
-        bf_col.apply(lambda_)
+    # Local data can be applied to element by element without by_row=False
+    assert_series_equal(
+        bf_col.apply(lambda_).to_pandas(),
+        scalars_pandas_df[col].apply(lambda_),
+        check_dtype=False,
+        nulls_are_nan=True,
+    )
 
     bf_result = bf_col.apply(lambda_, by_row=False).to_pandas()
 
@@ -4651,17 +4655,15 @@ def test_apply_numpy_ufunc(scalars_dfs, ufunc):
     scalars_df, scalars_pandas_df = scalars_dfs
 
     bf_col = scalars_df["int64_col"]
-
-    # Can't be applied to BigFrames Series without by_row=False
-    with pytest.raises(ValueError, match="by_row=False"):
-        bf_col.apply(ufunc)
-
     bf_result = bf_col.apply(ufunc, by_row=False).to_pandas()
+    # Local data can also be applied to without by_row=False
+    bf_local_result = bf_col.apply(ufunc).to_pandas()
 
     pd_col = scalars_pandas_df["int64_col"]
     pd_result = pd_col.apply(ufunc)
 
     assert_series_equal(bf_result, pd_result)
+    assert_series_equal(bf_local_result, pd_result, check_dtype=False)
 
 
 @pytest.mark.parametrize(
@@ -4798,9 +4800,13 @@ def test_apply_simple_udf(scalars_dfs):
 
     bf_col = scalars_df["int64_col"]
 
-    # Can't be applied to BigFrames Series without by_row=False
-    with pytest.raises(ValueError, match="by_row=False"):
-        bf_col.apply(foo)
+    # Local data can be applied to element by element without by_row=False
+    assert_series_equal(
+        bf_col.apply(foo).to_pandas(),
+        scalars_pandas_df["int64_col"].apply(foo),
+        check_dtype=False,
+        nulls_are_nan=True,
+    )
 
     bf_result = bf_col.apply(foo, by_row=False).to_pandas()
 
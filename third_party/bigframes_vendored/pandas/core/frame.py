@@ -4358,7 +4358,11 @@ class DataFrame(generic.NDFrame):
         """Apply a function to a Dataframe elementwise.
 
         This method applies a function that accepts and returns a scalar
-        to every element of a DataFrame.
+        to every element of a DataFrame. If every source of the DataFrame is
+        local data, such as from ``read_pandas`` or a pandas DataFrame,
+        ``func`` can also be a plain Python function, which is run in process.
+        DataFrames that read BigQuery tables, including through ``read_gbq``
+        or ``cache()``, require a BigQuery function.
 
         .. note::
            In pandas 2.1.0, DataFrame.applymap is deprecated and renamed to
@@ -4902,7 +4906,12 @@ class DataFrame(generic.NDFrame):
         Objects passed to the function are Series objects whose index is
         the DataFrame's index (``axis=0``) or the DataFrame's columns (``axis=1``).
         The final return type is inferred from the return type of the applied
-        function.
+        function. With ``axis=1``, ``func`` must be a BigQuery function, unless
+        every source of the DataFrame is local data, such as from
+        ``read_pandas`` or a pandas DataFrame, in which case a plain Python
+        function is run in process. DataFrames that read BigQuery tables,
+        including through ``read_gbq`` or ``cache()``, raise a ``ValueError``
+        for plain Python functions.
 
         .. note::
             ``axis=1`` scenario is in preview.
@@ -5348,9 +5357,14 @@ class DataFrame(generic.NDFrame):
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def median(self, *, numeric_only: bool = False, exact: bool = True):
+    def median(self, *, numeric_only: bool = False, exact: Optional[bool] = None):
         """Return the median of the values over colunms.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
             >>> import bigframes.pandas as bpd
@@ -5372,9 +5386,9 @@ class DataFrame(generic.NDFrame):
         Args:
             numeric_only (bool. default False):
                 Default False. Include only float, int, boolean columns.
-            exact (bool. default True):
-                Default True. Get the exact median instead of an approximate
-                one.
+            exact (bool, optional):
+                Get the exact median instead of an approximate one. Defaults to
+                ``not bigframes.options.compute.approximate``.
 
         Returns:
             bigframes.pandas.Series: Series with the median of values.
@@ -5382,11 +5396,20 @@ class DataFrame(generic.NDFrame):
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
     def quantile(
-        self, q: Union[float, Sequence[float]] = 0.5, *, numeric_only: bool = False
+        self,
+        q: Union[float, Sequence[float]] = 0.5,
+        *,
+        numeric_only: bool = False,
+        exact: Optional[bool] = None,
     ):
         """
         Return values at the given quantile over requested axis.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
             >>> import bigframes.pandas as bpd
@@ -5408,6 +5431,10 @@ class DataFrame(generic.NDFrame):
                 Value between 0 <= q <= 1, the quantile(s) to compute.
             numeric_only (bool, default False):
                 Include only `float`, `int` or `boolean` data.
+            exact (bool, optional):
+                Compute exact quantiles instead of approximate ones with
+                ``APPROX_QUANTILES``. Defaults to
+                ``not bigframes.options.compute.approximate``.
 
         Returns:
             bigframes.pandas.DataFrame or bigframes.pandas.Series:
@@ -5934,10 +5961,15 @@ class DataFrame(generic.NDFrame):
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def nunique(self):
+    def nunique(self, *, exact: Optional[bool] = None):
         """
         Count number of distinct elements in each column.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
 
@@ -5955,6 +5987,12 @@ class DataFrame(generic.NDFrame):
             B    2
             dtype: Int64
 
+        Args:
+            exact (bool, optional):
+                Count distinct values exactly instead of approximately with
+                ``APPROX_COUNT_DISTINCT``. Defaults to
+                ``not bigframes.options.compute.approximate``.
+
         Returns:
             bigframes.pandas.Series: Series with number of distinct elements.
         """
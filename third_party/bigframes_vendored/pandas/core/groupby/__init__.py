@@ -9,7 +9,7 @@ expose these user-facing objects to provide specific functionality.
 """
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
 
 from bigframes import constants
 
@@ -241,11 +241,16 @@ class GroupBy:
         self,
         numeric_only: bool = False,
         *,
-        exact: bool = True,
+        exact: Optional[bool] = None,
     ):
         """
         Compute median of groups, excluding missing values.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
         For SeriesGroupBy:
@@ -273,8 +278,9 @@ class GroupBy:
         Args:
             numeric_only (bool, default False):
                 Include only float, int, boolean columns.
-            exact (bool, default True):
-                Calculate the exact median instead of an approximation.
+            exact (bool, optional):
+                Get the exact median instead of an approximate one. Defaults to
+                ``not bigframes.options.compute.approximate``.
 
         Returns:
             bigframes.pandas.DataFrame or bigframes.pandas.Series:
@@ -282,10 +288,17 @@ class GroupBy:
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def quantile(self, q=0.5, *, numeric_only: bool = False):
+    def quantile(
+        self, q=0.5, *, numeric_only: bool = False, exact: Optional[bool] = None
+    ):
         """
         Return group values at the given quantile, a la numpy.percentile.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
             >>> import bigframes.pandas as bpd
@@ -306,6 +319,10 @@ class GroupBy:
                 Value(s) between 0 and 1 providing the quantile(s) to compute.
             numeric_only (bool, default False):
                 Include only `float`, `int` or `boolean` data.
+            exact (bool, optional):
+                Compute exact quantiles instead of approximate ones with
+                ``APPROX_QUANTILES``. Defaults to
+                ``not bigframes.options.compute.approximate``.
 
         Returns:
             bigframes.pandas.DataFrame or bigframes.pandas.Series:
@@ -1354,10 +1371,15 @@ class SeriesGroupBy(GroupBy):
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def nunique(self):
+    def nunique(self, *, exact: Optional[bool] = None):
         """
         Return number of unique elements in the group.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
 
@@ -1368,6 +1390,12 @@ class SeriesGroupBy(GroupBy):
             b    1
             dtype: Int64
 
+        Args:
+            exact (bool, optional):
+                Count distinct values exactly instead of approximately with
+                ``APPROX_COUNT_DISTINCT``. Defaults to
+                ``not bigframes.options.compute.approximate``.
+
         Returns:
             bigframes.pandas.Series:
                 Number of unique values within each group.
@@ -1578,10 +1606,15 @@ class DataFrameGroupBy(GroupBy):
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def nunique(self):
+    def nunique(self, *, exact: Optional[bool] = None):
         """
         Return DataFrame with counts of unique elements in each position.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
 
@@ -1598,6 +1631,12 @@ class DataFrameGroupBy(GroupBy):
             <BLANKLINE>
             [3 rows x 2 columns]
 
+        Args:
+            exact (bool, optional):
+                Count distinct values exactly instead of approximately with
+                ``APPROX_COUNT_DISTINCT``. Defaults to
+                ``not bigframes.options.compute.approximate``.
+
         Returns:
             bigframes.pandas.DataFrame:
                 Number of unique values within a BigQuery DataFrame.
@@ -887,12 +887,17 @@ class Series(NDFrame):  # type: ignore[misc]
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def nunique(self) -> int:
+    def nunique(self, *, exact: Optional[bool] = None) -> int:
         """
         Return number of unique elements in the object.
 
         Excludes NA values by default.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
 
@@ -908,6 +913,12 @@ class Series(NDFrame):  # type: ignore[misc]
             >>> s.nunique()
             np.int64(4)
 
+        Args:
+            exact (bool, optional):
+                Count distinct values exactly instead of approximately with
+                ``APPROX_COUNT_DISTINCT``. Defaults to
+                ``not bigframes.options.compute.approximate``.
+
         Returns:
             int:
                 number of unique elements in the object.
@@ -1790,6 +1801,10 @@ class Series(NDFrame):  # type: ignore[misc]
         Can be ufunc (a NumPy function that applies to the entire Series) or a
         Python function that only works on single values. If it is an arbitrary
         python function then converting it into a `remote_function` is recommended.
+        If every source of the Series is local data, such as from
+        ``read_pandas`` or a pandas Series, an arbitrary Python function is run
+        in process instead. Series that read BigQuery tables, including through
+        ``read_gbq`` or ``cache()``, require a BigQuery function.
 
         **Examples:**
 
@@ -4642,9 +4657,14 @@ class Series(NDFrame):  # type: ignore[misc]
         """
         raise NotImplementedError(constants.ABSTRACT_METHOD_ERROR_MESSAGE)
 
-    def median(self, *, exact: bool = True):
+    def median(self, *, exact: Optional[bool] = None):
         """Return the median of the values over the requested axis.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
             >>> import bigframes.pandas as bpd
@@ -4668,9 +4688,9 @@ class Series(NDFrame):  # type: ignore[misc]
             dtype: Float64
 
         Args:
-            exact (bool. default True):
-                Default True. Get the exact median instead of an approximate
-                one.
+            exact (bool, optional):
+                Get the exact median instead of an approximate one. Defaults to
+                ``not bigframes.options.compute.approximate``.
 
         Returns:
             scalar: Scalar.
@@ -4680,10 +4700,17 @@ class Series(NDFrame):  # type: ignore[misc]
     def quantile(
         self,
         q: Union[float, Sequence[float]] = 0.5,
+        *,
+        exact: Optional[bool] = None,
     ) -> Union[Series, float]:
         """
         Return value at the given quantile.
 
+        .. note::
+            When ``exact`` is False, or not set while
+            ``bigframes.options.compute.approximate`` is enabled, the result is
+            approximate.
+
         **Examples:**
 
             >>> import bigframes.pandas as bpd
@@ -4700,6 +4727,10 @@ class Series(NDFrame):  # type: ignore[misc]
         Args:
             q (Union[float, Sequence[float], default 0.5 (50% quantile)):
                 The quantile(s) to compute, which can lie in range: 0 <= q <= 1.
+            exact (bool, optional):
+                Compute exact quantiles instead of approximate ones with
+                ``APPROX_QUANTILES``. Defaults to
+                ``not bigframes.options.compute.approximate``.
 
         Returns:
             Union[float, bigframes.pandas.Series]: